@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+One command line for the local screening, plotting and workbook scripts.
+
+Every script under screening/, screening/visualizations/ and the local
+helpers in simulations/tcpython/ still runs on its own (python3 x.py). This
+wrapper only gives them one entry point:
+
+  python3 calphad.py screen --threshold -10
+  python3 calphad.py mass-balance --oxide SiO2 --radius-um 50
+  python3 calphad.py plot breakeven
+  python3 calphad.py build unified --incremental
+  python3 calphad.py                       (list all commands)
+
+Everything after the command name is passed to the script unchanged, so
+"python3 calphad.py screen --help" shows the script's own options.
+
+Nothing heavy is imported here. The command's script is executed only after
+the command line is parsed (runpy, exactly as python3 <script> would run it),
+so a mass-balance query never loads matplotlib, plotly, scipy, pandas or
+openpyxl; only the plotting and workbook commands pay for those.
+
+--time reports the wrapper's startup, the command's run time and which heavy
+libraries the command imported (on stderr):
+
+  python3 calphad.py --time mass-balance --oxide Fe2O3
+
+The TC-Python scripts are not listed; they still run on the OSU lab machine.
+
+Optional shell alias:  alias calphad="python3 /path/to/calphad.py"
+"""
+
+import runpy
+import sys
+import time
+from pathlib import Path
+
+T_START = time.perf_counter()
+
+ROOT = Path(__file__).resolve().parent
+
+# (group, name) -> (script, description); group None = top-level command
+COMMANDS = {
+    (None, "screen"):        ("screening/tiered_screening.py", "tiered Cu + MOx -> CuMOy screen"),
+    (None, "mass-balance"):  ("screening/mass_balance_calculator.py", "oxide dose for a Cu removal experiment"),
+    (None, "fits"):          ("screening/gibbs_fits.py", "piecewise G(T) fits of the oxide data"),
+    (None, "reaction-dG"):   ("screening/compute_reaction_dG.py", "Cu + oxide reaction dG from Ellingham data"),
+    (None, "ternary-dG"):    ("screening/compute_ternary_dG.py", "post-process ternary reaction energies"),
+    (None, "activity-dG"):   ("screening/compute_activity_corrected_dG.py", "activity-corrected ternary dG"),
+    (None, "decompose"):     ("screening/analyze_cufe2o4_decomposition.py", "CuFe2O4 Cu-capture vs Fe-oxidation"),
+    (None, "profile-metrics"): ("screening/profile_metrics.py", "capture metrics from the DICTRA profiles"),
+    (None, "ladle"):         ("screening/ladle_model.py", "melt-scale removal, coupled bulk Cu"),
+    (None, "psd"):           ("screening/psd.py", "particle size distributions (quadrature nodes)"),
+    (None, "sherwood"):      ("screening/convective_kinetics.py", "stirred-melt capture from Sherwood correlations"),
+    (None, "multicomponent"): ("screening/multicomponent_diffusion.py", "Fe-Cu-O-C-Si-Mn particle diffusion, oxide ranking check"),
+    (None, "diffusivity"):   ("screening/diffusivity_fit.py", "reference D_Cu(T) and DICTRA back-fit diagnostics"),
+    (None, "convergence"):   ("screening/diffusion_convergence.py", "accuracy vs cost of the DICTRA grid/shell/time step"),
+    (None, "shrinking-core"): ("screening/shrinking_core.py", "product-layer growth and saturation-limited capture"),
+    (None, "inverse"):       ("screening/inverse_design.py", "dose, radius, time or T needed for a Cu target"),
+    (None, "update-table"):  ("screening/update_screening_table.py", "refresh screening_table.csv"),
+    (None, "figures"):       ("screening/render_figures.py", "render stale figures in parallel"),
+    (None, "watch"):         ("screening/watch_pipeline.py", "rebuild figures/workbooks when raw data changes"),
+    (None, "cache"):         ("screening/formula_cache.py", "write cached formula values into .xlsx files"),
+    (None, "store"):         ("simulations/tcpython/gibbs_store.py", "long-format oxide Gibbs store"),
+    (None, "balance"):       ("simulations/tcpython/reaction_balancer.py", "reaction balancer / stoichiometry table"),
+    (None, "candidates"):    ("simulations/tcpython/candidate_generator.py", "enumerate Cu-M-O product candidates"),
+    (None, "verify"):        ("simulations/tcpython/verify_oxide_data.py", "check oxide data against literature"),
+    (None, "shards"):        ("simulations/tcpython/sweep_shards.py", "merge sharded sweep results"),
+    (None, "telemetry"):     ("simulations/tcpython/sweep_telemetry.py", "analyze sweep timing telemetry"),
+    (None, "rtf-logs"):      ("simulations/tcpython/import_rtf_logs.py", "import VM console logs as telemetry"),
+
+    ("build", "unified"):    ("screening/build_unified_xlsx.py", "Cu_Removal_Unified.xlsx"),
+    ("build", "validation"): ("screening/build_validation_xlsx.py", "Validation_Results.xlsx"),
+    ("build", "combined"):   ("screening/build_combined_screening.py", "Cu_Removal_Screening.xlsx"),
+    ("build", "ternary"):    ("screening/build_ternary_xlsx.py", "Ternary_Screening_Results.xlsx"),
+    ("build", "screening"):  ("screening/build_screening_xlsx.py", "Oxide_Screening_Table.xlsx"),
+
+    ("plot", "dG"):              ("screening/plot_dG_vs_T.py", "dG vs T, top 6 products"),
+    ("plot", "activity"):        ("screening/plot_cu_activity.py", "Cu activity vs oxide fraction"),
+    ("plot", "slag"):            ("screening/plot_slag_effects.py", "Cu activity vs slag basicity"),
+    ("plot", "ternary-phase"):   ("screening/plot_ternary_phase.py", "ternary phase maps at 1800 K"),
+    ("plot", "removal-rate"):    ("screening/plot_cu_removal_rate.py", "DICTRA Cu removal figures"),
+    ("plot", "breakeven"):       ("screening/visualizations/breakeven_contour.py", "dose x radius break-even contours"),
+    ("plot", "tornado"):         ("screening/visualizations/sensitivity_tornado.py", "sensitivity tornado chart"),
+    ("plot", "dose-response"):   ("screening/visualizations/dose_response_curves.py", "removal vs oxide dose"),
+    ("plot", "decision-matrix"): ("screening/visualizations/oxide_decision_matrix.py", "oxide radar chart"),
+    ("plot", "overlay"):         ("screening/visualizations/thermo_kinetics_overlay.py", "|dG| vs removal scatter"),
+    ("plot", "predictor"):       ("screening/visualizations/experiment_predictor.py", "final Cu recipe card"),
+    ("plot", "animate"):         ("screening/visualizations/animate_cu_removal.py", "parameter sweep GIF"),
+    ("plot", "heatmap"):         ("screening/visualizations/heatmap_cu_removal.py", "Plotly removal heatmap"),
+    ("plot", "surface3d"):       ("screening/visualizations/surface3d_cu_removal.py", "Plotly 3D removal surface"),
+    ("plot", "interactive"):     ("screening/visualizations/plotly_cu_removal.py", "Plotly removal vs time"),
+
+    ("label", "dG"):         ("screening/label_picker_dG.py", "interactive labels, dG vs T"),
+    ("label", "activity"):   ("screening/label_picker_activity.py", "interactive labels, Cu activity"),
+    ("label", "slag"):       ("screening/label_picker_slag.py", "interactive labels, slag basicity"),
+}
+
+# Reported by --time when a command imported them
+HEAVY_MODULES = ("numpy", "pandas", "scipy", "matplotlib", "plotly", "openpyxl", "pycalphad")
+
+
+def usage(group=None):
+    """Command table (only `group`'s commands if given)."""
+    lines = ["usage: python3 calphad.py [--time] COMMAND [ARGS...]", ""]
+    last = object()
+    for (g, name), (script, text) in COMMANDS.items():
+        if group is not None and g != group:
+            continue
+        if g != last:
+            lines.append("commands:" if g is None else "%s commands:" % g)
+            last = g
+        command = name if g is None else "%s %s" % (g, name)
+        lines.append("  %-24s %s" % (command, text))
+    return "\n".join(lines)
+
+
+def resolve(argv):
+    """Split argv into ((group, name), script args); None if unknown."""
+    if not argv:
+        return None, []
+    groups = {g for g, _ in COMMANDS if g is not None}
+    if argv[0] in groups:
+        if len(argv) < 2 or (argv[0], argv[1]) not in COMMANDS:
+            return argv[0], []
+        return (argv[0], argv[1]), argv[2:]
+    if (None, argv[0]) in COMMANDS:
+        return (None, argv[0]), argv[1:]
+    return None, []
+
+
+def run_script(script, args):
+    """Run a script as `python3 script args...` would, in this process."""
+    path = ROOT / script
+    sys.argv = [str(path), *args]
+    sys.path[0] = str(path.parent)     # sibling imports (oxide_store, ...)
+    runpy.run_path(str(path), run_name="__main__")
+
+
+def main():
+    argv = sys.argv[1:]
+    timed = bool(argv) and argv[0] == "--time"
+    if timed:
+        argv = argv[1:]
+
+    if not argv or argv[0] in ("-h", "--help"):
+        print(usage())
+        return 0
+    key, args = resolve(argv)
+    if key is None or (isinstance(key, str) and len(argv) > 1):
+        print("unknown command: %s\n" % " ".join(argv[:2]), file=sys.stderr)
+        print(usage(key), file=sys.stderr)
+        return 2
+    if isinstance(key, str):          # bare group: list its commands
+        print(usage(key))
+        return 0
+
+    script = COMMANDS[key][0]
+    command = " ".join(k for k in key if k)
+    t_dispatch = time.perf_counter()
+    try:
+        run_script(script, args)
+    finally:
+        if timed:
+            t_end = time.perf_counter()
+            heavy = [m for m in HEAVY_MODULES if m in sys.modules]
+            print("\n[calphad] startup %.1f ms, %s %.1f ms, heavy imports: %s" % (
+                (t_dispatch - T_START) * 1000, command, (t_end - t_dispatch) * 1000,
+                ", ".join(heavy) or "none"), file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -16,8 +16,12 @@ Run locally. Reads from:
 
 Output:
   - screening/Cu_Removal_Screening.xlsx
+
+  python3 build_combined_screening.py                 (full rebuild)
+  python3 build_combined_screening.py --incremental   (only tabs whose CSVs changed)
 """
 
+import argparse
 import csv
 from pathlib import Path
 
@@ -26,6 +30,8 @@ import openpyxl
 from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
 from openpyxl.utils import get_column_letter
 
+import incremental_xlsx
+
 SCRIPT_DIR = Path(__file__).parent
 DATA_DIR = SCRIPT_DIR.parent / "data" / "tcpython" / "raw"
 BINARY_CSV = DATA_DIR / "oxide_gibbs_energies.csv"
@@ -1181,28 +1187,43 @@ def build_tab7_pricing(wb):
 # Main
 # ============================================================================
 
-def main():
-    print("=" * 60)
-    print("Building combined screening workbook (TRACEABLE FORMULAS)...")
-    print("=" * 60)
+# Tab -> input files (for --incremental)
+TAB_INPUTS = {
+    "Formation Energies":       [BINARY_CSV],
+    "Binary Screening":         [BINARY_CSV],
+    "Ternary Reaction Balance": [],
+    "Ternary Reaction dG":      [TERNARY_CSV, BINARY_CSV],
+    "Combined Screening":       [BINARY_CSV, TERNARY_CSV],
+    "Normalization Explained":  [],
+    "Pricing & SDS":            [],
+}
 
+
+def build_workbook(tabs, path):
+    """Build the named tabs (all for a full rebuild) and save to path."""
     df = load_binary_data()
     ternary_data = load_ternary_data()
 
     wb = openpyxl.Workbook()
+    if "Formation Energies" not in tabs:
+        wb.remove(wb.active)   # tab 1 renames wb.active
+
+    builders = [
+        ("Formation Energies", lambda: build_tab1_formation_energies(wb, df)),
+        ("Binary Screening", lambda: build_tab2_binary_screening(wb, df)),
+        ("Ternary Reaction Balance", lambda: build_tab3_ternary_balancing(wb)),
+        ("Ternary Reaction dG", lambda: build_tab4_ternary_dG(wb, ternary_data, df)),
+        ("Combined Screening", lambda: build_tab5_combined_screening(wb, df, ternary_data)),
+        ("Normalization Explained", lambda: build_tab6_normalization(wb)),
+        ("Pricing & SDS", lambda: build_tab7_pricing(wb)),
+    ]
+    for tab, build in builders:
+        if tab in tabs:
+            build()
 
-    # Build all tabs
-    build_tab1_formation_energies(wb, df)
-    build_tab2_binary_screening(wb, df)
-    build_tab3_ternary_balancing(wb)
-    build_tab4_ternary_dG(wb, ternary_data, df)
-    build_tab5_combined_screening(wb, df, ternary_data)
-    build_tab6_normalization(wb)
-    build_tab7_pricing(wb)
-
-    wb.save(OUTPUT_FILE)
+    wb.save(path)
 
-    # Count all formula cells across all sheets
+    # Count all formula cells across all (re)built sheets
     total_formulas = 0
     for ws in wb.worksheets:
         for row in ws.iter_rows():
@@ -1210,8 +1231,7 @@ def main():
                 if isinstance(cell.value, str) and cell.value.startswith("="):
                     total_formulas += 1
 
-    print(f"\nSaved to: {OUTPUT_FILE}")
-    print(f"Tabs: {[ws.title for ws in wb.worksheets]}")
+    print(f"Tabs built: {[ws.title for ws in wb.worksheets]}")
     print(f"Total FORMULA cells: {total_formulas}")
 
     # Summary
@@ -1221,5 +1241,21 @@ def main():
         print("  -> Run extract_ternary_reactions.py on VM, copy CSV, then re-run this script.")
 
 
+def main():
+    parser = argparse.ArgumentParser(description="Build Cu_Removal_Screening.xlsx.")
+    parser.add_argument("--incremental", action="store_true",
+                        help="rebuild only tabs whose input CSVs changed")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("Building combined screening workbook (TRACEABLE FORMULAS)...")
+    print("=" * 60)
+
+    tabs = [(tab, [tab], inputs) for tab, inputs in TAB_INPUTS.items()]
+    if incremental_xlsx.run(OUTPUT_FILE, __file__, tabs, build_workbook,
+                            incremental=args.incremental):
+        print(f"\nSaved to: {OUTPUT_FILE}")
+
+
 if __name__ == "__main__":
     main()
@@ -24,16 +24,28 @@ Tab layout (narrative order, 3-tier color coding):
     14. Cu_Activity           — Cu activity sweep at 1800K (80 rows)
     15. Slag_Effects          — slag basicity effects on a_Cu (30 rows)
     16. Phase_Map             — ternary composition phase mapping (1107 rows)
+
+The workbook is written in openpyxl write-only (streaming) mode. The blue
+tabs are small and styled cell by cell, so they are built in an ordinary
+in-memory workbook and then streamed out (_stream_sheet). The green and gray
+CSV tabs never exist in memory: each CSV is read twice, once for the row
+count and column widths, once to stream the rows, and every cell gets one of
+a handful of shared named styles instead of its own font/fill/border. Build
+time and memory therefore stay flat as the raw sweeps grow.
 """
 
+import argparse
 import csv
+from copy import copy
 from pathlib import Path
 
 import openpyxl
 from openpyxl.drawing.image import Image as XlImage
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.styles import (
-    Font, PatternFill, Alignment, Border, Side, numbers,
+    Font, PatternFill, Alignment, Border, Side, NamedStyle, numbers,
 )
+from openpyxl.styles.fonts import DEFAULT_FONT
 from openpyxl.formatting.rule import CellIsRule
 from openpyxl.worksheet.datavalidation import DataValidation
 from openpyxl.utils import get_column_letter
@@ -42,6 +54,8 @@ from openpyxl.chart.axis import ChartLines
 from openpyxl.drawing.line import LineProperties
 from openpyxl.chart.shapes import GraphicalProperties
 
+import incremental_xlsx
+
 # ── Matplotlib-consistent colors and dash styles for Excel charts ─────
 # Matches compute_activity_corrected_dG.py COLORS and LINE_STYLES dicts.
 # matplotlib "-" → "solid", "--" → "dash", ":" → "dot", "-." → "dashDot"
@@ -173,13 +187,10 @@ TOXICITY_FILL = PatternFill(start_color="FFC7CE", end_color="FFC7CE",
                             fill_type="solid")
 
 
-def _highlight_toxicity(ws, col_idx, start_row, end_row):
-    """Apply red bold font to cells containing HIGH toxicity keywords."""
-    for r in range(start_row, end_row + 1):
-        cell = ws.cell(row=r, column=col_idx)
-        val = str(cell.value or "").upper()
-        if any(kw in val for kw in TOXICITY_KEYWORDS):
-            cell.font = TOXICITY_FONT
+def _is_toxic(value):
+    """True if a hazard cell contains a HIGH toxicity keyword."""
+    val = str(value or "").upper()
+    return any(kw in val for kw in TOXICITY_KEYWORDS)
 
 
 # ── helpers ────────────────────────────────────────────────────────────
@@ -194,6 +205,14 @@ def load_csv(path):
     return fieldnames, rows
 
 
+def iter_csv(path):
+    """Yield CSV rows as dicts without loading the file (large raw sweeps)."""
+    if not path.exists():
+        return
+    with open(path, encoding="utf-8-sig") as f:
+        yield from csv.DictReader(f)
+
+
 def _try_float(v):
     if v is None:
         return v
@@ -303,50 +322,174 @@ def _embed_image(ws, img_path, anchor_cell, width_px=500):
     return max(1, img.height // 15)
 
 
+# =====================================================================
+# STREAMING (write-only workbook)
+# =====================================================================
+def _stream_sheet(wb, src):
+    """Copy an in-memory worksheet into the write-only workbook wb.
+
+    Used for the blue analysis tabs, which need random cell access while
+    they are built. Charts, images, merges, validations and conditional
+    formats are carried over; cell styles are re-registered in wb.
+    """
+    ws = wb.create_sheet(src.title)
+    ws.sheet_properties.tabColor = src.sheet_properties.tabColor
+    ws.freeze_panes = src.freeze_panes
+    for key, dim in src.column_dimensions.items():
+        if dim.width:
+            ws.column_dimensions[key].width = dim.width
+    for idx, dim in src.row_dimensions.items():
+        if dim.height:
+            ws.row_dimensions[idx].height = dim.height
+    ws.merged_cells = src.merged_cells
+    ws.data_validations = src.data_validations
+    ws.conditional_formatting = src.conditional_formatting
+    ws._charts = src._charts
+    ws._images = src._images
+
+    for row in src.iter_rows():
+        out = []
+        for ce in row:
+            cell = WriteOnlyCell(ws, value=ce.value)
+            if ce.has_style:
+                cell.font = copy(ce.font)
+                cell.fill = copy(ce.fill)
+                cell.border = copy(ce.border)
+                cell.alignment = copy(ce.alignment)
+                cell.number_format = ce.number_format
+            if ce.hyperlink is not None:
+                cell.hyperlink = ce.hyperlink
+            out.append(cell)
+        ws.append(out)
+    return ws
+
+
+def raw_tab_styles(wb):
+    """Register the shared named styles for the streamed CSV tabs.
+
+    Returns {(role, col_pos, last_row, toxic): style name} with role
+    "header", "white" or "gray" and col_pos "first", "mid", "last" or
+    "only" (border edges). Cells are styled by name, which is much cheaper
+    than building a Font/Fill/Border per cell.
+    """
+    styles = {}
+    for role in ("header", "white", "gray"):
+        for col_pos in ("first", "mid", "last", "only"):
+            for last_row in (False, True):
+                for toxic in (False, True):
+                    if role == "header" and (last_row or toxic):
+                        continue
+                    left = THICK if col_pos in ("first", "only") else THIN
+                    right = THICK if col_pos in ("last", "only") else THIN
+                    top = THICK if role == "header" else THIN
+                    bottom = THICK if role == "header" or last_row else THIN
+                    name = "raw_%s_%s%s%s" % (role, col_pos,
+                                              "_end" if last_row else "",
+                                              "_toxic" if toxic else "")
+                    style = NamedStyle(
+                        name=name,
+                        border=Border(top=top, bottom=bottom, left=left, right=right))
+                    style.alignment = Alignment(horizontal="center")
+                    if role == "header":
+                        style.fill = HEADER_FILL
+                        style.font = HEADER_FONT
+                    else:
+                        style.fill = WHITE_FILL if role == "white" else GRAY_FILL
+                        style.font = TOXICITY_FONT if toxic else DEFAULT_FONT
+                    wb.add_named_style(style)
+                    styles[(role, col_pos, last_row, toxic)] = name
+    return styles
+
+
+def _col_pos(c, ncols):
+    if ncols == 1:
+        return "only"
+    return "first" if c == 1 else "last" if c == ncols else "mid"
+
+
+def _scan_csv(path, fields, intro, min_w=8, max_w=30):
+    """First pass over a CSV: row count and column widths (as auto_width)."""
+    widths = [max(min_w, min(len(h) + 2, max_w)) for h in fields]
+    if intro:
+        widths[0] = max([widths[0]] + [min(len(t) + 2, max_w) for t, _ in intro])
+    n = 0
+    for r in iter_csv(path):
+        n += 1
+        for c, h in enumerate(fields):
+            v = _try_float(r.get(h, ""))
+            if v is not None:
+                widths[c] = max(widths[c], min(len(str(v)) + 2, max_w))
+    return n, widths
+
+
 # =====================================================================
 # RAW DATA TABS (7 tabs — direct TC-Python CSV dumps)
 # =====================================================================
-def _build_raw_tab(wb, tab_name, csv_key, tab_color=GRAY_TAB, intro=None):
-    """Build a CSV-backed tab with optional intro card lines.
+def _build_raw_tab(wb, styles, tab_name, csv_key, tab_color=GRAY_TAB,
+                   intro=None, formula_cols=None, toxic_col=None):
+    """Stream a CSV-backed tab with optional intro card lines.
 
     intro: list of (text, Font) tuples for 1-2 card lines above the header.
+    formula_cols: {col_idx: f(row) -> formula} replacing CSV values.
+    toxic_col: column whose HIGH-hazard cells get the red toxicity font.
     """
-    fields, rows = load_csv(CSV_FILES[csv_key])
-    if not rows:
-        ws = wb.create_sheet(tab_name)
-        ws.cell(row=1, column=1, value=f"Data not available ({csv_key})")
-        freeze_and_color(ws, tab_color)
+    path = CSV_FILES[csv_key]
+    fields = None
+    if path.exists():
+        with open(path, encoding="utf-8-sig") as f:
+            fields = next(csv.reader(f), None)
+    ws = wb.create_sheet(tab_name)
+    ws.sheet_properties.tabColor = tab_color
+    n_rows, widths = _scan_csv(path, fields, intro) if fields else (0, [])
+    if not n_rows:
+        ws.freeze_panes = "A2"
+        ws.append([f"Data not available ({csv_key})"])
         return ws, 0
 
-    ws = wb.create_sheet(tab_name)
     ncols = len(fields)
-
-    offset = 0
-    if intro:
-        merge_end = min(ncols, 10)
-        for idx, (text, font) in enumerate(intro):
-            _write_card_line(ws, idx + 1, 1, merge_end, text, font=font)
-        offset = len(intro)
-
+    offset = len(intro) if intro else 0
     hdr_row = offset + 1
-    for c, h in enumerate(fields, 1):
-        ws.cell(row=hdr_row, column=c, value=h)
-    style_header(ws, hdr_row, ncols)
-
-    for i, r in enumerate(rows):
+    last_row = hdr_row + n_rows
+    # Column widths and freeze panes must be set before the first row
+    ws.freeze_panes = f"A{hdr_row + 1}"
+    for c, w in enumerate(widths, 1):
+        ws.column_dimensions[get_column_letter(c)].width = w
+
+    for idx, (text, font) in enumerate(intro or []):
+        cell = WriteOnlyCell(ws, value=text)
+        cell.font = font
+        cell.fill = CARD_FILL
+        ws.append([cell])
+        merge_end = min(ncols, 10)
+        if merge_end > 1:
+            ws.merged_cells.add(f"A{idx + 1}:{get_column_letter(merge_end)}{idx + 1}")
+
+    pos = [_col_pos(c, ncols) for c in range(1, ncols + 1)]
+    header = []
+    for c, h in enumerate(fields):
+        cell = WriteOnlyCell(ws, value=h)
+        cell.style = styles[("header", pos[c], False, False)]
+        header.append(cell)
+    ws.append(header)
+
+    formula_cols = formula_cols or {}
+    for i, r in enumerate(iter_csv(path)):
         row = hdr_row + 1 + i
+        role = "white" if i % 2 == 0 else "gray"
+        out = []
         for c, h in enumerate(fields, 1):
-            ws.cell(row=row, column=c, value=_try_float(r.get(h, "")))
+            if c in formula_cols:
+                value = formula_cols[c](row)
+            else:
+                value = _try_float(r.get(h, ""))
+            cell = WriteOnlyCell(ws, value=value)
+            toxic = c == toxic_col and _is_toxic(value)
+            cell.style = styles[(role, pos[c - 1], row == last_row, toxic)]
+            out.append(cell)
+        ws.append(out)
 
-    last_row = hdr_row + len(rows)
-    alt_shading(ws, hdr_row + 1, last_row, ncols)
-    center_all(ws, hdr_row, last_row, ncols)
-    apply_borders(ws, hdr_row, last_row, ncols)
-    auto_width(ws, ncols)
-    freeze_and_color(ws, tab_color, freeze_row=hdr_row + 1)
-
-    print(f"  {tab_name}: {len(rows)} rows, {ncols} cols")
-    return ws, len(rows)
+    print(f"  {tab_name}: {n_rows} rows, {ncols} cols")
+    return ws, n_rows
 
 
 def _intro(title, detail):
@@ -357,77 +500,86 @@ def _intro(title, detail):
     ]
 
 
-def build_raw_tabs(wb):
-    """Build 8 raw/backing data tabs (gray) with intro cards."""
-    _build_raw_tab(wb, "Ternary_Verdicts", "ternary_v",
-        tab_color=GRAY_TAB, intro=_intro(
-        "TERNARY VERDICTS \u2014 One row per Cu-M-O product "
-        "(backing data for Screening_Summary)",
-        "\u0394G < 0 means oxide captures Cu into a ternary compound. "
-        "Col I shows equilibrium phases at 1527\u00b0C (all melt into "
-        "IONIC_LIQ at steelmaking temp)."))
-    _build_raw_tab(wb, "OX_Gibbs", "ox_gibbs", intro=_intro(
-        "RAW TC-PYTHON \u2014 Binary oxide Gibbs energies (18 oxides, TCOX14+SSUB3)",
-        "GM values are per mole of ATOMS. See Normalization tab for conversion "
-        "to kJ/mol O\u2082. Temperatures: 500-2000 K in 50 K steps."))
-    _build_raw_tab(wb, "Ternary_Rxns", "ternary_rxns", intro=_intro(
-        "RAW TC-PYTHON \u2014 Ternary reaction energies (16 systems, TCOX14)",
-        "414 rows: 23 temperatures (800-1900 K, 50 K steps) \u00d7 18 products. "
-        "dG_rxn_kJ = total reaction driving force."))
-    _build_raw_tab(wb, "dG_Top6", "dG_top6", intro=_intro(
-        "RAW TC-PYTHON \u2014 Fine-resolution \u0394G vs T for top 6 candidates",
-        "25 K steps for higher resolution than the 50 K screening grid. "
-        "Source for the dG_vs_T_top6.png figure on the Dashboard."))
-    _build_raw_tab(wb, "CuFe2O4_Raw", "cufe2o4", intro=_intro(
-        "RAW TC-PYTHON \u2014 CuFe\u2082O\u2084 decomposition components",
-        "Splits total reaction into Cu-capture + Fe-oxidation. "
-        "See CuFe2O4_DeepDive tab for analysis with formula cells."))
-    _build_raw_tab(wb, "Cu_Activity", "cu_activity", intro=_intro(
-        "RAW TC-PYTHON \u2014 Cu activity sweep at 1800 K (4 systems)",
-        "a_Cu is invariant in 2-phase fields (Gibbs Phase Rule). "
-        "TCOX14 has no separate metallic Cu phase; all Cu enters IONIC_LIQ."))
-    _build_raw_tab(wb, "Slag_Effects", "slag", intro=_intro(
-        "RAW TC-PYTHON \u2014 Slag basicity effects on Cu activity",
-        "MnO:SiO\u2082 and Al\u2082O\u2083:SiO\u2082 ratio variations "
-        "at 1800 K. See Activity_and_Slag tab Section 4 for analysis."))
-    _build_raw_tab(wb, "Phase_Map", "phase_map", intro=_intro(
-        "RAW TC-PYTHON \u2014 Ternary composition phase mapping at 1800 K",
-        "20\u00d720 grid for Cu-Fe-O, Cu-Al-O, Cu-Mn-O, Cu-V-O systems. "
-        "Shows which phases are stable at each composition."))
-
-
-def build_results_tabs(wb):
-    """Build 3 derived results tabs (green) with intro cards + toxicity."""
-    ws_st, n_st = _build_raw_tab(wb, "Screening_Table", "screening",
-        tab_color=GREEN_TAB, intro=_intro(
-        "BINARY SCREENING TABLE \u2014 One row per candidate oxide",
-        "\u0394G_rxn from TC-Python TCOX14 at three temperatures. "
-        "Column K = toxicity hazard. RED = HIGH hazard \u2014 "
-        "additional safety review required before experimental use."))
+# (tab, CSV key, intro title, intro detail)
+RAW_TABS = [
+    ("Ternary_Verdicts", "ternary_v",
+     "TERNARY VERDICTS \u2014 One row per Cu-M-O product "
+     "(backing data for Screening_Summary)",
+     "\u0394G < 0 means oxide captures Cu into a ternary compound. "
+     "Col I shows equilibrium phases at 1527\u00b0C (all melt into "
+     "IONIC_LIQ at steelmaking temp)."),
+    ("OX_Gibbs", "ox_gibbs",
+     "RAW TC-PYTHON \u2014 Binary oxide Gibbs energies (18 oxides, TCOX14+SSUB3)",
+     "GM values are per mole of ATOMS. See Normalization tab for conversion "
+     "to kJ/mol O\u2082. Temperatures: 500-2000 K in 50 K steps."),
+    ("Ternary_Rxns", "ternary_rxns",
+     "RAW TC-PYTHON \u2014 Ternary reaction energies (16 systems, TCOX14)",
+     "414 rows: 23 temperatures (800-1900 K, 50 K steps) \u00d7 18 products. "
+     "dG_rxn_kJ = total reaction driving force."),
+    ("dG_Top6", "dG_top6",
+     "RAW TC-PYTHON \u2014 Fine-resolution \u0394G vs T for top 6 candidates",
+     "25 K steps for higher resolution than the 50 K screening grid. "
+     "Source for the dG_vs_T_top6.png figure on the Dashboard."),
+    ("CuFe2O4_Raw", "cufe2o4",
+     "RAW TC-PYTHON \u2014 CuFe\u2082O\u2084 decomposition components",
+     "Splits total reaction into Cu-capture + Fe-oxidation. "
+     "See CuFe2O4_DeepDive tab for analysis with formula cells."),
+    ("Cu_Activity", "cu_activity",
+     "RAW TC-PYTHON \u2014 Cu activity sweep at 1800 K (4 systems)",
+     "a_Cu is invariant in 2-phase fields (Gibbs Phase Rule). "
+     "TCOX14 has no separate metallic Cu phase; all Cu enters IONIC_LIQ."),
+    ("Slag_Effects", "slag",
+     "RAW TC-PYTHON \u2014 Slag basicity effects on Cu activity",
+     "MnO:SiO\u2082 and Al\u2082O\u2083:SiO\u2082 ratio variations "
+     "at 1800 K. See Activity_and_Slag tab Section 4 for analysis."),
+    ("Phase_Map", "phase_map",
+     "RAW TC-PYTHON \u2014 Ternary composition phase mapping at 1800 K",
+     "20\u00d720 grid for Cu-Fe-O, Cu-Al-O, Cu-Mn-O, Cu-V-O systems. "
+     "Shows which phases are stable at each composition."),
+]
+
+
+def build_raw_tabs(wb, styles, tabs=None):
+    """Stream the raw/backing data tabs (gray) with intro cards.
+
+    tabs: names to build (default all), for incremental rebuilds.
+    """
+    for tab_name, csv_key, title, detail in RAW_TABS:
+        if tabs is None or tab_name in tabs:
+            _build_raw_tab(wb, styles, tab_name, csv_key,
+                           intro=_intro(title, detail))
+
+
+def _verdict_formula(row, dg_col_letter="H"):
+    """Tiered verdict on dG_corrected_pO2_1atm_kJ (col H)."""
+    return (f'=IF({dg_col_letter}{row}<-10,"ROBUST",'
+            f'IF({dg_col_letter}{row}<0,"MARGINAL",'
+            f'IF({dg_col_letter}{row}<15,"UNCERTAIN",'
+            f'"UNFAVORABLE")))')
+
+
+def build_results_tabs(wb, styles, tabs=None):
+    """Stream 2 derived results tabs (green) with intro cards + toxicity."""
     # Toxicity highlighting (column K = 11)
-    if n_st > 0:
-        _highlight_toxicity(ws_st, col_idx=11,
-                            start_row=INTRO_ROWS + 2,
-                            end_row=INTRO_ROWS + 1 + n_st)
-
-    ws_ac, n_ac = _build_raw_tab(wb, "Activity_Corrected", "corrected",
-        tab_color=GREEN_TAB, intro=_intro(
-        "ACTIVITY-CORRECTED \u0394G \u2014 Accounting for dilute Cu in "
-        "liquid Fe",
-        "Pre-computed at X_Cu=0.003, \u03b3_Cu=8.5. Column M verdict "
-        "is a live formula. See Activity_and_Slag tab for interactive "
-        "version with editable parameter cells."))
-    # Replace verdict_corrected column (col 13 = M) with tiered IF formula
+    if tabs is None or "Screening_Table" in tabs:
+        _build_raw_tab(wb, styles, "Screening_Table", "screening",
+            tab_color=GREEN_TAB, toxic_col=11, intro=_intro(
+            "BINARY SCREENING TABLE \u2014 One row per candidate oxide",
+            "\u0394G_rxn from TC-Python TCOX14 at three temperatures. "
+            "Column K = toxicity hazard. RED = HIGH hazard \u2014 "
+            "additional safety review required before experimental use."))
+
+    # verdict_corrected column (col 13 = M) becomes a tiered IF formula
     # referencing dG_corrected_pO2_1atm_kJ (col 8 = H)
-    if n_ac > 0:
-        verdict_col = 13  # column M
-        dg_col_letter = "H"  # dG_corrected_pO2_1atm_kJ
-        for r in range(INTRO_ROWS + 2, INTRO_ROWS + 2 + n_ac):
-            ws_ac.cell(row=r, column=verdict_col,
-                       value=f'=IF({dg_col_letter}{r}<-10,"ROBUST",'
-                             f'IF({dg_col_letter}{r}<0,"MARGINAL",'
-                             f'IF({dg_col_letter}{r}<15,"UNCERTAIN",'
-                             f'"UNFAVORABLE")))')
+    if tabs is None or "Activity_Corrected" in tabs:
+        _build_raw_tab(wb, styles, "Activity_Corrected", "corrected",
+            tab_color=GREEN_TAB, formula_cols={13: _verdict_formula},
+            intro=_intro(
+            "ACTIVITY-CORRECTED \u0394G \u2014 Accounting for dilute Cu in "
+            "liquid Fe",
+            "Pre-computed at X_Cu=0.003, \u03b3_Cu=8.5. Column M verdict "
+            "is a live formula. See Activity_and_Slag tab for interactive "
+            "version with editable parameter cells."))
 
 
 # =====================================================================
@@ -1163,9 +1315,8 @@ def build_activity_and_slag(wb):
     rows_1800.sort(key=lambda r: float(r["dG_corrected_pO2_1atm_kJ"]))
 
     # Build product -> Ternary_Rxns row map at T=1800K
-    _, tern_rows = load_csv(CSV_FILES["ternary_rxns"])
     prod_tern_row = {}
-    for i, tr in enumerate(tern_rows):
+    for i, tr in enumerate(iter_csv(CSV_FILES["ternary_rxns"])):
         if abs(float(tr["T_K"]) - 1800) < 1:
             prod_tern_row[tr["product"]] = i + 2 + INTRO_ROWS
 
@@ -2060,34 +2211,75 @@ def build_normalization(wb):
 # =====================================================================
 # main
 # =====================================================================
-def main():
-    print("=" * 70)
-    print("Building Cu_Removal_Unified.xlsx")
-    print("  6 analysis (blue) + 2 results (green) + 8 raw/backing (gray) = 16 tabs")
-    print("=" * 70)
+# Inputs of every tab, for --incremental (figures count as inputs)
+TAB_INPUTS = {
+    "Dashboard":          list(FIGURES.values()),
+    "Screening_Summary":  [CSV_FILES["screening"], CSV_FILES["ternary_v"]],
+    "Mass_Balance":       [],
+    "Activity_and_Slag":  [CSV_FILES["corrected"], CSV_FILES["ternary_rxns"],
+                           CSV_FILES["slag"]],
+    "CuFe2O4_DeepDive":   [CSV_FILES["cufe2o4"]],
+    "Normalization":      [CSV_FILES["ox_gibbs"], CSV_FILES["cufe2o4"]],
+    "Screening_Table":    [CSV_FILES["screening"]],
+    "Activity_Corrected": [CSV_FILES["corrected"]],
+    **{tab: [CSV_FILES[key]] for tab, key, _, _ in RAW_TABS},
+}
+
+BLUE_BUILDERS = [
+    ("Dashboard", build_dashboard),
+    ("Screening_Summary", build_screening_summary),
+    ("Mass_Balance", build_mass_balance),
+    ("Activity_and_Slag", build_activity_and_slag),
+    ("CuFe2O4_DeepDive", build_cufe2o4_deepdive),
+    ("Normalization", build_normalization),
+]
 
-    wb = openpyxl.Workbook()
+
+def build_workbook(tabs, path):
+    """Build the named tabs (all of them for a full build) and save to path."""
+    # Blue tabs need random cell access: build them in memory, then stream
+    scratch = openpyxl.Workbook()
+    wb = openpyxl.Workbook(write_only=True)
+    if "Dashboard" not in tabs:
+        scratch.remove(scratch.active)   # build_dashboard renames wb.active
 
     # Blue analysis tabs (ordered by audience priority)
     print("\n--- Analysis Tabs (blue) ---")
-    build_dashboard(wb)
-    build_screening_summary(wb)
-    build_mass_balance(wb)
-    build_activity_and_slag(wb)
-    build_cufe2o4_deepdive(wb)
-    build_normalization(wb)
+    for tab, builder in BLUE_BUILDERS:
+        if tab in tabs:
+            builder(scratch)
+    for src in scratch.worksheets:
+        _stream_sheet(wb, src)
 
     # Green results tabs (Screening_Table + Activity_Corrected)
     # Ternary_Verdicts demoted to gray (backing data for Screening_Summary)
     print("\n--- Results Tabs (green) + Raw/Backing (gray) ---")
-    build_results_tabs(wb)
+    styles = raw_tab_styles(wb)
+    build_results_tabs(wb, styles, tabs)
 
     # Gray raw data tabs
-    build_raw_tabs(wb)
+    build_raw_tabs(wb, styles, tabs)
+
+    wb.save(path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build Cu_Removal_Unified.xlsx.")
+    parser.add_argument("--incremental", action="store_true",
+                        help="rebuild only tabs whose input CSVs/figures changed")
+    args = parser.parse_args()
+
+    print("=" * 70)
+    print("Building Cu_Removal_Unified.xlsx")
+    print("  6 analysis (blue) + 2 results (green) + 8 raw/backing (gray) = 16 tabs")
+    print("=" * 70)
 
-    wb.save(OUTPUT_FILE)
-    print(f"\nSaved: {OUTPUT_FILE}")
-    print(f"  {len(wb.sheetnames)} tabs: {', '.join(wb.sheetnames)}")
+    tabs = [(tab, [tab], inputs) for tab, inputs in TAB_INPUTS.items()]
+    rebuilt = incremental_xlsx.run(OUTPUT_FILE, __file__, tabs, build_workbook,
+                                   incremental=args.incremental)
+    if rebuilt:
+        print(f"\nSaved: {OUTPUT_FILE}")
+        print(f"  {len(rebuilt)} of {len(tabs)} tabs built: {', '.join(rebuilt)}")
     print("=" * 70)
 
 
@@ -13,8 +13,15 @@ Sheets:
   5. Slag_Effects     — slag composition data + % change formulas
   6. Cu_Activity      — raw activity data
   7. Data_Sources     — provenance documentation
+
+--incremental rebuilds only the sheets whose input CSVs changed
+(see incremental_xlsx.py).
+
+The formulas are saved with their computed values (formula_cache.py), so
+pandas / openpyxl data_only readers see numbers instead of None.
 """
 
+import argparse
 import csv
 from pathlib import Path
 
@@ -24,6 +31,8 @@ from openpyxl.styles import (
 )
 from openpyxl.utils import get_column_letter
 
+import incremental_xlsx
+
 # ── paths ──────────────────────────────────────────────────────────────
 SCRIPT_DIR = Path(__file__).parent
 DATA_DIR = SCRIPT_DIR.parent / "data" / "tcpython" / "raw"
@@ -849,23 +858,43 @@ def build_data_sources(wb):
 # =====================================================================
 # main
 # =====================================================================
+# sheet -> (builder, input files), in workbook order
+SHEETS = {
+    "dG_vs_T":               (build_dG_vs_T, [CSV_FILES["dG_top6"]]),
+    "CuFe2O4_Decomposition": (build_cufe2o4_decomp, [CSV_FILES["cufe2o4"],
+                                                     CSV_FILES["decomp"]]),
+    "Activity_Correction":   (build_activity_correction, [CSV_FILES["corrected"]]),
+    "Candidate_Ranking":     (build_candidate_ranking, [CSV_FILES["dG_top6"]]),
+    "Slag_Effects":          (build_slag_effects, [CSV_FILES["slag"]]),
+    "Cu_Activity":           (build_cu_activity, [CSV_FILES["activity"]]),
+    "Data_Sources":          (build_data_sources, []),
+}
+
+
+def build_workbook(sheets, path):
+    wb = openpyxl.Workbook()
+    if "dG_vs_T" not in sheets:
+        wb.remove(wb.active)   # build_dG_vs_T renames wb.active
+    for name, (builder, _) in SHEETS.items():
+        if name in sheets:
+            builder(wb)
+    wb.save(path)
+
+
 def main():
+    parser = argparse.ArgumentParser(description="Build Validation_Results.xlsx.")
+    parser.add_argument("--incremental", action="store_true",
+                        help="rebuild only sheets whose input CSVs changed")
+    args = parser.parse_args()
+
     print("=" * 70)
     print("Building Validation_Results.xlsx  (traceable cell formulas)")
     print("=" * 70)
 
-    wb = openpyxl.Workbook()
-
-    build_dG_vs_T(wb)
-    build_cufe2o4_decomp(wb)
-    build_activity_correction(wb)
-    build_candidate_ranking(wb)
-    build_slag_effects(wb)
-    build_cu_activity(wb)
-    build_data_sources(wb)
-
-    wb.save(OUTPUT_FILE)
-    print(f"\nSaved: {OUTPUT_FILE}")
+    tabs = [(name, [name], inputs) for name, (_, inputs) in SHEETS.items()]
+    if incremental_xlsx.run(OUTPUT_FILE, __file__, tabs, build_workbook,
+                            incremental=args.incremental):
+        print(f"\nSaved: {OUTPUT_FILE}")
     print("=" * 70)
 
 
@@ -50,28 +50,9 @@ X_CU = 0.003  # ~0.3 wt% Cu in steel
 GAMMA_CU = 8.5
 A_CU = GAMMA_CU * X_CU  # ~0.0255
 
-# Products and their O2 stoichiometric coefficients in the reaction
-# Cu + MOx + n*O2 -> CuMOy
-O2_COEFFICIENTS = {
-    "CuFe2O4": 1.0,     # Cu + 2FeO + O2 -> CuFe2O4
-    "Cu3V2O8": 1.5,     # 3Cu + V2O5 + 1.5O2 -> Cu3V2O8
-    "CuV2O6":  0.5,     # Cu + V2O5 + 0.5O2 -> CuV2O6
-    "CuMn2O4": 1.0,     # Cu + 2MnO + O2 -> CuMn2O4
-    "Cu2SiO4": 1.0,     # 2Cu + SiO2 + O2 -> Cu2SiO4
-    "CuB2O4":  0.5,     # Cu + B2O3 + 0.5O2 -> CuB2O4
-    "CuAl2O4": 0.5,     # Cu + Al2O3 + 0.5O2 -> CuAl2O4
-}
-
-# Number of Cu atoms consumed per formula unit
-CU_ATOMS = {
-    "CuFe2O4": 1,
-    "Cu3V2O8": 3,
-    "CuV2O6":  1,
-    "CuMn2O4": 1,
-    "Cu2SiO4": 2,
-    "CuB2O4":  1,
-    "CuAl2O4": 1,
-}
+# Signed reaction coefficients (products +, reactants -) come from the shared
+# stoichiometry table built by simulations/tcpython/reaction_balancer.py
+STOICH_TABLE = SCRIPT_DIR.parent / "data" / "tcpython" / "processed" / "reaction_stoichiometry.npz"
 
 # Plot order: by corrected dG (most favorable first)
 PRODUCT_ORDER = [
@@ -121,6 +102,28 @@ PARENT_OXIDE = {
 }
 
 
+def load_stoichiometry():
+    """Species list and {product: nu row} for each product from its parent oxide."""
+    with np.load(STOICH_TABLE, allow_pickle=False) as t:
+        species = [str(x) for x in t["species"]]
+        nu = {}
+        for product, oxide, row in zip(t["product"], t["oxide"], t["nu"]):
+            if PARENT_OXIDE.get(str(product)) == str(oxide):
+                nu[str(product)] = row
+    return species, nu
+
+
+SPECIES, NU = load_stoichiometry()
+CU_ATOMS = {p: int(-row[SPECIES.index("Cu")]) for p, row in NU.items()}
+O2_COEFFICIENTS = {p: -row[SPECIES.index("O2")] for p, row in NU.items()}
+
+# ln(activity) per species for the two corrections (columns): dilute Cu,
+# O2 at 0.21 atm. Ternary product and pure oxide stay at a = 1.
+LN_A = np.zeros((len(SPECIES), 2))
+LN_A[SPECIES.index("Cu"), 0] = math.log(A_CU)
+LN_A[SPECIES.index("O2"), 1] = math.log(0.21)
+
+
 def load_data():
     """Load dG data from both CSV sources."""
     data = {}
@@ -203,19 +206,17 @@ def main():
         n_cu = CU_ATOMS[product]
         n_o2 = O2_COEFFICIENTS[product]
 
-        for T, dG_pure in sorted(data[product]):
-            # Cu activity correction: Cu is a REACTANT, so lowering its
-            # activity raises dG (less favorable). For reaction quotient Q:
-            #   dG = dG_pure + RT*ln(Q)
-            #   Q = a_products / (a_Cu^n_Cu * a_O2^n_O2 * a_MOx)
-            # With a_products=1, a_MOx=1 (pure solid oxide):
-            #   RT*ln(Q) = -n_Cu*RT*ln(a_Cu) - n_O2*RT*ln(pO2)
-            cu_correction_kJ = -n_cu * R * T * math.log(A_CU) / 1000.0
-
-            # O2 correction at 1 atm: zero (ln(1) = 0)
-            # At 0.21 atm: -n_O2 * RT * ln(0.21) > 0 (less favorable)
-            o2_correction_air_kJ = -n_o2 * R * T * math.log(0.21) / 1000.0
+        # Cu activity correction: Cu is a REACTANT, so lowering its
+        # activity raises dG (less favorable). For reaction quotient Q:
+        #   dG = dG_pure + RT*ln(Q),  RT*ln(Q) = RT * sum_i nu_i * ln(a_i)
+        # With a_products=1, a_MOx=1 (pure solid oxide) this is
+        #   -n_Cu*RT*ln(a_Cu) - n_O2*RT*ln(pO2)
+        # O2 correction at 1 atm is zero; at 0.21 atm it is > 0.
+        pts = sorted(data[product])
+        T_arr = np.array([p[0] for p in pts])
+        corrections = R * T_arr[:, None] * (NU[product] @ LN_A) / 1000.0
 
+        for (T, dG_pure), (cu_correction_kJ, o2_correction_air_kJ) in zip(pts, corrections):
             # Case A: pO2 = 1 atm, dilute Cu
             dG_corrected_A = dG_pure + cu_correction_kJ
 
@@ -8,38 +8,36 @@ If ΔG_rxn > 0 → Cu CANNOT reduce the oxide (thermodynamically unfavorable)
 If ΔG_rxn < 0 → Cu CAN reduce the oxide (thermodynamically favorable)
 """
 
-import pandas as pd
-import numpy as np
-from pathlib import Path
+from gibbs_fits import load_fits, evaluate
 
-# Load existing Ellingham data
-csv_path = Path(__file__).parent.parent / "data" / "tcpython" / "raw" / "oxide_gibbs_energies.csv"
-df = pd.read_csv(csv_path)
+# Ellingham dG_f(T) from the piecewise fits of oxide_gibbs_energies.csv
+# (run gibbs_fits.py after new TC-Python data)
+fits = load_fits()
 
 # Oxides to screen (exclude Cu₂O itself — it's the reference)
 oxides = {
-    "Al₂O₃":  "dG_Al2O3_per_O2",
-    "MgO":    "dG_MgO_per_O2",
-    "SiO₂":   "dG_SiO2_per_O2",
-    "TiO₂":   "dG_TiO2_per_O2",
-    "FeO":    "dG_FeO_per_O2",
-    "CuO":    "dG_CuO_per_O2",
+    "Al₂O₃":  "Al2O3",
+    "MgO":    "MgO",
+    "SiO₂":   "SiO2",
+    "TiO₂":   "TiO2",
+    "FeO":    "FeO",
+    "CuO":    "CuO",
     # --- Expanded screening (Feb 2026) ---
-    "CaO":    "dG_CaO_per_O2",
-    "ZrO₂":   "dG_ZrO2_per_O2",
-    "Cr₂O₃":  "dG_Cr2O3_per_O2",
-    "MnO":    "dG_MnO_per_O2",
+    "CaO":    "CaO",
+    "ZrO₂":   "ZrO2",
+    "Cr₂O₃":  "Cr2O3",
+    "MnO":    "MnO",
     # --- Moonshot oxides (Mar 2026) ---
-    "NiO":    "dG_NiO_per_O2",
-    "CoO":    "dG_CoO_per_O2",
-    "PbO":    "dG_PbO_per_O2",
-    "B₂O₃":   "dG_B2O3_per_O2",
-    "V₂O₅":   "dG_V2O5_per_O2",
-    "La₂O₃":  "dG_La2O3_per_O2",
-    "CeO₂":   "dG_CeO2_per_O2",
+    "NiO":    "NiO",
+    "CoO":    "CoO",
+    "PbO":    "PbO",
+    "B₂O₃":   "B2O3",
+    "V₂O₅":   "V2O5",
+    "La₂O₃":  "La2O3",
+    "CeO₂":   "CeO2",
 }
 
-cu2o_col = "dG_Cu2O_per_O2"
+cu2o_fit = "Cu2O"
 
 # Representative temperatures
 temps_K = [1000, 1500, 1800]  # ~727°C, ~1227°C, ~1527°C (steelmaking)
@@ -60,17 +58,15 @@ print("-" * 85)
 
 results = []
 missing_oxides = []
-for name, col in oxides.items():
-    if col not in df.columns:
+dG_cu2o = evaluate(fits, cu2o_fit, "dG_f", temps_K)
+for name, fit_name in oxides.items():
+    if (fit_name, "dG_f") not in fits:
         missing_oxides.append(name)
         continue
+    dG_rxn = (dG_cu2o - evaluate(fits, fit_name, "dG_f", temps_K)) / 1000  # J → kJ
     row_data = {"Oxide": name}
-    for T in temps_K:
-        idx = np.argmin(np.abs(df["T_K"].values - T))
-        dG_cu2o = df[cu2o_col].values[idx]
-        dG_oxide = df[col].values[idx]
-        dG_rxn = (dG_cu2o - dG_oxide) / 1000  # J → kJ
-        row_data[f"{T}K"] = dG_rxn
+    for T, val in zip(temps_K, dG_rxn):
+        row_data[f"{T}K"] = float(val)
     results.append(row_data)
 
 if missing_oxides:
@@ -91,7 +87,7 @@ for r in results:
 # Steelmaking-specific summary
 print("\n" + "=" * 85)
 print(f"At steelmaking temperature (~1527°C / 1800 K):")
-print(f"  Cu₂O ΔG_f = {df[cu2o_col].values[np.argmin(np.abs(df['T_K'].values - 1800))] / 1000:.1f} kJ/mol O₂")
+print(f"  Cu₂O ΔG_f = {evaluate(fits, cu2o_fit, 'dG_f', 1800)[0] / 1000:.1f} kJ/mol O₂")
 print()
 
 for r in results:
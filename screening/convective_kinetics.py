@@ -0,0 +1,251 @@
+"""
+Convective Cu capture in a stirred melt, from Sherwood correlations.
+
+cu_removal_rate.py (DICTRA) models a particle in stagnant steel: Cu reaches
+it by diffusion alone. Induction- and gas-stirred melts move the steel past
+the particle, so transfer is set by a boundary layer of thickness d / Sh.
+This module is the alternative kinetics engine: with the same boundary
+conditions as the DICTRA runs (bulk at CU_REF_WT, surface at CU_SURFACE_WT)
+a lone particle captures
+
+  m(t) = 4 pi R^2 rho_steel dw (k t + 2 sqrt(D t / pi)),   k = Sh D / d
+
+which for Sh = 2 (no flow) is exactly ladle_model.SphereDiffusion; the sqrt
+term is the diffusive start-up before the boundary layer is established.
+
+Correlations (d = 2R, nu = mu / rho_steel, Sc = nu / D):
+  ranz-marshall   Sh = 2 + 0.6 Re^1/2 Sc^1/3,   Re = u_slip d / nu
+                  u_slip: buoyant rise (terminal velocity, Schiller-Naumann
+                  drag) and the turbulent velocity at the particle scale,
+                  (eps d)^1/3, in quadrature
+  levich          Sh = 2 + 0.52 Re_eps^0.52 Sc^1/3,   Re_eps = eps^1/3 d^4/3 / nu
+                  (Levich / Armenante-Kirwan, particles in isotropic turbulence)
+
+eps is the stirring power per kg of steel (W/kg). D_Cu(T) and mu(T) come
+from diffusivity_fit.py (reference_d_cu, fe_viscosity): the DICTRA value at 1800 K
+carried to other temperatures by Stokes-Einstein, D ~ T / mu(T), with mu(T)
+for liquid Fe from Assael et al. (2006).
+
+capture_mg() is vectorized over temperature, stirring power, radius and time
+at once. SherwoodCapture is a capture law for ladle_model.simulate, like
+DictraCapture; load_laws() gives {T: law} for the DICTRA temperatures (the
+solid-steel ones keep their DICTRA law: there is no flow in FCC steel).
+write_summary() writes the same capture(T, R, t) surface in the schema of
+cu_removal_rate_summary.csv, so anything reading that file can switch to
+convective kinetics by reading this one instead.
+
+  python3 convective_kinetics.py                    DICTRA vs Sherwood table
+  python3 convective_kinetics.py --write            + processed/ summary CSV
+  python3 convective_kinetics.py --power 0.5 --correlation levich --write
+"""
+
+import argparse
+import csv
+import time
+
+import numpy as np
+
+from diffusivity_fit import fe_viscosity, reference_d_cu
+from ladle_model import (CU_REF_WT, CU_SURFACE_WT, LIQUIDUS_K, RHO_STEEL,
+                         SHERWOOD_CSV, SUMMARY_CSV, load_laws as load_dictra_laws)
+
+SHELL_WIDTH_M = 5e-3       # steel shell of the DICTRA runs (cu_removed_shell_pct)
+
+G = 9.81                   # m/s2
+
+POWER_W_KG = 0.1           # default stirring power (induction furnace)
+RHO_OXIDE = 5240           # kg/m3, Fe2O3 (buoyant slip)
+CORRELATIONS = ("ranz-marshall", "levich")
+
+
+# ============================================================================
+# Melt properties
+# ============================================================================
+
+def rise_velocity(d_m, temp_K, rho_oxide=RHO_OXIDE, n_iter=30):
+    """
+    Terminal rise (or settling) velocity, m/s, with the Schiller-Naumann
+    drag C_D = 24 / Re (1 + 0.15 Re^0.687); Stokes for small particles.
+    """
+    mu = fe_viscosity(temp_K)
+    drho = abs(RHO_STEEL - rho_oxide)
+    u = drho * G * d_m ** 2 / (18 * mu)                      # Stokes
+    for _ in range(n_iter):
+        re = RHO_STEEL * u * d_m / mu
+        u_new = drho * G * d_m ** 2 / (18 * mu * (1 + 0.15 * re ** 0.687))
+        u = np.sqrt(u * u_new)                               # damped
+    return u
+
+
+# ============================================================================
+# Sherwood number and capture
+# ============================================================================
+
+def sherwood(radius_um, temp_K, power_W_kg, correlation="ranz-marshall",
+             D_m2_s=None, rho_oxide=RHO_OXIDE, slip_m_s=None):
+    """
+    Sh for the broadcast of radius_um, temp_K and power_W_kg. slip_m_s
+    overrides the ranz-marshall slip velocity.
+    """
+    d = 2e-6 * np.asarray(radius_um, dtype=float)
+    mu = fe_viscosity(temp_K)
+    nu = mu / RHO_STEEL
+    D = reference_d_cu(temp_K, "LIQUID") if D_m2_s is None else np.asarray(D_m2_s, dtype=float)
+    sc13 = np.cbrt(nu / D)
+    eps = np.asarray(power_W_kg, dtype=float)
+    if correlation == "ranz-marshall":
+        if slip_m_s is None:
+            u_rise = rise_velocity(d, temp_K, rho_oxide)
+            u_turb = np.cbrt(eps * d)
+            slip_m_s = np.hypot(u_rise, u_turb)
+        return 2 + 0.6 * np.sqrt(slip_m_s * d / nu) * sc13
+    if correlation == "levich":
+        return 2 + 0.52 * (np.cbrt(eps) * d ** (4 / 3) / nu) ** 0.52 * sc13
+    raise ValueError("correlation must be one of %s" % ", ".join(CORRELATIONS))
+
+
+def capture_mg(radius_um, temp_K, t_s, power_W_kg=POWER_W_KG,
+               correlation="ranz-marshall", ref_wt=CU_REF_WT,
+               surface_wt=CU_SURFACE_WT, D_m2_s=None, **kw):
+    """
+    Lone-particle capture (mg), shape (n_T, n_power, n_R, n_t) for 1-D
+    temp_K, power_W_kg, radius_um and t_s (scalars count as length 1).
+    D_m2_s (scalar, or shaped like temp_K[:, None, None, None]) replaces
+    reference_d_cu(T); other keywords go to sherwood().
+    """
+    T = np.atleast_1d(np.asarray(temp_K, dtype=float))[:, None, None, None]
+    P = np.atleast_1d(np.asarray(power_W_kg, dtype=float))[None, :, None, None]
+    R = np.atleast_1d(np.asarray(radius_um, dtype=float))[None, None, :, None]
+    t = np.atleast_1d(np.asarray(t_s, dtype=float))[None, None, None, :]
+    D = reference_d_cu(T, "LIQUID") if D_m2_s is None else np.asarray(D_m2_s, dtype=float)
+    r_m = R * 1e-6
+    k = sherwood(R, T, P, correlation, D_m2_s=D, **kw) * D / (2 * r_m)
+    dc = RHO_STEEL * (ref_wt - surface_wt) / 100             # kg/m3
+    kg = 4 * np.pi * r_m ** 2 * dc * (k * t + 2 * np.sqrt(D * t / np.pi))
+    return kg * 1e6
+
+
+class SherwoodCapture:
+    """Capture law for ladle_model.simulate at one temperature and stirring power."""
+
+    ref_wt = CU_REF_WT
+    surface_wt = CU_SURFACE_WT
+
+    def __init__(self, temp_K, power_W_kg=POWER_W_KG, correlation="ranz-marshall",
+                 **kw):
+        self.temp_K = temp_K
+        self.power_W_kg = power_W_kg
+        self.correlation = correlation
+        self.kw = kw
+
+    def captured_mg(self, radius_um, t_s):
+        """(n_radii, n_times) capture of a lone particle, f(R, t)."""
+        return capture_mg(radius_um, self.temp_K, t_s, self.power_W_kg,
+                          self.correlation, **self.kw)[0, 0]
+
+    def sherwood(self, radius_um):
+        return sherwood(radius_um, self.temp_K, self.power_W_kg, self.correlation,
+                        **self.kw)
+
+
+def load_laws(power_W_kg=POWER_W_KG, correlation="ranz-marshall", path=SUMMARY_CSV):
+    """
+    {temp_K: law} over the DICTRA temperatures: SherwoodCapture for liquid
+    steel, the DICTRA law itself below the liquidus.
+    """
+    laws = load_dictra_laws(path)
+    return {T: (SherwoodCapture(T, power_W_kg, correlation) if T > LIQUIDUS_K else law)
+            for T, law in laws.items()}
+
+
+# ============================================================================
+# Summary CSV in the DICTRA schema
+# ============================================================================
+
+def write_summary(out=SHERWOOD_CSV, power_W_kg=POWER_W_KG,
+                  correlation="ranz-marshall", path=SUMMARY_CSV):
+    """
+    Copy cu_removal_rate_summary.csv with the liquid rows recomputed from
+    the correlation: cu_captured_mg, cu_removed_shell_pct, and
+    depletion_depth_um as the boundary layer thickness d / Sh. One
+    capture_mg() call covers every liquid row.
+    """
+    with open(path) as f:
+        reader = csv.DictReader(f)
+        fields = reader.fieldnames
+        rows = list(reader)
+    liquid = [r for r in rows if int(r["temp_K"]) > LIQUIDUS_K]
+    temps = sorted({int(r["temp_K"]) for r in liquid})
+    radii = sorted({float(r["radius_um"]) for r in liquid})
+    times = sorted({float(r["time_s"]) for r in liquid})
+    mg = capture_mg(radii, temps, times, power_W_kg, correlation)[:, 0]
+    sh = sherwood(np.array(radii)[None, :], np.array(temps, dtype=float)[:, None],
+                  power_W_kg, correlation)
+    for r in liquid:
+        i, j = temps.index(int(r["temp_K"])), radii.index(float(r["radius_um"]))
+        k = times.index(float(r["time_s"]))
+        R = radii[j] * 1e-6
+        shell_cu_mg = (RHO_STEEL * 4 / 3 * np.pi * ((R + SHELL_WIDTH_M) ** 3 - R ** 3)
+                       * CU_REF_WT / 100 * 1e6)
+        r["cu_captured_mg"] = repr(float(mg[i, j, k]))
+        r["cu_removed_shell_pct"] = repr(float(mg[i, j, k] / shell_cu_mg * 100))
+        r["depletion_depth_um"] = repr(float(2 * radii[j] / sh[i, j]))
+    out.parent.mkdir(parents=True, exist_ok=True)
+    with open(out, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=fields)
+        writer.writeheader()
+        writer.writerows(rows)
+    return len(liquid)
+
+
+# ============================================================================
+# MAIN
+# ============================================================================
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Sherwood-correlation Cu capture for stirred melts")
+    parser.add_argument("--power", type=float, default=POWER_W_KG,
+                        help="stirring power, W per kg steel (default %(default)s)")
+    parser.add_argument("--correlation", choices=CORRELATIONS, default="ranz-marshall")
+    parser.add_argument("--write", action="store_true",
+                        help="write %s" % SHERWOOD_CSV.name)
+    args = parser.parse_args()
+
+    dictra = load_dictra_laws()
+    T = 1823 if 1823 in dictra else max(dictra)
+    radii = [25, 50, 100, 250, 500]
+    powers = [0.0, 0.01, args.power, 1.0] if args.power not in (0.0, 0.01, 1.0) \
+        else [0.0, 0.01, 0.1, 1.0]
+
+    print("=" * 75)
+    print("Convective Cu capture (%s), T = %d K, t = 30 min" % (args.correlation, T))
+    print("=" * 75)
+    print("mu_Fe = %.2f mPa s, D_Cu = %.2e m2/s, Sc = %.0f\n" % (
+        fe_viscosity(T) * 1e3, reference_d_cu(T, "LIQUID"),
+        fe_viscosity(T) / RHO_STEEL / reference_d_cu(T, "LIQUID")))
+    mg = capture_mg(radii, T, [1800], powers, args.correlation)[0, :, :, 0]
+    sh = sherwood(np.array(radii)[None, :], T, np.array(powers)[:, None],
+                  args.correlation)
+    print("%6s %10s" % ("R(um)", "DICTRA mg") + "".join(
+        " %18s" % ("%g W/kg: mg (Sh)" % p) for p in powers))
+    dictra_mg = dictra[T].captured_mg(radii, [1800])[:, 0]
+    for j, R in enumerate(radii):
+        print("%6d %10.4f" % (R, dictra_mg[j]) + "".join(
+            " %11.4f (%4.1f)" % (mg[i, j], sh[i, j]) for i in range(len(powers))))
+
+    # Whole surface: 11 T x 50 powers x 200 radii x 100 times in one call
+    t0 = time.perf_counter()
+    capture_mg(np.geomspace(10, 1000, 200), np.arange(1823, 1924, 10),
+               np.geomspace(1, 1800, 100), np.geomspace(1e-3, 10, 50), args.correlation)
+    print("\n11 x 50 x 200 x 100 capture surface in %.0f ms" % (
+        (time.perf_counter() - t0) * 1000))
+
+    if args.write:
+        n = write_summary(power_W_kg=args.power, correlation=args.correlation)
+        print("Saved: %s (%d liquid rows recomputed, %g W/kg)" % (
+            SHERWOOD_CSV, n, args.power))
+
+
+if __name__ == "__main__":
+    main()
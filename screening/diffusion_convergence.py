@@ -0,0 +1,392 @@
+"""
+Accuracy vs cost of the DICTRA particle-model settings.
+
+cu_removal_rate.py's grid (type, number of points), shell width and time-step
+control were picked by hand. This harness reruns a few representative
+(T, R, t) cases over a factorial of those settings, measures the cost of
+each run and the error of cu_captured_mg against a Richardson-extrapolated
+reference, and keeps the Pareto front: the settings no cheaper setting beats
+on accuracy. A production sweep can then take the cheapest one that meets a
+stated tolerance.
+
+Two sources of runs, same analysis:
+
+  local    A 1-D spherical finite-volume solver standing in for DICTRA:
+           fixed Cu at the particle surface, closed outer boundary, the same
+           linear / geometric / double-geometric grids and the trapezoidal
+           capture integral as cu_removal_rate.py, implicit Euler with the
+           step grown x2 per step up to a cap of max_dt_pct of the simulated
+           time. D is the DICTRA value (diffusivity_fit.reference_d_cu).
+           Cost = grid nodes x time steps: a run takes about a millisecond,
+           so wall time would rank the settings by timer noise.
+  dictra   data/tcpython/raw/dictra_convergence.csv from the VM script
+           simulations/tcpython/dictra_convergence.py (same cases, same
+           settings, DICTRA's own time stepping capped the same way).
+           Cost = wall time (s) on the VM.
+
+Shell widths are in diffusion lengths of the case, sqrt(D t). Production
+sizes its shell from an upper estimate of D at the longest time, so the
+production shell is at least as wide as the harness one at equal sigmas.
+
+Reference per case: a uniform refinement ladder on a REF_SIGMAS shell. Each
+level halves every cell of a geometric grid (cells x2, factor -> sqrt(factor),
+so the nodes nest) and halves the initial time step and the time-step cap;
+the observed order p = log2((q1 - q2) / (q2 - q3)) extrapolates q3. A graded
+grid is needed here: near steady state the profile scales with R, not
+sqrt(D t), and a linear ladder converges too slowly for small particles.
+The reference's own error estimate is |q_ref - q3|; tolerances below it
+cannot be resolved.
+
+  python3 diffusion_convergence.py                  local runs, Pareto table
+  python3 diffusion_convergence.py --tol 0.005      + cheapest setting within 0.5 %
+  python3 diffusion_convergence.py --source dictra  analyse the VM runs
+
+Writes processed/diffusion_convergence_<source>.csv (every setting, with its
+worst-case error, total cost over the cases and a Pareto flag).
+"""
+
+import argparse
+import csv
+import itertools
+import math
+import sys
+from pathlib import Path
+
+import numpy as np
+from scipy.linalg import solve_banded
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(SCRIPT_DIR))
+from diffusivity_fit import reference_d_cu  # noqa: E402
+
+DATA_DIR = SCRIPT_DIR.parent / "data" / "tcpython"
+DICTRA_RUNS_CSV = DATA_DIR / "raw" / "dictra_convergence.csv"
+OUT_CSV = DATA_DIR / "processed" / "diffusion_convergence_%s.csv"
+
+# Same setup as cu_removal_rate.py
+CU_INIT_WT = 0.30
+CU_SURFACE_WT = 0.01
+RHO_STEEL = 7000.0
+GEOMETRIC_FACTOR = 1.08
+UPPER_GEOMETRIC_FACTOR = 0.95
+
+# Representative cases (T K, R um, t s): both phases, both ends of R and t.
+# Keep in step with simulations/tcpython/dictra_convergence.py.
+CASES = [
+    (1723, 25, 60),        # FCC, small particle, short: thin layer
+    (1798, 500, 1800),     # FCC, large particle, long
+    (1823, 25, 1800),      # LIQUID, small particle near steady state
+    (1923, 500, 60),       # LIQUID, large particle, short
+]
+
+# Settings factorial
+GRIDS = ("linear", "geometric", "double-geometric")
+POINTS = (10, 20, 40, 80)
+SHELL_SIGMAS = (3.0, 4.5, 6.0)
+MAX_DT_PCT = (20.0, 10.0, 5.0)
+
+# Reference ladder: (points, max_dt_pct) per level on a geometric grid with
+# REF_FACTOR at level 1; each level refines every cell and time step by 2
+REF_SIGMAS = 12.0
+REF_LADDER = ((81, 2.0), (161, 1.0), (321, 0.5))
+REF_FACTOR = 1.05
+
+DT_INITIAL_S = 1e-6
+DT_GROWTH = 2.0
+
+COST_UNIT = {"local": "node-steps", "dictra": "wall (s)"}
+
+RUN_FIELDS = ["case", "temp_K", "radius_um", "time_s", "D_m2_s", "grid",
+              "points", "shell_sigmas", "shell_um", "max_dt_pct", "level",
+              "cu_captured_mg", "cost"]
+OUT_FIELDS = ["grid", "points", "shell_sigmas", "max_dt_pct", "max_rel_err",
+              "worst_case", "cost", "pareto"]
+
+
+# ============================================================================
+# Local stand-in for the DICTRA run
+# ============================================================================
+
+def grid_nodes(n, kind, width_m, factor=GEOMETRIC_FACTOR,
+               upper=UPPER_GEOMETRIC_FACTOR):
+    """
+    n node positions (distance from the particle surface, m) over width_m,
+    as DICTRA's CalculatedGrid builds them: cell sizes equal (linear), growing
+    by `factor` (geometric), or growing over the first half and shrinking by
+    `upper` over the second (double-geometric).
+    """
+    cells = n - 1
+    if kind == "linear":
+        h = np.ones(cells)
+    elif kind == "geometric":
+        h = factor ** np.arange(cells)
+    elif kind == "double-geometric":
+        lower = cells // 2
+        h = np.concatenate([factor ** np.arange(lower),
+                            factor ** (lower - 1)
+                            * upper ** np.arange(1, cells - lower + 1)])
+    else:
+        raise ValueError("unknown grid type %r" % kind)
+    return np.concatenate([[0.0], np.cumsum(h)]) * width_m / h.sum()
+
+
+def solve_sphere(radius_um, t_s, D, x_m, max_dt_pct, dt_initial=DT_INITIAL_S):
+    """
+    Cu profile (mass fraction) at t_s around a particle of radius_um, on the
+    nodes x_m, and the number of time steps taken. Vertex-centred finite
+    volumes in spherical coordinates, node 0 held at the surface
+    composition, zero flux at the last node.
+    """
+    r = radius_um * 1e-6 + x_m
+    faces = 0.5 * (r[1:] + r[:-1])
+    edges = np.concatenate([[r[0]], faces, [r[-1]]])
+    vol = (edges[1:] ** 3 - edges[:-1] ** 3) / 3
+    cond = D * faces ** 2 / np.diff(r)             # face conductances
+
+    c = np.full(len(r), CU_INIT_WT / 100)
+    c[0] = CU_SURFACE_WT / 100
+    vol_u = vol[1:]
+    g_left = cond                                  # between node i-1 and i
+    g_right = np.append(cond[1:], 0.0)             # closed outer boundary
+    n = len(vol_u)
+    t, dt, dt_max = 0.0, dt_initial, max_dt_pct / 100 * t_s
+    ab = np.zeros((3, n))
+    steps = 0
+    while t < t_s * (1 - 1e-12):
+        dt = min(dt, dt_max, t_s - t)
+        ab[0, 1:] = -g_right[:-1] * dt
+        ab[1] = vol_u + (g_left + g_right) * dt
+        ab[2, :-1] = -g_left[1:] * dt
+        rhs = vol_u * c[1:]
+        rhs[0] += g_left[0] * dt * c[0]
+        c[1:] = solve_banded((1, 1), ab, rhs)
+        t += dt
+        dt *= DT_GROWTH
+        steps += 1
+    return c, steps
+
+
+def captured_mg(radius_um, x_m, c):
+    """Trapezoidal capture integral, as cu_removal_rate.py computes it."""
+    r = radius_um * 1e-6 + x_m
+    r_mid = 0.5 * (r[1:] + r[:-1])
+    dc = CU_INIT_WT / 100 - c
+    dc_mid = 0.5 * (dc[1:] + dc[:-1])
+    return float(np.sum(dc_mid * RHO_STEEL * 4 * np.pi * r_mid ** 2 * np.diff(r))) * 1e6
+
+
+def ladder_factor(level):
+    """Geometric factor of reference level 1, 2, ... (nested refinement)."""
+    return REF_FACTOR ** (0.5 ** (level - 1))
+
+
+def run_local(case, grid, points, sigmas, max_dt_pct, level=0):
+    """
+    One stand-in run as a RUN_FIELDS row (cost = nodes x time steps).
+    level > 0 is a rung of the reference ladder.
+    """
+    temp_K, radius_um, t_s = CASES[case]
+    D = reference_d_cu(temp_K)
+    width = sigmas * math.sqrt(D * t_s)
+    if level:
+        x = grid_nodes(points, grid, width, factor=ladder_factor(level))
+        dt0 = DT_INITIAL_S * 0.5 ** (level - 1)
+    else:
+        x = grid_nodes(points, grid, width)
+        dt0 = DT_INITIAL_S
+    c, steps = solve_sphere(radius_um, t_s, D, x, max_dt_pct, dt0)
+    return {"case": case, "temp_K": temp_K, "radius_um": radius_um,
+            "time_s": t_s, "D_m2_s": D, "grid": grid, "points": points,
+            "shell_sigmas": sigmas, "shell_um": width * 1e6,
+            "max_dt_pct": max_dt_pct, "level": "ref%d" % level if level else "",
+            "cu_captured_mg": captured_mg(radius_um, x, c), "cost": points * steps}
+
+
+def local_runs():
+    """The full factorial plus the reference ladder, on the stand-in."""
+    rows = []
+    for case in range(len(CASES)):
+        for level, (points, pct) in enumerate(REF_LADDER, 1):
+            rows.append(run_local(case, "geometric", points, REF_SIGMAS, pct,
+                                  level))
+        for grid, points, sigmas, pct in itertools.product(
+                GRIDS, POINTS, SHELL_SIGMAS, MAX_DT_PCT):
+            rows.append(run_local(case, grid, points, sigmas, pct))
+    return rows
+
+
+def load_runs(path=DICTRA_RUNS_CSV):
+    """Runs written by dictra_convergence.py; failed runs are dropped."""
+    with open(path) as f:
+        rows = list(csv.DictReader(f))
+    out = []
+    for r in rows:
+        q = float(r["cu_captured_mg"])
+        if q == -1:
+            continue
+        out.append({**r, "case": int(r["case"]), "points": int(r["points"]),
+                    "shell_sigmas": float(r["shell_sigmas"]),
+                    "max_dt_pct": float(r["max_dt_pct"]),
+                    "cu_captured_mg": q, "cost": float(r["wall_s"])})
+    return out
+
+
+# ============================================================================
+# Analysis
+# ============================================================================
+
+def richardson(q1, q2, q3):
+    """
+    Extrapolate a three-level ladder (coarse to fine, refinement ratio 2).
+    Returns (q_ref, observed order or nan, error estimate of q_ref).
+    Non-monotone ladders fall back to q3 with |q3 - q2| as the error.
+    """
+    d12, d23 = q1 - q2, q2 - q3
+    if d23 == 0:
+        return q3, math.nan, 0.0
+    ratio = d12 / d23
+    if ratio <= 1:
+        return q3, math.nan, abs(d23)
+    q_ref = q3 + d23 / (ratio - 1)
+    return q_ref, math.log2(ratio), abs(q_ref - q3)
+
+
+def references(rows):
+    """{case: (q_ref, order, error)} from the ref1..ref3 rows."""
+    refs = {}
+    for case in sorted({r["case"] for r in rows}):
+        ladder = {r["level"]: r["cu_captured_mg"] for r in rows
+                  if r["case"] == case and r["level"]}
+        if len(ladder) < len(REF_LADDER):
+            continue
+        refs[case] = richardson(*(ladder["ref%d" % k]
+                                  for k in range(1, len(REF_LADDER) + 1)))
+    return refs
+
+
+def pareto_table(rows, refs):
+    """
+    One row per setting that ran on every referenced case: worst relative
+    error over the cases, total cost, and whether it is on the Pareto
+    front (no setting at most as expensive is strictly more accurate).
+    """
+    settings = {}
+    for r in rows:
+        if r["level"] or r["case"] not in refs:
+            continue
+        key = (r["grid"], r["points"], r["shell_sigmas"], r["max_dt_pct"])
+        settings.setdefault(key, []).append(r)
+    table = []
+    for key, runs in settings.items():
+        if {r["case"] for r in runs} != set(refs):
+            continue
+        errs = [abs(r["cu_captured_mg"] / refs[r["case"]][0] - 1) for r in runs]
+        worst = int(np.argmax(errs))
+        table.append(dict(zip(OUT_FIELDS[:4], key),
+                          max_rel_err=max(errs), worst_case=runs[worst]["case"],
+                          cost=sum(r["cost"] for r in runs), pareto=0))
+    table.sort(key=lambda s: (s["cost"], s["max_rel_err"]))
+    best = math.inf
+    for s in table:
+        if s["max_rel_err"] < best:
+            s["pareto"] = 1
+            best = s["max_rel_err"]
+    return table
+
+
+def cheapest(table, tol):
+    """Cheapest setting with max_rel_err <= tol, or None."""
+    ok = [s for s in table if s["max_rel_err"] <= tol]
+    return min(ok, key=lambda s: (s["cost"], s["max_rel_err"])) if ok else None
+
+
+def write_csv(table, path):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=OUT_FIELDS)
+        writer.writeheader()
+        for s in table:
+            writer.writerow({**s, "max_rel_err": "%.4e" % s["max_rel_err"],
+                             "cost": "%.6g" % s["cost"]})
+
+
+def flags(s):
+    """cu_removal_rate.py options for a setting."""
+    return "--grid %s --points %d --shell-sigmas %g --max-dt-pct %g" % (
+        s["grid"], s["points"], s["shell_sigmas"], s["max_dt_pct"])
+
+
+# ============================================================================
+# MAIN
+# ============================================================================
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Accuracy vs cost of the DICTRA grid, shell and "
+                    "time-step settings")
+    parser.add_argument("--source", choices=("local", "dictra"), default="local",
+                        help="finite-volume stand-in, or the VM runs "
+                             "(raw/dictra_convergence.csv)")
+    parser.add_argument("--tol", type=float, default=None,
+                        help="relative error target on cu_captured_mg "
+                             "(e.g. 0.01); prints the cheapest setting")
+    args = parser.parse_args()
+
+    if args.source == "dictra":
+        if not DICTRA_RUNS_CSV.exists():
+            sys.exit("No %s yet: run simulations/tcpython/dictra_convergence.py "
+                     "on the VM" % DICTRA_RUNS_CSV)
+        rows = load_runs()
+    else:
+        rows = local_runs()
+
+    refs = references(rows)
+    table = pareto_table(rows, refs)
+
+    print("=" * 78)
+    print("Convergence of cu_captured_mg (%s runs)" % args.source)
+    print("=" * 78)
+    print("%4s %6s %6s %6s %12s %12s %8s %10s" % (
+        "case", "T (K)", "R (um)", "t (s)", "D (m2/s)", "q_ref (mg)",
+        "order", "ref err"))
+    for case, (q, p, err) in refs.items():
+        T, R, t = CASES[case]
+        print("%4d %6d %6d %6d %12.3e %12.5e %8.2f %10.1e" % (
+            case, T, R, t, reference_d_cu(T), q, p, err / q))
+    if not refs:
+        sys.exit("No complete reference ladder in the runs")
+    ref_err = max(err / q for q, _, err in refs.values())
+
+    front = [s for s in table if s["pareto"]]
+    print()
+    print("Pareto front (%d of %d settings; error = worst case over %d cases)" % (
+        len(front), len(table), len(refs)))
+    print("%-17s %6s %7s %7s %11s %6s %12s" % (
+        "grid", "points", "sigmas", "dt %", "max error", "worst", COST_UNIT[args.source]))
+    for s in front:
+        print("%-17s %6d %7g %7g %10.2e %6d %12.6g" % (
+            s["grid"], s["points"], s["shell_sigmas"], s["max_dt_pct"],
+            s["max_rel_err"], s["worst_case"], s["cost"]))
+
+    if args.tol is not None:
+        print()
+        if args.tol < ref_err:
+            print("WARNING: tolerance %.1e is below the reference's own error "
+                  "estimate (%.1e)" % (args.tol, ref_err))
+        pick = cheapest(table, args.tol)
+        if pick is None:
+            print("No setting reaches %.2g %%; refine POINTS / MAX_DT_PCT" % (
+                args.tol * 100))
+        else:
+            print("Cheapest within %.2g %%: %.2e error, %.6g %s over the cases" % (
+                args.tol * 100, pick["max_rel_err"], pick["cost"],
+                COST_UNIT[args.source]))
+            print("  cu_removal_rate.py %s" % flags(pick))
+
+    out = Path(str(OUT_CSV) % args.source)
+    write_csv(table, out)
+    print("\nSaved: %s" % out)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,328 @@
+"""
+Reference D_Cu(T) for the screening scripts, and diagnostics of an Arrhenius
+back-fit to the DICTRA profiles.
+
+reference_d_cu() is the one D_Cu(T) of the screening scripts
+(convective_kinetics, multicomponent_diffusion, diffusion_convergence,
+mass_balance_calculator --temp-k). It is not fitted to anything here:
+  LIQUID   D_CU_REF = 9.63e-10 m2/s at 1800 K (the DICTRA value), carried to
+           other temperatures by Stokes-Einstein, D ~ T / mu(T), with mu(T)
+           for liquid Fe from Assael et al. (2006)
+  FCC_A1   Cu in gamma-Fe, D0 = 4.3e-5 m2/s, Q = 280 kJ/mol
+It needs only the standard library and takes numpy arrays, so a quick query
+stays fast.
+
+The back-fit (python3 diffusivity_fit.py) checks whether the 11-temperature
+DICTRA sweep (1673-1923 K) could replace the reference:
+
+  1. Each run (T, R, t) is fitted with the spherical fixed-surface solution
+       w(r, t) = w_b - (w_b - w_s) (R / r) erfc((r - R) / (2 sqrt(D t)))
+     by least squares in ln D: all 220 runs against a grid of D at once,
+     refined by a parabola through the grid minimum. The curvature gives
+     var(ln D) = 2 s^2 / SSE''. Runs whose minimum sits on the edge of the
+     grid (profile insensitive to D) get no weight.
+  2. Runs at one temperature are pooled by inverse variance; the standard
+     error is inflated by the scatter between runs when that is larger.
+  3. ln D vs 1/T per branch (FCC_A1 at and below LIQUIDUS_K, LIQUID above):
+     weighted least squares, confidence intervals from the t distribution
+     (n_T - 2 dof).
+
+A branch would be identified by Q > 0 and a 95 % D0 interval narrower than
+MAX_D0_SPAN; the "status" column of cu_diffusivity_fit_diagnostics.csv
+says which test fails. With the 60-point, 5 mm DICTRA grid neither passes:
+the liquid profiles are quasi-steady from t = 60 s (Q comes out negative)
+and the FCC interval spans eight decades. The captured mass does not help
+either: inverting M = 4 pi R rho dw (D t + 2 R sqrt(D t / pi)) gives a D that
+changes ~25x with R at one temperature, i.e. the grid, not D, sets it. So
+the fit stays a diagnostic until a finer sweep (cu_removal_rate.py defaults)
+is run.
+
+  python3 diffusivity_fit.py                fit, print, write the diagnostics CSV
+  python3 diffusivity_fit.py --at 1850 1700 reference D_Cu at T
+
+From a script:
+  from diffusivity_fit import reference_d_cu, reference_kinetics
+  reference_d_cu(1850)              # m2/s, phase picked by temperature
+  reference_d_cu(temps, "LIQUID")   # arrays need the phase
+  law = reference_kinetics(1850)    # ladle_model.SphereDiffusion with that D
+"""
+
+import argparse
+import csv
+import math
+from pathlib import Path
+
+from ladle_model import CU_REF_WT, LIQUIDUS_K, SphereDiffusion
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+PROC_DIR = SCRIPT_DIR.parent / "data" / "tcpython" / "processed"
+FIT_DIAGNOSTICS_CSV = PROC_DIR / "cu_diffusivity_fit_diagnostics.csv"
+
+R_GAS = 8.314462618        # J/mol/K
+
+
+LOG_D_GRID = (1e-16, 1e-6, 600)     # D range (m2/s) and points of the scan
+LEVEL = 0.95
+MAX_D0_SPAN = 100.0        # widest D0 interval (hi / lo) of an identified fit
+
+# Reference D_Cu
+D_CU_REF = 9.63e-10        # m2/s, liquid Fe at 1800 K (DICTRA Phase 4)
+T_REF_K = 1800
+FCC_D0 = 4.3e-5            # m2/s, Cu in gamma-Fe
+FCC_Q = 280e3              # J/mol
+
+FIELDS = ["phase", "T_min_K", "T_max_K", "n_temps", "n_runs", "D0_m2_s",
+          "Q_kJ_mol", "D0_lo_m2_s", "D0_hi_m2_s", "Q_lo_kJ_mol", "Q_hi_kJ_mol",
+          "var_lnD0", "var_Q", "cov_lnD0_Q", "t_crit", "status"]
+
+
+# ============================================================================
+# Arrhenius law with its uncertainty
+# ============================================================================
+
+class Arrhenius:
+    """D(T) = D0 exp(-Q / RT), Q in J/mol, with the (ln D0, Q) covariance."""
+
+    def __init__(self, phase, D0, Q, var_lnD0, var_Q, cov, t_crit,
+                 T_min=None, T_max=None, n_temps=0, n_runs=0):
+        self.phase = phase
+        self.D0 = D0
+        self.Q = Q
+        self.var_lnD0 = var_lnD0
+        self.var_Q = var_Q
+        self.cov = cov
+        self.t_crit = t_crit
+        self.T_min = T_min
+        self.T_max = T_max
+        self.n_temps = n_temps
+        self.n_runs = n_runs
+
+    def __call__(self, temp_K):
+        return self.D0 * math.exp(-self.Q / (R_GAS * temp_K))
+
+    def rejection(self):
+        """Why the fit does not identify D, or "" if it does."""
+        if self.Q <= 0:
+            return "Q <= 0"
+        span = math.exp(2 * self.t_crit * math.sqrt(self.var_lnD0))
+        if not span <= MAX_D0_SPAN:
+            return "D0 interval spans %.1f decades" % math.log10(span)
+        return ""
+
+    def row(self):
+        half_lnD0 = self.t_crit * math.sqrt(self.var_lnD0)
+        half_Q = self.t_crit * math.sqrt(self.var_Q)
+        return {
+            "phase": self.phase, "T_min_K": self.T_min, "T_max_K": self.T_max,
+            "n_temps": self.n_temps, "n_runs": self.n_runs,
+            "D0_m2_s": "%.6e" % self.D0, "Q_kJ_mol": "%.4f" % (self.Q / 1e3),
+            "D0_lo_m2_s": "%.6e" % (self.D0 * math.exp(-half_lnD0)),
+            "D0_hi_m2_s": "%.6e" % (self.D0 * math.exp(half_lnD0)),
+            "Q_lo_kJ_mol": "%.4f" % ((self.Q - half_Q) / 1e3),
+            "Q_hi_kJ_mol": "%.4f" % ((self.Q + half_Q) / 1e3),
+            "var_lnD0": "%.6e" % self.var_lnD0, "var_Q": "%.6e" % self.var_Q,
+            "cov_lnD0_Q": "%.6e" % self.cov, "t_crit": "%.6f" % self.t_crit,
+            "status": self.rejection() or "ok",
+        }
+
+    @classmethod
+    def from_row(cls, r):
+        return cls(r["phase"], float(r["D0_m2_s"]), float(r["Q_kJ_mol"]) * 1e3,
+                   float(r["var_lnD0"]), float(r["var_Q"]), float(r["cov_lnD0_Q"]),
+                   float(r["t_crit"]), float(r["T_min_K"]), float(r["T_max_K"]),
+                   int(r["n_temps"]), int(r["n_runs"]))
+
+
+def load_fit_diagnostics(path=FIT_DIAGNOSTICS_CSV):
+    """{phase: Arrhenius} from the back-fit diagnostics table."""
+    with open(path) as f:
+        return {r["phase"]: Arrhenius.from_row(r) for r in csv.DictReader(f)}
+
+
+def fe_viscosity(temp_K):
+    """Liquid Fe viscosity (Pa s): log10(mu / mPa s) = -0.7209 + 2694.9 / T."""
+    return 1e-3 * 10 ** (-0.7209 + 2694.9 / temp_K)
+
+
+def phase_at(temp_K):
+    """Steel phase at temp_K: LIQUID above LIQUIDUS_K, FCC_A1 at or below."""
+    return "LIQUID" if temp_K > LIQUIDUS_K else "FCC_A1"
+
+
+def reference_d_cu(temp_K, phase=None):
+    """
+    D_Cu (m2/s) at temp_K: the DICTRA value (LIQUID) or gamma-Fe data
+    (FCC_A1). temp_K may be an array when phase is given.
+    """
+    if (phase or phase_at(temp_K)) == "LIQUID":
+        return D_CU_REF * (temp_K / T_REF_K) * fe_viscosity(T_REF_K) / fe_viscosity(temp_K)
+    return FCC_D0 * math.e ** (-FCC_Q / (R_GAS * temp_K))
+
+
+def reference_kinetics(temp_K, phase=None):
+    """Capture law (ladle_model.SphereDiffusion) with reference_d_cu(temp_K)."""
+    return SphereDiffusion(reference_d_cu(temp_K, phase))
+
+
+# ============================================================================
+# Fitting
+# ============================================================================
+
+def fit_runs(profiles, wb=CU_REF_WT, grid=LOG_D_GRID):
+    """
+    Per-run ln D and its variance from the spherical erfc solution.
+    Returns (ln_D, var_ln_D) arrays over the runs; var is inf where the
+    profile does not pin D down.
+    """
+    import numpy as np
+    from scipy.special import erfc
+
+    p = profiles
+    starts = p.offsets[:-1]
+    counts = np.diff(p.offsets)
+    run = np.repeat(np.arange(len(starts)), counts)
+    R = p.radius_um[run] * 1e-6
+    x = p.dist_um * 1e-6
+    t = p.time_s[run].astype(float)
+    ws = p.cu_wt[starts][run]                   # surface value of each run
+
+    lnD = np.linspace(math.log(grid[0]), math.log(grid[1]), grid[2])
+    h = lnD[1] - lnD[0]
+    shape = (wb - ws)[:, None] * (R / (R + x))[:, None]
+    z = x[:, None] / (2 * np.sqrt(np.exp(lnD)[None, :] * t[:, None]))
+    sse = np.add.reduceat((wb - shape * erfc(z) - p.cu_wt[:, None]) ** 2,
+                          starts, axis=0)
+
+    k = sse.argmin(axis=1)
+    inside = (k > 0) & (k < len(lnD) - 1)
+    kc = np.clip(k, 1, len(lnD) - 2)
+    rows = np.arange(len(k))
+    s0, s1, s2 = sse[rows, kc - 1], sse[rows, kc], sse[rows, kc + 1]
+    curv = (s0 - 2 * s1 + s2) / h ** 2
+    ok = inside & (curv > 0)
+    denom = np.where(ok, s0 - 2 * s1 + s2, 1.0)
+    ln_best = lnD[kc] + np.where(ok, 0.5 * h * (s0 - s2) / denom, 0.0)
+    # Parabola vertex: minimum SSE and residual variance
+    sse_min = np.maximum(s1 - (s0 - s2) ** 2 / (8 * denom), 0.0)
+    s2_res = sse_min / np.maximum(counts - 1, 1)
+    var = np.where(ok, 2 * np.maximum(s2_res, 1e-30) / np.where(ok, curv, 1), np.inf)
+    return ln_best, var
+
+
+def pool_temperatures(temp_K, ln_D, var):
+    """
+    Inverse-variance mean of ln D per temperature. Returns arrays
+    (temps, ln_D, se, n_runs, spread) over the temperatures with usable
+    runs; spread is the standard deviation of log10 D between runs.
+    """
+    import numpy as np
+
+    out = []
+    for T in np.unique(temp_K):
+        m = (temp_K == T) & np.isfinite(var)
+        if not m.any():
+            continue
+        w = 1.0 / var[m]
+        mean = float(w @ ln_D[m] / w.sum())
+        se = math.sqrt(1.0 / w.sum())
+        n = int(m.sum())
+        if n > 1:
+            chi2 = float(w @ (ln_D[m] - mean) ** 2) / (n - 1)
+            se *= math.sqrt(max(chi2, 1.0))
+        out.append((T, mean, se, n, float(np.std(ln_D[m])) / math.log(10)))
+    return tuple(np.array(c) for c in zip(*out))
+
+
+def fit_arrhenius(phase, temps, ln_D, se, n_runs, level=LEVEL):
+    """Weighted least squares of ln D = ln D0 - Q / RT."""
+    import numpy as np
+    from scipy.stats import t as student_t
+
+    X = np.column_stack([np.ones(len(temps)), -1.0 / (R_GAS * temps)])
+    w = 1.0 / se ** 2
+    XtW = X.T * w
+    cov = np.linalg.inv(XtW @ X)
+    beta = cov @ XtW @ ln_D
+    dof = len(temps) - 2
+    if dof > 0:
+        chi2 = float(w @ (ln_D - X @ beta) ** 2) / dof
+        cov = cov * max(chi2, 1.0)
+        t_crit = float(student_t.ppf(0.5 + level / 2, dof))
+    else:
+        t_crit = float("inf")
+    return Arrhenius(phase, math.exp(beta[0]), float(beta[1]), float(cov[0, 0]),
+                     float(cov[1, 1]), float(cov[0, 1]), t_crit,
+                     float(temps.min()), float(temps.max()), len(temps),
+                     int(n_runs.sum()))
+
+
+def fit_all(profiles=None):
+    """
+    Fit both branches. Returns ({phase: Arrhenius}, per-temperature table
+    [(T, phase, D, se_lnD, n_runs, spread_dex)]).
+    """
+    if profiles is None:
+        from profile_metrics import Profiles
+        profiles = Profiles.from_csv()
+    ln_D, var = fit_runs(profiles)
+    temps, ln_means, ses, ns, spread = pool_temperatures(profiles.temp_K, ln_D, var)
+    laws, table = {}, []
+    for phase, sel in (("FCC_A1", temps <= LIQUIDUS_K), ("LIQUID", temps > LIQUIDUS_K)):
+        if sel.sum() < 2:
+            continue
+        laws[phase] = fit_arrhenius(phase, temps[sel], ln_means[sel], ses[sel], ns[sel])
+        table += [(int(T), phase, math.exp(l), s, int(n), sp)
+                  for T, l, s, n, sp in zip(temps[sel], ln_means[sel], ses[sel],
+                                            ns[sel], spread[sel])]
+    return laws, table
+
+
+def write_csv(laws, path=FIT_DIAGNOSTICS_CSV):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=FIELDS)
+        writer.writeheader()
+        for law in laws.values():
+            writer.writerow(law.row())
+
+
+# ============================================================================
+# MAIN
+# ============================================================================
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Reference D_Cu(T) and the Arrhenius back-fit diagnostics")
+    parser.add_argument("--at", type=float, nargs="+", metavar="T_K",
+                        help="only report the reference D_Cu at these temperatures")
+    args = parser.parse_args()
+
+    if args.at:
+        for T in args.at:
+            print("T = %7.1f K  %-6s  D_Cu = %.3e m2/s  (reference)" % (
+                T, phase_at(T), reference_d_cu(T)))
+        return
+
+    laws, table = fit_all()
+    print("=" * 70)
+    print("Back-fit of D_Cu(T) to the DICTRA profiles (diagnostic only)")
+    print("=" * 70)
+    print("%6s %-7s %12s %10s %6s %14s" % ("T (K)", "phase", "D (m2/s)", "se lnD",
+                                           "runs", "spread (dex)"))
+    for T, phase, D, se, n, spread in table:
+        print("%6d %-7s %12.3e %10.3f %6d %14.2f" % (T, phase, D, se, n, spread))
+    print()
+    for law in laws.values():
+        r = law.row()
+        print("%-7s D0 = %.3e m2/s (%s - %s),  Q = %.1f kJ/mol (%s - %s),  "
+              "%d T, %d runs" % (law.phase, law.D0, r["D0_lo_m2_s"], r["D0_hi_m2_s"],
+                                 law.Q / 1e3, r["Q_lo_kJ_mol"], r["Q_hi_kJ_mol"],
+                                 law.n_temps, law.n_runs))
+        print("        %s" % (law.rejection() or "identified"))
+    print("\nThe screening scripts use reference_d_cu() either way.")
+    write_csv(laws)
+    print("\nSaved: %s" % FIT_DIAGNOSTICS_CSV)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,889 @@
+"""
+Cached values for the formulas in the screening workbooks.
+
+build_validation_xlsx.py, build_unified_xlsx.py and build_combined_screening.py
+write every derived value as an Excel formula (=C2-D2, =IF(F14<-10,...)) so
+the arithmetic stays traceable. openpyxl stores those cells with an empty
+<v/> and marks the workbook fullCalcOnLoad, so pandas / openpyxl data_only
+readers see None and Excel recalculates everything on open.
+
+This module evaluates the formula subset those builders emit and writes the
+results into the saved package as cached values, next to the formulas:
+
+  operators   + - * / ^ % & = <> < > <= >=, unary minus
+  references  A1, $A$1, Sheet!A1, 'Sheet name'!A1, A1:B9, $Q:$Q
+  functions   IF IFERROR NOT ISNUMBER ABS LN EXP SQRT PI
+              MIN MAX SUM AVERAGE INDEX MATCH (exact match only)
+
+Formula cells are grouped by column and relative template (=A2-273.15,
+=A3-273.15, ... is one group) and each group is evaluated as numpy arrays
+over all its rows. Groups whose inputs are still uncomputed wait for a later
+pass; anything outside the subset is left uncached, and so is a result that
+is not a real value (empty text, which the builders never write on purpose,
+or NaN / infinity). fullCalcOnLoad is only dropped when every formula in the
+workbook got a real value.
+
+Excel semantics kept: blanks (including styled empty cells) are 0 in
+arithmetic and a formula pointing at one shows 0, text is ignored inside
+MIN/MAX/SUM/AVERAGE ranges, string comparison is case-insensitive, and
+errors (#DIV/0!, #NUM!, #N/A, ...) propagate until IFERROR catches them.
+
+Like incremental_xlsx.py this reads packages written by openpyxl.
+
+Usage:
+  python3 formula_cache.py Validation_Results.xlsx [...]
+
+  import formula_cache
+  n_cached, n_formulas = formula_cache.cache_values(OUTPUT_FILE)
+"""
+
+import argparse
+import math
+import re
+import zipfile
+import xml.etree.ElementTree as ET
+from pathlib import Path
+
+import numpy as np
+
+MAIN_NS = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+DOC_REL_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+
+ET.register_namespace("r", DOC_REL_NS)
+
+
+def _q(tag, ns=MAIN_NS):
+    return "{%s}%s" % (ns, tag)
+
+
+class XlError:
+    """An Excel error value (#DIV/0!, #N/A, ...)."""
+
+    __slots__ = ("code",)
+
+    def __init__(self, code):
+        self.code = code
+
+    def __repr__(self):
+        return self.code
+
+
+DIV0 = XlError("#DIV/0!")
+NUM = XlError("#NUM!")
+VALUE = XlError("#VALUE!")
+NA = XlError("#N/A")
+REF = XlError("#REF!")
+ERRORS = {e.code: e for e in (DIV0, NUM, VALUE, NA, REF)}
+
+
+class Unsupported(Exception):
+    """Formula outside the evaluated subset (left uncached)."""
+
+
+class _Pending(Exception):
+    """A referenced formula cell has no value yet."""
+
+
+# ===========================================================================
+# TOKENS AND TEMPLATES
+# ===========================================================================
+
+_SHEET = r"(?:'(?P<qsheet>(?:[^']|'')+)'|(?P<sheet>[A-Za-z_][\w.]*))!"
+_CELL = r"\$?[A-Z]{1,3}\$?\d+"
+_TOKEN = re.compile(r"""
+    (?P<ws>\s+)
+  | (?P<string>"(?:[^"]|"")*")
+  | (?P<func>[A-Z][A-Z0-9.]*)\(
+  | (?P<ref>(?:%s)?(?:%s(?::%s)?|\$?[A-Z]{1,3}:\$?[A-Z]{1,3}))(?![\w(])
+  | (?P<number>(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?)
+  | (?P<bool>TRUE|FALSE)(?![\w(])
+  | (?P<op><>|<=|>=|[-+*/^&%%=<>(),])
+""" % (_SHEET, _CELL, _CELL), re.VERBOSE)
+_ADDR = re.compile(r"(\$?)([A-Z]{1,3})(\$?)(\d*)")
+
+
+def col_index(letters):
+    n = 0
+    for ch in letters:
+        n = n * 26 + ord(ch) - 64
+    return n
+
+
+def col_letters(n):
+    s = ""
+    while n:
+        n, rem = divmod(n - 1, 26)
+        s = chr(65 + rem) + s
+    return s
+
+
+def split_ref(coord):
+    """'AB12' -> (12, 28)."""
+    m = _ADDR.fullmatch(coord)
+    return int(m.group(4)), col_index(m.group(2))
+
+
+def _address(text, row, col):
+    """One end of a reference, relative to the host cell.
+
+    Returns ((col_abs, col), (row_abs, row)); relative parts are offsets,
+    and a whole-column reference has row None.
+    """
+    m = _ADDR.fullmatch(text)
+    c = col_index(m.group(2))
+    col_part = (True, c) if m.group(1) else (False, c - col)
+    if not m.group(4):
+        return col_part, None
+    r = int(m.group(4))
+    return col_part, ((True, r) if m.group(3) else (False, r - row))
+
+
+def template(formula, row, col):
+    """Tokens of formula with references made relative to (row, col).
+
+    Formulas filled down a column (=A2-273.15, =A3-273.15, ...) share one
+    template, which is what lets a whole column be evaluated at once.
+    """
+    tokens = []
+    pos = 0
+    while pos < len(formula):
+        m = _TOKEN.match(formula, pos)
+        if m is None:
+            raise Unsupported("cannot parse %r at %d" % (formula, pos))
+        pos = m.end()
+        kind = m.lastgroup if m.lastgroup not in ("sheet", "qsheet") else "ref"
+        if kind == "ws":
+            continue
+        if kind == "func":
+            tokens.append(("func", m.group("func")))
+        elif kind == "ref":
+            sheet = m.group("sheet") or m.group("qsheet")
+            sheet = sheet.replace("''", "'") if m.group("qsheet") else sheet
+            text = m.group("ref").rsplit("!", 1)[-1]
+            ends = tuple(_address(t, row, col) for t in text.split(":"))
+            tokens.append(("ref", sheet, ends))
+        elif kind == "string":
+            tokens.append(("string", m.group("string")[1:-1].replace('""', '"')))
+        elif kind == "number":
+            tokens.append(("number", float(m.group("number"))))
+        elif kind == "bool":
+            tokens.append(("bool", m.group("bool") == "TRUE"))
+        else:
+            tokens.append(("op", m.group("op")))
+    return tuple(tokens)
+
+
+# ===========================================================================
+# PARSER
+# ===========================================================================
+
+class _Parser:
+    """Precedence climbing over template tokens; builds a tuple AST.
+
+    Excel precedence, loosest first: comparison, &, + -, * /, ^, unary -, %.
+    """
+
+    COMPARE = ("=", "<>", "<", ">", "<=", ">=")
+
+    def __init__(self, tokens):
+        self.tokens = tokens
+        self.i = 0
+
+    def peek(self):
+        return self.tokens[self.i] if self.i < len(self.tokens) else (None, None)
+
+    def take(self, op=None):
+        tok = self.peek()
+        if op is not None and tok != ("op", op):
+            raise Unsupported("expected %r" % op)
+        self.i += 1
+        return tok
+
+    def parse(self):
+        node = self.compare()
+        if self.i != len(self.tokens):
+            raise Unsupported("trailing tokens")
+        return node
+
+    def _binary(self, ops, operand):
+        node = operand()
+        while self.peek()[0] == "op" and self.peek()[1] in ops:
+            op = self.take()[1]
+            node = ("op", op, node, operand())
+        return node
+
+    def compare(self):
+        return self._binary(self.COMPARE, self.concat)
+
+    def concat(self):
+        return self._binary(("&",), self.additive)
+
+    def additive(self):
+        return self._binary(("+", "-"), self.term)
+
+    def term(self):
+        return self._binary(("*", "/"), self.power)
+
+    def power(self):
+        return self._binary(("^",), self.unary)
+
+    def unary(self):
+        if self.peek() == ("op", "-"):
+            self.take()
+            return ("neg", self.unary())
+        if self.peek() == ("op", "+"):
+            self.take()
+            return self.unary()
+        node = self.primary()
+        while self.peek() == ("op", "%"):
+            self.take()
+            node = ("op", "/", node, ("number", 100.0))
+        return node
+
+    def primary(self):
+        tok = self.take()
+        kind = tok[0]
+        if kind in ("number", "string", "bool"):
+            return tok
+        if kind == "ref":
+            return tok
+        if kind == "func":
+            args = []
+            if self.peek() != ("op", ")"):
+                args.append(self.compare())
+                while self.peek() == ("op", ","):
+                    self.take()
+                    args.append(self.compare())
+            self.take(")")
+            return ("call", tok[1], args)
+        if tok == ("op", "("):
+            node = self.compare()
+            self.take(")")
+            return node
+        raise Unsupported("unexpected token %r" % (tok,))
+
+
+# ===========================================================================
+# VALUES
+# ===========================================================================
+# A column of values is a 1-D array over the rows of a group: float64 when
+# every entry is a number, bool for comparison results, object otherwise
+# (str, bool, None for blank, XlError, float). A range is a _Block.
+
+class _Block:
+    """Cells of a range for every row of a group: object array (n, rows, cols)."""
+
+    def __init__(self, cells):
+        self.cells = cells
+
+
+def _is_number(v):
+    return isinstance(v, (int, float)) and not isinstance(v, bool)
+
+
+def _compact(values):
+    """Object array -> float64 when every entry is a number."""
+    if values.dtype == object and all(type(v) is float or type(v) is int for v in values):
+        return values.astype(float)
+    return values
+
+
+def _objects(values):
+    """Array -> object array of plain Python values."""
+    out = np.empty(len(values), dtype=object)
+    out[:] = values.tolist()
+    return out
+
+
+def _numbers(values):
+    """(float array, errors or None): blanks are 0, numeric text is coerced."""
+    if values.dtype != object:
+        return values.astype(float), None
+    out = np.zeros(len(values))
+    err = np.full(len(values), None, dtype=object)
+    for i, v in enumerate(values):
+        if v is None:
+            continue
+        if isinstance(v, XlError):
+            err[i] = v
+        elif isinstance(v, str):
+            try:
+                out[i] = float(v)
+            except ValueError:
+                err[i] = VALUE
+        else:
+            out[i] = float(v)
+    return out, (err if any(e is not None for e in err) else None)
+
+
+def _with_errors(result, *errors):
+    """Attach per-row errors (first one wins); non-finite results are #NUM!."""
+    bad = ~np.isfinite(result)
+    errors = [e for e in errors if e is not None]
+    if not bad.any() and not errors:
+        return result
+    out = _objects(result)
+    out[bad] = NUM
+    for err in reversed(errors):
+        _overlay(out, err)
+    return out
+
+
+def _overlay(out, err):
+    """Replace entries of object array out where err has an error."""
+    mask = np.array([e is not None for e in err], dtype=bool)
+    out[mask] = err[mask]
+    return out
+
+
+def _truth(values):
+    """(bool array, errors or None) for IF / NOT conditions."""
+    if values.dtype == bool:
+        return values, None
+    if values.dtype != object:
+        return values != 0, None
+    out = np.zeros(len(values), dtype=bool)
+    err = np.full(len(values), None, dtype=object)
+    for i, v in enumerate(values):
+        if isinstance(v, XlError):
+            err[i] = v
+        elif isinstance(v, str):
+            if v.upper() in ("TRUE", "FALSE"):
+                out[i] = v.upper() == "TRUE"
+            else:
+                err[i] = VALUE
+        elif v is not None:
+            out[i] = bool(v)
+    return out, (err if any(e is not None for e in err) else None)
+
+
+def _text(v):
+    if v is None:
+        return ""
+    if isinstance(v, bool):
+        return "TRUE" if v else "FALSE"
+    if isinstance(v, float):
+        return "%d" % v if v.is_integer() and abs(v) < 1e15 else "%.15g" % v
+    return str(v)
+
+
+def _rank(v):
+    return 2 if isinstance(v, bool) else 1 if isinstance(v, str) else 0
+
+
+def _compare1(op, x, y):
+    if isinstance(x, XlError):
+        return x
+    if isinstance(y, XlError):
+        return y
+    blank = {0: 0.0, 1: "", 2: False}
+    if x is None:
+        x = blank[_rank(y)] if y is not None else 0.0
+    if y is None:
+        y = blank[_rank(x)]
+    if _rank(x) != _rank(y):
+        x, y = _rank(x), _rank(y)
+    elif isinstance(x, str):
+        x, y = x.lower(), y.lower()
+    return {"=": x == y, "<>": x != y, "<": x < y, ">": x > y,
+            "<=": x <= y, ">=": x >= y}[op]
+
+
+_NUMERIC_OPS = {
+    "+": np.add, "-": np.subtract, "*": np.multiply, "/": np.divide,
+    "^": np.power,
+}
+_COMPARE_OPS = {
+    "=": np.equal, "<>": np.not_equal, "<": np.less, ">": np.greater,
+    "<=": np.less_equal, ">=": np.greater_equal,
+}
+_UNARY = {"ABS": np.abs, "LN": np.log, "EXP": np.exp, "SQRT": np.sqrt}
+
+
+# ===========================================================================
+# WORKBOOK
+# ===========================================================================
+
+class _Sheet:
+    """Cell values of one worksheet on a dense (row, col) grid, 1-based."""
+
+    def __init__(self, name, part, xml, shared):
+        self.name = name
+        self.part = part
+        self.root = ET.fromstring(xml)
+        cells = {}
+        self.formulas = {}   # (row, col) -> (<c> element, text, <f t=...>)
+        for c in self.root.iter(_q("c")):
+            row, col = split_ref(c.get("r"))
+            f = c.find(_q("f"))
+            if f is not None:
+                self.formulas[(row, col)] = (c, f.text or "", f.get("t"))
+                cells[(row, col)] = None
+            else:
+                cells[(row, col)] = _cell_value(c, shared)
+        n_rows = max([r for r, _ in cells] + [0]) + 1
+        n_cols = max([c for _, c in cells] + [0]) + 1
+        self.values = np.full((n_rows, n_cols), None, dtype=object)
+        self.pending = np.zeros((n_rows, n_cols), dtype=bool)
+        for (r, c), v in cells.items():
+            self.values[r, c] = v
+        for r, c in self.formulas:
+            self.pending[r, c] = True
+
+    def gather(self, rows, cols):
+        """Values at broadcast (rows, cols); blank outside the used range."""
+        rows, cols = np.broadcast_arrays(rows, cols)
+        if (rows < 1).any() or (cols < 1).any():
+            raise Unsupported("reference before A1")
+        inside = (rows < self.values.shape[0]) & (cols < self.values.shape[1])
+        r, c = np.where(inside, rows, 0), np.where(inside, cols, 0)
+        if (self.pending[r, c] & inside).any():
+            raise _Pending()
+        out = self.values[r, c]
+        out[~inside] = None
+        return out
+
+
+def _cell_value(c, shared):
+    t = c.get("t", "n")
+    if t == "inlineStr":
+        if c.find(_q("is")) is None:
+            return None      # styled empty cell, blank to Excel
+        return "".join(el.text or "" for el in c.iter(_q("t")))
+    v = c.find(_q("v"))
+    if v is None or v.text is None:
+        return None
+    if t == "s":
+        return shared[int(v.text)]
+    if t == "b":
+        return v.text == "1"
+    if t == "e":
+        return ERRORS.get(v.text, XlError(v.text))
+    if t == "str":
+        return v.text
+    return float(v.text)
+
+
+class _Book:
+    """Worksheets of an .xlsx package, parsed on first use."""
+
+    def __init__(self, zf):
+        self.zf = zf
+        rels = ET.fromstring(zf.read("xl/_rels/workbook.xml.rels"))
+        targets = {}
+        for r in rels:
+            target = r.get("Target")
+            targets[r.get("Id")] = (target.lstrip("/") if target.startswith("/")
+                                    else "xl/" + target)
+        self.workbook = ET.fromstring(zf.read("xl/workbook.xml"))
+        self.parts = {s.get("name"): targets[s.get(_q("id", DOC_REL_NS))]
+                      for s in self.workbook.iter(_q("sheet"))}
+        self.shared = []
+        if "xl/sharedStrings.xml" in zf.namelist():
+            for si in ET.fromstring(zf.read("xl/sharedStrings.xml")):
+                self.shared.append("".join(t.text or "" for t in si.iter(_q("t"))))
+        self.sheets = {}
+
+    def sheet(self, name):
+        if name not in self.parts:
+            raise Unsupported("no sheet %r" % name)
+        if name not in self.sheets:
+            part = self.parts[name]
+            self.sheets[name] = _Sheet(name, part, self.zf.read(part), self.shared)
+        return self.sheets[name]
+
+
+# ===========================================================================
+# EVALUATION
+# ===========================================================================
+
+class _Group:
+    """Formula cells of one column that share a template."""
+
+    def __init__(self, sheet, col, tokens, rows):
+        self.sheet = sheet
+        self.col = col
+        self.tokens = tokens
+        self.rows = np.asarray(rows)
+        self.ast = None
+
+
+class _Evaluator:
+    def __init__(self, book, group):
+        self.book = book
+        self.group = group
+        self.n = len(group.rows)
+
+    def const(self, v):
+        if isinstance(v, float):
+            return np.full(self.n, v)
+        out = np.empty(self.n, dtype=object)
+        out[:] = [v] * self.n
+        return out
+
+    def _axis(self, part, host):
+        absolute, value = part
+        return value if absolute else host + value
+
+    def ref(self, node):
+        _, sheet_name, ends = node
+        sheet = self.book.sheet(sheet_name or self.group.sheet.name)
+        rows, col = self.group.rows, self.group.col
+        if len(ends) == 1:
+            col_part, row_part = ends[0]
+            r = self._axis(row_part, rows)
+            return _compact(sheet.gather(np.broadcast_to(r, rows.shape),
+                                         self._axis(col_part, col)))
+        (c1, r1), (c2, r2) = ends
+        c1, c2 = sorted((self._axis(c1, col), self._axis(c2, col)))
+        if r1 is None or r2 is None:     # whole columns
+            r1 = np.ones_like(rows)
+            r2 = np.full_like(rows, max(sheet.values.shape[0] - 1, 1))
+        else:
+            r1 = np.broadcast_to(self._axis(r1, rows), rows.shape)
+            r2 = np.broadcast_to(self._axis(r2, rows), rows.shape)
+            r1, r2 = np.minimum(r1, r2), np.maximum(r1, r2)
+        height = r2 - r1
+        if (height != height[0]).any():
+            raise Unsupported("range height varies")
+        grid_rows = r1[:, None] + np.arange(height[0] + 1)[None, :]
+        cells = sheet.gather(grid_rows[:, :, None],
+                             np.arange(c1, c2 + 1)[None, None, :])
+        return _Block(cells)
+
+    def eval(self, node):
+        kind = node[0]
+        if kind == "number" or kind == "string" or kind == "bool":
+            return self.const(node[1])
+        if kind == "ref":
+            value = self.ref(node)
+            if isinstance(value, _Block):
+                raise Unsupported("range used as a value")
+            return value
+        if kind == "neg":
+            x, err = _numbers(self.eval(node[1]))
+            return _with_errors(-x, err)
+        if kind == "op":
+            return self.binary(node[1], self.eval(node[2]), self.eval(node[3]))
+        if kind == "call":
+            return self.call(node[1], node[2])
+        raise Unsupported(kind)
+
+    def binary(self, op, a, b):
+        if op in _NUMERIC_OPS:
+            x, ex = _numbers(a)
+            y, ey = _numbers(b)
+            with np.errstate(all="ignore"):
+                result = _NUMERIC_OPS[op](x, y)
+            if op == "/" and (y == 0).any():
+                div0 = np.full(self.n, None, dtype=object)
+                div0[y == 0] = DIV0
+                return _with_errors(np.where(y == 0, 0.0, result), ex, ey, div0)
+            return _with_errors(result, ex, ey)
+        if op == "&":
+            out = np.empty(self.n, dtype=object)
+            for i, (x, y) in enumerate(zip(a.tolist(), b.tolist())):
+                out[i] = x if isinstance(x, XlError) else \
+                    y if isinstance(y, XlError) else _text(x) + _text(y)
+            return out
+        if a.dtype != object and b.dtype != object:
+            return _COMPARE_OPS[op](a, b)
+        out = np.empty(self.n, dtype=object)
+        out[:] = [_compare1(op, x, y) for x, y in zip(a.tolist(), b.tolist())]
+        return out
+
+    def _select(self, cond, a, b):
+        truth, err = _truth(cond)
+        if a.dtype == b.dtype and a.dtype != object and err is None:
+            return np.where(truth, a, b)
+        out = np.where(truth, _objects(a), _objects(b))
+        if err is not None:
+            _overlay(out, err)
+        return _compact(out)
+
+    def _range_or_value(self, node):
+        return self.ref(node) if node[0] == "ref" else self.eval(node)
+
+    def _aggregate(self, name, args):
+        """MIN/MAX/SUM/AVERAGE: numbers from ranges, coerced scalars."""
+        columns, errors = [], []
+        for arg in args:
+            value = self._range_or_value(arg)
+            if arg[0] == "ref" and not isinstance(value, _Block):
+                value = _Block(_objects(value)[:, None, None])  # A1 acts as A1:A1
+            if isinstance(value, _Block):
+                cells = value.cells.reshape(self.n, -1)
+                block = np.full(cells.shape, np.nan)
+                err = np.full(self.n, None, dtype=object)
+                for (i, j), v in np.ndenumerate(cells):
+                    if isinstance(v, XlError):
+                        err[i] = err[i] or v
+                    elif _is_number(v):
+                        block[i, j] = v
+                columns.append(block)
+                errors.append(err if any(e is not None for e in err) else None)
+            else:
+                x, err = _numbers(value)
+                columns.append(x[:, None])
+                errors.append(err)
+        data = np.concatenate(columns, axis=1) if columns else np.full((self.n, 0), np.nan)
+        count = (~np.isnan(data)).sum(axis=1)
+        with np.errstate(all="ignore"):
+            if name == "SUM":
+                result = np.nansum(data, axis=1)
+            elif name == "AVERAGE":
+                result = np.nansum(data, axis=1) / np.where(count, count, 1)
+            else:
+                fill = np.inf if name == "MIN" else -np.inf
+                reduce = np.min if name == "MIN" else np.max
+                result = np.where(count, reduce(np.where(np.isnan(data), fill, data),
+                                                axis=1, initial=fill), 0.0)
+        if name == "AVERAGE" and (count == 0).any():
+            div0 = np.full(self.n, None, dtype=object)
+            div0[count == 0] = DIV0
+            errors.append(div0)
+        return _with_errors(result, *errors)
+
+    def _index(self, args):
+        block = self._range_or_value(args[0])
+        if not isinstance(block, _Block):
+            raise Unsupported("INDEX of a value")
+        cells = block.cells
+        i, ei = _numbers(self.eval(args[1]))
+        if len(args) > 2:
+            j, ej = _numbers(self.eval(args[2]))
+        elif cells.shape[2] == 1:
+            j, ej = np.ones(self.n), None
+        elif cells.shape[1] == 1:
+            i, ei, j, ej = np.ones(self.n), None, i, ei
+        else:
+            raise Unsupported("INDEX of a 2-D range needs a column")
+        out = np.empty(self.n, dtype=object)
+        for k in range(self.n):
+            if ei is not None and ei[k] is not None:
+                out[k] = ei[k]
+            elif ej is not None and ej[k] is not None:
+                out[k] = ej[k]
+            elif 1 <= i[k] <= cells.shape[1] and 1 <= j[k] <= cells.shape[2]:
+                v = cells[k, int(i[k]) - 1, int(j[k]) - 1]
+                out[k] = 0.0 if v is None else v
+            else:
+                out[k] = REF
+        return _compact(out)
+
+    def _match(self, args):
+        if len(args) > 2:
+            kind = self.eval(args[2])
+            if kind.dtype == object or (kind != 0).any():
+                raise Unsupported("MATCH without exact match")
+        needle = _objects(self.eval(args[0]))
+        block = self._range_or_value(args[1])
+        if not isinstance(block, _Block):
+            raise Unsupported("MATCH in a value")
+        cells = block.cells
+        out = np.empty(self.n, dtype=object)
+        for k in range(self.n):
+            x = needle[k]
+            if isinstance(x, XlError):
+                out[k] = x
+                continue
+            if cells.shape[1] > 1 and cells.shape[2] > 1:
+                out[k] = NA
+                continue
+            out[k] = NA
+            for pos, v in enumerate(cells[k].ravel(), start=1):
+                if v is not None and not isinstance(v, XlError) and \
+                        _rank(v) == _rank(x) and _compare1("=", x, v) is True:
+                    out[k] = float(pos)
+                    break
+        return _compact(out)
+
+    def call(self, name, args):
+        if name == "IF":
+            if len(args) not in (2, 3):
+                raise Unsupported("IF arity")
+            other = self.eval(args[2]) if len(args) == 3 else self.const(False)
+            return self._select(self.eval(args[0]), self.eval(args[1]), other)
+        if name == "IFERROR":
+            value = self.eval(args[0])
+            if value.dtype != object:
+                return value
+            is_err = np.array([isinstance(v, XlError) for v in value], dtype=bool)
+            return self._select(is_err, self.eval(args[1]), value)
+        if name == "NOT":
+            truth, err = _truth(self.eval(args[0]))
+            return ~truth if err is None else _overlay(_objects(~truth), err)
+        if name == "ISNUMBER":
+            value = self.eval(args[0])
+            if value.dtype == object:
+                return np.array([_is_number(v) for v in value], dtype=bool)
+            return np.full(self.n, value.dtype != bool)
+        if name == "PI" and not args:
+            return np.full(self.n, math.pi)
+        if name in _UNARY and len(args) == 1:
+            x, err = _numbers(self.eval(args[0]))
+            with np.errstate(all="ignore"):
+                return _with_errors(_UNARY[name](x), err)
+        if name in ("MIN", "MAX", "SUM", "AVERAGE"):
+            return self._aggregate(name, args)
+        if name == "INDEX" and len(args) in (2, 3):
+            return self._index(args)
+        if name == "MATCH" and len(args) in (2, 3):
+            return self._match(args)
+        raise Unsupported("function %s" % name)
+
+
+def _groups(book):
+    """Formula groups of the loaded sheets, by (sheet, column, template)."""
+    groups = {}
+    for name, sheet in list(book.sheets.items()):
+        for (row, col), (_, text, kind) in sorted(sheet.formulas.items()):
+            try:
+                if kind is not None:      # shared / array formulas
+                    raise Unsupported(kind)
+                key = (name, col, template(text, row, col))
+            except Unsupported:
+                continue
+            groups.setdefault(key, []).append(row)
+    return [_Group(book.sheet(name), col, tokens, rows)
+            for (name, col, tokens), rows in groups.items()]
+
+
+def evaluate(book):
+    """Evaluate every formula group of the loaded sheets.
+
+    Cells that could not be evaluated stay marked in sheet.pending.
+    """
+    todo = _groups(book)
+    while todo:
+        waiting = []
+        for group in todo:
+            try:
+                if group.ast is None:
+                    group.ast = _Parser(group.tokens).parse()
+                values = _Evaluator(book, group).eval(group.ast)
+            except _Pending:
+                waiting.append(group)
+                continue
+            except Unsupported:
+                continue
+            sheet = group.sheet
+            sheet.values[group.rows, group.col] = _objects(values)
+            sheet.pending[group.rows, group.col] = False
+        if len(waiting) == len(todo):
+            # Stuck: a column may depend on itself (running totals), so
+            # retry cell by cell; single cells still stuck form a cycle.
+            if all(len(g.rows) == 1 for g in waiting):
+                break
+            waiting = [_Group(g.sheet, g.col, g.tokens, [r]) for g in waiting
+                       for r in g.rows]
+        todo = waiting
+
+
+# ===========================================================================
+# PACKAGE
+# ===========================================================================
+
+def _tostring(root):
+    ET.register_namespace("", MAIN_NS)
+    return ET.tostring(root)
+
+
+def _store(c, f, value):
+    """Write value as the cached <v> of formula cell c."""
+    for v in c.findall(_q("v")):
+        c.remove(v)
+    c.attrib.pop("t", None)
+    if value is None:
+        value = 0.0          # a formula pointing at a blank shows 0
+    if isinstance(value, XlError):
+        c.set("t", "e")
+        text = value.code
+    elif isinstance(value, bool):
+        c.set("t", "b")
+        text = "1" if value else "0"
+    elif isinstance(value, str):
+        c.set("t", "str")
+        text = value
+    else:
+        value = float(value)
+        text = "%d" % value if value.is_integer() and abs(value) < 1e15 else repr(value)
+    v = ET.Element(_q("v"))
+    v.text = text
+    c.insert(list(c).index(f) + 1, v)
+
+
+def _resolved(value):
+    """False for results that are not a real cell value: empty text (no
+    builder formula yields it, so an input was misread) and NaN / infinity."""
+    if isinstance(value, str):
+        return value != ""
+    if _is_number(value):
+        return math.isfinite(value)
+    return True
+
+
+def cache_values(xlsx_path):
+    """Write cached values for every evaluable formula in xlsx_path.
+
+    Returns (n_cached, n_formulas). The workbook keeps fullCalcOnLoad
+    unless every formula was cached with a real value.
+    """
+    xlsx_path = Path(xlsx_path)
+    with zipfile.ZipFile(xlsx_path) as zf:
+        names = zf.namelist()
+        book = _Book(zf)
+        for name, part in book.parts.items():
+            if part in names and re.search(rb"<f[ >]", zf.read(part)):
+                book.sheet(name)
+        evaluate(book)
+
+        replaced = {}
+        n_formulas = uncached = 0
+        for sheet in list(book.sheets.values()):
+            if not sheet.formulas:
+                continue
+            n_formulas += len(sheet.formulas)
+            for (row, col), (c, _, _) in sheet.formulas.items():
+                if sheet.pending[row, col] or not _resolved(sheet.values[row, col]):
+                    uncached += 1
+                else:
+                    _store(c, c.find(_q("f")), sheet.values[row, col])
+            replaced[sheet.part] = _tostring(sheet.root)
+
+        calc = book.workbook.find(_q("calcPr"))
+        if calc is not None and n_formulas:
+            if uncached:
+                calc.set("fullCalcOnLoad", "1")
+            else:
+                calc.attrib.pop("fullCalcOnLoad", None)
+            replaced["xl/workbook.xml"] = _tostring(book.workbook)
+
+        if replaced:
+            tmp = xlsx_path.with_name(xlsx_path.stem + ".cache.xlsx")
+            with zipfile.ZipFile(tmp, "w", zipfile.ZIP_DEFLATED) as out:
+                for info in zf.infolist():
+                    if info.filename in replaced:
+                        out.writestr(info.filename, replaced[info.filename])
+                    else:
+                        out.writestr(info, zf.read(info.filename))
+    if replaced:
+        tmp.replace(xlsx_path)
+    return n_formulas - uncached, n_formulas
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Cache formula values in .xlsx files.")
+    parser.add_argument("files", nargs="+", type=Path, help="workbooks to update in place")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("Formula cached values")
+    print("=" * 60)
+    for path in args.files:
+        n_cached, n_formulas = cache_values(path)
+        print("  %-40s %5d / %d formulas" % (path.name, n_cached, n_formulas))
+
+
+if __name__ == "__main__":
+    main()
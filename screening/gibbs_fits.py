@@ -0,0 +1,265 @@
+"""
+Piecewise analytic G(T) fits for the oxide Gibbs energy data.
+
+The TC-Python oxide data (oxide_gibbs_long.csv, read through oxide_store.py)
+has every oxide at 31 fixed temperatures (500-2000 K, 50 K steps). This
+script fits each series
+with the usual Shomate/SGTE form
+
+    G(T) = a + b*T + c*T*ln(T) + d*T^2 + e/T
+
+piecewise between phase transitions, and writes the coefficients to a small
+table. Consumers then evaluate G at any temperature directly instead of
+re-reading and interpolating the raw data.
+
+Series fitted for each oxide (store quantity in brackets):
+  GM        G of the oxide phase   (J/mol atoms)   [GM]
+  G_metal   G of the metal          (J/mol)         [G_metal]
+  dG_f      Ellingham dG_f          (J/mol O2)      [dG_per_O2]
+
+Breakpoints: wherever the stable phase set changes (trace GAS ignored).
+Segments with fewer than MIN_POINTS points (phase flicker near a two-phase
+boundary) are merged into the previous segment. A segment that one fit
+still misses by more than SPLIT_TOL_J is split again at its best point,
+which catches transitions of the metal reference that the oxide's phase
+set does not show (Mg/Ca melting and boiling, Pb melting). Segment limits
+are placed midway between the last point of one segment and the first of
+the next, so the segments tile the fitted range. Short segments drop the high-order
+terms (e/T, then T^2) to keep at least one residual degree of freedom.
+
+Output: data/tcpython/processed/gibbs_fits.csv
+  oxide, quantity, T_lo, T_hi, phases, n_points, a, b, c, d, e,
+  rmse_J, max_abs_err_J
+
+Usage:
+  python3 gibbs_fits.py                  (fit and write the table)
+  python3 gibbs_fits.py --check 1800     (evaluate all dG_f at 1800 K)
+
+Other scripts:
+  from gibbs_fits import load_fits, evaluate
+  fits = load_fits()
+  dG = evaluate(fits, "Al2O3", "dG_f", [1000, 1500, 1800])
+"""
+
+import argparse
+import csv
+from pathlib import Path
+
+import numpy as np
+
+from oxide_store import STORE, load_store, pivot
+
+SCRIPT_DIR = Path(__file__).parent
+CSV_OUT = SCRIPT_DIR.parent / "data" / "tcpython" / "processed" / "gibbs_fits.csv"
+
+QUANTITIES = {
+    "GM": "GM",
+    "G_metal": "G_metal",
+    "dG_f": "dG_per_O2",
+}
+COEFFS = ["a", "b", "c", "d", "e"]
+MIN_POINTS = 4
+SPLIT_TOL_J = 200.0  # split a segment further if any point is off by more
+
+FIELDNAMES = ["oxide", "quantity", "T_lo", "T_hi", "phases", "n_points",
+              *COEFFS, "rmse_J", "max_abs_err_J"]
+
+
+# ===========================================================================
+# FITTING
+# ===========================================================================
+
+def basis(T, n_terms=5):
+    """Design matrix [1, T, T ln T, T^2, 1/T] (first n_terms columns)."""
+    T = np.asarray(T, dtype=float)
+    cols = [np.ones_like(T), T, T * np.log(T), T ** 2, 1.0 / T]
+    return np.column_stack(cols[:n_terms])
+
+
+def fit_segment(T, G):
+    """Least-squares fit of one segment. Returns (coeffs[5], rmse, max_err)."""
+    T = np.asarray(T, dtype=float)
+    G = np.asarray(G, dtype=float)
+    n_terms = max(1, min(5, len(T) - 1))
+    A = basis(T, n_terms)
+    # Column scaling keeps the T^2 and 1/T columns from dominating
+    scale = np.abs(A).max(axis=0)
+    sol, *_ = np.linalg.lstsq(A / scale, G, rcond=None)
+    coeffs = np.zeros(5)
+    coeffs[:n_terms] = sol / scale
+    resid = G - basis(T) @ coeffs
+    return coeffs, float(np.sqrt(np.mean(resid ** 2))), float(np.max(np.abs(resid)))
+
+
+def phase_key(phases):
+    """Stable phase set without trace gas ('GAS#1;QUARTZ#1' -> 'QUARTZ')."""
+    names = {p.split("#")[0] for p in phases.split(";") if p}
+    names.discard("GAS")
+    return ";".join(sorted(names))
+
+
+def segments(T, keys):
+    """Split point indices at phase changes, merging segments < MIN_POINTS."""
+    segs = []
+    for i, key in enumerate(keys):
+        if segs and segs[-1][0] == key:
+            segs[-1][1].append(i)
+        else:
+            segs.append([key, [i]])
+
+    merged = []
+    for key, idx in segs:
+        if merged and (len(idx) < MIN_POINTS or merged[-1][0] == key):
+            merged[-1][1].extend(idx)
+        elif merged and len(merged[-1][1]) < MIN_POINTS:
+            merged[-1][1].extend(idx)
+            merged[-1][0] = key
+        else:
+            merged.append([key, idx])
+    return merged
+
+
+def split_by_residual(T, G, idx):
+    """Recursively split idx where one fit misses by more than SPLIT_TOL_J.
+
+    Catches transitions that do not show up in the oxide's phase set
+    (e.g. the metal melting or boiling in a dG_f series).
+    """
+    _, _, max_err = fit_segment(T[idx], G[idx])
+    if max_err <= SPLIT_TOL_J or len(idx) < 2 * MIN_POINTS:
+        return [idx]
+    best = None
+    for k in range(MIN_POINTS, len(idx) - MIN_POINTS + 1):
+        sse = sum(fit_segment(T[part], G[part])[1] ** 2 * len(part)
+                  for part in (idx[:k], idx[k:]))
+        if best is None or sse < best[0]:
+            best = (sse, k)
+    k = best[1]
+    return split_by_residual(T, G, idx[:k]) + split_by_residual(T, G, idx[k:])
+
+
+def fit_series(T, G, keys):
+    """Piecewise fit of one G(T) series. Returns a list of fit dicts."""
+    T = np.asarray(T, dtype=float)
+    G = np.asarray(G, dtype=float)
+    segs = [[key, part] for key, idx in segments(T, keys)
+            for part in split_by_residual(T, G, idx)]
+    fits = []
+    for k, (key, idx) in enumerate(segs):
+        coeffs, rmse, max_err = fit_segment(T[idx], G[idx])
+        lo = T[idx[0]] if k == 0 else 0.5 * (T[segs[k - 1][1][-1]] + T[idx[0]])
+        hi = (T[idx[-1]] if k == len(segs) - 1
+              else 0.5 * (T[idx[-1]] + T[segs[k + 1][1][0]]))
+        fit = {"T_lo": lo, "T_hi": hi, "phases": key, "n_points": len(idx),
+               "rmse_J": rmse, "max_abs_err_J": max_err}
+        fit.update(zip(COEFFS, coeffs))
+        fits.append(fit)
+    return fits
+
+
+def fit_store(path=STORE):
+    """Fit every oxide / quantity in the long-format store."""
+    store = load_store(path)
+    phases = pivot(store, "phases")
+
+    out = []
+    for oxide in store["oxide"].unique():
+        for quantity, store_quantity in QUANTITIES.items():
+            values = pivot(store, store_quantity)
+            if oxide not in values:
+                continue
+            series = values[oxide].dropna()  # failed calculations are absent
+            if len(series) < 2:
+                continue
+            keys = [phase_key(p) if isinstance(p, str) else ""
+                    for p in phases[oxide].reindex(series.index)] \
+                if oxide in phases else [""] * len(series)
+            for fit in fit_series(series.index.values, series.values, keys):
+                out.append({"oxide": oxide, "quantity": quantity, **fit})
+    return out
+
+
+def write_fits(fits, path=CSV_OUT):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=FIELDNAMES)
+        writer.writeheader()
+        for fit in fits:
+            row = dict(fit)
+            for k in COEFFS:
+                row[k] = repr(float(fit[k]))
+            row["rmse_J"] = round(fit["rmse_J"], 2)
+            row["max_abs_err_J"] = round(fit["max_abs_err_J"], 2)
+            writer.writerow(row)
+
+
+# ===========================================================================
+# EVALUATION
+# ===========================================================================
+
+def load_fits(path=CSV_OUT):
+    """{(oxide, quantity): [segment dicts sorted by T_lo]}."""
+    fits = {}
+    with open(path) as f:
+        for r in csv.DictReader(f):
+            seg = {k: float(r[k]) for k in ["T_lo", "T_hi", *COEFFS]}
+            seg["phases"] = r["phases"]
+            fits.setdefault((r["oxide"], r["quantity"]), []).append(seg)
+    for segs in fits.values():
+        segs.sort(key=lambda s: s["T_lo"])
+    return fits
+
+
+def evaluate(fits, oxide, quantity, T):
+    """G(T) in J from the fitted coefficients; NaN outside the fitted range.
+
+    Raises KeyError if the oxide/quantity has no fit.
+    """
+    segs = fits[(oxide, quantity)]
+    T = np.atleast_1d(np.asarray(T, dtype=float))
+    out = np.full(T.shape, np.nan)
+    for seg in segs:
+        mask = (T >= seg["T_lo"]) & (T <= seg["T_hi"]) & np.isnan(out)
+        if mask.any():
+            coeffs = np.array([seg[k] for k in COEFFS])
+            out[mask] = basis(T[mask]) @ coeffs
+    return out
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fit piecewise G(T) coefficients.")
+    parser.add_argument("--check", type=float, default=None, metavar="T_K",
+                        help="print dG_f of every oxide at T_K from the saved table")
+    args = parser.parse_args()
+
+    if args.check is not None:
+        fits = load_fits()
+        for (oxide, quantity) in sorted(fits):
+            if quantity == "dG_f":
+                val = evaluate(fits, oxide, "dG_f", args.check)[0]
+                print("  %-6s  dG_f(%g K) = %8.1f kJ/mol O2" % (oxide, args.check, val / 1000))
+        return
+
+    fits = fit_store()
+    write_fits(fits)
+
+    print("=" * 78)
+    print("Piecewise G(T) fits: a + bT + cT lnT + dT^2 + e/T")
+    print("=" * 78)
+    print("%-6s %-8s %-12s %-32s %4s %9s" % (
+        "Oxide", "Quantity", "T range (K)", "Phases", "n", "RMSE (J)"))
+    print("-" * 78)
+    for fit in fits:
+        print("%-6s %-8s %5.0f-%-6.0f %-32s %4d %9.1f" % (
+            fit["oxide"], fit["quantity"], fit["T_lo"], fit["T_hi"],
+            fit["phases"][:32], fit["n_points"], fit["rmse_J"]))
+    worst = max(fits, key=lambda f: f["max_abs_err_J"])
+    print()
+    print("Segments: %d   Worst point: %.1f J (%s %s, %s)" % (
+        len(fits), worst["max_abs_err_J"], worst["oxide"], worst["quantity"],
+        worst["phases"]))
+    print("Written: %s" % CSV_OUT)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,391 @@
+"""
+Incremental rebuilds for the screening workbooks.
+
+build_unified_xlsx.py, build_validation_xlsx.py and build_combined_screening.py
+used to regenerate every sheet (and re-embed every PNG) on each run. With
+--incremental they instead:
+
+  1. hash the inputs of every tab (source CSVs, embedded figures) and the
+     builder script itself;
+  2. compare against <workbook>.manifest.json written by the previous build
+     (which also records the hash of the workbook it describes);
+  3. build only the stale tabs into a temporary workbook;
+  4. splice those sheets into the existing .xlsx package.
+
+Full and incremental builds both finish with formula_cache.cache_values(),
+so every formula in the saved workbook carries its computed value.
+
+An .xlsx file is a zip of XML parts. Splicing replaces the stale sheet parts
+(and their drawings, charts and images), merges the new cell styles into
+xl/styles.xml and remaps the sheet's style indices. Every other part is
+copied through byte for byte. A change to the builder script, a new or
+missing tab, or a missing workbook/manifest falls back to a full rebuild.
+
+The splice understands packages written by openpyxl (inline strings,
+absolute relationship targets), which is all these scripts produce.
+
+Usage from a builder:
+
+  TABS = [
+      # (key, sheet names, input files)
+      ("dashboard", ["Dashboard"], [CSV_FILES["screening"], *FIGURES.values()]),
+      ...
+  ]
+  incremental_xlsx.run(OUTPUT_FILE, __file__, TABS, build, incremental=True)
+
+where build(keys, path) writes a workbook containing the sheets of `keys`.
+"""
+
+import hashlib
+import json
+import posixpath
+import zipfile
+import xml.etree.ElementTree as ET
+from pathlib import Path
+
+import formula_cache
+
+MAIN_NS = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+REL_NS = "http://schemas.openxmlformats.org/package/2006/relationships"
+DOC_REL_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+CT_NS = "http://schemas.openxmlformats.org/package/2006/content-types"
+
+ET.register_namespace("r", DOC_REL_NS)
+
+# styles.xml sections in schema order
+STYLE_SECTIONS = ("numFmts", "fonts", "fills", "borders", "cellStyleXfs",
+                  "cellXfs", "cellStyles", "dxfs", "tableStyles", "colors", "extLst")
+XF_REFS = {"numFmtId": "numFmts", "fontId": "fonts", "fillId": "fills",
+           "borderId": "borders"}
+
+
+def _q(tag, ns=MAIN_NS):
+    return "{%s}%s" % (ns, tag)
+
+
+def _tostring(root, default_ns):
+    """Serialize with default_ns as the unprefixed namespace, as openpyxl does."""
+    ET.register_namespace("", default_ns)
+    return ET.tostring(root)
+
+
+# ===========================================================================
+# MANIFEST
+# ===========================================================================
+
+def hash_files(paths):
+    """SHA-256 over the names and bytes of paths (missing files count too)."""
+    h = hashlib.sha256()
+    for path in paths:
+        path = Path(path)
+        h.update(path.name.encode())
+        h.update(path.read_bytes() if path.exists() else b"<missing>")
+    return h.hexdigest()
+
+
+def manifest_path(xlsx_path):
+    xlsx_path = Path(xlsx_path)
+    return xlsx_path.with_name(xlsx_path.stem + ".manifest.json")
+
+
+def load_manifest(xlsx_path):
+    path = manifest_path(xlsx_path)
+    if not path.exists():
+        return None
+    with open(path) as f:
+        return json.load(f)
+
+
+def save_manifest(xlsx_path, manifest):
+    with open(manifest_path(xlsx_path), "w") as f:
+        json.dump(manifest, f, indent=2)
+        f.write("\n")
+
+
+def make_manifest(script, tabs):
+    return {
+        "script": hash_files([script]),
+        "sheets": {key: list(sheets) for key, sheets, _ in tabs},
+        "tabs": {key: hash_files(inputs) for key, _, inputs in tabs},
+    }
+
+
+def stale_tabs(xlsx_path, old, new):
+    """Keys to rebuild, or None if only a full rebuild is safe."""
+    if old is None or not Path(xlsx_path).exists():
+        return None
+    if old.get("script") != new["script"] or old.get("sheets") != new["sheets"]:
+        return None
+    # The workbook was replaced since the manifest was written (git pull)
+    if old.get("workbook") != hash_files([xlsx_path]):
+        return None
+    return [key for key in new["tabs"] if old["tabs"].get(key) != new["tabs"][key]]
+
+
+def run(xlsx_path, script, tabs, build, incremental=False):
+    """Full or incremental build of xlsx_path. Returns the rebuilt keys."""
+    xlsx_path = Path(xlsx_path)
+    manifest = make_manifest(script, tabs)
+    stale = stale_tabs(xlsx_path, load_manifest(xlsx_path), manifest) if incremental else None
+
+    if stale is None:
+        keys = [key for key, _, _ in tabs]
+        build(keys, xlsx_path)
+    elif not stale:
+        print(f"\n{xlsx_path.name} is up to date ({len(tabs)} tabs unchanged)")
+        return []
+    else:
+        keys = stale
+        sheets = [s for key in stale for s in manifest["sheets"][key]]
+        print(f"\nIncremental: rebuilding {', '.join(sheets)}")
+        partial = xlsx_path.with_name(xlsx_path.stem + ".partial.xlsx")
+        try:
+            build(stale, partial)
+            splice(xlsx_path, partial, sheets)
+        finally:
+            if partial.exists():
+                partial.unlink()
+    n_cached, n_formulas = formula_cache.cache_values(xlsx_path)
+    if n_formulas:
+        print(f"Cached values: {n_cached}/{n_formulas} formulas")
+    manifest["workbook"] = hash_files([xlsx_path])
+    save_manifest(xlsx_path, manifest)
+    return keys
+
+
+# ===========================================================================
+# PACKAGE SPLICING
+# ===========================================================================
+
+def _sheet_parts(zf):
+    """{sheet name: part name} from workbook.xml and its rels."""
+    rels = ET.fromstring(zf.read("xl/_rels/workbook.xml.rels"))
+    targets = {r.get("Id"): r.get("Target").lstrip("/") for r in rels}
+    wb = ET.fromstring(zf.read("xl/workbook.xml"))
+    return {s.get("name"): targets[s.get(_q("id", DOC_REL_NS))]
+            for s in wb.iter(_q("sheet"))}
+
+
+def _rels_name(part):
+    folder, name = posixpath.split(part)
+    return posixpath.join(folder, "_rels", name + ".rels")
+
+
+def _related(zf, part, names, out=None):
+    """Internal parts reachable from part's rels (drawings, charts, media)."""
+    out = [] if out is None else out
+    rels = _rels_name(part)
+    if rels not in names:
+        return out
+    for r in ET.fromstring(zf.read(rels)):
+        if r.get("TargetMode") == "External":
+            continue
+        target = r.get("Target")
+        target = (target.lstrip("/") if target.startswith("/")
+                  else posixpath.normpath(posixpath.join(posixpath.dirname(part), target)))
+        if target not in out:
+            out.append(target)
+            _related(zf, target, names, out)
+    return out
+
+
+def _free_name(part, taken):
+    """xl/charts/chart3.xml -> first unused xl/charts/chartN.xml."""
+    folder, name = posixpath.split(part)
+    stem, ext = posixpath.splitext(name)
+    base = stem.rstrip("0123456789")
+    n = 1
+    while posixpath.join(folder, f"{base}{n}{ext}") in taken:
+        n += 1
+    return posixpath.join(folder, f"{base}{n}{ext}")
+
+
+def _index(parent, child_tag):
+    return {ET.tostring(el): i for i, el in enumerate(parent.findall(child_tag))}
+
+
+def _section(root, tag):
+    """styles.xml section element, created (in schema order) if missing."""
+    el = root.find(_q(tag))
+    if el is None:
+        later = STYLE_SECTIONS[STYLE_SECTIONS.index(tag) + 1:]
+        pos = next((i for i, child in enumerate(root)
+                    if child.tag in {_q(t) for t in later}), len(root))
+        el = ET.Element(_q(tag))
+        root.insert(pos, el)
+    return el
+
+
+def merge_styles(old_xml, new_xml):
+    """Merge new styles.xml into old. Returns (xml, cellXfs map, dxfs map).
+
+    Identical entries are reused, so repeated splices do not grow the file.
+    """
+    old = ET.fromstring(old_xml)
+    new = ET.fromstring(new_xml)
+    maps = {}
+
+    # Custom number formats are matched by format code
+    old_fmts = _section(old, "numFmts")
+    codes = {f.get("formatCode"): int(f.get("numFmtId")) for f in old_fmts}
+    next_id = max([163] + list(codes.values())) + 1
+    maps["numFmts"] = {}
+    new_fmts = new.find(_q("numFmts"))
+    for f in (new_fmts if new_fmts is not None else []):
+        code = f.get("formatCode")
+        if code not in codes:
+            codes[code] = next_id
+            ET.SubElement(old_fmts, _q("numFmt"), numFmtId=str(next_id), formatCode=code)
+            next_id += 1
+        maps["numFmts"][int(f.get("numFmtId"))] = codes[code]
+
+    def merge_list(section, child, remap=None):
+        dst = _section(old, section)
+        seen = _index(dst, _q(child))
+        src = new.find(_q(section))
+        mapping = {}
+        for i, el in enumerate(src.findall(_q(child)) if src is not None else []):
+            if remap:
+                remap(el)
+            key = ET.tostring(el)
+            if key not in seen:
+                seen[key] = len(seen)
+                dst.append(el)
+            mapping[i] = seen[key]
+        dst.set("count", str(len(seen)))
+        return mapping
+
+    def remap_xf(el):
+        for attr, section in XF_REFS.items():
+            if el.get(attr) is not None:
+                idx = int(el.get(attr))
+                if section == "numFmts":
+                    el.set(attr, str(maps[section].get(idx, idx)))  # built-ins stay
+                else:
+                    el.set(attr, str(maps[section][idx]))
+
+    for section, child in (("fonts", "font"), ("fills", "fill"), ("borders", "border")):
+        maps[section] = merge_list(section, child)
+    style_xfs = merge_list("cellStyleXfs", "xf", remap_xf)
+
+    # Named styles: keep the existing definition when the name is known
+    old_names = _section(old, "cellStyles")
+    known = {cs.get("name") for cs in old_names}
+    new_names = new.find(_q("cellStyles"))
+    for cs in (new_names if new_names is not None else []):
+        if cs.get("name") not in known:
+            cs.set("xfId", str(style_xfs[int(cs.get("xfId"))]))
+            old_names.append(cs)
+    old_names.set("count", str(len(old_names)))
+
+    def remap_cell_xf(el):
+        remap_xf(el)
+        if el.get("xfId") is not None:
+            el.set("xfId", str(style_xfs[int(el.get("xfId"))]))
+
+    cell_xfs = merge_list("cellXfs", "xf", remap_cell_xf)
+    dxfs = merge_list("dxfs", "dxf")
+
+    if len(old_fmts):
+        old_fmts.set("count", str(len(old_fmts)))
+    else:
+        old.remove(old_fmts)
+    return _tostring(old, MAIN_NS), cell_xfs, dxfs
+
+
+def _remap_sheet(xml, cell_xfs, dxfs):
+    """Point a sheet's style (s=) and dxfId attributes at the merged styles."""
+    root = ET.fromstring(xml)
+    for tag in ("c", "row", "col"):
+        for el in root.iter(_q(tag)):
+            if el.get("s") is not None:
+                el.set("s", str(cell_xfs[int(el.get("s"))]))
+            if tag == "col" and el.get("style") is not None:
+                el.set("style", str(cell_xfs[int(el.get("style"))]))
+    for rule in root.iter(_q("cfRule")):
+        if rule.get("dxfId") is not None:
+            rule.set("dxfId", str(dxfs[int(rule.get("dxfId"))]))
+    return _tostring(root, MAIN_NS)
+
+
+def _retarget(rels_xml, renames):
+    root = ET.fromstring(rels_xml)
+    for r in root:
+        target = r.get("Target").lstrip("/")
+        if r.get("TargetMode") != "External" and target in renames:
+            r.set("Target", "/" + renames[target])
+    return _tostring(root, REL_NS)
+
+
+def splice(xlsx_path, partial_path, sheets):
+    """Replace `sheets` in xlsx_path with the same sheets from partial_path."""
+    xlsx_path = Path(xlsx_path)
+    with zipfile.ZipFile(xlsx_path) as zo, zipfile.ZipFile(partial_path) as zn:
+        old_names = set(zo.namelist())
+        new_names = set(zn.namelist())
+        old_sheets = _sheet_parts(zo)
+        new_sheets = _sheet_parts(zn)
+        missing = [s for s in sheets if s not in old_sheets or s not in new_sheets]
+        if missing:
+            raise KeyError(f"cannot splice sheets {missing}: not in both workbooks")
+
+        styles, cell_xfs, dxfs = merge_styles(zo.read("xl/styles.xml"),
+                                              zn.read("xl/styles.xml"))
+
+        # Parts of the replaced sheets that go away, and what replaces them
+        dropped = set()
+        for sheet in sheets:
+            part = old_sheets[sheet]
+            dropped.add(_rels_name(part))
+            dropped.update(_related(zo, part, old_names))
+        taken = old_names - dropped
+        replaced = {"xl/styles.xml": styles}
+        new_types = {}
+        ct_new = ET.fromstring(zn.read("[Content_Types].xml"))
+        overrides = {o.get("PartName").lstrip("/"): o.get("ContentType")
+                     for o in ct_new.findall(_q("Override", CT_NS))}
+
+        for sheet in sheets:
+            src = new_sheets[sheet]
+            dst = old_sheets[sheet]
+            renames = {}
+            for part in _related(zn, src, new_names):
+                renames[part] = _free_name(part, taken)
+                taken.add(renames[part])
+            for part, target in renames.items():
+                data = zn.read(part)
+                if _rels_name(part) in new_names:
+                    replaced[_rels_name(target)] = _retarget(zn.read(_rels_name(part)), renames)
+                replaced[target] = data
+                if part in overrides:
+                    new_types[target] = overrides[part]
+            replaced[dst] = _remap_sheet(zn.read(src), cell_xfs, dxfs)
+            if _rels_name(src) in new_names:
+                replaced[_rels_name(dst)] = _retarget(zn.read(_rels_name(src)), renames)
+
+        # Content types: drop overrides of removed parts, add the new ones
+        ct = ET.fromstring(zo.read("[Content_Types].xml"))
+        for o in ct.findall(_q("Override", CT_NS)):
+            if o.get("PartName").lstrip("/") in dropped - set(replaced):
+                ct.remove(o)
+        extensions = {d.get("Extension") for d in ct.findall(_q("Default", CT_NS))}
+        for d in ct_new.findall(_q("Default", CT_NS)):
+            if d.get("Extension") not in extensions:
+                ct.insert(0, d)
+        for part, content_type in new_types.items():
+            if not any(o.get("PartName") == "/" + part for o in ct.findall(_q("Override", CT_NS))):
+                ET.SubElement(ct, _q("Override", CT_NS), PartName="/" + part,
+                              ContentType=content_type)
+        replaced["[Content_Types].xml"] = _tostring(ct, CT_NS)
+
+        tmp = xlsx_path.with_name(xlsx_path.stem + ".splice.xlsx")
+        with zipfile.ZipFile(tmp, "w", zipfile.ZIP_DEFLATED) as out:
+            for info in zo.infolist():
+                name = info.filename
+                if name in replaced:
+                    out.writestr(name, replaced.pop(name))
+                elif name not in dropped:
+                    out.writestr(info, zo.read(name))  # unchanged: byte for byte
+            for name, data in replaced.items():
+                out.writestr(name, data)
+    tmp.replace(xlsx_path)
@@ -0,0 +1,298 @@
+"""
+Inverse design: the dose, radius, time or temperature that reaches a target.
+
+breakeven_contour.py and experiment_predictor.py answer "what removal do I
+get for this recipe"; this module answers the reverse, "what particle radius
+gets 0.30 -> 0.10 wt% Cu with 5 g Fe2O3 in 10 min at 1850 K?", for one of
+(dose, radius, time, temp) given the other three, over whole arrays of
+scenarios at once.
+
+Forward model (the surrogate). For one particle size the ladle model's
+coupled bulk Cu (ladle_model.simulate) has a closed form: with N particles
+each capturing f(R, t, T) in a bath held at w_ref,
+
+  w(t) - w_s = (w0 - w_s) exp(-100 N f(R, t, T) / (M_steel (w_ref - w_s)))
+
+and, since every particle saturates at once, the stoichiometric limit is a
+plain min() on the captured Cu. f comes from the DICTRA capture surface
+(or the Sherwood one, convective_kinetics.py): log-log in R and t as in
+ladle_model.DictraCapture, log f linear in 1/T within the FCC_A1 or LIQUID
+branch. It matches ladle_model.simulate to within its time stepping
+(< 0.5 % removal). Removal rises with dose, time and temperature and falls with
+radius, so each unknown is found by bisection in log space, vectorized over
+all scenarios (60 halvings; ~1e-15 relative bracket).
+
+Scenarios that cannot reach the target anywhere in BOUNDS are reported, not
+guessed: status "unreachable" (with the limiting factor: stoichiometry,
+kinetics, or the surface Cu floor) or "met at bound" (already met at the
+least favourable end of the range).
+
+  python3 inverse_design.py radius --dose 5 --time 600 --temp 1850
+  python3 inverse_design.py dose --radius 50 100 250 --time 600 1800 --temp 1873
+  python3 inverse_design.py time --dose 5 --radius 100 --temp 1823 1873 1923 \\
+      --oxide SiO2 --cu 0.30 0.10 --kinetics sherwood
+
+From a script (arrays broadcast against each other):
+  from inverse_design import solve
+  res = solve("radius", dose_g=5, time_s=600, temp_K=1850, target_wt=0.10)
+  res["value"], res["status"], res["limited_by"]
+"""
+
+import argparse
+import itertools
+
+import numpy as np
+
+from ladle_model import KINETICS, LIQUIDUS_K, MW_CU, load_laws, particle_mass_g
+from mass_balance_calculator import OXIDES, cu_per_mol
+
+STEEL_KG = 0.5
+CU_INIT_WT = 0.30
+CU_TARGET_WT = 0.10
+
+# Search range per unknown (log-space bisection)
+BOUNDS = {
+    "dose": (0.01, 1000.0),     # g
+    "radius": (5.0, 2000.0),    # um
+    "time": (1.0, 7200.0),      # s
+    "temp": (1673.0, 1923.0),   # K, the DICTRA sweep
+}
+UNKNOWNS = tuple(BOUNDS)
+N_BISECT = 60
+
+
+# ============================================================================
+# Capture surface f(R, t, T), elementwise
+# ============================================================================
+
+class CaptureSurface:
+    """
+    Lone-particle capture at arbitrary (R, t, T), elementwise over
+    broadcast arrays. Same R/t interpolation as DictraCapture; in T, log f
+    is linear in 1/T between the sweep temperatures of one phase and
+    extrapolated from the end segment of that phase.
+    """
+
+    def __init__(self, laws):
+        first = next(iter(laws.values()))
+        self.ln_r = np.log(first.radii_um)
+        self.ln_t = np.log(first.times_s)
+        self.branches = []
+        for liquid in (False, True):
+            temps = sorted(T for T in laws if (T > LIQUIDUS_K) == liquid)
+            if temps:
+                grid = np.stack([laws[T].log_mg for T in temps])   # (n_T, n_R, n_t)
+                # Nodes -1/T ascend with T
+                self.branches.append((liquid, -1.0 / np.array(temps, dtype=float), grid))
+        self.ref_wt = first.ref_wt
+        self.surface_wt = first.surface_wt
+
+    @classmethod
+    def load(cls, kinetics="dictra"):
+        return cls(load_laws(KINETICS[kinetics]))
+
+    @staticmethod
+    def _segment(nodes, q):
+        """Segment index and weight of q on ascending nodes (end segments extend)."""
+        i = np.clip(np.searchsorted(nodes, q) - 1, 0, len(nodes) - 2)
+        return i, (q - nodes[i]) / (nodes[i + 1] - nodes[i])
+
+    def _at_temp_index(self, grid, i, lr, lt):
+        """log f at sweep temperature index i (per element), R and t interpolated."""
+        j, w = self._segment(self.ln_r, lr)
+        k, u = self._segment(self.ln_t, np.maximum(lt, self.ln_t[0]))
+        g = lambda jj, kk: grid[i, jj, kk]
+        at_r = lambda kk: (1 - w) * g(j, kk) + w * g(j + 1, kk)
+        logf = (1 - u) * at_r(k) + u * at_r(k + 1)
+        # ~sqrt(t) before the first saved time
+        return np.where(lt < self.ln_t[0], at_r(0) + 0.5 * (lt - self.ln_t[0]), logf)
+
+    def captured_mg(self, radius_um, time_s, temp_K):
+        R, t, T = np.broadcast_arrays(np.asarray(radius_um, dtype=float),
+                                      np.asarray(time_s, dtype=float),
+                                      np.asarray(temp_K, dtype=float))
+        lr, lt, x = np.log(R), np.log(np.maximum(t, 1e-300)), -1.0 / T
+        out = np.zeros(R.shape)
+        for liquid, nodes, grid in self.branches:
+            sel = (T > LIQUIDUS_K) == liquid
+            if not sel.any():
+                continue
+            if len(nodes) == 1:
+                i = np.zeros(int(sel.sum()), dtype=int)
+                logf = self._at_temp_index(grid, i, lr[sel], lt[sel])
+            else:
+                i, v = self._segment(nodes, x[sel])
+                logf = ((1 - v) * self._at_temp_index(grid, i, lr[sel], lt[sel])
+                        + v * self._at_temp_index(grid, i + 1, lr[sel], lt[sel]))
+            out[sel] = np.exp(logf)
+        return np.where(t > 0, out, 0.0)
+
+
+# ============================================================================
+# Forward model
+# ============================================================================
+
+def oxide_props(oxide):
+    ox = OXIDES[oxide]
+    return ox["rho"], ox["MW_oxide"], cu_per_mol(oxide)
+
+
+def removal(surface, dose_g, radius_um, time_s, temp_K, oxide="Fe2O3",
+            steel_kg=STEEL_KG, cu_init_wt=CU_INIT_WT, detail=False):
+    """
+    Cu removal (%) of the coupled melt, elementwise over broadcast inputs.
+    detail=True also returns the kinetic and stoichiometric limits (mg).
+    """
+    rho, mw, cu_per_mol = oxide_props(oxide)
+    f = surface.captured_mg(radius_um, time_s, temp_K)
+    n = np.asarray(dose_g, dtype=float) / particle_mass_g(radius_um, rho)
+    steel_mg = steel_kg * 1e6
+    ws, span = surface.surface_wt, surface.ref_wt - surface.surface_wt
+    w = ws + (cu_init_wt - ws) * np.exp(-100 * n * f / (steel_mg * span))
+    kinetic_mg = (cu_init_wt - w) * steel_mg / 100
+    stoich_mg = np.asarray(dose_g, dtype=float) / mw * cu_per_mol * MW_CU * 1e3
+    pct = np.minimum(kinetic_mg, stoich_mg) / (steel_mg * cu_init_wt / 100) * 100
+    if detail:
+        return pct, kinetic_mg, stoich_mg
+    return pct
+
+
+# ============================================================================
+# Inverse
+# ============================================================================
+
+def solve(unknown, target_pct=None, target_wt=None, dose_g=None, radius_um=None,
+          time_s=None, temp_K=None, oxide="Fe2O3", steel_kg=STEEL_KG,
+          cu_init_wt=CU_INIT_WT, kinetics="dictra", surface=None, bounds=None):
+    """
+    Solve for `unknown` (dose, radius, time or temp) so removal reaches the
+    target (target_pct, or the final target_wt). The other three inputs
+    broadcast against each other. Returns a dict of arrays:
+
+      value        the unknown (g, um, s or K); nan unless status is "ok"
+      status       "ok", "unreachable" or "met at bound"
+      limited_by   the binding limit at value ("stoichiometry" or
+                   "kinetics"); for "unreachable" also "surface Cu" (target
+                   below the Cu held at the particle surface)
+      removal_pct  removal at value; for "unreachable" the best in range,
+                   for "met at bound" the least in range
+    """
+    if unknown not in BOUNDS:
+        raise ValueError("unknown must be one of %s" % ", ".join(UNKNOWNS))
+    if (target_pct is None) == (target_wt is None):
+        raise ValueError("give exactly one of target_pct and target_wt")
+    if target_pct is None:
+        target_pct = (1 - np.asarray(target_wt, dtype=float) / cu_init_wt) * 100
+    given = {"dose": dose_g, "radius": radius_um, "time": time_s, "temp": temp_K}
+    missing = [k for k, v in given.items() if v is None and k != unknown]
+    if missing or given[unknown] is not None:
+        raise ValueError("give every input except %s (missing: %s)" % (
+            unknown, ", ".join(missing) or "-"))
+    if surface is None:
+        surface = CaptureSurface.load(kinetics)
+    lo, hi = (bounds or BOUNDS)[unknown]
+
+    arrays = np.broadcast_arrays(*(np.asarray(v if v is not None else 0.0, dtype=float)
+                                   for v in (*given.values(), target_pct)))
+    shape = arrays[0].shape
+    args = dict(zip(list(given) + ["target"], arrays))
+    target = args.pop("target")
+
+    def g(value):
+        kw = dict(args, **{unknown: value})
+        return removal(surface, kw["dose"], kw["radius"], kw["time"], kw["temp"],
+                       oxide, steel_kg, cu_init_wt, detail=True)
+
+    # Removal falls with radius, rises with the rest
+    fav, unfav = (lo, hi) if unknown == "radius" else (hi, lo)
+    best = g(np.full(shape, fav))[0]
+    worst = g(np.full(shape, unfav))[0]
+    reachable = best >= target
+    met = worst >= target
+
+    a = np.full(shape, np.log(unfav))
+    b = np.full(shape, np.log(fav))
+    for _ in range(N_BISECT):
+        mid = 0.5 * (a + b)
+        ok = g(np.exp(mid))[0] >= target
+        b = np.where(ok, mid, b)
+        a = np.where(ok, a, mid)
+    value = np.where(reachable & ~met, np.exp(b), np.nan)
+
+    status = np.where(met, "met at bound", np.where(reachable, "ok", "unreachable"))
+    floor_pct = (1 - surface.surface_wt / cu_init_wt) * 100
+    at_value, kin, sto = g(np.where(np.isnan(value), fav, value))
+    limited_by = np.where(sto < kin, "stoichiometry", "kinetics")
+    limited_by = np.where((status == "unreachable") & (target >= floor_pct),
+                          "surface Cu", limited_by)
+    limited_by = np.where(met, "", limited_by)
+    reached = np.where(met, worst, np.where(np.isnan(value), best, at_value))
+    return {"value": value, "status": status, "limited_by": limited_by,
+            "removal_pct": reached, "target_pct": target, "bounds": (lo, hi)}
+
+
+# ============================================================================
+# MAIN
+# ============================================================================
+
+UNITS = {"dose": "g", "radius": "um", "time": "s", "temp": "K"}
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Solve for dose, radius, time or temperature that reaches a Cu target")
+    parser.add_argument("unknown", choices=UNKNOWNS)
+    parser.add_argument("--dose", type=float, nargs="+", metavar="G")
+    parser.add_argument("--radius", type=float, nargs="+", metavar="UM")
+    parser.add_argument("--time", type=float, nargs="+", metavar="S")
+    parser.add_argument("--temp", type=float, nargs="+", metavar="K")
+    parser.add_argument("--oxide", choices=list(OXIDES), default="Fe2O3")
+    parser.add_argument("--steel-kg", type=float, default=STEEL_KG)
+    parser.add_argument("--cu", type=float, nargs=2, default=[CU_INIT_WT, CU_TARGET_WT],
+                        metavar=("INIT", "TARGET"), help="Cu wt%% before and after")
+    parser.add_argument("--kinetics", choices=list(KINETICS), default="dictra")
+    args = parser.parse_args()
+
+    given = {k: getattr(args, k) for k in UNKNOWNS if k != args.unknown}
+    missing = [k for k, v in given.items() if v is None]
+    if missing:
+        parser.error("%s needs --%s" % (args.unknown, " --".join(missing)))
+    if getattr(args, args.unknown) is not None:
+        parser.error("--%s is the unknown" % args.unknown)
+
+    # Every combination of the given values is a scenario
+    combos = np.array(list(itertools.product(*given.values())), dtype=float)
+    kw = {"dose_g": None, "radius_um": None, "time_s": None, "temp_K": None}
+    names = dict(zip(UNKNOWNS, kw))
+    for col, k in enumerate(given):
+        kw[names[k]] = combos[:, col]
+    res = solve(args.unknown, target_wt=args.cu[1], oxide=args.oxide,
+                steel_kg=args.steel_kg, cu_init_wt=args.cu[0],
+                kinetics=args.kinetics, **kw)
+
+    lo, hi = res["bounds"]
+    print("=" * 75)
+    print("Inverse design: %s for %.2f -> %.2f wt%% Cu (%.1f%% removal)" % (
+        args.unknown, args.cu[0], args.cu[1], res["target_pct"].flat[0]))
+    print("%s, %.2f kg steel, %s kinetics; %s searched over %g-%g %s" % (
+        args.oxide, args.steel_kg, args.kinetics, args.unknown, lo, hi,
+        UNITS[args.unknown]))
+    print("=" * 75)
+    header = "".join("%10s" % ("%s(%s)" % (k, UNITS[k])) for k in given)
+    print(header + "%14s  %-13s %s" % ("%s(%s)" % (args.unknown, UNITS[args.unknown]),
+                                         "status", "note"))
+    for i, row in enumerate(combos):
+        value = res["value"][i]
+        note = res["limited_by"][i]
+        if res["status"][i] == "unreachable":
+            note = "%s (best %.1f%%)" % (note, res["removal_pct"][i])
+        elif res["status"][i] == "met at bound":
+            note = "already %.1f%% at the bound" % res["removal_pct"][i]
+        elif args.unknown == "temp" and value - LIQUIDUS_K < 1e-6 * LIQUIDUS_K:
+            note += ", on melting"
+        print("".join("%10g" % v for v in row) + "%14s  %-13s %s" % (
+            "-" if np.isnan(value) else "%.4g" % value, res["status"][i], note))
+
+
+if __name__ == "__main__":
+    main()
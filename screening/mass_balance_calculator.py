@@ -13,14 +13,33 @@ calculates:
 This is the experiment design tool for Fontana Lab trials.
 
 Usage:
-  python3 mass_balance_calculator.py
-
-No VM or TC-Python required — runs locally with standard Python.
+  python3 mass_balance_calculator.py                       (default report)
+  python3 mass_balance_calculator.py --oxide SiO2 --radius-um 50
+  python3 mass_balance_calculator.py --oxide Fe2O3 --steel-kg 1 --cu 0.4 0.1
+  python3 mass_balance_calculator.py --oxide Fe2O3 --lognormal 75 1.6
+  python3 mass_balance_calculator.py --oxide Fe2O3 --psd-csv sieve.csv
+  python3 mass_balance_calculator.py --oxide Fe2O3 --temp-k 1873
+
+A powder can be given as a particle size distribution instead of one radius
+(psd.py: log-normal median/gsd, or a sieve table / measured histogram CSV);
+particle count and area are then summed over its size classes and the
+diffusion time is the mass-weighted mean.
+
+--temp-k takes D_Cu at that temperature from diffusivity_fit.reference_d_cu
+(the DICTRA value carried to T, or gamma-Fe data below the liquidus) instead
+of the 1800 K constant.
+
+No VM or TC-Python required — runs locally with standard Python (NumPy only
+for --lognormal / --psd-csv). The capture stoichiometry is balanced in plain
+Python, so a single query stays quick (calphad.py mass-balance ...).
 
 Honda CALPHAD Project - MSE 4381 Capstone
 """
 
+import argparse
 import math
+import sys
+from pathlib import Path
 
 # ===========================================================================
 # OXIDE DATABASE (from screening results)
@@ -39,7 +58,6 @@ OXIDES = {
         "MW_product": 239.24,  # g/mol CuFe2O4
         "rho": 5240,           # kg/m³
         "mp_C": 1565,          # melting point °C
-        "cu_per_mol": 1,       # mol Cu captured per mol oxide
         "notes": "Top candidate. Spinel product persists to 1700K.",
     },
     "V2O5": {
@@ -50,7 +68,6 @@ OXIDES = {
         "MW_product": 372.53,
         "rho": 3357,
         "mp_C": 690,
-        "cu_per_mol": 3,       # 3 Cu per mol V2O5
         "notes": "Strong thermodynamic driving force. Low melting point.",
     },
     "MnO": {
@@ -61,7 +78,6 @@ OXIDES = {
         "MW_product": 237.43,
         "rho": 5430,
         "mp_C": 1945,
-        "cu_per_mol": 0.5,     # 1 Cu per 2 MnO
         "notes": "Spinel product. High melting point, refractory.",
     },
     "SiO2": {
@@ -72,7 +88,6 @@ OXIDES = {
         "MW_product": 183.15,
         "rho": 2650,
         "mp_C": 1713,
-        "cu_per_mol": 2,       # 2 Cu per mol SiO2
         "notes": "Cheap, abundant. Product melts into slag.",
     },
     "Al2O3": {
@@ -83,11 +98,32 @@ OXIDES = {
         "MW_product": 181.50,
         "rho": 3950,
         "mp_C": 2072,
-        "cu_per_mol": 1,
         "notes": "Tested last year. Spinel reaction confirmed by Zhang.",
     },
 }
 
+# mol Cu captured per mol oxide, from the same balancer that builds the shared
+# stoichiometry table (simulations/tcpython/reaction_balancer.py, plain Python):
+# cu_per_mol = n_Cu / n_oxide_fu for Cu + oxide + O2 -> product
+BALANCER_DIR = Path(__file__).parent.parent / "simulations" / "tcpython"
+SUBSCRIPTS = str.maketrans("₀₁₂₃₄₅₆₇₈₉", "0123456789")
+
+
+_CU_PER_MOL = {}
+
+
+def cu_per_mol(oxide_name):
+    """mol Cu per mol oxide_name (an OXIDES key), balanced on first use."""
+    if oxide_name not in _CU_PER_MOL:
+        if str(BALANCER_DIR) not in sys.path:
+            sys.path.insert(0, str(BALANCER_DIR))
+        from reaction_balancer import capture_stoichiometry
+
+        product = OXIDES[oxide_name]["product"].translate(SUBSCRIPTS)
+        nu = capture_stoichiometry(product, oxide_name)
+        _CU_PER_MOL[oxide_name] = nu["n_Cu"] / nu["n_oxide_fu"]
+    return _CU_PER_MOL[oxide_name]
+
 # Physical constants
 MW_CU = 63.546  # g/mol Cu
 D_CU_LIQUID = 9.63e-10  # m²/s at 1800K (from DICTRA Phase 4)
@@ -97,7 +133,8 @@ D_CU_LIQUID = 9.63e-10  # m²/s at 1800K (from DICTRA Phase 4)
 # ===========================================================================
 
 def calculate(steel_mass_kg, cu_init_wt, cu_target_wt, oxide_name,
-              excess_factor=3.0, particle_radius_um=100):
+              excess_factor=3.0, particle_radius_um=100, psd=None,
+              d_cu_m2_s=D_CU_LIQUID, d_cu_source="DICTRA, 1800K"):
     """Calculate oxide requirements for a Cu removal experiment.
 
     Args:
@@ -107,6 +144,9 @@ def calculate(steel_mass_kg, cu_init_wt, cu_target_wt, oxide_name,
         oxide_name: Key from OXIDES dict (e.g., "Fe2O3")
         excess_factor: Multiply stoichiometric amount by this (default 3x)
         particle_radius_um: Particle radius in micrometers
+        psd: psd.PSD of the powder; overrides particle_radius_um
+        d_cu_m2_s: Cu diffusivity in the steel for the contact time
+        d_cu_source: where d_cu_m2_s came from (for the report)
 
     Returns:
         dict with all calculated values
@@ -121,22 +161,30 @@ def calculate(steel_mass_kg, cu_init_wt, cu_target_wt, oxide_name,
 
     # Stoichiometric oxide needed
     # cu_per_mol = mol Cu captured per mol oxide
-    oxide_mol_needed = cu_remove_mol / ox["cu_per_mol"]
+    oxide_mol_needed = cu_remove_mol / cu_per_mol(oxide_name)
     oxide_mass_stoich_g = oxide_mol_needed * ox["MW_oxide"]
     oxide_mass_rec_g = oxide_mass_stoich_g * excess_factor
 
     # Particle calculations
-    r_m = particle_radius_um * 1e-6
-    v_particle = (4/3) * math.pi * r_m**3  # m³
-    m_particle = ox["rho"] * v_particle * 1000  # grams
-    n_particles = oxide_mass_rec_g / m_particle
-    a_particle = 4 * math.pi * r_m**2  # m²
-    total_area_m2 = n_particles * a_particle
+    if psd is None:
+        r_m = particle_radius_um * 1e-6
+        v_particle = (4/3) * math.pi * r_m**3  # m³
+        m_particle = ox["rho"] * v_particle * 1000  # grams
+        n_particles = oxide_mass_rec_g / m_particle
+        a_particle = 4 * math.pi * r_m**2  # m²
+        total_area_m2 = n_particles * a_particle
+        r2_m2 = r_m**2
+    else:
+        n_particles = float(psd.counts(oxide_mass_rec_g, ox["rho"]).sum())
+        total_area_m2 = float(psd.area_m2_per_g(ox["rho"])) * oxide_mass_rec_g
+        r2_m2 = float(psd.mean((psd.radius_um * 1e-6) ** 2))
+        particle_radius_um = psd.sauter_radius_um()
     total_area_cm2 = total_area_m2 * 1e4
 
     # Diffusion time estimate
     # Time for Cu to diffuse one particle radius: t ~ r^2 / (2*D)
-    t_diffusion_s = r_m**2 / (2 * D_CU_LIQUID)
+    # (for a PSD, r^2 is averaged over the powder mass)
+    t_diffusion_s = r2_m2 / (2 * d_cu_m2_s)
 
     # Oxide mass as wt% of steel
     oxide_wt_pct = oxide_mass_rec_g / (steel_mass_kg * 1000) * 100
@@ -156,9 +204,12 @@ def calculate(steel_mass_kg, cu_init_wt, cu_target_wt, oxide_name,
         "oxide_wt_pct": oxide_wt_pct,
         "excess_factor": excess_factor,
         "particle_radius_um": particle_radius_um,
+        "psd_label": psd.label if psd is not None else None,
         "n_particles": n_particles,
         "total_surface_area_cm2": total_area_cm2,
         "diffusion_time_s": t_diffusion_s,
+        "d_cu_m2_s": d_cu_m2_s,
+        "d_cu_source": d_cu_source,
         "notes": ox["notes"],
     }
 
@@ -186,12 +237,16 @@ def print_result(r):
         r["oxide_recommended_g"], r["excess_factor"]))
     print("  As wt%% of steel: %.2f%%" % r["oxide_wt_pct"])
     print()
-    print("  --- Particle Properties (R=%d um) ---" % r["particle_radius_um"])
+    if r["psd_label"]:
+        print("  --- Particle Properties (%s, R32=%.0f um) ---" % (
+            r["psd_label"], r["particle_radius_um"]))
+    else:
+        print("  --- Particle Properties (R=%d um) ---" % r["particle_radius_um"])
     print("  Number of particles: %.2e" % r["n_particles"])
     print("  Total surface area:  %.1f cm^2" % r["total_surface_area_cm2"])
     print()
     print("  --- Kinetics Estimate ---")
-    print("  D_Cu in liquid Fe: %.2e m^2/s (DICTRA, 1800K)" % D_CU_LIQUID)
+    print("  D_Cu in steel: %.2e m^2/s (%s)" % (r["d_cu_m2_s"], r["d_cu_source"]))
     print("  Diffusion time (r^2/2D): %.0f s (%.1f min)" % (
         r["diffusion_time_s"], r["diffusion_time_s"] / 60))
     print("  (Time for Cu to diffuse one particle radius)")
@@ -204,20 +259,22 @@ def print_result(r):
 # MAIN — Run default scenarios
 # ===========================================================================
 
-if __name__ == "__main__":
+# Default experiment: 0.5 kg steel, 0.3% Cu → 0.1% Cu
+STEEL_KG = 0.5
+CU_INIT = 0.30
+CU_TARGET = 0.10
+
+
+def report(steel_kg=STEEL_KG, cu_init=CU_INIT, cu_target=CU_TARGET):
+    """Comparison table, top-3 details and Fe2O3 particle size sweep."""
     print("=" * 65)
     print("Cu REMOVAL MASS BALANCE CALCULATOR")
     print("Honda CALPHAD - MSE 4381 Capstone")
     print("=" * 65)
 
-    # Default experiment: 0.5 kg steel, 0.3% Cu → 0.1% Cu
-    STEEL_KG = 0.5
-    CU_INIT = 0.30
-    CU_TARGET = 0.10
-
     print()
     print("Default scenario: %.1f kg steel, %.2f%% → %.2f%% Cu" % (
-        STEEL_KG, CU_INIT, CU_TARGET))
+        steel_kg, cu_init, cu_target))
     print()
 
     # Calculate for all oxides
@@ -230,7 +287,7 @@ if __name__ == "__main__":
     print("-" * 65)
 
     for name in ["Fe2O3", "V2O5", "MnO", "SiO2", "Al2O3"]:
-        r = calculate(STEEL_KG, CU_INIT, CU_TARGET, name,
+        r = calculate(steel_kg, cu_init, cu_target, name,
                       excess_factor=3.0, particle_radius_um=100)
         print("%-8s  %-12s  %-10.1f  %-10.2f  %-10.2f  %-8.2f" % (
             r["oxide_formula"], r["product"], r["dG_kJ"],
@@ -244,7 +301,7 @@ if __name__ == "__main__":
     print("=" * 65)
 
     for name in ["Fe2O3", "V2O5", "MnO"]:
-        r = calculate(STEEL_KG, CU_INIT, CU_TARGET, name,
+        r = calculate(steel_kg, cu_init, cu_target, name,
                       excess_factor=3.0, particle_radius_um=100)
         print_result(r)
 
@@ -259,7 +316,7 @@ if __name__ == "__main__":
     print("-" * 60)
 
     for radius in [10, 25, 50, 100, 250, 500]:
-        r = calculate(STEEL_KG, CU_INIT, CU_TARGET, "Fe2O3",
+        r = calculate(steel_kg, cu_init, cu_target, "Fe2O3",
                       excess_factor=3.0, particle_radius_um=radius)
         print("%-12d  %-15.2e  %-15.1f  %-12.1f" % (
             radius, r["n_particles"], r["total_surface_area_cm2"],
@@ -273,3 +330,51 @@ if __name__ == "__main__":
     print("Recommendation: R=50-100 um gives good balance of")
     print("  surface area vs handling. t_diff ~ 1-5 min is feasible")
     print("  in Fontana Lab induction furnace (10-30 min hold).")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Oxide mass balance for a Cu removal experiment.")
+    parser.add_argument("--oxide", choices=list(OXIDES),
+                        help="single oxide to size (default: full report)")
+    parser.add_argument("--steel-kg", type=float, default=STEEL_KG)
+    parser.add_argument("--cu", type=float, nargs=2, default=[CU_INIT, CU_TARGET],
+                        metavar=("INIT", "TARGET"), help="Cu wt%% before and after")
+    parser.add_argument("--excess", type=float, default=3.0)
+    parser.add_argument("--radius-um", type=float, default=100)
+    size = parser.add_mutually_exclusive_group()
+    size.add_argument("--lognormal", type=float, nargs=2, metavar=("MEDIAN_UM", "GSD"),
+                      help="log-normal powder: mass-median radius and geometric SD")
+    size.add_argument("--psd-csv", type=Path, metavar="FILE",
+                      help="sieve table (d_lower_um,d_upper_um,mass_fraction) or "
+                           "histogram (radius_um,mass_fraction) CSV")
+    parser.add_argument("--temp-k", type=float, metavar="T",
+                        help="D_Cu at T from diffusivity_fit.reference_d_cu")
+    args = parser.parse_args()
+
+    kinetics = {}
+    if args.temp_k is not None:
+        from diffusivity_fit import phase_at, reference_d_cu
+        if args.oxide is None:
+            parser.error("--temp-k needs --oxide")
+        kinetics = {"d_cu_m2_s": reference_d_cu(args.temp_k),
+                    "d_cu_source": "reference, %gK, %s" % (
+                        args.temp_k, phase_at(args.temp_k))}
+
+    psd = None
+    if args.lognormal or args.psd_csv:
+        from psd import PSD
+        if args.oxide is None:
+            parser.error("--lognormal/--psd-csv need --oxide")
+        psd = (PSD.lognormal(*args.lognormal) if args.lognormal
+               else PSD.from_csv(args.psd_csv))
+
+    if args.oxide is None:
+        report(args.steel_kg, *args.cu)
+        return
+    print_result(calculate(args.steel_kg, args.cu[0], args.cu[1], args.oxide,
+                           excess_factor=args.excess,
+                           particle_radius_um=args.radius_um, psd=psd, **kinetics))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,520 @@
+"""
+Multicomponent (Fe-Cu-O-C-Si-Mn) diffusion around an oxide particle.
+
+cu_removal_rate.py and the local stand-in (diffusion_convergence.py) treat
+the steel as binary Fe-Cu. Scrap melts also carry O, C, Si and Mn, which
+change the Cu activity at the interface and couple the fluxes. This module
+solves the same particle problem (fixed surface composition, closed outer
+boundary, spherical shell) for the five solutes at once, with the full
+diffusion matrix in the Wagner dilute-solution formalism:
+
+  J_i = -c sum_j D_ij grad x_j,     D_ij = D_i (delta_ij + x_i eps_ij)
+
+(Fe is the dependent component). eps_ij is the first-order interaction
+parameter in liquid Fe: e_i^j (wt%, log10) at 1873 K from the Steelmaking
+Data Sourcebook, converted with eps = 230 (M_j / M_Fe) e + (M_Fe - M_j) / M_Fe
+and scaled as 1873 / T. D_i at 1873 K are literature values for liquid
+iron (D_Cu is the DICTRA value, diffusivity_fit.reference_d_cu), carried to
+other temperatures by Stokes-Einstein. The interaction data are for the
+liquid, so the mode covers the liquid-steel temperatures of the sweep only.
+
+Numerics: vertex-centred finite volumes on the diffusion_convergence.py
+grids, implicit Euler with D_ij lagged one step, and a block-tridiagonal
+(5x5 blocks) Thomas sweep that is batched over every (T, R) case of the
+sweep, so each node costs one stacked np.linalg.solve for all cases. A
+solute is either held at a surface composition or closed (zero flux) at
+the particle.
+
+Default chemistry ("scrap", wt%): Cu 0.30, O 0.02, C 0.10, Si 0.20,
+Mn 0.50. At the surface Cu is CU_SURFACE_WT, O is at FeO saturation
+(log10 %O = -6320 / T + 2.734) and C, Si, Mn stay at bulk -- the same
+setup as cu_removal_rate.py --chemistry scrap on DICTRA.
+
+The oxide ranking check takes each oxide's equilibrium surface Cu activity
+(capture reaction at pO2 = 1 atm, as surface_bc_table.py) and turns it into
+a surface composition twice: binary (a = gamma_Cu x) and with the surface
+O, C, Si, Mn (a = gamma_Cu x exp(sum_j eps_Cu,j x_j)). The capture of both
+at one (T, R, t) shows whether realistic chemistry reorders the screen.
+
+  python3 multicomponent_diffusion.py               binary vs 5-solute sweep + ranking
+  python3 multicomponent_diffusion.py --write       + processed/ summary and ranking CSVs
+  python3 multicomponent_diffusion.py --bulk MN=1.0 --surface O=closed
+"""
+
+import argparse
+import csv
+import math
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(SCRIPT_DIR))
+from convective_kinetics import SHELL_WIDTH_M  # noqa: E402
+from diffusivity_fit import fe_viscosity, reference_d_cu  # noqa: E402
+from diffusion_convergence import DT_GROWTH, DT_INITIAL_S, grid_nodes  # noqa: E402
+from ladle_model import (CU_REF_WT, CU_SURFACE_WT, LIQUIDUS_K,  # noqa: E402
+                         MULTICOMPONENT_CSV, PROC_DIR, RHO_STEEL, SUMMARY_CSV)
+
+DG_CSV = PROC_DIR / "activity_corrected_dG.csv"
+RANKING_CSV = PROC_DIR / "multicomponent_oxide_ranking.csv"
+
+SOLUTES = ("CU", "O", "C", "SI", "MN")
+MOLAR_MASS = {"FE": 55.845, "CU": 63.546, "O": 15.999, "C": 12.011,
+              "SI": 28.086, "MN": 54.938}
+
+# Liquid Fe, 1873 K (m2/s); Cu comes from diffusivity_fit.reference_d_cu
+T_DATA_K = 1873
+D_1873 = {"O": 3.0e-9, "C": 7.0e-9, "SI": 3.5e-9, "MN": 3.5e-9}
+
+# e_i^j in liquid Fe at 1873 K (wt%, log10); row i is the affected solute
+E_WT = {
+    "CU": {"CU": -0.023, "O": -0.065, "C": 0.066, "SI": 0.027, "MN": 0.0},
+    "O":  {"CU": -0.013, "O": -0.17, "C": -0.45, "SI": -0.131, "MN": -0.021},
+    "C":  {"CU": 0.016, "O": -0.34, "C": 0.14, "SI": 0.08, "MN": -0.012},
+    "SI": {"CU": 0.014, "O": -0.23, "C": 0.18, "SI": 0.11, "MN": 0.002},
+    "MN": {"CU": 0.0, "O": -0.083, "C": -0.07, "SI": -0.0327, "MN": 0.0},
+}
+
+# Representative scrap melt (wt%) and surface conditions: a wt%, "sat"
+# (O only: FeO saturation), "bulk" (held at bulk) or "closed" (zero flux)
+CHEMISTRY = {
+    "scrap": {"CU": CU_REF_WT, "O": 0.02, "C": 0.10, "SI": 0.20, "MN": 0.50},
+}
+SURFACE = {"CU": CU_SURFACE_WT, "O": "sat", "C": "bulk", "SI": "bulk", "MN": "bulk"}
+
+# Cu activity coefficient at infinite dilution (compute_activity_corrected_dG.py)
+GAMMA_CU = 8.5
+GAMMA_CU_T_K = 1800
+PO2_ATM = 1.0
+R_GAS = 8.314
+
+# Same sweep as cu_removal_rate.py, liquid temperatures only
+TEMPS_K = [T for T in range(1673, 1924, 25) if T > LIQUIDUS_K]
+RADII_UM = [25, 50, 100, 250, 500]
+TIMES_S = [60, 300, 600, 1800]
+
+# Numerics: geometric grid, 6 diffusion lengths of the fastest solute,
+# time-step cap in % of the next output time (diffusion_convergence.py)
+N_POINTS = 60
+GRID = "geometric"
+SHELL_SIGMAS = 6.0
+MAX_DT_PCT = 5.0
+
+RANK_AT = (1873, 100, 1800)      # T K, R um, t s for the oxide ranking
+
+
+# ============================================================================
+# Properties
+# ============================================================================
+
+def diffusivities(temp_K, solutes=SOLUTES):
+    """D_i (m2/s), shape (..., n_solutes), Stokes-Einstein from 1873 K."""
+    T = np.asarray(temp_K, dtype=float)[..., None]
+    scale = (T / T_DATA_K) * fe_viscosity(T_DATA_K) / fe_viscosity(T)
+    return np.concatenate([reference_d_cu(T, "LIQUID") if s == "CU" else D_1873[s] * scale
+                           for s in solutes], axis=-1)
+
+
+def epsilon(temp_K, solutes=SOLUTES):
+    """Interaction parameters eps_ij (mole fraction, ln), shape (..., n, n)."""
+    m_fe = MOLAR_MASS["FE"]
+    e = np.array([[230 * MOLAR_MASS[j] / m_fe * E_WT[i][j] + (m_fe - MOLAR_MASS[j]) / m_fe
+                   for j in solutes] for i in solutes])
+    return e * (T_DATA_K / np.asarray(temp_K, dtype=float))[..., None, None]
+
+
+def wt_to_x(wt, solutes=SOLUTES):
+    """wt% (..., n_solutes) -> mole fractions, Fe the balance."""
+    wt = np.asarray(wt, dtype=float)
+    moles = wt / np.array([MOLAR_MASS[s] for s in solutes])
+    fe = (100 - wt.sum(-1, keepdims=True)) / MOLAR_MASS["FE"]
+    return moles / (moles.sum(-1, keepdims=True) + fe)
+
+
+def x_to_wt(x, solutes=SOLUTES):
+    x = np.asarray(x, dtype=float)
+    mass = x * np.array([MOLAR_MASS[s] for s in solutes])
+    total = mass.sum(-1, keepdims=True) + (1 - x.sum(-1, keepdims=True)) * MOLAR_MASS["FE"]
+    return 100 * mass / total
+
+
+def o_saturation_wt(temp_K):
+    """Dissolved O at FeO saturation in liquid Fe (wt%)."""
+    return 10 ** (-6320 / np.asarray(temp_K, dtype=float) + 2.734)
+
+
+def diffusion_matrix(x, D, eps):
+    """D_ij = D_i (delta_ij + x_i eps_ij); x, D (..., n), eps (..., n, n)."""
+    n = x.shape[-1]
+    return D[..., :, None] * (np.eye(n) + x[..., :, None] * eps)
+
+
+def surface_wt(temp_K, bulk, surface=SURFACE, solutes=SOLUTES):
+    """
+    Surface wt% per solute (nan = closed) for each temperature, shape
+    (n_T, n_solutes), from the SURFACE rules.
+    """
+    temps = np.atleast_1d(np.asarray(temp_K, dtype=float))
+    out = np.empty((len(temps), len(solutes)))
+    for k, s in enumerate(solutes):
+        rule = surface.get(s, "bulk")
+        if rule == "closed":
+            out[:, k] = np.nan
+        elif rule == "bulk":
+            out[:, k] = bulk[s]
+        elif rule == "sat":
+            if s != "O":
+                raise ValueError("'sat' is only defined for O")
+            out[:, k] = o_saturation_wt(temps)
+        else:
+            out[:, k] = float(rule)
+    return out
+
+
+# ============================================================================
+# Solver
+# ============================================================================
+
+def solve(radius_um, temp_K, times_s, bulk_wt, surf_wt, solutes=SOLUTES,
+          n_points=N_POINTS, grid=GRID, sigmas=SHELL_SIGMAS, max_dt_pct=MAX_DT_PCT,
+          interactions=True):
+    """
+    Batched particle runs. radius_um, temp_K: (B,) cases; bulk_wt,
+    surf_wt: (B, n_solutes) wt%, nan in surf_wt = closed at the particle.
+    Returns (nodes_m (B, n_points), x (n_times, B, n_points, n_solutes))
+    with the profiles at each of times_s (ascending).
+    """
+    radius_um = np.asarray(radius_um, dtype=float)
+    temp_K = np.asarray(temp_K, dtype=float)
+    times_s = np.asarray(times_s, dtype=float)
+    B, ns, n = len(radius_um), len(solutes), n_points
+
+    D = diffusivities(temp_K, solutes)                          # (B, ns)
+    eps = epsilon(temp_K, solutes) if interactions else np.zeros((B, ns, ns))
+    width = sigmas * np.sqrt(D.max(-1) * times_s[-1])
+    nodes = np.stack([grid_nodes(n, grid, w) for w in width])   # (B, n)
+
+    r = radius_um[:, None] * 1e-6 + nodes
+    faces = 0.5 * (r[:, 1:] + r[:, :-1])
+    edges = np.concatenate([r[:, :1], faces, r[:, -1:]], axis=1)
+    vol = (edges[:, 1:] ** 3 - edges[:, :-1] ** 3) / 3          # (B, n)
+    g = faces ** 2 / np.diff(r, axis=1)                         # (B, n-1)
+
+    fixed = ~np.isnan(surf_wt)                                  # (B, ns)
+    x_surf = wt_to_x(np.where(fixed, surf_wt, bulk_wt), solutes)
+    x = np.repeat(wt_to_x(bulk_wt, solutes)[:, None, :], n, axis=1)
+    x[:, 0] = np.where(fixed, x_surf, x[:, 0])
+
+    eye = np.eye(ns)
+    out = np.empty((len(times_s),) + x.shape)
+    t, dt = 0.0, DT_INITIAL_S
+    for k_out, t_out in enumerate(times_s):
+        dt_max = max_dt_pct / 100 * t_out
+        while t < t_out * (1 - 1e-12):
+            dt = min(dt, dt_max, t_out - t)
+            Dm = diffusion_matrix(x, D[:, None, :], eps[:, None])   # (B, n, ns, ns)
+            K = (dt * g)[..., None, None] * 0.5 * (Dm[:, 1:] + Dm[:, :-1])
+            diag = vol[..., None, None] * eye
+            diag[:, 1:] += K
+            diag[:, :-1] += K
+            rhs = vol[..., None] * x
+            # Fixed solutes: identity rows at the particle surface
+            diag[:, 0] = np.where(fixed[..., None], eye, diag[:, 0])
+            upper0 = np.where(fixed[..., None], 0.0, -K[:, 0])
+            rhs[:, 0] = np.where(fixed, x_surf, rhs[:, 0])
+            x = _block_thomas(diag, -K, upper0, rhs)
+            t += dt
+            dt *= DT_GROWTH
+        out[k_out] = x
+    return nodes, out
+
+
+def _block_thomas(diag, off, upper0, rhs):
+    """
+    Solve the block-tridiagonal systems diag[k] x_k + off[k-1] x_{k-1} +
+    off[k] x_{k+1} = rhs[k] (symmetric off-diagonal blocks, the first upper
+    block replaced by upper0), batched over the leading axis.
+    """
+    n = diag.shape[1]
+    c = np.empty_like(off)
+    d = np.empty_like(rhs)
+    c[:, 0] = np.linalg.solve(diag[:, 0], upper0)
+    d[:, 0] = np.linalg.solve(diag[:, 0], rhs[:, 0, :, None])[..., 0]
+    for k in range(1, n):
+        m = diag[:, k] - off[:, k - 1] @ c[:, k - 1]
+        if k < n - 1:
+            c[:, k] = np.linalg.solve(m, off[:, k])
+        d[:, k] = np.linalg.solve(
+            m, (rhs[:, k] - (off[:, k - 1] @ d[:, k - 1, :, None])[..., 0])[..., None])[..., 0]
+    for k in range(n - 2, -1, -1):
+        d[:, k] -= (c[:, k] @ d[:, k + 1, :, None])[..., 0]
+    return d
+
+
+def captured_mg(radius_um, nodes, wt, bulk_wt):
+    """
+    Solute taken out of the steel per particle (mg), trapezoidal in
+    spherical coordinates as in cu_removal_rate.py; negative = supplied.
+    wt (..., B, n, ns), bulk_wt (B, ns). Returns (..., B, ns).
+    """
+    r = np.asarray(radius_um, dtype=float)[:, None] * 1e-6 + nodes
+    r_mid = 0.5 * (r[:, 1:] + r[:, :-1])
+    dv = 4 * np.pi * r_mid ** 2 * np.diff(r, axis=1)            # (B, n-1)
+    dw = (bulk_wt[:, None, :] - wt) / 100
+    dw_mid = 0.5 * (dw[..., 1:, :] + dw[..., :-1, :])
+    return np.einsum("...bns,bn->...bs", dw_mid, dv) * RHO_STEEL * 1e6
+
+
+# ============================================================================
+# Sweep and oxide ranking
+# ============================================================================
+
+def sweep(bulk, surface=SURFACE, solutes=SOLUTES, temps=TEMPS_K, radii=RADII_UM,
+          times=TIMES_S, **kw):
+    """
+    Every (T, R) case in one batch. Returns (Cu capture mg (n_T, n_R, n_t),
+    Cu profiles wt% (n_T, n_R, n_t, n_points), nodes_m (n_T, n_R, n_points),
+    surface wt% (n_T, n_solutes)).
+    """
+    TT, RR = np.meshgrid(temps, radii, indexing="ij")
+    surf = surface_wt(temps, bulk, surface, solutes)
+    bulk_wt = np.array([bulk[s] for s in solutes])
+    B = TT.size
+    surf_b = np.repeat(surf, len(radii), axis=0)
+    bulk_b = np.tile(bulk_wt, (B, 1))
+    nodes, x = solve(RR.ravel(), TT.ravel(), times, bulk_b, surf_b, solutes, **kw)
+    wt = x_to_wt(x, solutes)
+    mg = captured_mg(RR.ravel(), nodes, wt, bulk_b)[..., solutes.index("CU")]
+    shape = (len(temps), len(radii))
+    return (np.moveaxis(mg, 0, -1).reshape(shape + (len(times),)),
+            np.moveaxis(wt[..., solutes.index("CU")], 0, 1).reshape(
+                shape + (len(times), nodes.shape[-1])),
+            nodes.reshape(shape + (-1,)), surf)
+
+
+def surface_activity(temp_K, p_o2=PO2_ATM, path=DG_CSV):
+    """
+    {parent_oxide: (product, a_Cu)} at the capture-reaction equilibrium,
+    the product with the lowest a_Cu per oxide (as surface_bc_table.py).
+    """
+    curves = {}
+    with open(path) as f:
+        for row in csv.DictReader(f):
+            key = (row["parent_oxide"], row["product"])
+            curves.setdefault(key, (float(row["n_Cu"]), float(row["n_O2"]), []))[2].append(
+                (float(row["T_K"]), float(row["dG_pure_kJ"])))
+    best = {}
+    for (oxide, product), (n_cu, n_o2, pts) in curves.items():
+        T, dg = np.array(sorted(pts)).T
+        g = float(np.interp(temp_K, T, dg)) if temp_K <= T[-1] else \
+            dg[-1] + (dg[-1] - dg[-2]) / (T[-1] - T[-2]) * (temp_K - T[-1])
+        a = math.exp(g * 1e3 / (n_cu * R_GAS * temp_K)) * p_o2 ** (-n_o2 / n_cu)
+        if oxide not in best or a < best[oxide][1]:
+            best[oxide] = (product, a)
+    return best
+
+
+def gamma_cu(temp_K):
+    """Infinite-dilution gamma_Cu, regular-solution scaling from GAMMA_CU_T_K."""
+    return math.exp(math.log(GAMMA_CU) * GAMMA_CU_T_K / temp_K)
+
+
+def surface_cu_x(a_cu, temp_K, x_others, solutes=SOLUTES):
+    """
+    Surface X_Cu in equilibrium with a_cu, given the other solutes' surface
+    mole fractions (dict; empty = binary Fe-Cu). Fixed point in X_Cu.
+    """
+    eps = epsilon(temp_K, solutes)[solutes.index("CU")]
+    shift = sum(eps[solutes.index(s)] * xs for s, xs in x_others.items())
+    g0, e_cc = gamma_cu(temp_K), eps[solutes.index("CU")] if x_others else 0.0
+    x = a_cu / g0
+    for _ in range(50):
+        x = a_cu / (g0 * math.exp(e_cc * x + shift))
+    return x
+
+
+def rank_oxides(bulk, surface=SURFACE, at=RANK_AT, **kw):
+    """
+    Cu capture per particle for every screened oxide at one (T, R, t),
+    binary Fe-Cu vs the full chemistry. Rows sorted by multicomponent capture.
+    """
+    T, R, t = at
+    surf = surface_wt([T], bulk, surface)[0]
+    surf_x = wt_to_x(np.where(np.isnan(surf), [bulk[s] for s in SOLUTES], surf))
+    others = {s: surf_x[k] for k, s in enumerate(SOLUTES) if s != "CU"}
+    x_bulk = float(wt_to_x([[bulk["CU"]]], ("CU",))[0, 0])
+    rows = []
+    for oxide, (product, a_eq) in sorted(surface_activity(T).items()):
+        x_bin = surface_cu_x(a_eq, T, {})
+        x_mc = surface_cu_x(a_eq, T, others)
+        rows.append({"oxide": oxide, "product": product, "a_cu_eq": a_eq,
+                     "cu_surface_binary_wt_pct": float(x_to_wt([[x_bin]], ("CU",))[0, 0]),
+                     "cu_surface_multicomponent_wt_pct": float(
+                         x_to_wt([[x_mc]], ("CU",))[0, 0]),
+                     "drives_binary": x_bin < x_bulk, "drives_multicomponent": x_mc < x_bulk})
+
+    # Binary runs (Cu only) and full-chemistry runs, one batch each
+    for mode, solutes, key in (("binary", ("CU",), "cu_surface_binary_wt_pct"),
+                               ("multicomponent", SOLUTES, "cu_surface_multicomponent_wt_pct")):
+        bulk_wt = np.array([bulk[s] for s in solutes])
+        surf_b = np.array([[r[key] if s == "CU" else surf[SOLUTES.index(s)]
+                            for s in solutes] for r in rows])
+        radii = np.full(len(rows), float(R))
+        nodes, x = solve(radii, np.full(len(rows), float(T)), [t],
+                         np.tile(bulk_wt, (len(rows), 1)), surf_b, solutes, **kw)
+        mg = captured_mg(radii, nodes, x_to_wt(x, solutes),
+                         np.tile(bulk_wt, (len(rows), 1)))[0, :, solutes.index("CU")]
+        for r, m in zip(rows, mg):
+            r["cu_captured_%s_mg" % mode] = float(m) if r["drives_" + mode] else 0.0
+    for mode in ("binary", "multicomponent"):
+        # Oxides without a driving force tie at zero; the lower a_Cu ranks first
+        order = sorted(rows, key=lambda r: (-r["cu_captured_%s_mg" % mode], r["a_cu_eq"]))
+        for k, r in enumerate(order, 1):
+            r["rank_" + mode] = k
+    return sorted(rows, key=lambda r: r["rank_multicomponent"])
+
+
+# ============================================================================
+# Output
+# ============================================================================
+
+def write_summary(mg, cu_wt, nodes, surf, bulk, out=MULTICOMPONENT_CSV, path=SUMMARY_CSV):
+    """
+    Copy cu_removal_rate_summary.csv with the liquid rows recomputed by the
+    multicomponent solver (FCC rows keep their DICTRA values).
+    """
+    with open(path) as f:
+        reader = csv.DictReader(f)
+        fields = reader.fieldnames
+        rows = list(reader)
+    n = 0
+    for r in rows:
+        T = int(r["temp_K"])
+        if T not in TEMPS_K:
+            continue
+        i, j = TEMPS_K.index(T), RADII_UM.index(int(float(r["radius_um"])))
+        k = TIMES_S.index(int(float(r["time_s"])))
+        profile, dist_um = cu_wt[i, j, k], nodes[i, j] * 1e6
+        below = np.nonzero(profile >= 0.9 * bulk["CU"])[0]
+        R = RADII_UM[j] * 1e-6
+        shell_cu_mg = (RHO_STEEL * 4 / 3 * np.pi * ((R + SHELL_WIDTH_M) ** 3 - R ** 3)
+                       * bulk["CU"] / 100 * 1e6)
+        r["cu_surface_wt_pct"] = repr(float(surf[i, SOLUTES.index("CU")]))
+        r["cu_farfield_wt_pct"] = repr(float(profile[-1]))
+        r["depletion_depth_um"] = repr(float(dist_um[below[0]] if len(below) else dist_um[-1]))
+        r["cu_captured_mg"] = repr(float(mg[i, j, k]))
+        r["cu_removed_shell_pct"] = repr(float(mg[i, j, k] / shell_cu_mg * 100))
+        n += 1
+    out.parent.mkdir(parents=True, exist_ok=True)
+    with open(out, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=fields)
+        writer.writeheader()
+        writer.writerows(rows)
+    return n
+
+
+def write_ranking(rows, out=RANKING_CSV):
+    out.parent.mkdir(parents=True, exist_ok=True)
+    with open(out, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=list(rows[0]))
+        writer.writeheader()
+        for r in rows:
+            writer.writerow({k: ("%.6g" % v if isinstance(v, float) else int(v)
+                                 if isinstance(v, bool) else v) for k, v in r.items()})
+
+
+def _assignments(items, what):
+    out = {}
+    for item in items or []:
+        key, _, value = item.partition("=")
+        key = key.upper()
+        if key not in SOLUTES or not value:
+            raise SystemExit("%s: expected SOLUTE=VALUE with SOLUTE in %s, got %r" % (
+                what, ", ".join(SOLUTES), item))
+        out[key] = value
+    return out
+
+
+# ============================================================================
+# MAIN
+# ============================================================================
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Fe-Cu-O-C-Si-Mn diffusion around an oxide particle")
+    parser.add_argument("--chemistry", choices=list(CHEMISTRY), default="scrap")
+    parser.add_argument("--bulk", nargs="+", metavar="SOLUTE=WT",
+                        help="override bulk wt%%, e.g. MN=1.0 O=0.05")
+    parser.add_argument("--surface", nargs="+", metavar="SOLUTE=RULE",
+                        help="surface rule: wt%%, bulk, closed or sat (O), e.g. O=closed")
+    parser.add_argument("--points", type=int, default=N_POINTS)
+    parser.add_argument("--max-dt-pct", type=float, default=MAX_DT_PCT)
+    parser.add_argument("--write", action="store_true",
+                        help="write %s and %s" % (MULTICOMPONENT_CSV.name, RANKING_CSV.name))
+    args = parser.parse_args()
+
+    bulk = dict(CHEMISTRY[args.chemistry])
+    bulk.update({k: float(v) for k, v in _assignments(args.bulk, "--bulk").items()})
+    surface = dict(SURFACE)
+    surface.update(_assignments(args.surface, "--surface"))
+    kw = dict(n_points=args.points, max_dt_pct=args.max_dt_pct)
+
+    print("=" * 75)
+    print("Multicomponent Cu capture (liquid Fe, %s)" % ", ".join(SOLUTES))
+    print("=" * 75)
+    print("Bulk wt%%:    %s" % "  ".join("%s %g" % (s, bulk[s]) for s in SOLUTES))
+    print("Surface:     %s" % "  ".join("%s %s" % (s, surface.get(s, "bulk"))
+                                        for s in SOLUTES))
+    D = diffusivities(T_DATA_K)
+    print("D at %d K:  %s m2/s" % (T_DATA_K, "  ".join(
+        "%s %.2e" % (s, d) for s, d in zip(SOLUTES, D))))
+
+    t0 = time.perf_counter()
+    mg_bin, _, _, _ = sweep({"CU": bulk["CU"]}, {"CU": surface["CU"]}, ("CU",), **kw)
+    t_bin = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    mg, cu_wt, nodes, surf = sweep(bulk, surface, **kw)
+    t_mc = time.perf_counter() - t0
+    n_cases = len(TEMPS_K) * len(RADII_UM)
+    print("\nSweep: %d (T, R) cases x %d times, %d nodes: binary %.2f s, "
+          "%d solutes %.2f s\n" % (n_cases, len(TIMES_S), args.points, t_bin,
+                                   len(SOLUTES), t_mc))
+
+    j, k = RADII_UM.index(100), TIMES_S.index(1800)
+    print("R = 100 um, t = 30 min")
+    print("%6s %12s %12s %12s %8s" % ("T (K)", "O surf wt%", "binary mg",
+                                     "5-solute mg", "ratio"))
+    for i, T in enumerate(TEMPS_K):
+        o_surf = surf[i, SOLUTES.index("O")]
+        print("%6d %12s %12.4e %12.4e %8.3f" % (
+            T, "closed" if np.isnan(o_surf) else "%.4f" % o_surf,
+            mg_bin[i, j, k], mg[i, j, k], mg[i, j, k] / mg_bin[i, j, k]))
+
+    rows = rank_oxides(bulk, surface, **kw)
+    T, R, t = RANK_AT
+    print("\nOxide ranking at %d K, R = %d um, t = %d s (pO2 = %g atm)" % (T, R, t, PO2_ATM))
+    print("%-6s %-8s %10s %12s %12s %12s %12s %5s %5s" % (
+        "oxide", "product", "a_Cu", "surf bin %", "surf 5s %", "binary mg",
+        "5-solute mg", "rk b", "rk m"))
+    for r in rows:
+        print("%-6s %-8s %10.3e %12.4g %12.4g %12.4e %12.4e %5d %5d" % (
+            r["oxide"], r["product"], r["a_cu_eq"], r["cu_surface_binary_wt_pct"],
+            r["cu_surface_multicomponent_wt_pct"], r["cu_captured_binary_mg"],
+            r["cu_captured_multicomponent_mg"], r["rank_binary"],
+            r["rank_multicomponent"]))
+    movers = [r["oxide"] for r in rows if r["rank_binary"] != r["rank_multicomponent"]]
+    print("Ranking %s" % ("unchanged by the chemistry" if not movers else
+                          "changed for " + ", ".join(movers)))
+
+    if args.write:
+        n = write_summary(mg, cu_wt, nodes, surf, bulk)
+        write_ranking(rows)
+        print("\nSaved: %s (%d liquid rows recomputed)" % (MULTICOMPONENT_CSV, n))
+        print("Saved: %s" % RANKING_CSV)
+
+
+if __name__ == "__main__":
+    main()
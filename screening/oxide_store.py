@@ -0,0 +1,62 @@
+"""
+Vectorized reader for the long-format oxide Gibbs energy store.
+
+The canonical data is data/tcpython/raw/oxide_gibbs_long.csv
+(T_K, oxide, quantity, value, source_db) plus the phase-string dictionary
+oxide_gibbs_phases.csv, written by simulations/tcpython/gibbs_store.py.
+This module loads it with pandas and pivots on demand, so no reader has to
+parse wide column names like dG_Al2O3_per_O2 any more.
+
+  from oxide_store import load_store, pivot
+  store = load_store()
+  dG = pivot(store, "dG_per_O2")          # DataFrame: index T_K, one column per oxide
+  phases = pivot(store, "phases")         # phase strings, decoded
+"""
+
+from pathlib import Path
+
+import pandas as pd
+
+SCRIPT_DIR = Path(__file__).parent
+STORE = SCRIPT_DIR.parent / "data" / "tcpython" / "raw" / "oxide_gibbs_long.csv"
+
+NUMERIC_QUANTITIES = ("GM", "GM_system", "G_metal", "dG_per_O2")
+PHASE_QUANTITIES = ("phases", "oxide_phase")
+
+
+def phases_path(store_path):
+    store_path = Path(store_path)
+    stem = store_path.stem
+    stem = stem[:-len("_long")] if stem.endswith("_long") else stem
+    return store_path.with_name(stem + "_phases.csv")
+
+
+def load_store(path=STORE):
+    """Long table with duplicates resolved (the last row written wins)."""
+    store = pd.read_csv(path, dtype={"T_K": float, "oxide": str, "quantity": str,
+                                     "value": float, "source_db": str})
+    store = store.drop_duplicates(["T_K", "oxide", "quantity"], keep="last")
+    ppath = phases_path(path)
+    if ppath.exists():
+        phases = pd.read_csv(ppath, dtype={"phase_id": int, "phases": str},
+                             keep_default_na=False)
+        store.attrs["phases"] = phases.set_index("phase_id")["phases"]
+    else:
+        store.attrs["phases"] = pd.Series(dtype=str)
+    return store
+
+
+def pivot(store, quantity):
+    """One quantity as a T_K x oxide DataFrame (phase quantities decoded)."""
+    sub = store[store["quantity"] == quantity]
+    wide = sub.pivot(index="T_K", columns="oxide", values="value").sort_index()
+    if quantity in PHASE_QUANTITIES:
+        codes = store.attrs["phases"]
+        wide = wide.apply(lambda col: col.map(lambda v: codes.get(int(v)) if v == v else None))
+    return wide
+
+
+def sources(store):
+    """source_db per oxide (e.g. {"PbO": "SSUB3", "Al2O3": "TCOX14"})."""
+    last = store.drop_duplicates("oxide", keep="last")
+    return dict(zip(last["oxide"], last["source_db"]))
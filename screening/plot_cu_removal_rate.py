@@ -10,7 +10,10 @@ Reads cu_removal_rate_profiles.csv and cu_removal_rate_summary.csv
 
 Colorblind-friendly palette per CLAUDE.md.
 
-Run locally after copying CSVs from OSU VM.
+Run locally after copying CSVs from OSU VM. --figure NAME renders just one
+of them (profiles, capture, system, temperature); render_figures.py uses it
+to draw the four in parallel. --kinetics sherwood / multicomponent draws
+figures 2-4 from that capture law instead of the DICTRA summary.
 """
 
 import csv
@@ -19,6 +22,9 @@ import numpy as np
 import matplotlib.pyplot as plt
 from pathlib import Path
 
+from ladle_model import KINETICS
+from profile_metrics import Profiles
+
 SCRIPT_DIR = Path(__file__).parent
 RAW_DIR = SCRIPT_DIR.parent / "data" / "tcpython" / "raw"
 FIG_DIR = SCRIPT_DIR.parent / "figures"
@@ -35,6 +41,9 @@ OXIDE_DOSE_G = 50.0    # grams of Fe2O3
 # Reference temperature for Figs 1-3 (closest liquid temp to 1800K)
 T_REF = 1823  # K — first liquid temperature in sweep
 
+# Capture law named in the figure titles (set by --kinetics)
+SOURCE = "DICTRA"
+
 # ── Colorblind palette ───────────────────────────────────────────────
 COLORS_BY_TIME = {
     60:   "#0077BB",  # blue
@@ -64,23 +73,12 @@ MARKERS_BY_RADIUS = {
 # ── Load data ────────────────────────────────────────────────────────
 
 def load_profiles():
-    rows = []
-    with open(PROFILES_CSV) as f:
-        reader = csv.DictReader(f)
-        for r in reader:
-            rows.append({
-                "temp_K": int(r["temp_K"]),
-                "radius_um": int(r["radius_um"]),
-                "time_s": int(r["time_s"]),
-                "dist_um": float(r["distance_from_surface_um"]),
-                "cu_wt": float(r["cu_wt_pct"]),
-            })
-    return rows
+    return Profiles.from_csv(PROFILES_CSV)
 
 
-def load_summary():
+def load_summary(path=SUMMARY_CSV):
     rows = []
-    with open(SUMMARY_CSV) as f:
+    with open(path) as f:
         reader = csv.DictReader(f)
         for r in reader:
             rows.append({
@@ -103,12 +101,7 @@ def plot_profiles(profiles):
     fig, ax = plt.subplots(figsize=(7, 5))
 
     for t_s in [60, 300, 600, 1800]:
-        pts = [p for p in profiles
-               if p["temp_K"] == T_REF and p["radius_um"] == r_um
-               and p["time_s"] == t_s]
-        pts.sort(key=lambda p: p["dist_um"])
-        dist = [p["dist_um"] for p in pts]
-        cu = [p["cu_wt"] for p in pts]
+        dist, cu = profiles.profile(T_REF, r_um, t_s)
 
         ax.plot(dist, cu,
                 color=COLORS_BY_TIME[t_s],
@@ -117,12 +110,7 @@ def plot_profiles(profiles):
                 label=LABELS_BY_TIME[t_s])
 
     # Shade the depletion zone for 30 min case
-    pts_30 = [p for p in profiles
-              if p["temp_K"] == T_REF and p["radius_um"] == r_um
-              and p["time_s"] == 1800]
-    pts_30.sort(key=lambda p: p["dist_um"])
-    dist_30 = [p["dist_um"] for p in pts_30]
-    cu_30 = [p["cu_wt"] for p in pts_30]
+    dist_30, cu_30 = profiles.profile(T_REF, r_um, 1800)
     ax.fill_between(dist_30, cu_30, CU_INIT_WT, alpha=0.08, color="#009988")
 
     ax.axhline(CU_INIT_WT, color="gray", linestyle="--", alpha=0.5, linewidth=1)
@@ -291,7 +279,7 @@ def plot_system_removal(summary):
         for spine in ax.spines.values():
             spine.set_visible(False)
 
-    fig.suptitle("Cu Removal from 0.5 kg Steel at %d K (DICTRA)" % T_REF,
+    fig.suptitle("Cu Removal from 0.5 kg Steel at %d K (%s)" % (T_REF, SOURCE),
                  fontsize=13, fontweight="bold", y=1.02)
     fig.tight_layout()
     for ext in ("png", "pdf"):
@@ -397,7 +385,7 @@ def plot_temperature_effect(summary):
     for spine in ax2.spines.values():
         spine.set_visible(False)
 
-    fig.suptitle("Temperature Effect on Cu Removal (DICTRA, 0.5 kg steel)",
+    fig.suptitle("Temperature Effect on Cu Removal (%s, 0.5 kg steel)" % SOURCE,
                  fontsize=13, fontweight="bold", y=1.02)
     fig.tight_layout()
     for ext in ("png", "pdf"):
@@ -409,24 +397,47 @@ def plot_temperature_effect(summary):
 
 # ── Main ─────────────────────────────────────────────────────────────
 
+# Figure name -> (plotter, data it needs); see --figure
+FIGURES = {
+    "profiles":    (plot_profiles, "profiles"),
+    "capture":     (plot_capture_per_particle, "summary"),
+    "system":      (plot_system_removal, "summary"),
+    "temperature": (plot_temperature_effect, "summary"),
+}
+
+
 if __name__ == "__main__":
-    print("Loading DICTRA Cu removal rate data...")
-    profiles = load_profiles()
-    summary = load_summary()
-    print("  Profiles: %d points" % len(profiles))
-    print("  Summary:  %d rows" % len(summary))
+    import argparse
+    parser = argparse.ArgumentParser(description="Plot DICTRA Cu removal rate results")
+    parser.add_argument("--figure", action="append", choices=list(FIGURES),
+                        help="only this figure (repeatable; default all four)")
+    parser.add_argument("--kinetics", choices=list(KINETICS), default="dictra",
+                        help="capture law for figures 2-4: stagnant DICTRA, "
+                             "stirred-melt Sherwood or scrap-melt multicomponent")
+    args = parser.parse_args()
+    names = args.figure or list(FIGURES)
+    if args.kinetics != "dictra":
+        SOURCE = "%s kinetics" % args.kinetics
+    needs = {FIGURES[n][1] for n in names}
 
-    temps = sorted(set(s["temp_K"] for s in summary))
-    print("  Temperatures: %s" % temps)
+    print("Loading DICTRA Cu removal rate data...")
+    data = {}
+    if "profiles" in needs:
+        data["profiles"] = load_profiles()
+        print("  Profiles: %d points" % len(data["profiles"].dist_um))
+    if "summary" in needs:
+        summary = data["summary"] = load_summary(KINETICS[args.kinetics])
+        print("  Summary:  %d rows" % len(summary))
+        temps = sorted(set(s["temp_K"] for s in summary))
+        print("  Temperatures: %s" % temps)
     print("  Reference T for Figs 1-3: %d K" % T_REF)
     print()
 
     FIG_DIR.mkdir(exist_ok=True)
 
-    plot_profiles(profiles)
-    plot_capture_per_particle(summary)
-    plot_system_removal(summary)
-    plot_temperature_effect(summary)
+    for name in names:
+        plotter, needed = FIGURES[name]
+        plotter(data[needed])
 
     print()
-    print("Done. 4 figures saved to %s" % FIG_DIR)
+    print("Done. %d figure(s) saved to %s" % (len(names), FIG_DIR))
@@ -5,8 +5,12 @@ Reads ternary_phase_map_1800K.csv and produces filled ternary phase maps
 for each Cu-M-O system, using Delaunay triangulation with tripcolor.
 
 Run locally after copying CSV from OSU VM.
+
+  python3 plot_ternary_phase.py                    (all systems)
+  python3 plot_ternary_phase.py --system Cu-Al-O   (one map)
 """
 
+import argparse
 import csv
 import numpy as np
 import matplotlib.pyplot as plt
@@ -53,6 +57,11 @@ def ternary_to_cartesian(x_cu, x_m, x_o):
 
 
 def main():
+    parser = argparse.ArgumentParser(description="Ternary phase maps at 1800 K")
+    parser.add_argument("--system", action="append",
+                        help="only this system, e.g. Cu-Al-O (repeatable)")
+    args = parser.parse_args()
+
     if not CSV_IN.exists():
         print(f"ERROR: {CSV_IN} not found!")
         print("Run ternary_phase_map_1800K.py on OSU VM first.")
@@ -72,6 +81,13 @@ def main():
             systems[sys_name] = []
         systems[sys_name].append(r)
 
+    if args.system:
+        unknown = [name for name in args.system if name not in systems]
+        if unknown:
+            raise SystemExit(f"ERROR: no data for {', '.join(unknown)} "
+                             f"(have {', '.join(systems)})")
+        systems = {name: systems[name] for name in args.system}
+
     for sys_name, sys_rows in systems.items():
         print(f"\n{'='*60}")
         print(f"System: {sys_name} at 1800K")
@@ -0,0 +1,288 @@
+"""
+Capture metrics for the DICTRA Cu removal profiles, vectorized over all runs.
+
+cu_removal_rate.py (OSU VM) reduces each radial Cu profile to a few numbers
+(cu_captured_mg, depletion_depth_um, cu_removed_shell_pct) with per-point
+loops while the sweep runs. This module recomputes those from
+cu_removal_rate_profiles.csv, so a metric can be redefined or added without
+rerunning DICTRA, and adds:
+
+  - depletion depth at any fraction of bulk (50 %, 99 %), interpolated
+  - Cu gradient at the particle surface
+  - flux into the particle: mean over [0, t] and between saved times,
+    from the captured mass (J = dm/dt / 4 pi R^2)
+  - effective mass-transfer coefficient k = J / (rho * (w_bulk - w_surf))
+
+The profiles are held as one ragged set (Profiles): flat point arrays
+sorted by run, plus run offsets. Every metric is one NumPy pass over all
+220 runs (np.add.reduceat / np.minimum.reduceat over the run segments); no
+per-run Python loop.
+
+  python3 profile_metrics.py            metrics table -> processed/
+  python3 profile_metrics.py --check    compare with the VM's summary CSV
+
+From a script:
+  from profile_metrics import Profiles, metrics
+  m = metrics(Profiles.from_csv())
+  m["depletion_50_um"], m["k_eff_m_s"], ...
+"""
+
+import argparse
+import csv
+from pathlib import Path
+
+import numpy as np
+
+from ladle_model import CU_REF_WT, RHO_STEEL
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+RAW_DIR = SCRIPT_DIR.parent / "data" / "tcpython" / "raw"
+PROC_DIR = SCRIPT_DIR.parent / "data" / "tcpython" / "processed"
+PROFILES_CSV = RAW_DIR / "cu_removal_rate_profiles.csv"
+SUMMARY_CSV = RAW_DIR / "cu_removal_rate_summary.csv"
+CSV_OUT = PROC_DIR / "cu_removal_profile_metrics.csv"
+
+DEPLETION_FRACTION = 0.90   # VM definition of depletion_depth_um
+
+
+class Profiles:
+    """
+    All radial profiles as ragged arrays: run i owns the points
+    offsets[i]:offsets[i + 1] of dist_um / cu_wt (sorted by distance).
+    temp_K, radius_um and time_s have one entry per run.
+    """
+
+    def __init__(self, temp_K, radius_um, time_s, offsets, dist_um, cu_wt):
+        self.temp_K = np.asarray(temp_K)
+        self.radius_um = np.asarray(radius_um)
+        self.time_s = np.asarray(time_s)
+        self.offsets = np.asarray(offsets)
+        self.dist_um = np.asarray(dist_um, dtype=float)
+        self.cu_wt = np.asarray(cu_wt, dtype=float)
+
+    @classmethod
+    def from_csv(cls, path=PROFILES_CSV):
+        cols = np.loadtxt(path, delimiter=",", skiprows=1, usecols=(0, 1, 2, 4, 6),
+                          ndmin=2)
+        temp, radius, time_s, dist, cu = cols.T
+        # Group by run, keeping each run's points in distance order
+        order = np.lexsort((dist, time_s, radius, temp))
+        temp, radius, time_s = temp[order], radius[order], time_s[order]
+        new_run = np.ones(len(order), dtype=bool)
+        new_run[1:] = ((temp[1:] != temp[:-1]) | (radius[1:] != radius[:-1])
+                       | (time_s[1:] != time_s[:-1]))
+        starts = np.flatnonzero(new_run)
+        offsets = np.append(starts, len(order))
+        return cls(temp[starts].astype(int), radius[starts].astype(int),
+                   time_s[starts].astype(int), offsets, dist[order], cu[order])
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    @property
+    def starts(self):
+        return self.offsets[:-1]
+
+    @property
+    def ends(self):
+        """Index of each run's last point."""
+        return self.offsets[1:] - 1
+
+    @property
+    def run_of_point(self):
+        return np.repeat(np.arange(len(self)), np.diff(self.offsets))
+
+    def find(self, temp_K, radius_um, time_s):
+        """Run index for a (T, R, t) triplet; KeyError if absent."""
+        hit = np.flatnonzero((self.temp_K == temp_K) & (self.radius_um == radius_um)
+                             & (self.time_s == time_s))
+        if not len(hit):
+            raise KeyError((temp_K, radius_um, time_s))
+        return int(hit[0])
+
+    def profile(self, temp_K, radius_um, time_s):
+        """(dist_um, cu_wt) arrays of one run."""
+        i = self.find(temp_K, radius_um, time_s)
+        sl = slice(self.offsets[i], self.offsets[i + 1])
+        return self.dist_um[sl], self.cu_wt[sl]
+
+
+# ============================================================================
+# Metrics (one value per run)
+# ============================================================================
+
+def _segments(p):
+    """Start index of each run among the n_points - n_runs segments."""
+    return p.starts - np.arange(len(p))
+
+
+def captured_mg(p, bulk_wt=CU_REF_WT, rho=RHO_STEEL):
+    """Cu removed from the steel shell (mg): trapezoid in spherical coords."""
+    # Segments (k-1, k) inside a run; the VM's loop, as arrays
+    inside = np.ones(len(p.dist_um), dtype=bool)
+    inside[p.starts] = False
+    k = np.flatnonzero(inside)
+    r_m = np.repeat(p.radius_um * 1e-6, np.diff(p.offsets) - 1)
+    d1, d2 = p.dist_um[k - 1] * 1e-6, p.dist_um[k] * 1e-6
+    r_mid = r_m + 0.5 * (d1 + d2)
+    dc_mid = bulk_wt / 100 - 0.5 * (p.cu_wt[k - 1] + p.cu_wt[k]) / 100
+    dm = dc_mid * rho * 4 * np.pi * r_mid ** 2 * (d2 - d1)
+    return np.add.reduceat(dm, _segments(p)) * 1e6
+
+
+def shell_removed_pct(p, captured, bulk_wt=CU_REF_WT, rho=RHO_STEEL):
+    """captured as % of the Cu initially in the modelled shell."""
+    r_m = p.radius_um * 1e-6
+    shell_m = p.dist_um[p.ends] * 1e-6
+    shell_vol = 4 / 3 * np.pi * ((r_m + shell_m) ** 3 - r_m ** 3)
+    return captured / (bulk_wt / 100 * rho * shell_vol * 1e6) * 100
+
+
+def depletion_depth(p, fraction=DEPLETION_FRACTION, bulk_wt=CU_REF_WT,
+                    interpolate=False):
+    """
+    Distance (um) at which Cu first reaches fraction * bulk. Without
+    interpolation this is the first grid point at or above the threshold
+    (the VM definition); runs that never reach it get the shell width.
+    """
+    n = len(p.dist_um)
+    threshold = fraction * bulk_wt
+    above = np.where(p.cu_wt >= threshold, np.arange(n), n)
+    first = np.minimum.reduceat(above, p.starts)
+    never = first == n
+    first = np.where(never, p.ends, first)
+    depth = p.dist_um[first]
+    if interpolate:
+        # Linear between the last point below and the first point above
+        prev = np.maximum(first - 1, p.starts)
+        c0, c1 = p.cu_wt[prev], p.cu_wt[first]
+        d0 = p.dist_um[prev]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            frac = np.where(c1 > c0, (threshold - c0) / (c1 - c0), 1.0)
+        depth = np.where(never | (prev == first), depth,
+                         d0 + np.clip(frac, 0.0, 1.0) * (depth - d0))
+    return depth
+
+
+def surface_gradient(p):
+    """dCu/dr at the particle surface (wt% per um), first grid segment."""
+    s = p.starts
+    return (p.cu_wt[s + 1] - p.cu_wt[s]) / (p.dist_um[s + 1] - p.dist_um[s])
+
+
+def fluxes(p, captured):
+    """
+    (mean, interval) Cu flux into the particle, kg/m2/s. The mean is over
+    [0, t]; the interval flux is between this run and the previous saved
+    time of the same (T, R) (from t = 0 for the first).
+    """
+    area = 4 * np.pi * (p.radius_um * 1e-6) ** 2
+    mass_kg = captured * 1e-6
+    mean = mass_kg / (area * p.time_s)
+
+    order = np.lexsort((p.time_s, p.radius_um, p.temp_K))
+    t, m = p.time_s[order].astype(float), mass_kg[order]
+    first = np.ones(len(order), dtype=bool)
+    first[1:] = ((p.temp_K[order][1:] != p.temp_K[order][:-1])
+                 | (p.radius_um[order][1:] != p.radius_um[order][:-1]))
+    dt = np.where(first, t, t - np.roll(t, 1))
+    dm = np.where(first, m, m - np.roll(m, 1))
+    interval = np.empty(len(order))
+    interval[order] = dm / dt
+    return mean, interval / area
+
+
+def metrics(p, bulk_wt=CU_REF_WT, rho=RHO_STEEL):
+    """Every metric for every run, as {column: array}."""
+    captured = captured_mg(p, bulk_wt, rho)
+    mean_flux, interval_flux = fluxes(p, captured)
+    surface = p.cu_wt[p.starts]
+    driving = rho * (bulk_wt - surface) / 100          # kg Cu / m3
+    return {
+        "temp_K": p.temp_K,
+        "radius_um": p.radius_um,
+        "time_s": p.time_s,
+        "cu_surface_wt_pct": surface,
+        "cu_farfield_wt_pct": p.cu_wt[p.ends],
+        "depletion_depth_um": depletion_depth(p, DEPLETION_FRACTION, bulk_wt),
+        "depletion_50_um": depletion_depth(p, 0.50, bulk_wt, interpolate=True),
+        "depletion_90_um": depletion_depth(p, 0.90, bulk_wt, interpolate=True),
+        "depletion_99_um": depletion_depth(p, 0.99, bulk_wt, interpolate=True),
+        "cu_captured_mg": captured,
+        "cu_removed_shell_pct": shell_removed_pct(p, captured, bulk_wt, rho),
+        "surface_gradient_wt_per_um": surface_gradient(p),
+        "flux_mean_kg_m2_s": mean_flux,
+        "flux_interval_kg_m2_s": interval_flux,
+        "k_eff_mean_m_s": mean_flux / driving,
+        "k_eff_interval_m_s": interval_flux / driving,
+    }
+
+
+def write_csv(m, path=CSV_OUT):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(list(m))
+        writer.writerows(zip(*(col.tolist() for col in m.values())))
+
+
+def check(m, path=SUMMARY_CSV):
+    """Max relative difference from the VM's summary values, per column."""
+    rows = {}
+    with open(path) as f:
+        for r in csv.DictReader(f):
+            if float(r["cu_captured_mg"]) >= 0:      # failed points are -1
+                rows[(int(r["temp_K"]), int(r["radius_um"]), int(r["time_s"]))] = r
+    keys = list(zip(m["temp_K"].tolist(), m["radius_um"].tolist(),
+                    m["time_s"].tolist()))
+    idx = [i for i, key in enumerate(keys) if key in rows]
+    worst = {}
+    for col in ("cu_surface_wt_pct", "cu_farfield_wt_pct", "depletion_depth_um",
+                "cu_captured_mg", "cu_removed_shell_pct"):
+        ref = np.array([float(rows[keys[i]][col]) for i in idx])
+        got = m[col][idx]
+        worst[col] = float(np.max(np.abs(got - ref) / np.maximum(np.abs(ref), 1e-300)))
+    return len(idx), worst
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Capture metrics from the DICTRA Cu removal profiles")
+    parser.add_argument("--check", action="store_true",
+                        help="compare with cu_removal_rate_summary.csv")
+    parser.add_argument("--out", type=Path, default=CSV_OUT,
+                        help="metrics CSV (default %(default)s)")
+    args = parser.parse_args()
+
+    print("=" * 70)
+    print("Cu removal profile metrics")
+    print("=" * 70)
+    p = Profiles.from_csv()
+    m = metrics(p)
+    print("%d runs, %d profile points" % (len(p), len(p.dist_um)))
+
+    if args.check:
+        n, worst = check(m)
+        print("\nMax relative difference vs %s (%d runs):" % (SUMMARY_CSV.name, n))
+        for col, rel in worst.items():
+            print("  %-24s %.2e" % (col, rel))
+        return
+
+    write_csv(m, args.out)
+    print("Written: %s" % args.out)
+
+    # Reference-temperature overview (liquid, 30 min)
+    T_ref = 1823
+    sel = np.flatnonzero((p.temp_K == T_ref) & (p.time_s == 1800))
+    print("\n%d K, 30 min:" % T_ref)
+    print("  %6s %10s %10s %10s %12s %12s" % (
+        "R(um)", "capt(mg)", "d50(um)", "d99(um)", "J(kg/m2s)", "k_eff(m/s)"))
+    for i in sel:
+        print("  %6d %10.3e %10.0f %10.0f %12.3e %12.3e" % (
+            p.radius_um[i], m["cu_captured_mg"][i], m["depletion_50_um"][i],
+            m["depletion_99_um"][i], m["flux_mean_kg_m2_s"][i],
+            m["k_eff_mean_m_s"][i]))
+
+
+if __name__ == "__main__":
+    main()
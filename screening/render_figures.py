@@ -0,0 +1,322 @@
+"""
+Render every figure under figures/ in parallel, skipping the up-to-date ones.
+
+FIGURES is the registry: each figure names the script (and arguments) that
+draws it, the data files it reads and the files it writes. The runner
+
+  1. hashes each figure's inputs together with its script, its arguments and
+     every repository module the script imports (directly or through another
+     module), so editing e.g. ladle_model.py re-renders the figures using it;
+  2. skips figures whose hash matches the last render and whose outputs are
+     still the files that render wrote (figures/.manifests/<name>.manifest.json);
+  3. renders the rest on a process pool, slowest first (by the last recorded
+     duration), so a full regeneration takes about as long as the slowest
+     figure rather than the sum of all of them.
+
+Workers import matplotlib once (Agg backend) and run the plot scripts
+in-process, exactly as python3 <script> would, with their rcParams changes
+undone after each figure. The scripts themselves are unchanged and still run
+on their own; the multi-figure ones take --figure / --system so each output
+can be a separate job.
+
+Usage:
+  python3 render_figures.py                  (stale figures, all cores)
+  python3 render_figures.py breakeven dG     (only these, if stale)
+  python3 render_figures.py --force          (ignore the hashes)
+  python3 render_figures.py --list           (registry and status)
+
+compute_activity_corrected_dG.py also writes two figures, but as a side
+effect of producing activity_corrected_dG.csv; it stays a pipeline stage
+(watch_pipeline.py) rather than a registry entry.
+"""
+
+import argparse
+import ast
+import contextlib
+import io
+import json
+import os
+import runpy
+import sys
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+MANIFEST_DIR = ROOT / "figures" / ".manifests"
+
+RAW = "data/tcpython/raw/"
+FIG = "figures/"
+SUMMARY = RAW + "cu_removal_rate_summary.csv"
+
+# Where the scripts' sibling modules live (the sys.path entries they add)
+IMPORT_DIRS = ("screening", "simulations/tcpython")
+
+
+def _both(stem):
+    return [FIG + stem + ".png", FIG + stem + ".pdf"]
+
+
+# name -> (script, args, inputs, outputs); paths relative to the repository root.
+# inputs are data files; imported modules are added by local_imports().
+FIGURES = {
+    "removal-profiles": ("screening/plot_cu_removal_rate.py", ["--figure", "profiles"],
+                         [RAW + "cu_removal_rate_profiles.csv"],
+                         _both("cu_removal_profiles")),
+    "removal-capture": ("screening/plot_cu_removal_rate.py", ["--figure", "capture"],
+                        [SUMMARY], _both("cu_capture_per_particle")),
+    "removal-system": ("screening/plot_cu_removal_rate.py", ["--figure", "system"],
+                       [SUMMARY], _both("cu_removal_system_scale")),
+    "removal-temperature": ("screening/plot_cu_removal_rate.py", ["--figure", "temperature"],
+                            [SUMMARY], _both("cu_removal_temperature_effect")),
+    "dG": ("screening/plot_dG_vs_T.py", [],
+           [RAW + "dG_vs_T_top6.csv", RAW + "ternary_reaction_energies.csv"],
+           _both("dG_vs_T_top6")),
+    "activity": ("screening/plot_cu_activity.py", [],
+                 [RAW + "cu_activity_vs_oxide.csv"], _both("cu_activity_vs_oxide")),
+    "slag": ("screening/plot_slag_effects.py", [],
+             [RAW + "slag_composition_effects.csv"], _both("slag_basicity_vs_aCu")),
+    "phase-map-cu-al-o": ("screening/plot_ternary_phase.py", ["--system", "Cu-Al-O"],
+                          [RAW + "ternary_phase_map_1800K.csv"],
+                          _both("phase_map_cu_al_o_1800K")),
+    "phase-map-cu-fe-o": ("screening/plot_ternary_phase.py", ["--system", "Cu-Fe-O"],
+                          [RAW + "ternary_phase_map_1800K.csv"],
+                          _both("phase_map_cu_fe_o_1800K")),
+    "phase-map-cu-mn-o": ("screening/plot_ternary_phase.py", ["--system", "Cu-Mn-O"],
+                          [RAW + "ternary_phase_map_1800K.csv"],
+                          _both("phase_map_cu_mn_o_1800K")),
+    "breakeven": ("screening/visualizations/breakeven_contour.py", [],
+                  [SUMMARY], _both("breakeven_contour")),
+    "tornado": ("screening/visualizations/sensitivity_tornado.py", [],
+                [SUMMARY], _both("sensitivity_tornado")),
+    "dose-response": ("screening/visualizations/dose_response_curves.py", [],
+                      [SUMMARY], _both("dose_response_curves")),
+    "decision-matrix": ("screening/visualizations/oxide_decision_matrix.py", [],
+                        [], _both("oxide_decision_matrix")),
+    "overlay": ("screening/visualizations/thermo_kinetics_overlay.py", [],
+                [SUMMARY], _both("thermo_kinetics_overlay")),
+    "predictor": ("screening/visualizations/experiment_predictor.py", [],
+                  [SUMMARY], _both("experiment_predictor")),
+    "animate": ("screening/visualizations/animate_cu_removal.py", [],
+                [SUMMARY], [FIG + "cu_removal_sweep.gif"]),
+    "heatmap": ("screening/visualizations/heatmap_cu_removal.py", [],
+                [SUMMARY], [FIG + "cu_removal_heatmap.html"]),
+    "surface3d": ("screening/visualizations/surface3d_cu_removal.py", [],
+                  [SUMMARY], [FIG + "cu_removal_3d.html"]),
+    "interactive": ("screening/visualizations/plotly_cu_removal.py", [],
+                    [SUMMARY], [FIG + "cu_removal_interactive.html"]),
+}
+
+TAIL_LINES = 8     # lines of a failed figure's output to show
+
+
+# ============================================================================
+# Manifests
+# ============================================================================
+
+def _hash_files(paths):
+    from incremental_xlsx import hash_files
+    return hash_files(paths)
+
+
+def local_imports(script, found=None):
+    """
+    Repository modules `script` imports, at any depth (including imports
+    inside functions), as sorted paths relative to the root. A module is
+    looked up next to the importing file, then in IMPORT_DIRS; anything not
+    found there (numpy, the stdlib, ...) is ignored.
+    """
+    found = set() if found is None else found
+    path = ROOT / script
+    names = set()
+    for node in ast.walk(ast.parse(path.read_text(), str(path))):
+        if isinstance(node, ast.Import):
+            names.update(alias.name.split(".")[0] for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.level == 0 and node.module:
+            names.add(node.module.split(".")[0])
+    for mod in sorted(names):
+        for folder in (path.parent, *(ROOT / d for d in IMPORT_DIRS)):
+            candidate = folder / (mod + ".py")
+            if candidate.exists():
+                rel = candidate.relative_to(ROOT).as_posix()
+                if rel not in found:
+                    found.add(rel)
+                    local_imports(rel, found)
+                break
+    return sorted(found)
+
+
+def inputs(name):
+    """A figure's data files plus the modules its script imports."""
+    script, _, data, _ = FIGURES[name]
+    return [*data, *(m for m in local_imports(script) if m != script)]
+
+
+def signature(name):
+    """Hash of a figure's script, arguments, input files and imported modules."""
+    script, args, _, _ = FIGURES[name]
+    return "%s:%s" % (_hash_files([ROOT / script, *(ROOT / p for p in inputs(name))]),
+                      " ".join(args))
+
+
+def manifest_path(name):
+    return MANIFEST_DIR / (name + ".manifest.json")
+
+
+def load_manifest(name):
+    path = manifest_path(name)
+    if not path.exists():
+        return None
+    with open(path) as f:
+        return json.load(f)
+
+
+def save_manifest(name, manifest):
+    MANIFEST_DIR.mkdir(parents=True, exist_ok=True)
+    with open(manifest_path(name), "w") as f:
+        json.dump(manifest, f, indent=2)
+        f.write("\n")
+
+
+def output_hashes(name):
+    return {p: _hash_files([ROOT / p]) for p in FIGURES[name][3]}
+
+
+def is_current(name, old, sig):
+    """True if the last render used `sig` and its outputs are untouched."""
+    if old is None or old.get("signature") != sig:
+        return False
+    if not all((ROOT / p).exists() for p in FIGURES[name][3]):
+        return False
+    return old.get("outputs") == output_hashes(name)
+
+
+# ============================================================================
+# Rendering
+# ============================================================================
+
+def _init_worker():
+    """Import matplotlib once per worker process."""
+    os.environ["MPLBACKEND"] = "Agg"
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot  # noqa: F401
+
+
+def render(name):
+    """
+    Run a figure's script in this process (as python3 <script> args would).
+    Returns (name, seconds, captured stdout, traceback text or None).
+    """
+    import matplotlib
+    import matplotlib.pyplot as plt
+
+    script, args, _, _ = FIGURES[name]
+    path = ROOT / script
+    saved = sys.argv, sys.path[0]
+    sys.argv = [str(path), *args]
+    sys.path[0] = str(path.parent)      # sibling imports
+    out = io.StringIO()
+    error = None
+    t0 = time.perf_counter()
+    try:
+        with matplotlib.rc_context(), contextlib.redirect_stdout(out):
+            runpy.run_path(str(path), run_name="__main__")
+    except SystemExit as exc:
+        if exc.code not in (None, 0):
+            error = "exit status %s" % exc.code
+    except Exception:
+        error = traceback.format_exc()
+    finally:
+        plt.close("all")
+        sys.argv, sys.path[0] = saved
+    return name, time.perf_counter() - t0, out.getvalue(), error
+
+
+def render_all(names, jobs, force=False, log=print):
+    """
+    Render the stale figures among `names`. Returns {name: (status, seconds)}
+    with status "rendered", "current" or "failed".
+    """
+    results, stale, manifests, sigs = {}, [], {}, {}
+    for name in names:
+        manifests[name] = load_manifest(name)
+        sigs[name] = signature(name)
+        if not force and is_current(name, manifests[name], sigs[name]):
+            results[name] = ("current", 0.0)
+        else:
+            stale.append(name)
+    if not stale:
+        return results
+
+    # Longest first, so the slowest figure starts right away
+    stale.sort(key=lambda n: -(manifests[n] or {}).get("seconds", 0.0))
+    with ProcessPoolExecutor(max_workers=max(1, min(jobs, len(stale))),
+                             initializer=_init_worker) as pool:
+        futures = [pool.submit(render, name) for name in stale]
+        for future in as_completed(futures):
+            name, seconds, output, error = future.result()
+            missing = [p for p in FIGURES[name][3] if not (ROOT / p).exists()]
+            if error is None and missing:
+                error = "did not write %s" % ", ".join(missing)
+            if error is None:
+                save_manifest(name, {"signature": sigs[name],
+                                     "outputs": output_hashes(name),
+                                     "seconds": round(seconds, 2)})
+                results[name] = ("rendered", seconds)
+                log("  done  %-20s %5.1f s" % (name, seconds))
+            else:
+                results[name] = ("failed", seconds)
+                log("  FAIL  %-20s %5.1f s" % (name, seconds))
+                for line in (output + error).rstrip().splitlines()[-TAIL_LINES:]:
+                    log("        | " + line)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Render the figures/ outputs in parallel, skipping current ones")
+    parser.add_argument("names", nargs="*", metavar="FIGURE",
+                        help="registry names (default all; see --list)")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count() or 1,
+                        help="worker processes (default %(default)s)")
+    parser.add_argument("--force", action="store_true",
+                        help="render even if inputs and code are unchanged")
+    parser.add_argument("--list", action="store_true",
+                        help="show the registry and which figures are stale")
+    args = parser.parse_args()
+
+    unknown = [n for n in args.names if n not in FIGURES]
+    if unknown:
+        parser.error("unknown figure(s): %s (see --list)" % ", ".join(unknown))
+    names = args.names or list(FIGURES)
+
+    if args.list:
+        for name in names:
+            script, fig_args, _, outputs = FIGURES[name]
+            state = "current" if is_current(name, load_manifest(name),
+                                            signature(name)) else "stale"
+            print("%-20s %-8s %s %s -> %s" % (
+                name, state, script, " ".join(fig_args),
+                ", ".join(Path(p).name for p in outputs)))
+        return 0
+
+    t0 = time.perf_counter()
+    results = render_all(names, args.jobs, args.force)
+    wall = time.perf_counter() - t0
+
+    counts = {s: sum(1 for st, _ in results.values() if st == s)
+              for s in ("rendered", "current", "failed")}
+    n_files = sum(len(FIGURES[n][3]) for n, (st, _) in results.items()
+                  if st == "rendered")
+    print("\n%d figures: %d rendered (%d files), %d current, %d failed; "
+          "wall %.1f s (render total %.1f s, %d jobs)" % (
+              len(results), counts["rendered"], n_files, counts["current"],
+              counts["failed"], wall, sum(s for _, s in results.values()),
+              args.jobs))
+    return 1 if counts["failed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,412 @@
+"""
+Multi-fidelity screening of Cu + MOx -> CuMOy reactions.
+
+extract_ternary_reactions.py runs a full TCOX14 equilibrium for every
+product at every temperature (18 products x 23 temperatures, plus the
+reference calculations). Most of those points are not close to the
+viability threshold, so a cheap bound is enough to decide them. This script
+screens the candidate library in three tiers and only sends the undecided
+points to Thermo-Calc:
+
+  Tier 0  Linearized Ellingham data, dGf = A + B*T per formula unit.
+          The product is split into its constituent binary oxides
+          (CuAl2O4 = CuO + Al2O3, CuMn2O4 = CuO + Mn2O3, ...):
+            dG_rxn = sum dGf(constituents) - n_ox * dGf(MOx) + dG_complex
+          dG_complex (mixed-oxide formation from the binaries) is not known,
+          so it is bounded by a range per structure family. Together with a
+          linearization error band this gives [lower, upper] for dG_rxn.
+
+  Tier 1  Cached TC-Python results (ternary_reaction_energies.csv,
+          dG_vs_T_top6.csv, generated_candidates_dG.csv,
+          tier2_equilibria.csv), linearly interpolated in
+          T between neighbouring points. The bound is the interpolation error
+          estimated from the local curvature, |f''| h^2 / 8, plus a small
+          numerical tolerance.
+
+  Tier 2  Points whose tier-1 bounds still straddle the threshold (or that
+          have no cached data) are written to tier2_queue.csv. Run
+          simulations/tcpython/screen_tier2_equilibria.py on the OSU VM to
+          compute only those points; its output is picked up by tier 1 on
+          the next run.
+
+A point is VIABLE if its upper bound is below the threshold, NOT VIABLE if
+its lower bound is above it, and goes to the next tier otherwise.
+
+Output: screening/tiered_screening_results.csv
+        screening/tier2_queue.csv   (points that need an equilibrium call)
+
+Usage:
+  python3 tiered_screening.py
+  python3 tiered_screening.py --threshold -10 --temps 1000 1500 1800
+  python3 tiered_screening.py --no-cache        (tier 0 only: cost without TC data)
+  python3 tiered_screening.py --library         (generated_candidates.csv)
+"""
+
+import argparse
+import csv
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).parent
+RAW_DIR = SCRIPT_DIR.parent / "data" / "tcpython" / "raw"
+
+# Tier-1 sources; later files win where they overlap (finer / newer data)
+CACHE_FILES = [
+    RAW_DIR / "ternary_reaction_energies.csv",
+    RAW_DIR / "dG_vs_T_top6.csv",
+    RAW_DIR / "generated_candidates_dG.csv",
+    RAW_DIR / "tier2_equilibria.csv",
+]
+
+# Written by simulations/tcpython/candidate_generator.py --csv
+GENERATED_LIBRARY = SCRIPT_DIR / "generated_candidates.csv"
+
+CSV_OUT = SCRIPT_DIR / "tiered_screening_results.csv"
+QUEUE_OUT = SCRIPT_DIR / "tier2_queue.csv"
+
+# Same temperature grid as extract_ternary_reactions.py
+T_MIN = 800
+T_MAX = 1900
+T_STEP = 50
+
+# dG_rxn below this is viable (kJ per formula unit of product)
+THRESHOLD_KJ = 0.0
+
+# =============================================================================
+# Tier 0 data: linearized standard Gibbs energy of formation
+# dGf = A + B*T  (kJ per formula unit, T in K)
+# =============================================================================
+LINEAR_GIBBS = {
+    # From cu_ceramic_affinity.py / compute_cu_o_data.py
+    "Cu2O":  (-170.0, 0.075),
+    "CuO":   (-155.0, 0.085),
+    "Al2O3": (-1676.0, 0.32),
+    "MgO":   (-601.0, 0.11),
+    "SiO2":  (-910.0, 0.18),
+    "TiO2":  (-944.0, 0.18),
+    "FeO":   (-264.0, 0.065),
+    # dHf(298) - T*dSf(298), NIST-JANAF / Barin
+    "Fe2O3": (-824.2, 0.275),
+    "MnO":   (-385.2, 0.075),
+    "Mn2O3": (-959.0, 0.261),
+    "Cr2O3": (-1139.7, 0.274),
+    "V2O5":  (-1550.6, 0.440),
+    "CaO":   (-634.9, 0.106),
+    "ZrO2":  (-1100.6, 0.194),
+    "NiO":   (-239.7, 0.094),
+    "CoO":   (-237.9, 0.080),
+    "Co3O4": (-891.0, 0.393),
+    "La2O3": (-1793.7, 0.295),
+    "CeO2":  (-1088.7, 0.215),
+    "B2O3":  (-1273.5, 0.266),
+}
+# Co2O3 is not stable on its own: the O-balanced 2/3 Co3O4 + 1/6 O2 stands in
+# for it (dGf of O2 is zero), so Co(III) products keep their O count
+LINEAR_GIBBS["Co2O3"] = tuple(2 / 3 * v for v in LINEAR_GIBBS["Co3O4"])
+
+# Linearization error per formula unit of each constituent (kJ).
+# Grows with distance from 298 K (melting, phase changes, Cp terms).
+LINEAR_ERR_KJ = 4.0
+LINEAR_ERR_PER_K = 0.01
+
+# Range of dG_complex: formation of the ternary from its binary oxides (kJ)
+COMPLEX_RANGE_KJ = {
+    "spinel":       (-80.0, 10.0),
+    "delafossite":  (-60.0, 15.0),
+    "vanadate":     (-120.0, 5.0),
+    "silicate":     (-50.0, 15.0),
+    "titanate":     (-50.0, 20.0),
+    "borate":       (-80.0, 10.0),
+    "hypothetical": (-30.0, 40.0),
+}
+
+# Candidate library (products of ternary_systems.py TERNARY_SYSTEMS)
+#   oxide / n_oxide_fu: reactant oxide and formula units consumed
+#   constituents: binary oxides with the same metal and O atoms as the product
+CANDIDATES = [
+    {"product": "CuAl2O4", "oxide": "Al2O3", "n_oxide_fu": 1, "family": "spinel",
+     "constituents": {"CuO": 1, "Al2O3": 1}},
+    {"product": "CuAlO2", "oxide": "Al2O3", "n_oxide_fu": 0.5, "family": "delafossite",
+     "constituents": {"Cu2O": 0.5, "Al2O3": 0.5}},
+    {"product": "CuCr2O4", "oxide": "Cr2O3", "n_oxide_fu": 1, "family": "spinel",
+     "constituents": {"CuO": 1, "Cr2O3": 1}},
+    {"product": "CuMn2O4", "oxide": "MnO", "n_oxide_fu": 2, "family": "spinel",
+     "constituents": {"CuO": 1, "Mn2O3": 1}},
+    {"product": "CuFe2O4", "oxide": "FeO", "n_oxide_fu": 2, "family": "spinel",
+     "constituents": {"CuO": 1, "Fe2O3": 1}},
+    {"product": "CuV2O6", "oxide": "V2O5", "n_oxide_fu": 1, "family": "vanadate",
+     "constituents": {"CuO": 1, "V2O5": 1}},
+    {"product": "Cu3V2O8", "oxide": "V2O5", "n_oxide_fu": 1, "family": "vanadate",
+     "constituents": {"CuO": 3, "V2O5": 1}},
+    {"product": "CuTiO3", "oxide": "TiO2", "n_oxide_fu": 1, "family": "titanate",
+     "constituents": {"CuO": 1, "TiO2": 1}},
+    {"product": "CuSiO3", "oxide": "SiO2", "n_oxide_fu": 1, "family": "silicate",
+     "constituents": {"CuO": 1, "SiO2": 1}},
+    {"product": "Cu2SiO4", "oxide": "SiO2", "n_oxide_fu": 1, "family": "silicate",
+     "constituents": {"CuO": 2, "SiO2": 1}},
+    {"product": "CuMgO2", "oxide": "MgO", "n_oxide_fu": 1, "family": "hypothetical",
+     "constituents": {"CuO": 1, "MgO": 1}},
+    {"product": "CuCaO2", "oxide": "CaO", "n_oxide_fu": 1, "family": "hypothetical",
+     "constituents": {"CuO": 1, "CaO": 1}},
+    {"product": "CuZrO3", "oxide": "ZrO2", "n_oxide_fu": 1, "family": "hypothetical",
+     "constituents": {"CuO": 1, "ZrO2": 1}},
+    {"product": "CuNiO2", "oxide": "NiO", "n_oxide_fu": 1, "family": "delafossite",
+     "constituents": {"CuO": 1, "NiO": 1}},
+    {"product": "CuCo2O4", "oxide": "CoO", "n_oxide_fu": 2, "family": "spinel",
+     "constituents": {"CuO": 1, "Co2O3": 1}},
+    {"product": "CuLaO2", "oxide": "La2O3", "n_oxide_fu": 0.5, "family": "delafossite",
+     "constituents": {"Cu2O": 0.5, "La2O3": 0.5}},
+    {"product": "CuCeO3", "oxide": "CeO2", "n_oxide_fu": 1, "family": "hypothetical",
+     "constituents": {"CuO": 1, "CeO2": 1}},
+    {"product": "CuB2O4", "oxide": "B2O3", "n_oxide_fu": 1, "family": "borate",
+     "constituents": {"CuO": 1, "B2O3": 1}},
+]
+
+
+def load_library(path):
+    """Read a candidate CSV written by candidate_generator.py --csv."""
+    cands = []
+    with open(path) as f:
+        for r in csv.DictReader(f):
+            constituents = {}
+            for part in r["constituents"].split(";"):
+                ox, _, coef = part.partition(":")
+                constituents[ox] = float(coef)
+            cands.append({"product": r["product"], "oxide": r["oxide"],
+                          "n_oxide_fu": float(r["n_oxide_fu"]),
+                          "family": r["family"], "constituents": constituents})
+    return cands
+
+
+# Tier 1 interpolation settings
+TIER1_TOL_KJ = 1.0      # numerical noise of a cached TC value
+TIER1_MAX_GAP_K = 100   # do not interpolate across larger gaps
+
+
+# =============================================================================
+# Tier 0
+# =============================================================================
+def linear_dGf(oxide, T):
+    A, B = LINEAR_GIBBS[oxide]
+    return A + B * T
+
+
+def tier0_bounds(cand, T):
+    """Return (lower, upper, estimate) for dG_rxn in kJ, or None if no data."""
+    species = list(cand["constituents"]) + [cand["oxide"]]
+    if any(s not in LINEAR_GIBBS for s in species):
+        return None
+
+    dG = sum(c * linear_dGf(ox, T) for ox, c in cand["constituents"].items())
+    dG -= cand["n_oxide_fu"] * linear_dGf(cand["oxide"], T)
+
+    n_units = sum(cand["constituents"].values()) + cand["n_oxide_fu"]
+    err = n_units * (LINEAR_ERR_KJ + LINEAR_ERR_PER_K * abs(T - 298.15))
+    lo_c, hi_c = COMPLEX_RANGE_KJ[cand["family"]]
+    return dG + lo_c - err, dG + hi_c + err, dG + 0.5 * (lo_c + hi_c)
+
+
+# =============================================================================
+# Tier 1
+# =============================================================================
+def load_cache(paths):
+    """Read cached dG_rxn from TC-Python CSVs -> {product: [(T, dG_kJ), ...]}."""
+    cache = {}
+    for path in paths:
+        if not path.exists():
+            continue
+        with open(path) as f:
+            for r in csv.DictReader(f):
+                try:
+                    T = float(r["T_K"])
+                    dG = float(r["dG_rxn_system_kJ"])
+                except (KeyError, ValueError):
+                    continue
+                cache.setdefault(r["product"], {})[T] = dG
+    return {p: sorted(pts.items()) for p, pts in cache.items()}
+
+
+def tier1_bounds(points, T):
+    """Interpolate cached (T, dG) points. Returns (lower, upper, estimate) or None."""
+    if not points:
+        return None
+    Ts = [p[0] for p in points]
+
+    for Ti, dGi in points:
+        if abs(Ti - T) < 0.5:
+            return dGi - TIER1_TOL_KJ, dGi + TIER1_TOL_KJ, dGi
+
+    hi = next((i for i, Ti in enumerate(Ts) if Ti > T), None)
+    if hi is None or hi == 0:
+        return None  # outside the cached range: no extrapolation
+    (T1, g1), (T2, g2) = points[hi - 1], points[hi]
+    h = T2 - T1
+    if h > TIER1_MAX_GAP_K:
+        return None
+    est = g1 + (g2 - g1) * (T - T1) / h
+
+    # Curvature from the neighbouring interval on either side
+    curv = 0.0
+    for a, b, c in ((hi - 2, hi - 1, hi), (hi - 1, hi, hi + 1)):
+        if a < 0 or c >= len(points):
+            continue
+        (Ta, ga), (Tb, gb), (Tc, gc) = points[a], points[b], points[c]
+        s1 = (gb - ga) / (Tb - Ta)
+        s2 = (gc - gb) / (Tc - Tb)
+        curv = max(curv, abs(s2 - s1) / (0.5 * (Tc - Ta)))
+    err = curv * h * h / 8.0 + TIER1_TOL_KJ
+    return est - err, est + err, est
+
+
+# =============================================================================
+# Screening
+# =============================================================================
+def classify(lower, upper, threshold):
+    if upper < threshold:
+        return "VIABLE"
+    if lower > threshold:
+        return "NOT VIABLE"
+    return None
+
+
+def screen(candidates, temps, threshold, cache):
+    """Run the tiered screen. Returns (rows, queue)."""
+    rows = []
+    queue = []
+    for cand in candidates:
+        for T in temps:
+            row = {"product": cand["product"], "oxide": cand["oxide"],
+                   "family": cand["family"], "T_K": T}
+            verdict = None
+            for tier, bounds in ((0, tier0_bounds(cand, T)),
+                                 (1, tier1_bounds(cache.get(cand["product"]), T))):
+                if bounds is None:
+                    continue
+                lower, upper, est = bounds
+                row.update({"tier": tier, "dG_lower_kJ": round(lower, 2),
+                            "dG_upper_kJ": round(upper, 2),
+                            "dG_estimate_kJ": round(est, 2)})
+                verdict = classify(lower, upper, threshold)
+                if verdict:
+                    break
+            if verdict is None:
+                row["tier"] = 2
+                verdict = "UNRESOLVED"
+                queue.append({"product": cand["product"], "oxide": cand["oxide"],
+                              "T_K": T})
+            row["verdict"] = verdict
+            rows.append(row)
+    return rows, queue
+
+
+def tier0_check(candidates, cache):
+    """Count cached TC points inside the tier-0 bounds (sanity check)."""
+    inside = total = 0
+    misses = []
+    for cand in candidates:
+        for T, dG in cache.get(cand["product"], []):
+            b = tier0_bounds(cand, T)
+            if b is None:
+                continue
+            total += 1
+            if b[0] <= dG <= b[1]:
+                inside += 1
+            else:
+                misses.append((cand["product"], T, dG, b[0], b[1]))
+    return inside, total, misses
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Tiered (multi-fidelity) screening of ternary Cu capture reactions.")
+    parser.add_argument("--threshold", type=float, default=THRESHOLD_KJ,
+                        help="viability threshold for dG_rxn in kJ (default 0)")
+    parser.add_argument("--temps", type=float, nargs="+", default=None,
+                        help="temperatures in K (default %d-%d step %d)"
+                             % (T_MIN, T_MAX, T_STEP))
+    parser.add_argument("--library", nargs="?", const=str(GENERATED_LIBRARY),
+                        default=None,
+                        help="candidate CSV from candidate_generator.py --csv "
+                             "(default without this flag: the built-in 18 products)")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="skip tier 1 (show the cost of a screen without TC data)")
+    args = parser.parse_args()
+
+    temps = args.temps or list(range(T_MIN, T_MAX + 1, T_STEP))
+    candidates = load_library(args.library) if args.library else CANDIDATES
+    cache = {} if args.no_cache else load_cache(CACHE_FILES)
+
+    print("=" * 80)
+    print("Tiered Screening — Cu + MOx -> CuMOy")
+    print(f"Threshold: dG_rxn < {args.threshold:+.1f} kJ is VIABLE")
+    print(f"{len(candidates)} candidates x {len(temps)} temperatures "
+          f"= {len(candidates) * len(temps)} points")
+    if not args.no_cache:
+        n_cached = sum(len(v) for v in cache.values())
+        print(f"Tier-1 cache: {n_cached} TC points for {len(cache)} products")
+    print("=" * 80)
+
+    rows, queue = screen(candidates, temps, args.threshold, cache)
+
+    # Per-product table
+    print(f"\n{'Product':<10} {'Family':<13} {'VIABLE':>7} {'NOT':>5} {'T2':>4}"
+          f"   {'tier 0/1/2':<12} {'dG @ 1800 K (kJ)':<24}")
+    print("-" * 80)
+    for cand in candidates:
+        prows = [r for r in rows if r["product"] == cand["product"]]
+        counts = {v: sum(1 for r in prows if r["verdict"] == v)
+                  for v in ("VIABLE", "NOT VIABLE", "UNRESOLVED")}
+        tiers = "/".join(str(sum(1 for r in prows if r["tier"] == t)) for t in (0, 1, 2))
+        r1800 = [r for r in prows if abs(r["T_K"] - 1800) < 0.5 and "dG_lower_kJ" in r]
+        span = (f"[{r1800[0]['dG_lower_kJ']:+7.1f}, {r1800[0]['dG_upper_kJ']:+7.1f}]"
+                if r1800 else "--")
+        print(f"{cand['product']:<10} {cand['family']:<13} {counts['VIABLE']:>7} "
+              f"{counts['NOT VIABLE']:>5} {counts['UNRESOLVED']:>4}   {tiers:<12} {span}")
+
+    # Cost summary
+    n = len(rows)
+    by_tier = {t: sum(1 for r in rows if r["tier"] == t) for t in (0, 1, 2)}
+    # Full sweep: product equilibria plus per-T Cu, O2 and binary-oxide references
+    n_oxides = len({c["oxide"] for c in candidates})
+    full_calls = n + len(temps) * (2 + n_oxides)
+    q_temps = {q["T_K"] for q in queue}
+    q_oxide_T = {(q["oxide"], q["T_K"]) for q in queue}
+    tier2_calls = len(queue) + 2 * len(q_temps) + len(q_oxide_T)
+
+    print(f"\n{'='*80}")
+    print("COST")
+    print("=" * 80)
+    print(f"  Decided by tier 0 (linear Ellingham):  {by_tier[0]:5d} / {n}")
+    print(f"  Decided by tier 1 (cached TC data):    {by_tier[1]:5d} / {n}")
+    print(f"  Sent to tier 2 (equilibrium):          {by_tier[2]:5d} / {n}")
+    print(f"  Equilibrium calls: {tier2_calls} vs {full_calls} for the full sweep "
+          f"({100.0 * tier2_calls / full_calls:.1f}%)")
+
+    if cache:
+        inside, total, misses = tier0_check(candidates, cache)
+        if total:
+            print(f"\n  Tier-0 bound check: {inside}/{total} cached TC points "
+                  f"inside the linear bounds")
+            for product, T, dG, lo, hi in misses[:5]:
+                print(f"    outside: {product} @ {T:.0f} K  TC {dG:+.1f}  "
+                      f"bounds [{lo:+.1f}, {hi:+.1f}]")
+
+    fieldnames = ["product", "oxide", "family", "T_K", "tier",
+                  "dG_lower_kJ", "dG_upper_kJ", "dG_estimate_kJ", "verdict"]
+    with open(CSV_OUT, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames)
+        writer.writeheader()
+        writer.writerows(rows)
+    print(f"\nCSV written to: {CSV_OUT}")
+
+    with open(QUEUE_OUT, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=["product", "oxide", "T_K"])
+        writer.writeheader()
+        writer.writerows(queue)
+    print(f"Tier-2 queue written to: {QUEUE_OUT} ({len(queue)} points)")
+    if queue:
+        print("Copy it to the VM and run screen_tier2_equilibria.py, then copy")
+        print("data/tcpython/raw/tier2_equilibria.csv back and re-run this script.")
+
+
+if __name__ == "__main__":
+    main()
@@ -23,9 +23,9 @@ import matplotlib.patches as mpatches
 import matplotlib.animation as animation
 from pathlib import Path
 
-SCRIPT_DIR = Path(__file__).parent
-RAW_DIR = SCRIPT_DIR.parent / "data" / "tcpython" / "raw"
-FIG_DIR = SCRIPT_DIR.parent / "figures"
+SCRIPT_DIR = Path(__file__).resolve().parent
+RAW_DIR = SCRIPT_DIR.parent.parent / "data" / "tcpython" / "raw"
+FIG_DIR = SCRIPT_DIR.parent.parent / "figures"
 SUMMARY_CSV = RAW_DIR / "cu_removal_rate_summary.csv"
 
 # ── Physical parameters ───────────────────────────────────────────
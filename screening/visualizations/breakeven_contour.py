@@ -13,12 +13,21 @@ need less mass; higher cu_per_mol oxides (V₂O₅) also shift left.
 Per-particle Cu capture is interpolated (log-linear in radius) between
 the 5 DICTRA data points (R = 25, 50, 100, 250, 500 μm).
 
+With --gsd the powder is log-normal (psd.py) and the radius axis is its
+mass-median radius: capture per gram is integrated over the size
+distribution (16 quadrature nodes per grid row, so the map costs about the
+same as the single-radius one). With --kinetics sherwood the captures are
+the stirred-melt ones (convective_kinetics.py --write), with --kinetics
+multicomponent the scrap-melt ones (multicomponent_diffusion.py --write).
+
 Outputs: figures/breakeven_contour.png, .pdf
-Run: python3 screening/visualizations/breakeven_contour.py
+Run: python3 screening/visualizations/breakeven_contour.py [--gsd 1.6] [--kinetics sherwood]
 """
 
+import argparse
 import csv
 import math
+import sys
 import numpy as np
 import matplotlib.pyplot as plt
 import matplotlib.ticker as ticker
@@ -32,6 +41,10 @@ FIG_DIR = SCRIPT_DIR.parent.parent / "figures"
 FIG_DIR.mkdir(exist_ok=True)
 SUMMARY_CSV = RAW_DIR / "cu_removal_rate_summary.csv"
 
+sys.path.insert(0, str(SCRIPT_DIR.parent))      # screening/ modules
+from ladle_model import KINETICS, particle_mass_g
+from psd import PSD
+
 # ── Physical constants ─────────────────────────────────────────────
 STEEL_MASS_KG = 0.50
 CU_INIT_WT = 0.30
@@ -60,10 +73,10 @@ RADIUS_RANGE = np.linspace(20, 550, 300)  # μm
 # DATA & INTERPOLATION
 # ══════════════════════════════════════════════════════════════════
 
-def load_captures():
+def load_captures(path=SUMMARY_CSV):
     """Load per-particle Cu capture for each radius at T=1823K, t=1800s."""
     radii_cap = {}
-    with open(SUMMARY_CSV) as f:
+    with open(path) as f:
         for row in csv.DictReader(f):
             T = float(row["temp_K"])
             R = float(row["radius_um"])
@@ -84,18 +97,27 @@ def build_capture_interpolator(radii_cap):
 
 
 def compute_removal_grid(dose_arr, radius_arr, rho, cu_per_mol, mw_oxide,
-                         cap_func):
-    """Compute removal % on a 2D grid of (dose, radius)."""
+                         cap_func, shape=None):
+    """
+    Compute removal % on a 2D grid of (dose, radius). `shape` is a PSD
+    with unit median (PSD.lognormal(1, gsd)); radius is then its median.
+    """
     D, R = np.meshgrid(dose_arr, radius_arr)
-    # Per-particle capture at each radius
-    cap = cap_func(R)
-    # Particle count
-    r_m = R * 1e-6
-    v_particle = (4 / 3) * np.pi * r_m ** 3
-    m_particle_g = rho * v_particle * 1e3
-    n_particles = D / m_particle_g
+    if shape is None:
+        # Per-particle capture at each radius
+        cap = cap_func(R)
+        # Particle count
+        r_m = R * 1e-6
+        v_particle = (4 / 3) * np.pi * r_m ** 3
+        m_particle_g = rho * v_particle * 1e3
+        n_particles = D / m_particle_g
+        kin = cap * n_particles
+    else:
+        # Capture per gram of powder, integrated over the size classes
+        nodes = np.asarray(radius_arr)[:, None] * shape.radius_um
+        per_g = (cap_func(nodes) / particle_mass_g(nodes, rho)) @ shape.mass_fraction
+        kin = D * per_g[:, None]
     # Kinetic and stoichiometric limits
-    kin = cap * n_particles
     stoich = (D / mw_oxide) * cu_per_mol * MW_CU * 1e3
     actual = np.minimum(np.minimum(kin, stoich), TOTAL_CU_MG)
     removal = actual / TOTAL_CU_MG * 100
@@ -107,17 +129,27 @@ def compute_removal_grid(dose_arr, radius_arr, rho, cu_per_mol, mw_oxide,
 # ══════════════════════════════════════════════════════════════════
 
 def main():
-    radii_cap = load_captures()
+    parser = argparse.ArgumentParser(description="Break-even dose x radius contour map")
+    parser.add_argument("--gsd", type=float, default=1.0,
+                        help="log-normal geometric SD of the powder "
+                             "(default 1 = single radius)")
+    parser.add_argument("--kinetics", choices=list(KINETICS), default="dictra",
+                        help="capture law: stagnant DICTRA, stirred-melt Sherwood "
+                             "or scrap-melt multicomponent")
+    args = parser.parse_args()
+    shape = PSD.lognormal(1.0, args.gsd) if args.gsd > 1 else None
+
+    radii_cap = load_captures(KINETICS[args.kinetics])
     cap_func = build_capture_interpolator(radii_cap)
 
-    print(f"DICTRA captures at T={T_K}K, t={TIME_S}s:")
+    print(f"{args.kinetics} captures at T={T_K}K, t={TIME_S}s:")
     for r in sorted(radii_cap):
         print(f"  R={r:>5.0f} μm: {radii_cap[r]:.6f} mg")
 
     # ── Compute Fe₂O₃ grid for filled contour ─────────────────────
     fe_rho, fe_cu, fe_mw = 5240, 1.0, 159.69
     D, R, Z_fe = compute_removal_grid(DOSE_RANGE, RADIUS_RANGE,
-                                       fe_rho, fe_cu, fe_mw, cap_func)
+                                       fe_rho, fe_cu, fe_mw, cap_func, shape)
 
     # ── Figure ─────────────────────────────────────────────────────
     fig, ax = plt.subplots(figsize=(10, 7))
@@ -139,7 +171,7 @@ def main():
     # ── 66.7% contour for ALL 5 oxides ────────────────────────────
     for name, rho, cu_per_mol, mw, color, ls in OXIDES:
         _, _, Z = compute_removal_grid(DOSE_RANGE, RADIUS_RANGE,
-                                       rho, cu_per_mol, mw, cap_func)
+                                       rho, cu_per_mol, mw, cap_func, shape)
         cs = ax.contour(D, R, Z, levels=[TARGET_PCT],
                         colors=[color], linewidths=2.5, linestyles=[ls],
                         zorder=3)
@@ -170,7 +202,8 @@ def main():
 
     # ── Formatting ─────────────────────────────────────────────────
     ax.set_xlabel("Oxide dose (g)", fontsize=12)
-    ax.set_ylabel("Particle radius (μm)", fontsize=12)
+    ax.set_ylabel("Particle radius (μm)" if shape is None
+                  else "Mass-median radius (μm)", fontsize=12)
     ax.set_xlim(0.1, 20)
     ax.set_ylim(20, 550)
     ax.grid(which="major", alpha=0.2, zorder=0)
@@ -180,7 +213,9 @@ def main():
     ax.set_title(
         "Break-Even Contour: Feasible Operating Window for 66.7% Cu Removal\n"
         f"T = {T_K} K,  t = {TIME_S // 60} min,  0.5 kg steel,  "
-        f"{CU_INIT_WT} wt% Cu",
+        f"{CU_INIT_WT} wt% Cu"
+        + ("" if shape is None else f",  log-normal powder (gsd {args.gsd:g})")
+        + ("" if args.kinetics == "dictra" else f",  {args.kinetics} kinetics"),
         fontsize=12, fontweight="bold", pad=12,
     )
 
@@ -17,11 +17,13 @@ for all 5 oxides (same liquid Fe diffusion). What differs is density
 (particle count per gram) and stoichiometric capacity (Cu atoms per mol oxide).
 
 Outputs: figures/dose_response_curves.png, .pdf
-Run: python3 screening/visualizations/dose_response_curves.py
+Run: python3 screening/visualizations/dose_response_curves.py [--kinetics sherwood]
 """
 
+import argparse
 import csv
 import math
+import sys
 import numpy as np
 import matplotlib.pyplot as plt
 from pathlib import Path
@@ -33,6 +35,9 @@ FIG_DIR = SCRIPT_DIR.parent.parent / "figures"
 FIG_DIR.mkdir(exist_ok=True)
 SUMMARY_CSV = RAW_DIR / "cu_removal_rate_summary.csv"
 
+sys.path.insert(0, str(SCRIPT_DIR.parent))      # screening/ modules
+from ladle_model import KINETICS
+
 # ── Physical constants ─────────────────────────────────────────────
 STEEL_MASS_KG = 0.50
 CU_INIT_WT = 0.30        # wt%
@@ -60,16 +65,16 @@ DOSES = np.linspace(0.05, 20, 500)
 # HELPERS
 # ══════════════════════════════════════════════════════════════════
 
-def load_dictra_capture(time_s):
+def load_dictra_capture(time_s, path=SUMMARY_CSV):
     """Load per-particle Cu capture (mg) at T=1823K, R=100μm for given time."""
-    with open(SUMMARY_CSV) as f:
+    with open(path) as f:
         reader = csv.DictReader(f)
         for row in reader:
             if (abs(float(row["temp_K"]) - T_K) < 1
                     and abs(float(row["radius_um"]) - R_UM) < 1
                     and abs(float(row["time_s"]) - time_s) < 1):
                 return float(row["cu_captured_mg"])
-    raise ValueError(f"No DICTRA data for T={T_K}, R={R_UM}, t={time_s}")
+    raise ValueError(f"No data for T={T_K}, R={R_UM}, t={time_s} in {path}")
 
 
 def compute_removal_curve(doses, rho, cu_per_mol, mw_oxide, cu_captured_mg):
@@ -102,8 +107,16 @@ def find_crossover(doses, removals, target):
 # ══════════════════════════════════════════════════════════════════
 
 def main():
-    cap_30min = load_dictra_capture(1800)
-    cap_1min = load_dictra_capture(60)
+    parser = argparse.ArgumentParser(description="Cu removal vs oxide dose")
+    parser.add_argument("--kinetics", choices=list(KINETICS), default="dictra",
+                        help="capture law: stagnant DICTRA, stirred-melt Sherwood "
+                             "or scrap-melt multicomponent")
+    args = parser.parse_args()
+    path = KINETICS[args.kinetics]
+    note = "" if args.kinetics == "dictra" else f",  {args.kinetics} kinetics"
+
+    cap_30min = load_dictra_capture(1800, path)
+    cap_1min = load_dictra_capture(60, path)
 
     print(f"Per-particle Cu capture at T={T_K}K, R={R_UM}μm:")
     print(f"  30 min: {cap_30min:.6f} mg")
@@ -179,7 +192,7 @@ def main():
     fig.suptitle(
         "Dose-Response: Cu Removal vs Oxide Mass\n"
         f"T = {T_K} K,  R = {R_UM} μm,  {STEEL_MASS_KG} kg steel,  "
-        f"{CU_INIT_WT} wt% Cu",
+        f"{CU_INIT_WT} wt% Cu{note}",
         fontsize=13, fontweight="bold",
     )
     plt.tight_layout(rect=[0, 0, 1, 0.92])
@@ -9,15 +9,26 @@ heatmap table — green cells meet the 0.10 wt% target, red cells don't.
 This is the "recipe card" for experiment planning: pick your oxide, read
 across to find which dose + particle size combinations are predicted to work.
 
-All predictions use DICTRA per-particle Cu capture (real kinetic data) with
-stoichiometric capping. No empirical fudge factors.
+All predictions use DICTRA per-particle Cu capture (real kinetic data)
+through ladle_model.py: the particles draw on one melt whose Cu falls as they
+capture it, and each stops at its stoichiometric capacity. No empirical
+fudge factors.
+
+With --gsd each row is a log-normal powder (psd.py) with that mass-median
+radius instead of a single particle size; the ladle model then tracks all
+of its size classes at once.
+
+With --kinetics sherwood the capture law is the stirred-melt one
+(convective_kinetics.py --write) instead of the stagnant DICTRA runs;
+--kinetics multicomponent uses the Fe-Cu-O-C-Si-Mn scrap-melt runs
+(multicomponent_diffusion.py --write).
 
 Outputs: figures/experiment_predictor.png, .pdf
-Run: python3 screening/visualizations/experiment_predictor.py
+Run: python3 screening/visualizations/experiment_predictor.py [--gsd 1.6] [--kinetics sherwood]
 """
 
-import csv
-import math
+import argparse
+import sys
 import numpy as np
 import matplotlib.pyplot as plt
 import matplotlib.colors as mcolors
@@ -30,11 +41,13 @@ FIG_DIR = SCRIPT_DIR.parent.parent / "figures"
 FIG_DIR.mkdir(exist_ok=True)
 SUMMARY_CSV = RAW_DIR / "cu_removal_rate_summary.csv"
 
+sys.path.insert(0, str(SCRIPT_DIR.parent))      # screening/ modules
+from ladle_model import KINETICS, Population, load_laws, simulate, stoich_capacity_mg
+from psd import PSD
+
 # ── Physical constants ─────────────────────────────────────────────
 STEEL_MASS_KG = 0.50
 CU_INIT_WT = 0.30   # wt%
-TOTAL_CU_MG = STEEL_MASS_KG * 1e3 * CU_INIT_WT / 100 * 1e3  # 1500 mg
-MW_CU = 63.546
 CU_TARGET_WT = 0.10  # hot shortness threshold
 TARGET_REMOVAL_PCT = (CU_INIT_WT - CU_TARGET_WT) / CU_INIT_WT * 100  # 66.7%
 T_K = 1823
@@ -58,31 +71,24 @@ RADII = [50, 100, 250, 500]      # μm
 # DATA
 # ══════════════════════════════════════════════════════════════════
 
-def load_captures():
-    """Load per-particle Cu capture for each radius at T=1823K, t=1800s."""
-    caps = {}
-    with open(SUMMARY_CSV) as f:
-        for row in csv.DictReader(f):
-            T = float(row["temp_K"])
-            R = float(row["radius_um"])
-            t = float(row["time_s"])
-            if abs(T - T_K) < 1 and abs(t - TIME_S) < 1:
-                caps[int(R)] = float(row["cu_captured_mg"])
-    return caps
-
-
-def predict_final_cu(cap, R_um, dose, rho, cu_per_mol, mw_oxide):
-    """Predict final Cu wt% after experiment."""
-    r_m = R_um * 1e-6
-    v = (4 / 3) * math.pi * r_m ** 3
-    m_p = rho * v * 1e3
-    n = dose / m_p
-    kin = cap * n
-    stoich = (dose / mw_oxide) * cu_per_mol * MW_CU * 1e3
-    captured = min(kin, stoich, TOTAL_CU_MG)
-    remaining_mg = TOTAL_CU_MG - captured
-    remaining_wt = remaining_mg / (STEEL_MASS_KG * 1e3 * 1e3) * 100
-    return max(remaining_wt, 0.0)
+def load_law(path=SUMMARY_CSV):
+    """Lone-particle capture law at T_K (all radii, all times)."""
+    return load_laws(path)[T_K]
+
+
+def predict_final_cu(law, size, dose, rho, cu_per_mol, mw_oxide):
+    """
+    Predict final Cu wt% after TIME_S of treatment. `size` is a particle
+    radius in μm or a psd.PSD of the powder.
+    """
+    if isinstance(size, PSD):
+        pop = size.population(dose, rho)
+        cap = stoich_capacity_mg(size.radius_um, rho, mw_oxide, cu_per_mol)
+    else:
+        pop = Population.from_dose(dose, size, rho)
+        cap = stoich_capacity_mg(size, rho, mw_oxide, cu_per_mol)
+    res = simulate(pop, law, STEEL_MASS_KG, CU_INIT_WT, [TIME_S], capacity_mg=cap)
+    return max(float(res["bulk_wt"][0]), 0.0)
 
 
 # ══════════════════════════════════════════════════════════════════
@@ -90,7 +96,17 @@ def predict_final_cu(cap, R_um, dose, rho, cu_per_mol, mw_oxide):
 # ══════════════════════════════════════════════════════════════════
 
 def main():
-    caps = load_captures()
+    parser = argparse.ArgumentParser(description="Predicted final Cu wt% heatmap table")
+    parser.add_argument("--gsd", type=float, default=1.0,
+                        help="log-normal geometric SD of each powder "
+                             "(default 1 = single radius)")
+    parser.add_argument("--kinetics", choices=list(KINETICS), default="dictra",
+                        help="capture law: stagnant DICTRA, stirred-melt Sherwood "
+                             "or scrap-melt multicomponent")
+    args = parser.parse_args()
+    sizes = RADII if args.gsd <= 1 else [PSD.lognormal(R, args.gsd) for R in RADII]
+
+    law = load_law(KINETICS[args.kinetics])
 
     n_oxides = len(OXIDES)
     n_doses = len(DOSES)
@@ -110,10 +126,9 @@ def main():
 
         # Build prediction grid: rows=radius (top=small), cols=dose
         grid = np.zeros((n_radii, n_doses))
-        for i, R in enumerate(RADII):
-            cap = caps.get(R, caps[min(caps.keys(), key=lambda x: abs(x - R))])
+        for i, size in enumerate(sizes):
             for j, dose in enumerate(DOSES):
-                grid[i, j] = predict_final_cu(cap, R, dose, rho, cu_per_mol, mw)
+                grid[i, j] = predict_final_cu(law, size, dose, rho, cu_per_mol, mw)
 
         # Plot heatmap
         im = ax.imshow(grid, cmap=cmap, aspect="auto",
@@ -143,7 +158,8 @@ def main():
         if idx == 0:
             ax.set_yticks(range(n_radii))
             ax.set_yticklabels([f"{r} μm" for r in RADII], fontsize=9)
-            ax.set_ylabel("Particle radius", fontsize=11)
+            ax.set_ylabel("Particle radius" if args.gsd <= 1
+                          else f"Mass-median radius (gsd {args.gsd:g})", fontsize=11)
         else:
             ax.set_yticks(range(n_radii))
             ax.set_yticklabels([])
@@ -174,7 +190,9 @@ def main():
     fig.suptitle(
         "Experiment Outcome Predictor: Predicted Final Cu wt%\n"
         f"T = {T_K} K,  t = 30 min,  {STEEL_MASS_KG} kg steel,  "
-        f"{CU_INIT_WT} wt% Cu initial     "
+        f"{CU_INIT_WT} wt% Cu initial"
+        + ("" if args.kinetics == "dictra" else f",  {args.kinetics} kinetics")
+        + "     "
         f"Green ≤ {CU_TARGET_WT} wt% (target)  |  Red > {CU_INIT_WT - 0.05} wt% (little removal)",
         fontsize=12, fontweight="bold",
     )
@@ -187,10 +205,9 @@ def main():
     print()
     for name, rho, cu_per_mol, mw, dG in OXIDES:
         feasible = []
-        for R in RADII:
-            cap = caps.get(R, caps[min(caps.keys(), key=lambda x: abs(x - R))])
+        for R, size in zip(RADII, sizes):
             for dose in DOSES:
-                val = predict_final_cu(cap, R, dose, rho, cu_per_mol, mw)
+                val = predict_final_cu(law, size, dose, rho, cu_per_mol, mw)
                 if val <= CU_TARGET_WT:
                     feasible.append(f"R={R}/d={dose}g")
         n_feas = len(feasible)
@@ -6,36 +6,46 @@ Y-axis: particle radius (25, 50, 100, 250, 500 um)
 Color:  system-scale Cu removal (%)
 Frames: temperature (1673-1923 K, 11 steps) — play button + scrubber
 
+System-scale removal comes from ladle_model.py: the whole dose draws on
+one melt, so bulk Cu falls as it is captured, and each particle stops at
+its stoichiometric capacity.
+
 Outputs: figures/cu_removal_heatmap.html (self-contained, opens in any browser)
 
-Run: python3 screening/heatmap_cu_removal.py
+Run: python3 screening/heatmap_cu_removal.py [--kinetics sherwood]
 """
 
+import argparse
 import csv
-import math
+import sys
 import numpy as np
 import plotly.graph_objects as go
 from pathlib import Path
 
-SCRIPT_DIR = Path(__file__).parent
-RAW_DIR = SCRIPT_DIR.parent / "data" / "tcpython" / "raw"
-FIG_DIR = SCRIPT_DIR.parent / "figures"
+SCRIPT_DIR = Path(__file__).resolve().parent
+RAW_DIR = SCRIPT_DIR.parent.parent / "data" / "tcpython" / "raw"
+FIG_DIR = SCRIPT_DIR.parent.parent / "figures"
 SUMMARY_CSV = RAW_DIR / "cu_removal_rate_summary.csv"
 
+sys.path.insert(0, str(SCRIPT_DIR.parent))      # screening/ modules
+from ladle_model import KINETICS, Population, load_laws, simulate, stoich_capacity_mg
+
 # ── Physical parameters ───────────────────────────────────────────
 RHO_OXIDE = 5240       # kg/m3 Fe2O3
 CU_INIT_WT = 0.30      # wt%
 STEEL_MASS_KG = 0.50   # kg
 OXIDE_DOSE_G = 2.0     # grams (shows differentiation; 5g saturates)
-MW_CU = 63.546
 FE_LIQUIDUS = 1811     # K
 
+MW_OXIDE = 159.69      # Fe2O3
+CU_PER_MOL = 1.0       # Cu + Fe2O3 -> CuFe2O4 (stoichiometric capacity)
+
 TARGET_REMOVAL = (1 - 0.10 / CU_INIT_WT) * 100  # 66.7%
 
 
-def load_summary():
+def load_summary(path=SUMMARY_CSV):
     rows = []
-    with open(SUMMARY_CSV) as f:
+    with open(path) as f:
         for r in csv.DictReader(f):
             rows.append({
                 "temp_K": int(r["temp_K"]),
@@ -47,17 +57,24 @@ def load_summary():
     return rows
 
 
-def compute_removal(cu_captured_mg, radius_um):
-    r_m = radius_um * 1e-6
-    vol = (4 / 3) * math.pi * r_m ** 3
-    n = (OXIDE_DOSE_G / 1000) / (RHO_OXIDE * vol)
-    total_mg = cu_captured_mg * n
-    cu_total_mg = STEEL_MASS_KG * (CU_INIT_WT / 100) * 1e6
-    return min(total_mg / cu_total_mg * 100, 100.0)
+def compute_removal(law, radius_um, times_s):
+    """System-scale Cu removal (%) at times_s, bulk Cu coupled (ladle_model)."""
+    pop = Population.from_dose(OXIDE_DOSE_G, radius_um, RHO_OXIDE)
+    cap = stoich_capacity_mg(radius_um, RHO_OXIDE, MW_OXIDE, CU_PER_MOL)
+    res = simulate(pop, law, STEEL_MASS_KG, CU_INIT_WT, times_s, capacity_mg=cap)
+    return res["removal_pct"]
 
 
 def main():
-    summary = load_summary()
+    parser = argparse.ArgumentParser(description="Cu removal heatmap over T, radius and time")
+    parser.add_argument("--kinetics", choices=list(KINETICS), default="dictra",
+                        help="capture law: stagnant DICTRA, stirred-melt Sherwood "
+                             "or scrap-melt multicomponent")
+    args = parser.parse_args()
+    path = KINETICS[args.kinetics]
+    note = "" if args.kinetics == "dictra" else f", {args.kinetics} kinetics"
+
+    summary = load_summary(path)
 
     temps = sorted(set(r["temp_K"] for r in summary))
     radii = sorted(set(r["radius_um"] for r in summary))
@@ -68,14 +85,12 @@ def main():
     y_labels = [f"{r} um" for r in radii]
 
     # Build removal % grid for each temperature
+    laws = load_laws(path)
     grids = {}
     for T in temps:
         grid = np.zeros((len(radii), len(times_s)))
-        for r in summary:
-            if r["temp_K"] == T:
-                ri = radii.index(r["radius_um"])
-                ti = times_s.index(r["time_s"])
-                grid[ri, ti] = compute_removal(r["cu_captured_mg"], r["radius_um"])
+        for ri, R in enumerate(radii):
+            grid[ri] = compute_removal(laws[T], R, times_s)
         grids[T] = grid
 
     # Custom text for hover
@@ -131,7 +146,7 @@ def main():
         layout=go.Layout(
             title=dict(
                 text=(f"Cu Removal Heatmap — {OXIDE_DOSE_G:.0f}g Fe₂O₃ in "
-                      f"{STEEL_MASS_KG} kg steel ({CU_INIT_WT}% Cu)<br>"
+                      f"{STEEL_MASS_KG} kg steel ({CU_INIT_WT}% Cu){note}<br>"
                       f"<span style='font-size:14px; color:#888;'>"
                       f"T = {T0} K ({phase0}) — Use play button or slider below</span>"),
                 font=dict(size=18),
@@ -228,7 +243,7 @@ def main():
                 layout=go.Layout(
                     title=dict(
                         text=(f"Cu Removal Heatmap — {OXIDE_DOSE_G:.0f}g Fe₂O₃ in "
-                              f"{STEEL_MASS_KG} kg steel ({CU_INIT_WT}% Cu)<br>"
+                              f"{STEEL_MASS_KG} kg steel ({CU_INIT_WT}% Cu){note}<br>"
                               f"<span style='font-size:14px; color:"
                               f"{'#009988' if T >= 1823 else '#CC3311'};'>"
                               f"T = {T} K ({'LIQUID' if T >= 1823 else 'SOLID'})"
@@ -7,27 +7,38 @@ from 1673→1923 K. Play button, temperature scrubber, hover tooltips.
 At solid temps the curves are flat near zero. Cross the liquidus and
 they leap up — you watch the data morph in real time.
 
+System-scale removal comes from ladle_model.py: the whole dose draws on
+one melt, so bulk Cu falls as it is captured, and each particle stops at
+its stoichiometric capacity.
+
 Outputs: figures/cu_removal_interactive.html
-Run: python3 screening/plotly_cu_removal.py
+Run: python3 screening/plotly_cu_removal.py [--kinetics sherwood]
 """
 
+import argparse
 import csv
-import math
+import sys
 import numpy as np
 import plotly.graph_objects as go
 from pathlib import Path
 
-SCRIPT_DIR = Path(__file__).parent
-RAW_DIR = SCRIPT_DIR.parent / "data" / "tcpython" / "raw"
-FIG_DIR = SCRIPT_DIR.parent / "figures"
+SCRIPT_DIR = Path(__file__).resolve().parent
+RAW_DIR = SCRIPT_DIR.parent.parent / "data" / "tcpython" / "raw"
+FIG_DIR = SCRIPT_DIR.parent.parent / "figures"
 SUMMARY_CSV = RAW_DIR / "cu_removal_rate_summary.csv"
 
+sys.path.insert(0, str(SCRIPT_DIR.parent))      # screening/ modules
+from ladle_model import KINETICS, Population, load_laws, simulate, stoich_capacity_mg
+
 # ── Physical parameters ───────────────────────────────────────────
 RHO_OXIDE = 5240
 CU_INIT_WT = 0.30
 STEEL_MASS_KG = 0.50
 OXIDE_DOSE_G = 5.0
 
+MW_OXIDE = 159.69      # Fe2O3
+CU_PER_MOL = 1.0       # Cu + Fe2O3 -> CuFe2O4 (stoichiometric capacity)
+
 TARGET_REMOVAL = (1 - 0.10 / CU_INIT_WT) * 100  # 66.7%
 
 # Colorblind palette
@@ -43,9 +54,9 @@ DASH = {
 }
 
 
-def load_summary():
+def load_summary(path=SUMMARY_CSV):
     rows = []
-    with open(SUMMARY_CSV) as f:
+    with open(path) as f:
         for r in csv.DictReader(f):
             rows.append({
                 "temp_K": int(r["temp_K"]),
@@ -57,17 +68,24 @@ def load_summary():
     return rows
 
 
-def compute_removal(cu_captured_mg, radius_um):
-    r_m = radius_um * 1e-6
-    vol = (4 / 3) * math.pi * r_m ** 3
-    n = (OXIDE_DOSE_G / 1000) / (RHO_OXIDE * vol)
-    total_mg = cu_captured_mg * n
-    cu_total_mg = STEEL_MASS_KG * (CU_INIT_WT / 100) * 1e6
-    return min(total_mg / cu_total_mg * 100, 100.0)
+def compute_removal(law, radius_um, times_s):
+    """System-scale Cu removal (%) at times_s, bulk Cu coupled (ladle_model)."""
+    pop = Population.from_dose(OXIDE_DOSE_G, radius_um, RHO_OXIDE)
+    cap = stoich_capacity_mg(radius_um, RHO_OXIDE, MW_OXIDE, CU_PER_MOL)
+    res = simulate(pop, law, STEEL_MASS_KG, CU_INIT_WT, times_s, capacity_mg=cap)
+    return res["removal_pct"]
 
 
 def main():
-    summary = load_summary()
+    parser = argparse.ArgumentParser(description="Cu removal vs contact time, animated over T")
+    parser.add_argument("--kinetics", choices=list(KINETICS), default="dictra",
+                        help="capture law: stagnant DICTRA, stirred-melt Sherwood "
+                             "or scrap-melt multicomponent")
+    args = parser.parse_args()
+    path = KINETICS[args.kinetics]
+    note = "" if args.kinetics == "dictra" else f", {args.kinetics} kinetics"
+
+    summary = load_summary(path)
 
     temps = sorted(set(r["temp_K"] for r in summary))
     radii = sorted(set(r["radius_um"] for r in summary))
@@ -75,19 +93,11 @@ def main():
     times_min = [t / 60 for t in times_s]
 
     # Precompute all curves: {(T, R): [removal_pct for each time]}
+    laws = load_laws(path)
     curves = {}
     for T in temps:
         for R in radii:
-            vals = []
-            for t in times_s:
-                match = [r for r in summary
-                         if r["temp_K"] == T and r["radius_um"] == R
-                         and r["time_s"] == t]
-                if match:
-                    vals.append(compute_removal(match[0]["cu_captured_mg"], R))
-                else:
-                    vals.append(0.0)
-            curves[(T, R)] = vals
+            curves[(T, R)] = compute_removal(laws[T], R, times_s).tolist()
 
     # ── Build figure ─────────────────────────────────────────────
     T0 = temps[0]
@@ -163,7 +173,7 @@ def main():
             layout=go.Layout(
                 title=dict(
                     text=(f"<b>Cu Removal vs Contact Time</b> — "
-                          f"{OXIDE_DOSE_G:.0f}g Fe₂O₃, {STEEL_MASS_KG} kg steel"
+                          f"{OXIDE_DOSE_G:.0f}g Fe₂O₃, {STEEL_MASS_KG} kg steel{note}"
                           f"<br><span style='font-size:14px; color:{phase_color};'>"
                           f"T = {T} K ({phase})"
                           f"{'  ⚡ LIQUIDUS CROSSED — curves jump ~260x' if T == 1823 else ''}"
@@ -190,7 +200,7 @@ def main():
     fig.update_layout(
         title=dict(
             text=(f"<b>Cu Removal vs Contact Time</b> — "
-                  f"{OXIDE_DOSE_G:.0f}g Fe₂O₃, {STEEL_MASS_KG} kg steel"
+                  f"{OXIDE_DOSE_G:.0f}g Fe₂O₃, {STEEL_MASS_KG} kg steel{note}"
                   f"<br><span style='font-size:14px; color:#888;'>"
                   f"Use play button or temperature slider below</span>"),
             font=dict(size=16),
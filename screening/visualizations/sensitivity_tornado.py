@@ -16,11 +16,13 @@ Key insights:
     ~16 pp of each other. The real levers are particle size and dose.
 
 Outputs: figures/sensitivity_tornado.png, .pdf
-Run: python3 screening/visualizations/sensitivity_tornado.py
+Run: python3 screening/visualizations/sensitivity_tornado.py [--kinetics sherwood]
 """
 
+import argparse
 import csv
 import math
+import sys
 import numpy as np
 import matplotlib.pyplot as plt
 import matplotlib.patches as mpatches
@@ -33,6 +35,9 @@ FIG_DIR = SCRIPT_DIR.parent.parent / "figures"
 FIG_DIR.mkdir(exist_ok=True)
 SUMMARY_CSV = RAW_DIR / "cu_removal_rate_summary.csv"
 
+sys.path.insert(0, str(SCRIPT_DIR.parent))      # screening/ modules
+from ladle_model import KINETICS
+
 # ── Physical constants ─────────────────────────────────────────────
 STEEL_MASS_KG = 0.50
 CU_INIT_WT = 0.30
@@ -57,9 +62,9 @@ CLR_UP = "#0077BB"     # blue — upside gain
 # DATA
 # ══════════════════════════════════════════════════════════════════
 
-def load_data():
+def load_data(path=SUMMARY_CSV):
     rows = []
-    with open(SUMMARY_CSV) as f:
+    with open(path) as f:
         for row in csv.DictReader(f):
             rows.append({
                 "T": float(row["temp_K"]),
@@ -99,7 +104,15 @@ def removal_pct(T, R, t, dose, rho=RHO_BASE, cu_per_mol=CU_PER_MOL_BASE,
 
 def main():
     global DATA
-    DATA = load_data()
+    parser = argparse.ArgumentParser(description="One-at-a-time sensitivity of Cu removal")
+    parser.add_argument("--kinetics", choices=list(KINETICS), default="dictra",
+                        help="capture law: stagnant DICTRA, stirred-melt Sherwood "
+                             "or scrap-melt multicomponent")
+    args = parser.parse_args()
+    path = KINETICS[args.kinetics]
+    note = "" if args.kinetics == "dictra" else f", {args.kinetics} kinetics"
+
+    DATA = load_data(path)
 
     base_pct = removal_pct(T_BASE, R_BASE, T_BASE_S, DOSE_BASE)
     print(f"Baseline: T={T_BASE}K, R={R_BASE}μm, t={T_BASE_S}s, "
@@ -222,7 +235,7 @@ def main():
     ax.set_title(
         "Sensitivity Tornado: One-at-a-Time Perturbations from Baseline\n"
         f"Baseline: T={T_BASE}K, R={R_BASE}μm, t={T_BASE_S//60}min, "
-        f"dose={DOSE_BASE}g Fe₂O₃, 0.5kg steel, {CU_INIT_WT}wt% Cu",
+        f"dose={DOSE_BASE}g Fe₂O₃, 0.5kg steel, {CU_INIT_WT}wt% Cu{note}",
         fontsize=12, fontweight="bold", pad=12,
     )
 
@@ -15,21 +15,29 @@ Rotate, zoom, hover for exact values.
 
 Temperature animation frames also available via play button.
 
+System-scale removal comes from ladle_model.py: the whole dose draws on
+one melt, so bulk Cu falls as it is captured, and each particle stops at
+its stoichiometric capacity.
+
 Outputs: figures/cu_removal_3d.html
-Run: python3 screening/surface3d_cu_removal.py
+Run: python3 screening/surface3d_cu_removal.py [--kinetics sherwood]
 """
 
+import argparse
 import csv
-import math
+import sys
 import numpy as np
 import plotly.graph_objects as go
 from pathlib import Path
 
-SCRIPT_DIR = Path(__file__).parent
-RAW_DIR = SCRIPT_DIR.parent / "data" / "tcpython" / "raw"
-FIG_DIR = SCRIPT_DIR.parent / "figures"
+SCRIPT_DIR = Path(__file__).resolve().parent
+RAW_DIR = SCRIPT_DIR.parent.parent / "data" / "tcpython" / "raw"
+FIG_DIR = SCRIPT_DIR.parent.parent / "figures"
 SUMMARY_CSV = RAW_DIR / "cu_removal_rate_summary.csv"
 
+sys.path.insert(0, str(SCRIPT_DIR.parent))      # screening/ modules
+from ladle_model import KINETICS, Population, load_laws, simulate, stoich_capacity_mg
+
 # ── Physical parameters ───────────────────────────────────────────
 RHO_OXIDE = 5240
 CU_INIT_WT = 0.30
@@ -37,12 +45,15 @@ STEEL_MASS_KG = 0.50
 OXIDE_DOSE_G = 5.0  # 5g shows more interesting surface shape
 FE_LIQUIDUS = 1811
 
+MW_OXIDE = 159.69      # Fe2O3
+CU_PER_MOL = 1.0       # Cu + Fe2O3 -> CuFe2O4 (stoichiometric capacity)
+
 TARGET_REMOVAL = (1 - 0.10 / CU_INIT_WT) * 100  # 66.7%
 
 
-def load_summary():
+def load_summary(path=SUMMARY_CSV):
     rows = []
-    with open(SUMMARY_CSV) as f:
+    with open(path) as f:
         for r in csv.DictReader(f):
             rows.append({
                 "temp_K": int(r["temp_K"]),
@@ -54,28 +65,32 @@ def load_summary():
     return rows
 
 
-def compute_removal(cu_captured_mg, radius_um):
-    r_m = radius_um * 1e-6
-    vol = (4 / 3) * math.pi * r_m ** 3
-    n = (OXIDE_DOSE_G / 1000) / (RHO_OXIDE * vol)
-    total_mg = cu_captured_mg * n
-    cu_total_mg = STEEL_MASS_KG * (CU_INIT_WT / 100) * 1e6
-    return min(total_mg / cu_total_mg * 100, 100.0)
+def compute_removal(law, radius_um, times_s):
+    """System-scale Cu removal (%) at times_s, bulk Cu coupled (ladle_model)."""
+    pop = Population.from_dose(OXIDE_DOSE_G, radius_um, RHO_OXIDE)
+    cap = stoich_capacity_mg(radius_um, RHO_OXIDE, MW_OXIDE, CU_PER_MOL)
+    res = simulate(pop, law, STEEL_MASS_KG, CU_INIT_WT, times_s, capacity_mg=cap)
+    return res["removal_pct"]
 
 
-def build_grid(summary, T, radii, times_s):
+def build_grid(law, radii, times_s):
     """Build 2D removal % grid for one temperature."""
     grid = np.zeros((len(radii), len(times_s)))
-    for r in summary:
-        if r["temp_K"] == T:
-            ri = radii.index(r["radius_um"])
-            ti = times_s.index(r["time_s"])
-            grid[ri, ti] = compute_removal(r["cu_captured_mg"], r["radius_um"])
+    for ri, R in enumerate(radii):
+        grid[ri] = compute_removal(law, R, times_s)
     return grid
 
 
 def main():
-    summary = load_summary()
+    parser = argparse.ArgumentParser(description="3D Cu removal surface over radius and time")
+    parser.add_argument("--kinetics", choices=list(KINETICS), default="dictra",
+                        help="capture law: stagnant DICTRA, stirred-melt Sherwood "
+                             "or scrap-melt multicomponent")
+    args = parser.parse_args()
+    path = KINETICS[args.kinetics]
+    note = "" if args.kinetics == "dictra" else f", {args.kinetics} kinetics"
+
+    summary = load_summary(path)
 
     temps = sorted(set(r["temp_K"] for r in summary))
     radii = sorted(set(r["radius_um"] for r in summary))
@@ -86,7 +101,8 @@ def main():
     T_mesh, R_mesh = np.meshgrid(times_min, radii)
 
     # Build grids for all temperatures
-    grids = {T: build_grid(summary, T, radii, times_s) for T in temps}
+    laws = load_laws(path)
+    grids = {T: build_grid(laws[T], radii, times_s) for T in temps}
 
     # Target plane
     target_z = np.full_like(T_mesh, TARGET_REMOVAL, dtype=float)
@@ -214,7 +230,7 @@ def main():
             layout=go.Layout(
                 title=dict(
                     text=(f"Cu Removal Surface — {OXIDE_DOSE_G:.0f}g Fe₂O₃, "
-                          f"{STEEL_MASS_KG} kg steel<br>"
+                          f"{STEEL_MASS_KG} kg steel{note}<br>"
                           f"<span style='font-size:14px; color:{phase_color};'>"
                           f"T = {T} K ({phase})"
                           f"{'  —  LIQUIDUS CROSSED' if T == 1823 else ''}"
@@ -229,7 +245,7 @@ def main():
     fig.update_layout(
         title=dict(
             text=(f"Cu Removal Surface — {OXIDE_DOSE_G:.0f}g Fe₂O₃, "
-                  f"{STEEL_MASS_KG} kg steel<br>"
+                  f"{STEEL_MASS_KG} kg steel{note}<br>"
                   f"<span style='font-size:14px; color:#888;'>"
                   f"Gray = solid steel ({T_solid} K). "
                   f"Colored = current T. Purple plane = target ({TARGET_REMOVAL:.0f}%)."
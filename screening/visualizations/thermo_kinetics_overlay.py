@@ -17,11 +17,13 @@ tier but the highest removal (light, high Cu capacity).
 Reference: T=1823K, R=250μm, dose=3g, 0.5 kg steel, 0.30 wt% Cu.
 
 Outputs: figures/thermo_kinetics_overlay.png, .pdf
-Run: python3 screening/visualizations/thermo_kinetics_overlay.py
+Run: python3 screening/visualizations/thermo_kinetics_overlay.py [--kinetics sherwood]
 """
 
+import argparse
 import csv
 import math
+import sys
 import numpy as np
 import matplotlib.pyplot as plt
 from pathlib import Path
@@ -33,6 +35,9 @@ FIG_DIR = SCRIPT_DIR.parent.parent / "figures"
 FIG_DIR.mkdir(exist_ok=True)
 SUMMARY_CSV = RAW_DIR / "cu_removal_rate_summary.csv"
 
+sys.path.insert(0, str(SCRIPT_DIR.parent))      # screening/ modules
+from ladle_model import KINETICS
+
 # ── Physical constants ─────────────────────────────────────────────
 STEEL_MASS_KG = 0.50
 CU_INIT_WT = 0.30
@@ -61,10 +66,10 @@ TIME_LABELS = ["1 min", "5 min", "10 min", "30 min"]
 # DATA
 # ══════════════════════════════════════════════════════════════════
 
-def load_captures():
+def load_captures(path=SUMMARY_CSV):
     """Load per-particle Cu capture for each time at T=1823K, R=250μm."""
     caps = {}
-    with open(SUMMARY_CSV) as f:
+    with open(path) as f:
         for row in csv.DictReader(f):
             T = float(row["temp_K"])
             R = float(row["radius_um"])
@@ -89,7 +94,15 @@ def removal_pct(cap, rho, cu_per_mol, mw_oxide):
 # ══════════════════════════════════════════════════════════════════
 
 def main():
-    caps = load_captures()
+    parser = argparse.ArgumentParser(description="Driving force vs Cu removal per oxide")
+    parser.add_argument("--kinetics", choices=list(KINETICS), default="dictra",
+                        help="capture law: stagnant DICTRA, stirred-melt Sherwood "
+                             "or scrap-melt multicomponent")
+    args = parser.parse_args()
+    path = KINETICS[args.kinetics]
+    note = "" if args.kinetics == "dictra" else f",  {args.kinetics} kinetics"
+
+    caps = load_captures(path)
     print(f"Per-particle capture at T={T_K}K, R={R_UM}μm:")
     for t in TIMES:
         print(f"  t={t:>4}s: {caps[t]:.6f} mg")
@@ -165,7 +178,7 @@ def main():
     ax.set_title(
         "Thermo × Kinetics: Driving Force vs Removal Performance\n"
         f"T = {T_K} K,  R = {R_UM} μm,  dose = {DOSE_G} g,  "
-        f"0.5 kg steel,  {CU_INIT_WT} wt% Cu",
+        f"0.5 kg steel,  {CU_INIT_WT} wt% Cu{note}",
         fontsize=12, fontweight="bold", pad=12,
     )
 
@@ -0,0 +1,411 @@
+"""
+Watch the raw data folders and rebuild only the artifacts that depend on them.
+
+Results arrive by copying CSVs from the OSU VM into data/tcpython/raw (and the
+pycalphad notebook writes data/pycalphad). This script polls both folders,
+waits until a burst of copies has gone quiet, works out which stages read the
+changed files (and which stages read *their* outputs), and reruns just those
+on a small worker pool, in dependency order:
+
+  python3 watch_pipeline.py                    watch until Ctrl-C
+  python3 watch_pipeline.py --jobs 2 --quiet 5
+  python3 watch_pipeline.py ../data/tcpython/raw/dG_vs_T_top6.csv
+                                               run once for these files
+  python3 watch_pipeline.py --dry-run FILE...  show the stages, run nothing
+  python3 watch_pipeline.py --list             stage table
+
+Each stage is one of the existing scripts, run as its own process
+(python3 <script>, MPLBACKEND=Agg) from the repository root; figures are
+rendered through render_figures.py, one stage per registry entry. STAGES lists what
+every stage reads and writes; the dependency graph comes from matching one
+stage's outputs against another's inputs, so a new stage only needs its
+entry. The workbooks are built with --incremental, so a rerun only rebuilds
+the tabs whose inputs actually changed (incremental_xlsx.py).
+
+After every run the script prints each stage's status and duration. Files
+written by the stages themselves (e.g. gibbs_store.py rewriting
+oxide_gibbs_energies.csv in raw/) do not trigger another run.
+
+Stdlib only: change detection compares (mtime, size) snapshots every
+--interval seconds, so it works the same on Linux, macOS and a network drive.
+"""
+
+import argparse
+import fnmatch
+import os
+import subprocess
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from pathlib import Path
+
+import render_figures
+
+ROOT = Path(__file__).resolve().parent.parent
+
+WATCH_DIRS = ("data/tcpython/raw", "data/pycalphad")
+
+RAW = "data/tcpython/raw/"
+PROC = "data/tcpython/processed/"
+FIG = "figures/"
+
+# name -> (command, inputs, outputs); paths relative to the repository root,
+# fnmatch patterns allowed. A command starting with a .py file runs that
+# script with this interpreter.
+STAGES = {
+    "store-wide": (
+        ["simulations/tcpython/gibbs_store.py", "wide"],
+        [RAW + "oxide_gibbs_long.csv", RAW + "oxide_gibbs_phases.csv"],
+        [RAW + "oxide_gibbs_energies.csv"]),
+    "fits": (
+        ["screening/gibbs_fits.py"],
+        [RAW + "oxide_gibbs_long.csv", RAW + "oxide_gibbs_phases.csv"],
+        [PROC + "gibbs_fits.csv"]),
+    "update-table": (
+        ["screening/update_screening_table.py"],
+        [PROC + "gibbs_fits.csv"],
+        ["screening/screening_table.csv"]),
+    "ternary-dG": (
+        ["screening/compute_ternary_dG.py"],
+        [RAW + "ternary_reaction_energies.csv"],
+        ["screening/ternary_screening_results.csv"]),
+    "activity-dG": (
+        ["screening/compute_activity_corrected_dG.py"],
+        [RAW + "ternary_reaction_energies.csv", RAW + "dG_vs_T_top6.csv",
+         PROC + "reaction_stoichiometry.npz"],
+        [PROC + "activity_corrected_dG.csv",
+         FIG + "dG_corrected_comparison.*", FIG + "dG_sensitivity_gamma_Cu.*"]),
+    "decompose": (
+        ["screening/analyze_cufe2o4_decomposition.py"],
+        [RAW + "cufe2o4_alternative_reaction.csv"],
+        ["screening/cufe2o4_decomposition_results.csv"]),
+    "profile-metrics": (
+        ["screening/profile_metrics.py"],
+        [RAW + "cu_removal_rate_profiles.csv"],
+        [PROC + "cu_removal_profile_metrics.csv"]),
+    "diffusivity": (
+        ["screening/diffusivity_fit.py"],
+        [RAW + "cu_removal_rate_profiles.csv"],
+        [PROC + "cu_diffusivity_fit_diagnostics.csv"]),
+    "convergence": (
+        ["screening/diffusion_convergence.py"],
+        ["screening/diffusivity_fit.py"],
+        [PROC + "diffusion_convergence_local.csv"]),
+    "convergence-dictra": (
+        ["screening/diffusion_convergence.py", "--source", "dictra"],
+        [RAW + "dictra_convergence.csv"],
+        [PROC + "diffusion_convergence_dictra.csv"]),
+    "sherwood": (
+        ["screening/convective_kinetics.py", "--write"],
+        [RAW + "cu_removal_rate_summary.csv"],
+        [PROC + "cu_removal_rate_summary_sherwood.csv"]),
+    "multicomponent": (
+        ["screening/multicomponent_diffusion.py", "--write"],
+        [RAW + "cu_removal_rate_summary.csv", PROC + "activity_corrected_dG.csv"],
+        [PROC + "cu_removal_rate_summary_multicomponent.csv",
+         PROC + "multicomponent_oxide_ranking.csv"]),
+    "shrinking-core": (
+        ["screening/shrinking_core.py", "--write"],
+        [RAW + "cu_removal_rate_summary.csv"],
+        [PROC + "shrinking_core_capture.csv"]),
+    "screen": (
+        ["screening/tiered_screening.py"],
+        [RAW + "ternary_reaction_energies.csv", RAW + "dG_vs_T_top6.csv",
+         RAW + "generated_candidates_dG.csv", RAW + "tier2_equilibria.csv",
+         "screening/generated_candidates.csv"],
+        ["screening/tiered_screening_results.csv", "screening/tier2_queue.csv"]),
+
+    "cu-o-notebook": (
+        ["-m", "marimo", "export", "html",
+         "simulations/notebooks/cu_o_visualization.py",
+         "-o", FIG + "cu_o_visualization.html"],
+        ["data/pycalphad/cu_o_gibbs_energies.csv"],
+        [FIG + "cu_o_visualization.html"]),
+
+    "build-ternary": (
+        ["screening/build_ternary_xlsx.py"],
+        [RAW + "ternary_reaction_energies.csv",
+         "screening/ternary_screening_results.csv"],
+        ["screening/Ternary_Screening_Results.xlsx"]),
+    "build-combined": (
+        ["screening/build_combined_screening.py", "--incremental"],
+        [RAW + "oxide_gibbs_energies.csv", RAW + "ternary_reaction_energies.csv"],
+        ["screening/Cu_Removal_Screening.xlsx"]),
+    "build-validation": (
+        ["screening/build_validation_xlsx.py", "--incremental"],
+        [RAW + "dG_vs_T_top6.csv", RAW + "cufe2o4_alternative_reaction.csv",
+         "screening/cufe2o4_decomposition_results.csv",
+         RAW + "slag_composition_effects.csv", RAW + "cu_activity_vs_oxide.csv",
+         PROC + "activity_corrected_dG.csv"],
+        ["screening/Validation_Results.xlsx"]),
+    "build-unified": (
+        ["screening/build_unified_xlsx.py", "--incremental"],
+        [RAW + "oxide_gibbs_energies.csv", RAW + "ternary_reaction_energies.csv",
+         RAW + "dG_vs_T_top6.csv", RAW + "cufe2o4_alternative_reaction.csv",
+         RAW + "cu_activity_vs_oxide.csv", RAW + "slag_composition_effects.csv",
+         RAW + "ternary_phase_map_1800K.csv", PROC + "activity_corrected_dG.csv",
+         "screening/screening_table.csv", "screening/ternary_screening_results.csv",
+         FIG + "dG_vs_T_top6.png", FIG + "dG_corrected_comparison.png",
+         FIG + "slag_basicity_vs_aCu.png", FIG + "cufe2o4_decomposition.png"],
+        ["screening/Cu_Removal_Unified.xlsx"]),
+}
+
+# One stage per figure in the render_figures.py registry; rendering through
+# it records the hashes, so a later render_figures.py run skips these
+STAGES.update({
+    "fig-" + name: (["screening/render_figures.py", name, "--jobs", "1"],
+                    render_figures.inputs(name), outputs)
+    for name, (_, _, _, outputs) in render_figures.FIGURES.items()
+})
+
+TAIL_LINES = 8     # lines of a failed stage's output to show
+
+
+# ============================================================================
+# Dependency graph
+# ============================================================================
+
+def _matches(path, patterns):
+    """True if the relative path `path` matches any pattern."""
+    return any(fnmatch.fnmatchcase(path, p) or fnmatch.fnmatchcase(p, path)
+               for p in patterns)
+
+
+def upstream(stages=STAGES):
+    """stage -> set of stages whose outputs it reads."""
+    deps = {name: set() for name in stages}
+    for name, (_, inputs, _) in stages.items():
+        for other, (_, _, outputs) in stages.items():
+            if other != name and any(_matches(o, inputs) for o in outputs):
+                deps[name].add(other)
+    return deps
+
+
+def topo_order(stages=STAGES):
+    """Stage names with every stage after the ones it reads from."""
+    deps = upstream(stages)
+    order, done = [], set()
+    while len(order) < len(deps):
+        ready = [n for n in deps if n not in done and deps[n] <= done]
+        if not ready:
+            raise ValueError("dependency cycle among stages: %s"
+                             % ", ".join(sorted(set(deps) - done)))
+        order.extend(ready)
+        done.update(ready)
+    return order
+
+
+def affected(paths, stages=STAGES):
+    """Stages that read any of `paths`, plus everything downstream of them."""
+    hit = {n for n, (_, inputs, _) in stages.items()
+           if any(_matches(p, inputs) for p in paths)}
+    deps = upstream(stages)
+    grew = True
+    while grew:
+        more = {n for n in deps if n not in hit and deps[n] & hit}
+        hit |= more
+        grew = bool(more)
+    return [n for n in topo_order(stages) if n in hit]
+
+
+# ============================================================================
+# Running stages
+# ============================================================================
+
+def command(name):
+    """argv for a stage."""
+    cmd = STAGES[name][0]
+    if cmd[0].endswith(".py"):
+        return [sys.executable, str(ROOT / cmd[0]), *cmd[1:]]
+    return [sys.executable, *cmd]
+
+
+def run_stage(name):
+    """Run one stage; returns (returncode, seconds, combined output)."""
+    env = dict(os.environ, MPLBACKEND="Agg")
+    t0 = time.perf_counter()
+    proc = subprocess.run(command(name), cwd=ROOT, env=env, text=True,
+                          stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+    return proc.returncode, time.perf_counter() - t0, proc.stdout
+
+
+def run_stages(names, jobs=2, log=print):
+    """
+    Run `names` (in topo order) on a pool of `jobs` workers. A stage starts
+    once every upstream stage in `names` has finished; if one of those
+    failed, it is skipped. Returns {name: (status, seconds)}.
+    """
+    deps = upstream()
+    wanted = set(names)
+    results = {}
+    pending = list(names)
+    running = {}
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as pool:
+        while pending or running:
+            for name in list(pending):
+                before = deps[name] & wanted
+                if any(results.get(d, ("",))[0] in ("failed", "skipped")
+                       for d in before):
+                    results[name] = ("skipped", 0.0)
+                    pending.remove(name)
+                    log("  skip  %s (upstream failed)" % name)
+                elif before <= set(results):
+                    running[pool.submit(run_stage, name)] = name
+                    pending.remove(name)
+                    log("  start %s" % name)
+            if not running:
+                continue
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                name = running.pop(future)
+                try:
+                    code, seconds, output = future.result()
+                except OSError as exc:
+                    code, seconds, output = -1, 0.0, str(exc)
+                status = "ok" if code == 0 else "failed"
+                results[name] = (status, seconds)
+                log("  %-5s %s (%.1f s)" % ("done" if code == 0 else "FAIL",
+                                            name, seconds))
+                if code != 0:
+                    for line in output.rstrip().splitlines()[-TAIL_LINES:]:
+                        log("        | " + line)
+    return results
+
+
+def report(results, wall):
+    """Per-stage status and duration table."""
+    lines = ["", "  %-24s %-8s %8s" % ("stage", "status", "time"),
+             "  " + "-" * 42]
+    for name, (status, seconds) in results.items():
+        lines.append("  %-24s %-8s %6.1f s" % (name, status, seconds))
+    counts = {s: sum(1 for st, _ in results.values() if st == s)
+              for s in ("ok", "failed", "skipped")}
+    lines.append("  " + "-" * 42)
+    lines.append("  %d stages: %d ok, %d failed, %d skipped; wall %.1f s "
+                 "(stage total %.1f s)" % (
+                     len(results), counts["ok"], counts["failed"],
+                     counts["skipped"], wall,
+                     sum(s for _, s in results.values())))
+    return "\n".join(lines)
+
+
+def rebuild(paths, jobs, dry_run=False):
+    """Rerun the stages affected by `paths`; returns ({name: result}, failed)."""
+    names = affected(paths)
+    unread = [p for p in paths if not _matches(p, [i for _, ins, _ in
+                                                     STAGES.values() for i in ins])]
+    for p in unread:
+        print("  (no stage reads %s)" % p)
+    if not names:
+        return {}, 0
+    print("Stages: %s" % ", ".join(names))
+    if dry_run:
+        return dict.fromkeys(names), 0
+    t0 = time.perf_counter()
+    results = run_stages(names, jobs)
+    print(report(results, time.perf_counter() - t0))
+    return results, sum(1 for status, _ in results.values() if status != "ok")
+
+
+# ============================================================================
+# Watching
+# ============================================================================
+
+def snapshot():
+    """{relative path: (mtime_ns, size)} of every file in WATCH_DIRS."""
+    snap = {}
+    for folder in WATCH_DIRS:
+        for path in (ROOT / folder).rglob("*"):
+            if path.name.startswith((".", "~")) or not path.is_file():
+                continue
+            try:
+                st = path.stat()
+            except OSError:          # removed between listing and stat
+                continue
+            snap[path.relative_to(ROOT).as_posix()] = (st.st_mtime_ns, st.st_size)
+    return snap
+
+
+def changed(old, new):
+    """Paths added, removed or modified between two snapshots."""
+    return {p for p in old.keys() | new.keys() if old.get(p) != new.get(p)}
+
+
+def watch(jobs, quiet, interval):
+    """Poll WATCH_DIRS forever; rebuild after `quiet` s without changes."""
+    print("Watching %s (every %.1f s, quiet period %.1f s, %d worker(s))" % (
+        ", ".join(WATCH_DIRS), interval, quiet, jobs))
+    base = snapshot()
+    pending, last = set(), None
+    while True:
+        time.sleep(interval)
+        now = snapshot()
+        diff = changed(base, now)
+        if diff:
+            pending |= diff
+            base, last = now, time.monotonic()
+            continue
+        if not pending or time.monotonic() - last < quiet:
+            continue
+
+        print("\n[%s] %d file(s) changed: %s" % (
+            time.strftime("%H:%M:%S"), len(pending), ", ".join(sorted(pending))))
+        results, _ = rebuild(sorted(pending), jobs)
+        # Outputs the stages wrote into the watched folders are not new data
+        produced = [o for n in results for o in STAGES[n][2]]
+        after = snapshot()
+        pending = {p for p in changed(base, after) if not _matches(p, produced)}
+        base = after
+        last = time.monotonic() if pending else None
+
+
+def _relative(path):
+    """Repository-relative posix path for a command-line file argument."""
+    p = Path(path).resolve()
+    try:
+        return p.relative_to(ROOT).as_posix()
+    except ValueError:
+        return Path(path).as_posix()
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Rebuild figures and workbooks when raw data changes")
+    parser.add_argument("files", nargs="*",
+                        help="run once for these changed files instead of watching")
+    parser.add_argument("--jobs", type=int, default=min(4, os.cpu_count() or 1),
+                        help="stages run in parallel (default %(default)s)")
+    parser.add_argument("--quiet", type=float, default=2.0, metavar="S",
+                        help="seconds without changes before rebuilding "
+                             "(default %(default)s)")
+    parser.add_argument("--interval", type=float, default=1.0, metavar="S",
+                        help="polling interval (default %(default)s)")
+    parser.add_argument("--dry-run", action="store_true",
+                        help="list the stages for FILES without running them")
+    parser.add_argument("--list", action="store_true",
+                        help="print the stage table and exit")
+    args = parser.parse_args()
+
+    if args.list:
+        deps = upstream()
+        for name in topo_order():
+            after = ", ".join(sorted(deps[name]))
+            print("%-24s %s%s" % (name, " ".join(STAGES[name][0]),
+                                  "   (after %s)" % after if after else ""))
+        return 0
+    if args.files:
+        _, failed = rebuild([_relative(f) for f in args.files], args.jobs,
+                            args.dry_run)
+        return 1 if failed else 0
+    if args.dry_run:
+        parser.error("--dry-run needs FILES")
+
+    try:
+        watch(args.jobs, args.quiet, args.interval)
+    except KeyboardInterrupt:
+        print("\nStopped.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -589,6 +589,66 @@ def _(mo, plt, np, math, calc, DICTRA_DATA, OXIDES, story_toggle, story_frame):
     return
 
 
+# ── Inverse design (screening/inverse_design.py) ────────────────────
+
+@app.cell
+def _(mo):
+    import sys as _sys
+    _sys.path.insert(0, str(mo.notebook_dir().parent.parent / "screening"))
+    from inverse_design import CaptureSurface, solve as inverse_solve
+
+    # Loaded once; every slider change re-solves against it
+    INVERSE_SURFACE = CaptureSurface.load("dictra")
+    return INVERSE_SURFACE, inverse_solve
+
+
+@app.cell
+def _(
+    mo, INVERSE_SURFACE, inverse_solve,
+    oxide_dropdown, steel_mass_slider, cu_init_slider,
+    cu_target_slider, oxide_mass_slider, particle_radius_slider,
+    temp_slider,
+):
+    _oxide = oxide_dropdown.value.translate(str.maketrans("₀₁₂₃₄₅₆₇₈₉", "0123456789"))
+    _given = {
+        "dose": oxide_mass_slider.value,
+        "radius": particle_radius_slider.value,
+        "time": 1800,
+        "temp": temp_slider.value,
+    }
+    _keys = {"dose": "dose_g", "radius": "radius_um", "time": "time_s", "temp": "temp_K"}
+    _units = {"dose": "g", "radius": "um", "time": "s", "temp": "K"}
+    _rows = []
+    for _unknown in _given:
+        _kw = {_keys[k]: v for k, v in _given.items() if k != _unknown}
+        _r = inverse_solve(_unknown, target_wt=cu_target_slider.value,
+                           oxide=_oxide, steel_kg=steel_mass_slider.value,
+                           cu_init_wt=cu_init_slider.value,
+                           surface=INVERSE_SURFACE, **_kw)
+        _status = _r["status"].item()
+        _value = float(_r["value"])
+        _limit = _r["limited_by"].item()
+        if _status == "ok":
+            _answer = f"**{_value:.4g} {_units[_unknown]}**"
+        elif _status == "met at bound":
+            _answer = "met anywhere in range"
+        else:
+            _answer = f"unreachable (best {float(_r['removal_pct']):.1f}%)"
+        _rows.append(f"| {_unknown} | {_answer} | {_limit} |")
+
+    mo.accordion({
+        "Inverse Design — what it takes to hit the target": mo.md(f"""
+Each row solves for one quantity with the others at their slider values
+(30 min treatment), coupled melt model, DICTRA capture surface.
+
+| Solve for | Needed | Limited by |
+|-----------|--------|------------|
+{chr(10).join(_rows)}
+        """),
+    })
+    return
+
+
 # ── Details (below the fold) ────────────────────────────────────────
 
 @app.cell
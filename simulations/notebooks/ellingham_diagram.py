@@ -56,33 +56,43 @@ def _(mo):
 
 @app.cell
 def _(Path, pd):
-    # Load TC-Python extracted data
+    # Load the piecewise G(T) fits of the TC-Python data
+    # (screening/gibbs_fits.py: a + bT + cT lnT + dT^2 + e/T per phase segment)
     # Try local path first, fall back to GitHub raw URL for Molab
-    local_path = Path(__file__).parent.parent.parent / "data" / "tcpython" / "raw" / "oxide_gibbs_energies.csv"
-    github_url = "https://raw.githubusercontent.com/dimascad/honda-calphad/main/data/tcpython/raw/oxide_gibbs_energies.csv"
+    local_path = Path(__file__).parent.parent.parent / "data" / "tcpython" / "processed" / "gibbs_fits.csv"
+    github_url = "https://raw.githubusercontent.com/dimascad/honda-calphad/main/data/tcpython/processed/gibbs_fits.csv"
 
     try:
         if local_path.exists():
-            df = pd.read_csv(local_path)
+            fits = pd.read_csv(local_path)
         else:
-            df = pd.read_csv(github_url)
+            fits = pd.read_csv(github_url)
     except:
         # Molab fallback - __file__ doesn't exist
-        df = pd.read_csv(github_url)
+        fits = pd.read_csv(github_url)
+
+    # Evaluate on a 1 K grid so any slider temperature is exact
+    T_K = np.arange(500.0, 2001.0)
+    T_C = T_K - 273.15
+
+    def dG_f(oxide):
+        """dG_f(T) in kJ/mol O2 from the fitted segments."""
+        out = np.full_like(T_K, np.nan)
+        segs = fits[(fits["oxide"] == oxide) & (fits["quantity"] == "dG_f")]
+        for s in segs.itertuples():
+            m = (T_K >= s.T_lo) & (T_K <= s.T_hi) & np.isnan(out)
+            out[m] = (s.a + s.b * T_K[m] + s.c * T_K[m] * np.log(T_K[m])
+                      + s.d * T_K[m] ** 2 + s.e / T_K[m])
+        return out / 1000
 
-    # Extract relevant columns for Ellingham diagram
-    T_K = df['T_K'].values
-    T_C = df['T_C'].values
-
-    # dG values in J/mol O2 -> convert to kJ/mol O2
     oxide_dG = {
-        'Cu₂O': df['dG_Cu2O_per_O2'].values / 1000,
-        'CuO': df['dG_CuO_per_O2'].values / 1000,
-        'Al₂O₃': df['dG_Al2O3_per_O2'].values / 1000,
-        'MgO': df['dG_MgO_per_O2'].values / 1000,
-        'SiO₂': df['dG_SiO2_per_O2'].values / 1000,
-        'TiO₂': df['dG_TiO2_per_O2'].values / 1000,
-        'FeO': df['dG_FeO_per_O2'].values / 1000,
+        'Cu₂O': dG_f('Cu2O'),
+        'CuO': dG_f('CuO'),
+        'Al₂O₃': dG_f('Al2O3'),
+        'MgO': dG_f('MgO'),
+        'SiO₂': dG_f('SiO2'),
+        'TiO₂': dG_f('TiO2'),
+        'FeO': dG_f('FeO'),
     }
 
     # Plotting metadata
@@ -95,7 +105,7 @@ def _(Path, pd):
         'TiO₂': {'color': '#E69F00', 'ls': ':', 'reaction': 'Ti + O₂ → TiO₂'},
         'FeO': {'color': '#EE7733', 'ls': '--', 'reaction': '2Fe + O₂ → 2FeO'},
     }
-    return T_C, T_K, data_path, df, oxide_dG, oxide_style
+    return T_C, T_K, oxide_dG, oxide_style
 
 
 @app.cell
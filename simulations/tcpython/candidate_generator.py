@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""
+Enumerate Cu-M-O ternary product candidates instead of hand-writing them.
+
+TERNARY_SYSTEMS in ternary_systems.py lists 18 products by hand.
+This module builds the same kind of definitions from a few structure
+families and a table of metals:
+
+  Family       Cu  M    Formula templates (Cu : M)         Metals
+  borate       +2  +3   CuM2O4, Cu2M2O5, Cu3M2O6           B
+  vanadate     +2  +5   CuM2O6, Cu2M2O7, Cu3M2O8, Cu5M2O10 any M5+ (V, Nb, Ta, P)
+  silicate     +2  +4   CuMO3, Cu2MO4                      any M4+ (Si, Ti, Zr, ...)
+  spinel       +2  +3   CuM2O4                             any M3+ except B
+  delafossite  +1  +3   CuMO2                              any M3+ except B
+
+The oxygen count follows from charge neutrality. Each product is balanced
+against the metal's screening oxide (e.g. FeO for Fe, even though Fe is +3
+in CuFe2O4) by reaction_balancer.py:
+
+  n_Cu Cu + n_oxide_fu MaOb + n_O2 O2 -> Cu_c M_m O_o
+
+A negative n_O2 means the reaction releases O2. A formula produced by more
+than one family is kept once, under the first family in FAMILIES.
+
+The candidate dicts use the same keys as the TERNARY_SYSTEMS ternaries
+(product, name, reaction, X_Cu, X_M, X_O, atoms_per_formula, phase_hints,
+n_Cu, n_oxide_fu, oxide_atoms, n_O2), plus oxide, metal, family and
+constituents (binary oxides for the tier-0 bounds in
+screening/tiered_screening.py).
+
+Plain Python, no TC-Python needed:
+  python3 candidate_generator.py                    (summary table)
+  python3 candidate_generator.py --csv out.csv      (full list)
+  python3 candidate_generator.py --families spinel vanadate --metals FE MN V
+"""
+
+import argparse
+import csv
+import sys
+from fractions import Fraction
+
+from reaction_balancer import capture_stoichiometry
+
+# =============================================================================
+# Metals: screening (reactant) oxide and the valences M can take in products.
+# Elements missing from the selected database are dropped by the batch
+# evaluator when it probes the Cu-M-O system.
+# =============================================================================
+METALS = {
+    "AL": {"oxide": "Al2O3", "valences": (3,)},
+    "B":  {"oxide": "B2O3",  "valences": (3,)},
+    "CE": {"oxide": "CeO2",  "valences": (3, 4)},
+    "CO": {"oxide": "CoO",   "valences": (3,)},
+    "CR": {"oxide": "Cr2O3", "valences": (3,)},
+    "FE": {"oxide": "FeO",   "valences": (3,)},
+    "GA": {"oxide": "Ga2O3", "valences": (3,)},
+    "HF": {"oxide": "HfO2",  "valences": (4,)},
+    "LA": {"oxide": "La2O3", "valences": (3,)},
+    "MN": {"oxide": "MnO",   "valences": (3, 4)},
+    "NB": {"oxide": "Nb2O5", "valences": (5,)},
+    "ND": {"oxide": "Nd2O3", "valences": (3,)},
+    "NI": {"oxide": "NiO",   "valences": (3,)},
+    "P":  {"oxide": "P2O5",  "valences": (5,)},
+    "SC": {"oxide": "Sc2O3", "valences": (3,)},
+    "SI": {"oxide": "SiO2",  "valences": (4,)},
+    "SN": {"oxide": "SnO2",  "valences": (4,)},
+    "TA": {"oxide": "Ta2O5", "valences": (5,)},
+    "TI": {"oxide": "TiO2",  "valences": (3, 4)},
+    "V":  {"oxide": "V2O5",  "valences": (3, 5)},
+    "Y":  {"oxide": "Y2O3",  "valences": (3,)},
+    "ZR": {"oxide": "ZrO2",  "valences": (4,)},
+}
+
+# =============================================================================
+# Structure families. Order matters: the first family to produce a formula
+# keeps it (CuB2O4 is a borate, not a spinel).
+# =============================================================================
+FAMILIES = [
+    {"family": "borate", "cu_valence": 2, "m_valence": 3,
+     "ratios": [(1, 2), (2, 2), (3, 2)], "metals": ["B"],
+     "phase_hints": ["BORATE", "CUBO"]},
+    {"family": "vanadate", "cu_valence": 2, "m_valence": 5,
+     "ratios": [(1, 2), (2, 2), (3, 2), (5, 2)], "metals": None,
+     "phase_hints": ["VANADATE", "ORTHOVANADATE", "PYROVANADATE"]},
+    {"family": "silicate", "cu_valence": 2, "m_valence": 4,
+     "ratios": [(1, 1), (2, 1)], "metals": None,
+     "phase_hints": ["PYROXENE", "OLIVINE", "ILMENITE", "PEROVSKITE"]},
+    {"family": "spinel", "cu_valence": 2, "m_valence": 3,
+     "ratios": [(1, 2)], "metals": None, "exclude": ["B"],
+     "phase_hints": ["SPINEL"]},
+    {"family": "delafossite", "cu_valence": 1, "m_valence": 3,
+     "ratios": [(1, 1)], "metals": None, "exclude": ["B"],
+     "phase_hints": ["DELAFOSSITE"]},
+]
+
+FAMILY_NAMES = [f["family"] for f in FAMILIES]
+
+
+# =============================================================================
+# Formula helpers
+# =============================================================================
+def element_symbol(el):
+    """TC element name -> chemical symbol ("FE" -> "Fe")."""
+    return el[0] + el[1:].lower()
+
+
+def parse_oxide(formula):
+    """"Al2O3" -> ("Al", 2, 3). Only binary M_aO_b formulas."""
+    head, _, o = formula.partition("O")
+    i = 1
+    while i < len(head) and head[i].islower():
+        i += 1
+    metal, a = head[:i], head[i:]
+    return metal, int(a or 1), int(o or 1)
+
+
+def formula(parts):
+    """[("Cu", 1), ("Al", 2), ("O", 4)] -> "CuAl2O4"."""
+    return "".join(s + (str(n) if n != 1 else "") for s, n in parts)
+
+
+def oxide_at_valence(symbol, valence):
+    """Binary oxide of `symbol` with the metal at `valence` ("Fe", 3 -> "Fe2O3")."""
+    if valence % 2 == 0:
+        return formula([(symbol, 1), ("O", valence // 2)])
+    return formula([(symbol, 2), ("O", valence)])
+
+
+# =============================================================================
+# Generator
+# =============================================================================
+def generate_candidates(families=None, metals=None):
+    """Enumerate balanced Cu-M-O candidates.
+
+    families / metals: optional lists restricting the enumeration
+    (family names, TC element names). Returns a list of candidate dicts in
+    a deterministic order (family order, then metal, then ratio).
+    """
+    seen = set()
+    out = []
+    for fam in FAMILIES:
+        if families and fam["family"] not in families:
+            continue
+        for el in sorted(METALS):
+            if metals and el not in metals:
+                continue
+            if fam["metals"] is not None and el not in fam["metals"]:
+                continue
+            if el in fam.get("exclude", ()):
+                continue
+            if fam["m_valence"] not in METALS[el]["valences"]:
+                continue
+
+            symbol = element_symbol(el)
+            oxide = METALS[el]["oxide"]
+            for c, m in fam["ratios"]:
+                charge = c * fam["cu_valence"] + m * fam["m_valence"]
+                if charge % 2:
+                    continue
+                o = charge // 2
+                product = formula([("Cu", c), (symbol, m), ("O", o)])
+                if product in seen:
+                    continue
+                seen.add(product)
+
+                cu_oxide = "CuO" if fam["cu_valence"] == 2 else "Cu2O"
+                cu_units = c if fam["cu_valence"] == 2 else Fraction(c, 2)
+                m_oxide = oxide_at_valence(symbol, fam["m_valence"])
+                _, ma, _ = parse_oxide(m_oxide)
+
+                cand = {
+                    "product": product,
+                    "name": "copper %s %s" % (symbol, fam["family"]),
+                    "family": fam["family"],
+                    "metal": el,
+                    "oxide": oxide,
+                    "phase_hints": fam["phase_hints"] + [product.upper()],
+                    "constituents": {cu_oxide: float(cu_units),
+                                     m_oxide: m / ma},
+                }
+                cand.update(capture_stoichiometry(product, oxide))
+                out.append(cand)
+    return out
+
+
+CSV_FIELDS = ["product", "name", "family", "metal", "oxide", "reaction",
+              "X_Cu", "X_M", "X_O", "atoms_per_formula", "n_Cu", "n_oxide_fu",
+              "oxide_atoms", "n_O2", "phase_hints", "constituents"]
+
+
+def write_candidates_csv(path, candidates):
+    with open(path, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=CSV_FIELDS, extrasaction="ignore")
+        writer.writeheader()
+        for cand in candidates:
+            row = dict(cand)
+            row["phase_hints"] = ";".join(cand["phase_hints"])
+            row["constituents"] = ";".join("%s:%g" % kv
+                                           for kv in cand["constituents"].items())
+            writer.writerow(row)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Enumerate balanced Cu-M-O ternary product candidates.")
+    parser.add_argument("--families", nargs="+", choices=FAMILY_NAMES, default=None)
+    parser.add_argument("--metals", nargs="+", default=None,
+                        help="TC element names, e.g. FE MN V")
+    parser.add_argument("--csv", default=None, help="write the full list to CSV")
+    args = parser.parse_args()
+
+    metals = [m.upper() for m in args.metals] if args.metals else None
+    cands = generate_candidates(args.families, metals)
+
+    print("=" * 78)
+    print("Generated Cu-M-O candidates: %d" % len(cands))
+    print("=" * 78)
+    print("%-12s %-6s %-11s  %s" % ("Product", "Metal", "Family", "Reaction"))
+    print("-" * 78)
+    for c in cands:
+        print("%-12s %-6s %-11s  %s" % (c["product"], c["metal"],
+                                        c["family"], c["reaction"]))
+    if args.csv:
+        write_candidates_csv(args.csv, cands)
+        print("\nCSV written to: %s" % args.csv)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -28,6 +28,8 @@ from datetime import datetime
 
 from tc_python import *
 
+from sweep_telemetry import SweepTelemetry
+
 # =============================================================================
 # Configuration
 # =============================================================================
@@ -97,6 +99,8 @@ def main():
     print("Systems: {}".format(", ".join(s["name"] for s in SYSTEMS)))
     print("Output: {}".format(OUTPUT_FILE))
     print("Started: {}".format(datetime.now().isoformat()))
+    tel = SweepTelemetry("cu_activity_vs_oxide", DATABASE)
+    print("Telemetry: {}".format(tel.path))
     print()
 
     OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
@@ -153,6 +157,8 @@ def main():
                 row["X_M"] = round(X_M, 6)
                 row["X_O"] = round(X_O, 6)
 
+                ev = tel.start(sys_name, T_K=T_FIXED, X_Cu=row["X_Cu"],
+                               X_O=row["X_O"])
                 try:
                     calc = system.with_single_equilibrium_calculation()
                     calc.set_condition(ThermodynamicQuantity.temperature(), T_FIXED)
@@ -174,8 +180,10 @@ def main():
                     row["stable_phases"] = "; ".join(stable)
                     row["notes"] = ""
                     success += 1
+                    tel.ok(ev, phases=stable)
 
                 except Exception as e:
+                    tel.fail(ev, e)
                     row["a_Cu"] = ""
                     row["stable_phases"] = "ERROR: {}".format(e)
                     row["notes"] = str(e)
@@ -196,6 +204,8 @@ def main():
                     last["X_Cu"], last["a_Cu"]))
             print()
 
+    tel.close()
+
     # =========================================================================
     # Write CSV
     # =========================================================================
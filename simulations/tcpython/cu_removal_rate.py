@@ -21,6 +21,23 @@ Output CSVs:
   - cu_removal_rate_profiles.csv   (full radial profiles)
   - cu_removal_rate_summary.csv    (one row per temp x radius x time)
 
+Grid and shell (per temperature):
+  - The steel shell is SHELL_SIGMAS * sqrt(D * t_max) wide, with D an upper
+    estimate of D_Cu in the phase (D_ESTIMATE): 18 mm for LIQUID, 0.22-0.45 mm
+    for FCC_A1, instead of a fixed 5 mm. --shell fixed restores 5 mm.
+  - The grid is geometric by default (points packed at the particle surface,
+    where the gradient is); --grid linear / double-geometric are options.
+  - Default: 80 geometric points, time step capped at 10 % of the simulated
+    time. The convergence harness (screening/diffusion_convergence.py, local
+    stand-in) puts that within 1 % on cu_captured_mg; the earlier 40 points
+    were off by about 12 % in the worst case.
+  - Every run checks that the far-field Cu stayed at bulk; if it moved by
+    more than FARFIELD_TOL of the driving force the run is repeated with a
+    doubled shell (up to SHELL_RETRIES times), and a run that still fails
+    the check is flagged (farfield_ok = 0 in the summary).
+  - cu_removed_shell_pct stays relative to the reference 5 mm shell, so it
+    is comparable between temperatures and with earlier sweeps.
+
 Temperature notes:
   - Above ~1811 K (1538 C, pure Fe melting): steel is LIQUID
   - Below ~1811 K: steel is FCC_A1 (solid). D_Cu drops ~1000x.
@@ -30,22 +47,58 @@ Temperature notes:
 Run on OSU VM:
   "C:\\Program Files\\Thermo-Calc\\2025b\\python\\python.exe" cu_removal_rate.py
 
-Expected runtime: ~5-10 minutes (260 DICTRA calculations).
+Expected runtime: ~5-10 minutes (260 DICTRA calculations) on the old 40-point
+grid; the 80-point default takes about twice as long or more.
+
+Split across K lab machines (see sweep_shards.py):
+  ... cu_removal_rate.py --shard 1/4   (then 2/4, 3/4, 4/4 on other seats)
+  python3 sweep_shards.py merge ../../data/tcpython/raw/cu_removal_rate_summary.csv \
+      ../../data/tcpython/raw/cu_removal_rate_profiles.csv
+
+Grid options (default: --grid geometric --points 80 --max-dt-pct 10 --shell auto):
+  ... cu_removal_rate.py --grid linear --shell fixed --points 60 --max-dt-pct 0   (old setup)
+  ... cu_removal_rate.py --points 40 --max-dt-pct 0   (previous default, ~12 % error)
+  ... cu_removal_rate.py --grid double-geometric --points 50
+  ... cu_removal_rate.py --shell-sigmas 4.5 --max-dt-pct 5
+The cheapest settings for a given accuracy come from the convergence
+harness (dictra_convergence.py, screening/diffusion_convergence.py).
+
+Oxide-specific surface Cu (after surface_bc_table.py):
+  ... cu_removal_rate.py --oxide FeO             (pO2 = 1 atm entries)
+  ... cu_removal_rate.py --oxide MnO --po2 air
+The surface composition per temperature then comes from
+data/tcpython/raw/surface_bc_table.csv instead of CU_SURFACE_WT, and the
+outputs are cu_removal_rate_{summary,profiles}_<oxide>[_air].csv.
+Temperatures where the oxide has no driving force (surface Cu at or above
+bulk) are recorded with zero capture and not sent to DICTRA.
+
+Scrap chemistry (Fe-Cu-O-C-Si-Mn; local counterpart
+screening/multicomponent_diffusion.py):
+  ... cu_removal_rate.py --chemistry scrap
+adds O, C, Si and Mn at the CHEMISTRY bulk levels, holds O at FeO
+saturation and C, Si, Mn at bulk at the particle, runs the liquid
+temperatures only and writes cu_removal_rate_{summary,profiles}_scrap.csv.
+Combines with --oxide.
 
 Honda CALPHAD Project - MSE 4381 Capstone
 """
 
 from datetime import datetime
+import argparse
 import csv
 import math
 import os
 import sys
 import traceback
 
+from sweep_shards import shard_from_argv, in_shard, shard_label, write_shard_csv
+from sweep_telemetry import SweepTelemetry
+
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 OUTPUT_DIR = os.path.join(SCRIPT_DIR, "..", "..", "data", "tcpython", "raw")
 PROFILE_CSV = os.path.join(OUTPUT_DIR, "cu_removal_rate_profiles.csv")
 SUMMARY_CSV = os.path.join(OUTPUT_DIR, "cu_removal_rate_summary.csv")
+SURFACE_BC_CSV = os.path.join(OUTPUT_DIR, "surface_bc_table.csv")
 
 # ===========================================================================
 # PARAMETERS
@@ -77,6 +130,8 @@ CU_INIT_WT = 0.30  # 0.3% Cu — typical contaminated scrap
 # a_Cu — DICTRA picks the Cu-rich root (~100% Cu) instead of the
 # Fe-rich root (~0.01% Cu), driving Cu TO the surface instead of away.
 # Fixed composition BC avoids this ambiguity entirely.
+# --oxide replaces this value with the per-(oxide, T) Fe-rich root from
+# surface_bc_table.py, which does the root selection outside DICTRA.
 CU_SURFACE_WT = 0.01
 
 # Particle radii to sweep (meters)
@@ -89,28 +144,152 @@ TIMES_LABEL = ["1 min", "5 min", "10 min", "30 min"]
 
 # Steel shell around particle — must be large enough that the
 # outer boundary stays at bulk Cu concentration.
-# Rule: shell >> sqrt(2 * D * t_max). D ~ 1e-9 (liquid), t_max = 1800 s
-# => sqrt(2 * 1e-9 * 1800) ~ 1.9 mm. Use 5 mm for safety.
-# For solid (D ~ 1e-12), depletion < 60 um so 5 mm is very safe.
-SHELL_WIDTH_M = 5e-3  # 5 mm of steel around particle
-
-# Grid points — finer near the particle surface where gradients are steep
-N_GRID_POINTS = 60
+# Rule: shell >> sqrt(D * t_max). erfc(3) = 2e-5, so 6 diffusion lengths
+# leave the far field at bulk. D is an upper estimate per phase:
+#   LIQUID: 5e-9 m^2/s (5x the DICTRA value at 1800 K)
+#   FCC_A1: Cu in gamma-Fe, D0 = 4.3e-5 m^2/s, Q = 280 kJ/mol, x10
+# => LIQUID 18 mm; FCC_A1 0.22 mm (1673 K) to 0.45 mm (1798 K).
+# The old fixed 5 mm was too narrow for the liquid (far field moved) and
+# ~20x too wide for the solid (depletion < 60 um).
+SHELL_SIGMAS = 6.0
+SHELL_MIN_M = 50e-6            # never thinner than this
+SHELL_REF_M = 5e-3             # reference shell for cu_removed_shell_pct
+SHELL_RETRIES = 2              # doublings if the far-field check fails
+FARFIELD_TOL = 1e-3            # allowed far-field drop / (bulk - surface)
+
+D_ESTIMATE = {
+    "LIQUID": lambda T: 5e-9,
+    "FCC_A1": lambda T: 10 * 4.3e-5 * math.exp(-280e3 / (8.314 * T)),
+}
+
+# Grid — finer near the particle surface where gradients are steep.
+# A geometric factor > 1 packs points at the lower (particle) end.
+GRID_TYPES = ("geometric", "double-geometric", "linear")
+GEOMETRIC_FACTOR = 1.08        # ratio of neighbouring cells
+UPPER_GEOMETRIC_FACTOR = 0.95  # double-geometric: mild packing at the far end
+DEFAULT_POINTS = {"geometric": 80, "double-geometric": 50, "linear": 60}
+
+# Largest time step, % of the simulated time (0 = DICTRA's own control).
+# With 80 geometric points this is the cheapest setting within 1 % in the
+# convergence harness (diffusion_convergence.py --tol 0.01).
+DEFAULT_MAX_DT_PCT = 10.0
 
 # Databases — confirmed working from Phase 3-6
 THERMO_DB = "TCFE13"
 MOBILITY_DB = "MOBFE8"
 ELEMENTS = ["FE", "CU"]
 
+# --chemistry: other solutes of a scrap melt (bulk wt%), diffused with Cu
+# (screening/multicomponent_diffusion.py is the local counterpart). At the
+# particle O is held at FeO saturation, the rest at bulk. The interaction
+# data behind it are for the liquid, so only liquid temperatures are run.
+CHEMISTRY = {
+    "scrap": {"O": 0.02, "C": 0.10, "SI": 0.20, "MN": 0.50},
+}
+
 # Density of steel (kg/m^3) — approximate, used for mass integration
 RHO_STEEL = 7000.0
 
 # ===========================================================================
 
+# Optional --shard i/K: run only every K-th point of the sweep
+SHARD = shard_from_argv()
+
+_parser = argparse.ArgumentParser(add_help=False)
+_parser.add_argument("--grid", choices=GRID_TYPES, default="geometric")
+_parser.add_argument("--shell", choices=("auto", "fixed"), default="auto")
+_parser.add_argument("--points", type=int, default=None)
+_parser.add_argument("--shell-sigmas", type=float, default=SHELL_SIGMAS)
+_parser.add_argument("--max-dt-pct", type=float, default=DEFAULT_MAX_DT_PCT)
+_parser.add_argument("--oxide", default=None)
+_parser.add_argument("--po2", choices=("1atm", "air"), default="1atm")
+_parser.add_argument("--chemistry", choices=list(CHEMISTRY), default=None)
+_opts, _ = _parser.parse_known_args()
+GRID_TYPE = _opts.grid
+SHELL_MODE = _opts.shell
+SHELL_SIGMAS = _opts.shell_sigmas
+N_GRID_POINTS = _opts.points or DEFAULT_POINTS[GRID_TYPE]
+MAX_DT_PCT = _opts.max_dt_pct or None   # None = DICTRA's default time-step control
+OXIDE = _opts.oxide
+PO2 = _opts.po2
+CHEMISTRY_NAME = _opts.chemistry
+BULK_SOLUTES = CHEMISTRY.get(CHEMISTRY_NAME, {})
+if BULK_SOLUTES:
+    ELEMENTS = ELEMENTS + list(BULK_SOLUTES)
+    TEMPS_K = [T for T in TEMPS_K if T >= LIQUIDUS_K]
+    PROFILE_CSV = PROFILE_CSV.replace(".csv", "_%s.csv" % CHEMISTRY_NAME)
+    SUMMARY_CSV = SUMMARY_CSV.replace(".csv", "_%s.csv" % CHEMISTRY_NAME)
+
+
+def o_saturation_wt(temp_K):
+    """Dissolved O at FeO saturation in liquid Fe (wt%)."""
+    return 10 ** (-6320.0 / temp_K + 2.734)
+
+
+def surface_solutes(temp_K):
+    """{element: wt%} held at the particle besides Cu (--chemistry)."""
+    return {el: (o_saturation_wt(temp_K) if el == "O" else wt)
+            for el, wt in BULK_SOLUTES.items()}
+
+
+def load_surface_bc(oxide, po2, path=SURFACE_BC_CSV):
+    """{temp_K: (cu_surface_wt_pct or None, status)} for one oxide and pO2."""
+    table = {}
+    with open(path) as f:
+        for row in csv.DictReader(f):
+            if row["oxide"] == oxide and row["po2"] == po2:
+                wt = row["cu_surface_wt_pct"]
+                table[int(row["temp_K"])] = (float(wt) if wt else None,
+                                             row["status"])
+    return table
+
+
+if OXIDE is None:
+    SURFACE_BC = {T: (CU_SURFACE_WT, "ok") for T in TEMPS_K}
+else:
+    try:
+        SURFACE_BC = load_surface_bc(OXIDE, PO2)
+    except OSError as e:
+        print("ERROR: %s (run surface_bc_table.py first)" % e)
+        sys.exit(1)
+    missing = [T for T in TEMPS_K
+               if SURFACE_BC.get(T, (None, "failed"))[1] == "failed"]
+    if missing:
+        print("ERROR: no surface BC for %s (pO2 %s) at %s K; rerun "
+              "surface_bc_table.py" % (OXIDE, PO2, missing))
+        sys.exit(1)
+    _suffix = "_%s%s.csv" % (OXIDE, "" if PO2 == "1atm" else "_" + PO2)
+    PROFILE_CSV = PROFILE_CSV.replace(".csv", _suffix)
+    SUMMARY_CSV = SUMMARY_CSV.replace(".csv", _suffix)
+
+
+def shell_width_m(temp_K, phase_label):
+    """Steel shell for this temperature: SHELL_SIGMAS diffusion lengths at t_max."""
+    if SHELL_MODE == "fixed":
+        return SHELL_REF_M
+    D = D_ESTIMATE["LIQUID" if phase_label.startswith("LIQUID") else "FCC_A1"](temp_K)
+    return max(SHELL_MIN_M, SHELL_SIGMAS * math.sqrt(D * max(TIMES_S)))
+
+
+def make_grid():
+    if GRID_TYPE == "linear":
+        return CalculatedGrid.linear().set_no_of_points(N_GRID_POINTS)
+    if GRID_TYPE == "geometric":
+        return (CalculatedGrid.geometric().set_no_of_points(N_GRID_POINTS)
+                .set_geometrical_factor(GEOMETRIC_FACTOR))
+    return (CalculatedGrid.double_geometric().set_no_of_points(N_GRID_POINTS)
+            .set_lower_geometrical_factor(GEOMETRIC_FACTOR)
+            .set_upper_geometrical_factor(UPPER_GEOMETRIC_FACTOR))
+
+STARTED = datetime.now().isoformat()
+N_SWEEP = len(TEMPS_K) * len(RADII_UM) * len(TIMES_S)
+TELEMETRY = SweepTelemetry("cu_removal_rate",
+                           "%s+%s" % (THERMO_DB, MOBILITY_DB), shard=SHARD)
+
 print("=" * 75)
 print("Cu REMOVAL RATE PREDICTION - DICTRA Spherical Particle Model")
 print("Honda CALPHAD - Cu Removal from Recycled Steel")
-print("Started: %s" % datetime.now().isoformat())
+print("Started: %s" % STARTED)
 print("=" * 75)
 print()
 print("Parameters:")
@@ -118,13 +297,26 @@ print("  Temperatures:   %d K to %d K (%d steps)" % (
     TEMPS_K[0], TEMPS_K[-1], len(TEMPS_K)))
 print("  Liquidus:       ~%d K (LIQUID above, FCC_A1 below)" % LIQUIDUS_K)
 print("  Initial Cu:     %.2f wt%%" % CU_INIT_WT)
-print("  Cu at surface:  %.3f wt%% (fixed composition BC)" % CU_SURFACE_WT)
+if BULK_SOLUTES:
+    print("  Chemistry:      %s: %s wt%% (O at FeO saturation at the surface)" % (
+        CHEMISTRY_NAME, ", ".join("%s %g" % kv for kv in BULK_SOLUTES.items())))
+if OXIDE is None:
+    print("  Cu at surface:  %.3f wt%% (fixed composition BC)" % CU_SURFACE_WT)
+else:
+    print("  Cu at surface:  %s, pO2 %s, from %s" % (
+        OXIDE, PO2, os.path.basename(SURFACE_BC_CSV)))
 print("  Particle radii: %s um" % RADII_UM)
 print("  Contact times:  %s s" % TIMES_S)
-print("  Steel shell:    %.1f mm" % (SHELL_WIDTH_M * 1e3))
-print("  Grid points:    %d" % N_GRID_POINTS)
+print("  Steel shell:    %s" % ("%.1f mm (fixed)" % (SHELL_REF_M * 1e3)
+                                 if SHELL_MODE == "fixed" else
+                                 "%g x sqrt(D t_max) per temperature" % SHELL_SIGMAS))
+print("  Grid:           %s, %d points" % (GRID_TYPE, N_GRID_POINTS))
+print("  Time step:      %s" % ("default control" if MAX_DT_PCT is None else
+                                "<= %g%% of simulation time" % MAX_DT_PCT))
 print("  Databases:      %s + %s" % (THERMO_DB, MOBILITY_DB))
-print("  Total calcs:    %d" % (len(TEMPS_K) * len(RADII_UM) * len(TIMES_S)))
+print("  Total calcs:    %d" % N_SWEEP)
+print("  Sweep:          %s" % shard_label(SHARD))
+print("  Telemetry:      %s" % TELEMETRY.path)
 print()
 
 # ===========================================================================
@@ -193,13 +385,13 @@ if liquid_phase is None and fcc_phase is None:
 summary_rows = []
 profile_rows = []
 
-n_total = len(TEMPS_K) * len(RADII_UM) * len(TIMES_S)
+n_total = sum(1 for j in range(N_SWEEP) if in_shard(j, SHARD))
 n_done = 0
 n_fail = 0
 n_liquid = 0
 n_solid = 0
 
-for temp_K in TEMPS_K:
+for tk, temp_K in enumerate(TEMPS_K):
     temp_C = temp_K - 273.15
 
     # Select diffusion phase based on temperature
@@ -215,9 +407,17 @@ for temp_K in TEMPS_K:
         diff_phase = liquid_phase  # fallback
         phase_label = "LIQUID (fallback)"
 
+    shell_m = shell_width_m(temp_K, phase_label)
+    cu_surface_bc, bc_status = SURFACE_BC[temp_K]
+
     print("=" * 75)
-    print("TEMPERATURE: %d K (%.0f C) -- phase: %s" % (
-        temp_K, temp_C, phase_label))
+    print("TEMPERATURE: %d K (%.0f C) -- phase: %s, shell %.3f mm" % (
+        temp_K, temp_C, phase_label, shell_m * 1e3))
+    if bc_status == "ok":
+        print("Surface Cu: %.4g wt%%" % cu_surface_bc)
+    else:
+        print("Surface Cu: %s (%s) -- no capture at this temperature" % (
+            OXIDE, bc_status))
     print("=" * 75)
 
     for ri, (r_um, r_m) in enumerate(zip(RADII_UM, RADII_M)):
@@ -225,38 +425,89 @@ for temp_K in TEMPS_K:
         print("  Particle radius: %d um" % r_um)
 
         for ti, (t_s, t_label) in enumerate(zip(TIMES_S, TIMES_LABEL)):
+            # Canonical index in the full temp x radius x time sweep
+            point_index = (tk * len(RADII_UM) + ri) * len(TIMES_S) + ti
+            if not in_shard(point_index, SHARD):
+                continue
             n_done += 1
             tag = "[%d/%d]" % (n_done, n_total)
 
+            if bc_status != "ok":
+                # Surface Cu at or above bulk: the oxide takes nothing up
+                summary_rows.append({
+                    "point_index": point_index,
+                    "temp_K": temp_K,
+                    "phase": phase_label,
+                    "radius_um": r_um,
+                    "time_s": t_s,
+                    "time_label": t_label,
+                    "cu_surface_wt_pct": (CU_INIT_WT if cu_surface_bc is None
+                                          else cu_surface_bc),
+                    "cu_farfield_wt_pct": CU_INIT_WT,
+                    "depletion_depth_um": 0.0,
+                    "cu_captured_mg": 0.0,
+                    "cu_removed_shell_pct": 0.0,
+                    "shell_um": 0,
+                    "farfield_ok": 1,
+                    "oxide": OXIDE,
+                })
+                continue
+            ev = TELEMETRY.start("-".join(ELEMENTS), temp_K=temp_K,
+                                 phase=phase_label, radius_um=r_um,
+                                 time_s=t_s, grid=GRID_TYPE,
+                                 grid_points=N_GRID_POINTS,
+                                 cu_surface_wt=cu_surface_bc)
+
             try:
-                calc = system.with_isothermal_diffusion_calculation()
-                calc.set_temperature(temp_K)
-                calc.set_simulation_time(t_s)
-
-                region = Region("steel_shell").set_width(SHELL_WIDTH_M)
-                region.add_phase(diff_phase)
-                region = (region
-                          .with_grid(CalculatedGrid.linear()
-                                     .set_no_of_points(N_GRID_POINTS))
-                          .with_composition_profile(
-                              CompositionProfile(Unit.MASS_PERCENT)
-                              .add("CU", ElementProfile.constant(CU_INIT_WT))))
-
-                calc.add_region(region)
-                calc.with_spherical_geometry()
-
-                left_bc = (BoundaryCondition
-                           .fixed_compositions(Unit.MASS_PERCENT)
-                           .set_composition("CU", CU_SURFACE_WT))
-                calc.with_left_boundary_condition(left_bc)
-                calc.with_right_boundary_condition(
-                    BoundaryCondition.closed_system())
-
-                result = calc.calculate()
-
-                # Extract final Cu profile
-                dist, comp = result.get_mass_fraction_of_component_at_time(
-                    "CU", SimulationTime.LAST)
+                run_shell_m = shell_m
+                for attempt in range(SHELL_RETRIES + 1):
+                    calc = system.with_isothermal_diffusion_calculation()
+                    calc.set_temperature(temp_K)
+                    calc.set_simulation_time(t_s)
+                    if MAX_DT_PCT is not None:
+                        calc.with_timestep_control(
+                            TimestepControl()
+                            .set_max_timestep_allowed_as_percent_of_simulation_time(
+                                MAX_DT_PCT))
+
+                    region = Region("steel_shell").set_width(run_shell_m)
+                    region.add_phase(diff_phase)
+                    profile = (CompositionProfile(Unit.MASS_PERCENT)
+                               .add("CU", ElementProfile.constant(CU_INIT_WT)))
+                    for el, wt in BULK_SOLUTES.items():
+                        profile.add(el, ElementProfile.constant(wt))
+                    region = (region
+                              .with_grid(make_grid())
+                              .with_composition_profile(profile))
+
+                    calc.add_region(region)
+                    calc.with_spherical_geometry()
+
+                    left_bc = (BoundaryCondition
+                               .fixed_compositions(Unit.MASS_PERCENT)
+                               .set_composition("CU", cu_surface_bc))
+                    for el, wt in surface_solutes(temp_K).items():
+                        left_bc.set_composition(el, wt)
+                    calc.with_left_boundary_condition(left_bc)
+                    calc.with_right_boundary_condition(
+                        BoundaryCondition.closed_system())
+
+                    result = calc.calculate()
+
+                    # Extract final Cu profile
+                    dist, comp = result.get_mass_fraction_of_component_at_time(
+                        "CU", SimulationTime.LAST)
+
+                    # Far-field check: the closed outer boundary must still
+                    # be at bulk, or the shell was too thin for this run
+                    drop = (CU_INIT_WT - comp[-1] * 100) / (CU_INIT_WT - cu_surface_bc)
+                    farfield_ok = drop <= FARFIELD_TOL
+                    if farfield_ok or attempt == SHELL_RETRIES:
+                        break
+                    print("    far field moved %.2e of the driving force at "
+                          "%.3f mm shell; retrying with %.3f mm" % (
+                              drop, run_shell_m * 1e3, 2 * run_shell_m * 1e3))
+                    run_shell_m *= 2
 
                 cu_wt = [c * 100 for c in comp]
                 dist_um = [d * 1e6 for d in dist]
@@ -265,6 +516,7 @@ for temp_K in TEMPS_K:
                 # Store profile data
                 for k in range(len(dist)):
                     profile_rows.append({
+                        "point_index": point_index,
                         "temp_K": temp_K,
                         "radius_um": r_um,
                         "time_s": t_s,
@@ -301,16 +553,17 @@ for temp_K in TEMPS_K:
 
                 cu_captured_mg = cu_captured_kg * 1e6
 
-                # Cu removal % relative to initial Cu in modeled shell
+                # Cu removal % relative to initial Cu in the reference shell
                 shell_vol = (4/3) * math.pi * (
-                    (r_m + SHELL_WIDTH_M)**3 - r_m**3)
+                    (r_m + SHELL_REF_M)**3 - r_m**3)
                 total_cu_mg = CU_INIT_WT/100 * RHO_STEEL * shell_vol * 1e6
                 cu_removed_pct = cu_captured_mg / total_cu_mg * 100
 
                 print("    %s R=%3d um, t=%4s: Cu_surf=%.4f%%, "
-                      "depl=%.0f um, captured=%.4e mg  OK" % (
+                      "depl=%.0f um, captured=%.4e mg  %s" % (
                           tag, r_um, t_label, cu_surface,
-                          depletion_um, cu_captured_mg))
+                          depletion_um, cu_captured_mg,
+                          "OK" if farfield_ok else "FAR FIELD MOVED"))
 
                 if temp_K >= LIQUIDUS_K:
                     n_liquid += 1
@@ -318,6 +571,7 @@ for temp_K in TEMPS_K:
                     n_solid += 1
 
                 summary_rows.append({
+                    "point_index": point_index,
                     "temp_K": temp_K,
                     "phase": phase_label,
                     "radius_um": r_um,
@@ -328,14 +582,20 @@ for temp_K in TEMPS_K:
                     "depletion_depth_um": depletion_um,
                     "cu_captured_mg": cu_captured_mg,
                     "cu_removed_shell_pct": cu_removed_pct,
+                    "shell_um": run_shell_m * 1e6,
+                    "farfield_ok": int(farfield_ok),
+                    "oxide": OXIDE or "",
                 })
+                TELEMETRY.ok(ev, phases=[diff_phase])
 
             except Exception as e:
+                TELEMETRY.fail(ev, e, phases=[diff_phase])
                 n_fail += 1
                 print("    %s R=%3d um, t=%4s: FAILED: %s" % (
                     tag, r_um, t_label, str(e)[:100]))
                 traceback.print_exc()
                 summary_rows.append({
+                    "point_index": point_index,
                     "temp_K": temp_K,
                     "phase": phase_label,
                     "radius_um": r_um,
@@ -346,8 +606,13 @@ for temp_K in TEMPS_K:
                     "depletion_depth_um": -1,
                     "cu_captured_mg": -1,
                     "cu_removed_shell_pct": -1,
+                    "shell_um": -1,
+                    "farfield_ok": 0,
+                    "oxide": OXIDE or "",
                 })
 
+TELEMETRY.close()
+
 # ===========================================================================
 # WRITE CSVs
 # ===========================================================================
@@ -363,41 +628,60 @@ try:
 except Exception:
     pass
 
+SUMMARY_FIELDS = [
+    "temp_K", "phase", "radius_um", "time_s", "time_label",
+    "cu_surface_wt_pct", "cu_farfield_wt_pct",
+    "depletion_depth_um", "cu_captured_mg", "cu_removed_shell_pct",
+    "shell_um", "farfield_ok", "oxide",
+]
+PROFILE_FIELDS = [
+    "temp_K", "radius_um", "time_s", "time_label",
+    "distance_from_surface_um", "radial_position_um", "cu_wt_pct",
+]
+
 # Summary CSV
 try:
-    with open(SUMMARY_CSV, "w", newline="") as f:
-        writer = csv.DictWriter(f, fieldnames=[
-            "temp_K", "phase", "radius_um", "time_s", "time_label",
-            "cu_surface_wt_pct", "cu_farfield_wt_pct",
-            "depletion_depth_um", "cu_captured_mg", "cu_removed_shell_pct",
-        ])
-        writer.writeheader()
-        writer.writerows(summary_rows)
-    print("Summary CSV: %s (%d rows)" % (SUMMARY_CSV, len(summary_rows)))
+    if SHARD is None:
+        summary_path = SUMMARY_CSV
+        with open(SUMMARY_CSV, "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=SUMMARY_FIELDS,
+                                    extrasaction="ignore")
+            writer.writeheader()
+            writer.writerows(summary_rows)
+    else:
+        # Failed points carry cu_captured_mg = -1
+        summary_path = write_shard_csv(
+            SUMMARY_CSV, SUMMARY_FIELDS, summary_rows, SHARD, N_SWEEP,
+            STARTED, fail_column="cu_captured_mg", fail_value=-1)
+    print("Summary CSV: %s (%d rows)" % (summary_path, len(summary_rows)))
 except Exception as e:
     print("Could not write summary CSV: %s" % e)
     print("--- SUMMARY CSV FALLBACK (copy this) ---")
     print("temp_K,phase,radius_um,time_s,time_label,cu_surface_wt_pct,"
           "cu_farfield_wt_pct,depletion_depth_um,cu_captured_mg,"
-          "cu_removed_shell_pct")
+          "cu_removed_shell_pct,shell_um,farfield_ok,oxide")
     for row in summary_rows:
-        print("%s,%s,%s,%s,%s,%s,%s,%s,%s,%s" % (
+        print("%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s" % (
             row["temp_K"], row["phase"],
             row["radius_um"], row["time_s"], row["time_label"],
             row["cu_surface_wt_pct"], row["cu_farfield_wt_pct"],
             row["depletion_depth_um"], row["cu_captured_mg"],
-            row["cu_removed_shell_pct"]))
+            row["cu_removed_shell_pct"], row["shell_um"],
+            row["farfield_ok"], row["oxide"]))
 
 # Profile CSV
 try:
-    with open(PROFILE_CSV, "w", newline="") as f:
-        writer = csv.DictWriter(f, fieldnames=[
-            "temp_K", "radius_um", "time_s", "time_label",
-            "distance_from_surface_um", "radial_position_um", "cu_wt_pct",
-        ])
-        writer.writeheader()
-        writer.writerows(profile_rows)
-    print("Profile CSV: %s (%d rows)" % (PROFILE_CSV, len(profile_rows)))
+    if SHARD is None:
+        profile_path = PROFILE_CSV
+        with open(PROFILE_CSV, "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=PROFILE_FIELDS,
+                                    extrasaction="ignore")
+            writer.writeheader()
+            writer.writerows(profile_rows)
+    else:
+        profile_path = write_shard_csv(
+            PROFILE_CSV, PROFILE_FIELDS, profile_rows, SHARD, N_SWEEP, STARTED)
+    print("Profile CSV: %s (%d rows)" % (profile_path, len(profile_rows)))
 except Exception as e:
     print("Could not write profile CSV: %s" % e)
 
@@ -425,7 +709,7 @@ print("-" * 80)
 
 ref_rows = [r for r in summary_rows if r["temp_K"] == 1800]
 for row in ref_rows:
-    if row["cu_captured_mg"] <= 0:
+    if row["cu_captured_mg"] < 0:
         print("%-10d  %-8d  FAIL" % (row["radius_um"], row["time_s"]))
         continue
 
@@ -459,7 +743,7 @@ print("-" * 60)
 
 for row in summary_rows:
     if row["radius_um"] == 100 and row["time_s"] == 1800:
-        if row["cu_captured_mg"] > 0:
+        if row["cu_captured_mg"] >= 0:
             print("%-8d  %-8s  %-12.4f  %-12.0f  %-15.4e" % (
                 row["temp_K"], row["phase"],
                 row["cu_surface_wt_pct"], row["depletion_depth_um"],
@@ -24,6 +24,9 @@ from datetime import datetime
 
 from tc_python import *
 
+from reaction_balancer import capture_stoichiometry, oxide_X_O
+from sweep_telemetry import SweepTelemetry
+
 # =============================================================================
 # Configuration
 # =============================================================================
@@ -38,8 +41,8 @@ OUTPUT_DIR = SCRIPT_DIR.parent.parent / "data" / "tcpython" / "raw"
 OUTPUT_FILE = OUTPUT_DIR / "dG_vs_T_top6.csv"
 
 # =============================================================================
-# Top 6 products with full stoichiometry definitions
-# (Same structure as extract_ternary_reactions.py TERNARY_SYSTEMS)
+# Top 6 products (same structure as ternary_systems.py TERNARY_SYSTEMS;
+# stoichiometry filled in by reaction_balancer.py)
 # =============================================================================
 TOP6 = [
     {
@@ -47,75 +50,50 @@ TOP6 = [
         "name": "copper ferrite spinel",
         "oxide": "FeO",
         "metal": "FE",
-        "reaction": "Cu + 2FeO + O2 -> CuFe2O4",
-        "X_Cu": 1/7, "X_O": 4/7,
-        "atoms_per_formula": 7,
         "phase_hints": ["SPINEL"],
-        "n_Cu": 1, "n_oxide_fu": 2, "oxide_atoms": 2, "n_O2": 1.0,
-        "oxide_X_O": 1/2,  # FeO
     },
     {
         "product": "Cu3V2O8",
         "name": "copper orthovanadate",
         "oxide": "V2O5",
         "metal": "V",
-        "reaction": "3Cu + V2O5 + 1.5 O2 -> Cu3V2O8",
-        "X_Cu": 3/13, "X_O": 8/13,
-        "atoms_per_formula": 13,
         "phase_hints": ["ORTHOVANADATE", "CU3V2O8"],
-        "n_Cu": 3, "n_oxide_fu": 1, "oxide_atoms": 7, "n_O2": 1.5,
-        "oxide_X_O": 5/7,  # V2O5
     },
     {
         "product": "CuMn2O4",
         "name": "copper manganite spinel",
         "oxide": "MnO",
         "metal": "MN",
-        "reaction": "Cu + 2MnO + O2 -> CuMn2O4",
-        "X_Cu": 1/7, "X_O": 4/7,
-        "atoms_per_formula": 7,
         "phase_hints": ["SPINEL"],
-        "n_Cu": 1, "n_oxide_fu": 2, "oxide_atoms": 2, "n_O2": 1.0,
-        "oxide_X_O": 1/2,  # MnO
     },
     {
         "product": "Cu2SiO4",
         "name": "copper orthosilicate",
         "oxide": "SiO2",
         "metal": "SI",
-        "reaction": "2Cu + SiO2 + O2 -> Cu2SiO4",
-        "X_Cu": 2/7, "X_O": 4/7,
-        "atoms_per_formula": 7,
         "phase_hints": ["OLIVINE", "CU2SIO4"],
-        "n_Cu": 2, "n_oxide_fu": 1, "oxide_atoms": 3, "n_O2": 1.0,
-        "oxide_X_O": 2/3,  # SiO2
     },
     {
         "product": "CuB2O4",
         "name": "copper borate",
         "oxide": "B2O3",
         "metal": "B",
-        "reaction": "Cu + B2O3 + 0.5 O2 -> CuB2O4",
-        "X_Cu": 1/7, "X_O": 4/7,
-        "atoms_per_formula": 7,
         "phase_hints": ["BORATE", "CUBO", "CUB2O4"],
-        "n_Cu": 1, "n_oxide_fu": 1, "oxide_atoms": 5, "n_O2": 0.5,
-        "oxide_X_O": 3/5,  # B2O3
     },
     {
         "product": "CuAl2O4",
         "name": "copper aluminate spinel",
         "oxide": "Al2O3",
         "metal": "AL",
-        "reaction": "Cu + Al2O3 + 0.5 O2 -> CuAl2O4",
-        "X_Cu": 1/7, "X_O": 4/7,
-        "atoms_per_formula": 7,
         "phase_hints": ["SPINEL"],
-        "n_Cu": 1, "n_oxide_fu": 1, "oxide_atoms": 5, "n_O2": 0.5,
-        "oxide_X_O": 3/5,  # Al2O3
     },
 ]
 
+# Balanced stoichiometry, compositions and oxide reference X_O from the formulas
+for _prod in TOP6:
+    _prod.update(capture_stoichiometry(_prod["product"], _prod["oxide"]))
+    _prod["oxide_X_O"] = oxide_X_O(_prod["oxide"])
+
 
 def find_phase_gm(result, phase_hints):
     """Search for a specific phase and return its GM value."""
@@ -141,6 +119,8 @@ def main():
     print("Products: {}".format(", ".join(p["product"] for p in TOP6)))
     print("Output: {}".format(OUTPUT_FILE))
     print("Started: {}".format(datetime.now().isoformat()))
+    tel = SweepTelemetry("dG_vs_T_top6", DATABASE)
+    print("Telemetry: {}".format(tel.path))
     print()
 
     OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
@@ -268,6 +248,9 @@ def main():
                     "reaction": prod_def["reaction"],
                 }
 
+                ev = tel.start("Cu-{}-O".format(metal), T_K=T, product=product,
+                               X_Cu=round(prod_def["X_Cu"], 6),
+                               X_O=round(prod_def["X_O"], 6))
                 try:
                     calc = ternary_system.with_single_equilibrium_calculation()
                     calc.set_condition(ThermodynamicQuantity.temperature(), T)
@@ -317,8 +300,10 @@ def main():
                         row["notes"] = "No binary oxide reference"
 
                     success += 1
+                    tel.ok(ev, phases=stable)
 
                 except Exception as e:
+                    tel.fail(ev, e)
                     row["GM_system_product"] = ""
                     row["stable_phases"] = "ERROR: {}".format(e)
                     row["ternary_phase_found"] = ""
@@ -344,6 +329,8 @@ def main():
                     s["dG_rxn_system_kJ"], verdict))
                 print("  Phases: {}".format(s["stable_phases"]))
 
+    tel.close()
+
     # =========================================================================
     # Write CSV
     # =========================================================================
@@ -0,0 +1,301 @@
+"""
+DICTRA convergence harness for the Cu removal particle model.
+
+Reruns a few representative (T, R, t) cases of cu_removal_rate.py over a
+factorial of the numerical settings (grid type, number of grid points, shell
+width, time-step cap) plus a refinement ladder per case, and records
+cu_captured_mg and the wall time of every run. The analysis (Richardson
+reference, worst-case error, Pareto front, cheapest setting for a tolerance)
+is screening/diffusion_convergence.py --source dictra.
+
+Same setup as cu_removal_rate.py: fixed-composition Cu at the particle
+surface, closed outer boundary, spherical geometry, TCFE13 + MOBFE8.
+
+Settings:
+  - grid:    linear / geometric (1.08) / double-geometric (1.08, 0.95)
+  - points:  10, 20, 40, 80
+  - shell:   3, 4.5, 6 diffusion lengths sqrt(D t) of the case, with D the
+             DICTRA value (Stokes-Einstein from 9.63e-10 m2/s at 1800 K in
+             the liquid, Cu in gamma-Fe in FCC)
+  - time:    largest step 20, 10, 5 % of the simulation time
+  - ladder:  12-sigma shell, geometric grid with 81/161/321 points and
+             factor 1.05^(1/2^k) (nested), cap 2/1/0.5 %, initial step
+             halved per level
+Keep CASES and the settings in step with screening/diffusion_convergence.py.
+
+Run on OSU VM:
+  "C:\\Program Files\\Thermo-Calc\\2025b\\python\\python.exe" dictra_convergence.py
+
+Expected runtime: ~15-25 minutes (444 DICTRA calculations).
+
+Split across K lab machines (see sweep_shards.py):
+  ... dictra_convergence.py --shard 1/4   (then 2/4, 3/4, 4/4 on other seats)
+  python3 sweep_shards.py merge ../../data/tcpython/raw/dictra_convergence.csv
+
+Output: data/tcpython/raw/dictra_convergence.csv
+
+Honda CALPHAD Project - MSE 4381 Capstone
+"""
+
+from datetime import datetime
+import csv
+import itertools
+import math
+import os
+import sys
+import time
+import traceback
+
+from sweep_shards import shard_from_argv, in_shard, shard_label, write_shard_csv
+from sweep_telemetry import SweepTelemetry
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+DATA_DIR = os.path.join(SCRIPT_DIR, "..", "..", "data", "tcpython")
+OUTPUT_CSV = os.path.join(DATA_DIR, "raw", "dictra_convergence.csv")
+
+# ===========================================================================
+# PARAMETERS
+# ===========================================================================
+
+# Same setup as cu_removal_rate.py
+LIQUIDUS_K = 1800
+CU_INIT_WT = 0.30
+CU_SURFACE_WT = 0.01
+RHO_STEEL = 7000.0
+THERMO_DB = "TCFE13"
+MOBILITY_DB = "MOBFE8"
+ELEMENTS = ["FE", "CU"]
+GEOMETRIC_FACTOR = 1.08
+UPPER_GEOMETRIC_FACTOR = 0.95
+
+# Representative cases (T K, R um, t s): both phases, both ends of R and t
+CASES = [
+    (1723, 25, 60),        # FCC, small particle, short: thin layer
+    (1798, 500, 1800),     # FCC, large particle, long
+    (1823, 25, 1800),      # LIQUID, small particle near steady state
+    (1923, 500, 60),       # LIQUID, large particle, short
+]
+
+# Settings factorial
+GRIDS = ("linear", "geometric", "double-geometric")
+POINTS = (10, 20, 40, 80)
+SHELL_SIGMAS = (3.0, 4.5, 6.0)
+MAX_DT_PCT = (20.0, 10.0, 5.0)
+
+# Reference ladder: (points, max_dt_pct) per level
+REF_SIGMAS = 12.0
+REF_LADDER = ((81, 2.0), (161, 1.0), (321, 0.5))
+REF_FACTOR = 1.05
+DT_INITIAL_S = 1e-6        # ladder level 1; halved per level
+
+FIELDS = ["case", "temp_K", "phase", "radius_um", "time_s", "D_m2_s", "grid",
+          "points", "shell_sigmas", "shell_um", "max_dt_pct", "level",
+          "cu_captured_mg", "wall_s"]
+
+
+def reference_d(temp_K):
+    """
+    D_Cu (m2/s) of the case's phase, DICTRA values.
+    Must match screening/diffusivity_fit.reference_d_cu.
+    """
+    if temp_K > LIQUIDUS_K:
+        def eta(T):
+            return 1e-3 * 10 ** (-0.7209 + 2694.9 / T)
+        return 9.63e-10 * (temp_K / 1800.0) * eta(1800.0) / eta(temp_K)
+    return 4.3e-5 * math.exp(-280e3 / (8.314462618 * temp_K))
+
+
+# Every run of the sweep: (case, grid, points, sigmas, max_dt_pct, level)
+RUNS = []
+for _case in range(len(CASES)):
+    for _level, (_n, _pct) in enumerate(REF_LADDER, 1):
+        RUNS.append((_case, "geometric", _n, REF_SIGMAS, _pct, _level))
+    for _grid, _n, _sig, _pct in itertools.product(GRIDS, POINTS, SHELL_SIGMAS,
+                                                   MAX_DT_PCT):
+        RUNS.append((_case, _grid, _n, _sig, _pct, 0))
+N_SWEEP = len(RUNS)
+
+# ===========================================================================
+
+SHARD = shard_from_argv()
+STARTED = datetime.now().isoformat()
+TELEMETRY = SweepTelemetry("dictra_convergence",
+                           "%s+%s" % (THERMO_DB, MOBILITY_DB), shard=SHARD)
+
+print("=" * 75)
+print("DICTRA CONVERGENCE HARNESS - Cu removal particle model")
+print("Honda CALPHAD - Cu Removal from Recycled Steel")
+print("Started: %s" % STARTED)
+print("=" * 75)
+print()
+print("  Cases:          %s" % CASES)
+print("  Grids:          %s" % (GRIDS,))
+print("  Points:         %s" % (POINTS,))
+print("  Shell sigmas:   %s" % (SHELL_SIGMAS,))
+print("  Max dt (%%):     %s" % (MAX_DT_PCT,))
+print("  Ladder:         %s, %g sigmas" % (REF_LADDER, REF_SIGMAS))
+print("  Total calcs:    %d" % N_SWEEP)
+print("  Sweep:          %s" % shard_label(SHARD))
+print("  Telemetry:      %s" % TELEMETRY.path)
+print()
+
+# ===========================================================================
+# TC-PYTHON SETUP
+# ===========================================================================
+
+try:
+    from tc_python import *
+    print("tc_python imported successfully.")
+except ImportError:
+    print("ERROR: tc_python not available. Run on OSU VM.")
+    sys.exit(1)
+
+_tcp_ctx = TCPython()
+session = _tcp_ctx.__enter__()
+
+try:
+    system = (session
+              .select_thermodynamic_and_kinetic_databases_with_elements(
+                  THERMO_DB, MOBILITY_DB, ELEMENTS)
+              .get_system())
+except Exception as e:
+    print("FATAL: Could not load system: %s" % e)
+    traceback.print_exc()
+    sys.exit(1)
+
+liquid_phase = fcc_phase = None
+for p in system.get_phases_in_system():
+    pu = p.upper()
+    if "LIQUID" in pu and liquid_phase is None:
+        liquid_phase = p
+    if "FCC" in pu and "A1" in pu and fcc_phase is None:
+        fcc_phase = p
+print("  LIQUID phase: %s, FCC_A1 phase: %s" % (liquid_phase, fcc_phase))
+print()
+
+
+def make_grid(grid, points, level):
+    if level:
+        return (CalculatedGrid.geometric().set_no_of_points(points)
+                .set_geometrical_factor(REF_FACTOR ** (0.5 ** (level - 1))))
+    if grid == "linear":
+        return CalculatedGrid.linear().set_no_of_points(points)
+    if grid == "geometric":
+        return (CalculatedGrid.geometric().set_no_of_points(points)
+                .set_geometrical_factor(GEOMETRIC_FACTOR))
+    return (CalculatedGrid.double_geometric().set_no_of_points(points)
+            .set_lower_geometrical_factor(GEOMETRIC_FACTOR)
+            .set_upper_geometrical_factor(UPPER_GEOMETRIC_FACTOR))
+
+
+def captured_mg(r_m, dist, comp):
+    """Trapezoidal capture integral, as in cu_removal_rate.py."""
+    total = 0.0
+    for k in range(1, len(dist)):
+        r_mid = r_m + 0.5 * (dist[k-1] + dist[k])
+        dc_mid = CU_INIT_WT/100 - 0.5 * (comp[k-1] + comp[k])
+        total += dc_mid * RHO_STEEL * 4 * math.pi * r_mid**2 * (dist[k] - dist[k-1])
+    return total * 1e6
+
+
+# ===========================================================================
+# SWEEP
+# ===========================================================================
+
+rows = []
+n_total = sum(1 for j in range(N_SWEEP) if in_shard(j, SHARD))
+n_done = n_fail = 0
+
+for point_index, (case, grid, points, sigmas, pct, level) in enumerate(RUNS):
+    if not in_shard(point_index, SHARD):
+        continue
+    n_done += 1
+    temp_K, r_um, t_s = CASES[case]
+    phase_label = "LIQUID" if temp_K > LIQUIDUS_K else "FCC_A1"
+    diff_phase = liquid_phase if phase_label == "LIQUID" else fcc_phase
+    D = reference_d(temp_K)
+    shell_m = sigmas * math.sqrt(D * t_s)
+    r_m = r_um * 1e-6
+    row = {"point_index": point_index, "case": case, "temp_K": temp_K,
+           "phase": phase_label, "radius_um": r_um, "time_s": t_s,
+           "D_m2_s": D, "grid": grid, "points": points, "shell_sigmas": sigmas,
+           "shell_um": shell_m * 1e6, "max_dt_pct": pct,
+           "level": "ref%d" % level if level else ""}
+    ev = TELEMETRY.start("-".join(ELEMENTS), case=case, grid=grid,
+                         grid_points=points, shell_sigmas=sigmas,
+                         max_dt_pct=pct, level=level)
+    t0 = time.perf_counter()
+    try:
+        calc = system.with_isothermal_diffusion_calculation()
+        calc.set_temperature(temp_K)
+        calc.set_simulation_time(t_s)
+        control = (TimestepControl()
+                   .set_max_timestep_allowed_as_percent_of_simulation_time(pct))
+        if level:
+            control = control.set_initial_time_step(
+                DT_INITIAL_S * 0.5 ** (level - 1))
+        calc.with_timestep_control(control)
+
+        region = Region("steel_shell").set_width(shell_m)
+        region.add_phase(diff_phase)
+        region = (region
+                  .with_grid(make_grid(grid, points, level))
+                  .with_composition_profile(
+                      CompositionProfile(Unit.MASS_PERCENT)
+                      .add("CU", ElementProfile.constant(CU_INIT_WT))))
+        calc.add_region(region)
+        calc.with_spherical_geometry()
+        calc.with_left_boundary_condition(
+            BoundaryCondition.fixed_compositions(Unit.MASS_PERCENT)
+            .set_composition("CU", CU_SURFACE_WT))
+        calc.with_right_boundary_condition(BoundaryCondition.closed_system())
+
+        result = calc.calculate()
+        dist, comp = result.get_mass_fraction_of_component_at_time(
+            "CU", SimulationTime.LAST)
+        row["cu_captured_mg"] = captured_mg(r_m, dist, comp)
+        row["wall_s"] = time.perf_counter() - t0
+        TELEMETRY.ok(ev, phases=[diff_phase])
+        print("  [%d/%d] case %d %-16s n=%3d %4.1f sig %4.1f%% %s: "
+              "%.5e mg  %.2f s" % (
+                  n_done, n_total, case, grid, points, sigmas, pct,
+                  row["level"] or "   ", row["cu_captured_mg"], row["wall_s"]))
+    except Exception as e:
+        TELEMETRY.fail(ev, e, phases=[diff_phase])
+        n_fail += 1
+        row["cu_captured_mg"] = -1
+        row["wall_s"] = time.perf_counter() - t0
+        print("  [%d/%d] case %d %s n=%d: FAILED: %s" % (
+            n_done, n_total, case, grid, points, str(e)[:100]))
+    rows.append(row)
+
+TELEMETRY.close()
+
+# ===========================================================================
+# WRITE CSV
+# ===========================================================================
+
+try:
+    os.makedirs(os.path.dirname(OUTPUT_CSV), exist_ok=True)
+except Exception:
+    pass
+
+if SHARD is None:
+    out_path = OUTPUT_CSV
+    with open(OUTPUT_CSV, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=FIELDS, extrasaction="ignore")
+        writer.writeheader()
+        writer.writerows(rows)
+else:
+    out_path = write_shard_csv(OUTPUT_CSV, FIELDS, rows, SHARD, N_SWEEP,
+                               STARTED, fail_column="cu_captured_mg",
+                               fail_value=-1)
+
+print()
+print("=" * 75)
+print("Completed: %d/%d calculations (%d failed)" % (
+    n_done - n_fail, n_done, n_fail))
+print("Output: %s" % out_path)
+print("Next:   python3 screening/diffusion_convergence.py --source dictra --tol 0.01")
+print("Finished: %s" % datetime.now().isoformat())
+print("=" * 75)
@@ -9,13 +9,17 @@ Method:
 4. Calculate: dG_f = G(oxide) - n*G(metal) - m*G(O2)
 5. Normalize per mole O2 for Ellingham diagram
 
-Output: ../../data/tcpython/raw/oxide_gibbs_energies.csv
+Output: ../../data/tcpython/raw/oxide_gibbs_long.csv (long format, appended;
+        see gibbs_store.py) and the regenerated wide view
+        ../../data/tcpython/raw/oxide_gibbs_energies.csv
 """
 
-import csv
 from pathlib import Path
 from tc_python import *
 
+from gibbs_store import LONG_FILE, WIDE_COLUMNS, append_records, write_wide
+from sweep_telemetry import SweepTelemetry
+
 # =============================================================================
 # Configuration
 # =============================================================================
@@ -25,7 +29,7 @@ T_STEP = 50
 
 SCRIPT_DIR = Path(__file__).parent
 OUTPUT_DIR = SCRIPT_DIR.parent.parent / "data" / "tcpython" / "raw"
-OUTPUT_FILE = OUTPUT_DIR / "oxide_gibbs_energies.csv"
+OUTPUT_FILE = OUTPUT_DIR / "oxide_gibbs_energies.csv"  # wide view of LONG_FILE
 
 # =============================================================================
 # Oxide definitions
@@ -212,6 +216,8 @@ def main():
     print(f"Temperature range: {T_MIN}-{T_MAX} K ({len(temperatures)} points)\n")
 
     results = {T: {"T_K": T, "T_C": T - 273.15} for T in temperatures}
+    tel = SweepTelemetry("extract_oxide_gibbs", "TCOX14")
+    print(f"Telemetry: {tel.path}\n")
 
     with TCPython() as session:
         print("Connected to Thermo-Calc")
@@ -262,6 +268,8 @@ def main():
                 phase_patterns = config["phase_patterns"]
                 success = 0
                 for T in temperatures:
+                    ev = tel.start("-".join(elements), T_K=T, oxide=oxide_name,
+                                   X_O=X_O)
                     try:
                         calc = system.with_single_equilibrium_calculation()
                         calc.set_condition(ThermodynamicQuantity.temperature(), T)
@@ -300,7 +308,9 @@ def main():
                         results[T][f"dG_{oxide_name}_per_O2"] = dG_per_O2
 
                         success += 1
+                        tel.ok(ev, phases=stable)
                     except Exception as e:
+                        tel.fail(ev, e)
                         results[T][f"GM_{oxide_name}"] = None
                         results[T][f"dG_{oxide_name}_per_O2"] = None
                         results[T][f"phases_{oxide_name}"] = f"Error: {e}"
@@ -319,23 +329,22 @@ def main():
             except Exception as e:
                 print(f"  SYSTEM ERROR: {e}")
 
-        # Write CSV
-        print(f"\n{'='*70}")
-        print(f"Writing to {OUTPUT_FILE}")
-
-        fieldnames = ["T_K", "T_C"]
-        for oxide in OXIDES.keys():
-            fieldnames.extend([f"GM_{oxide}", f"GM_system_{oxide}", f"G_metal_{oxide}",
-                             f"dG_{oxide}_per_O2", f"phases_{oxide}", f"oxide_phase_{oxide}"])
+        tel.close()
 
-        with open(OUTPUT_FILE, 'w', newline='') as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-            for T in temperatures:
-                row = {k: results[T].get(k, "") for k in fieldnames}
-                writer.writerow(row)
-
-        print(f"Done! {len(temperatures)} rows written.")
+        # Append to the long-format store, then regenerate the wide view
+        print(f"\n{'='*70}")
+        print(f"Appending to {LONG_FILE}")
+
+        records = []
+        for T in temperatures:
+            for oxide in OXIDES.keys():
+                for quantity, col in WIDE_COLUMNS.items():
+                    value = results[T].get(col.format(oxide))
+                    records.append((T, oxide, quantity, value, "TCOX14"))
+        n = append_records(records, LONG_FILE)
+        write_wide(LONG_FILE, OUTPUT_FILE)
+
+        print(f"Done! {n} values stored; wide view: {OUTPUT_FILE}")
         print("=" * 70)
 
 
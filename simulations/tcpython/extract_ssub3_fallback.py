@@ -10,21 +10,18 @@ Uses SSUB3 (pure substance database) to get Gibbs energies for:
 Run on OSU VM:
   "C:\Program Files\Thermo-Calc\2025b\python\python.exe" extract_ssub3_fallback.py
 
-This appends columns to the existing oxide_gibbs_energies.csv.
+This appends rows (source_db = SSUB3, or whichever fallback database
+answered) to the long-format store oxide_gibbs_long.csv (see gibbs_store.py)
+and regenerates the wide oxide_gibbs_energies.csv view from it.
 """
 
-import csv
-import os
-from pathlib import Path
-
 try:
     from tc_python import *
 except ImportError:
     print("ERROR: tc_python not found. Run this on the OSU VM.")
     exit(1)
 
-# Output CSV path (same as main extraction)
-CSV_PATH = Path(__file__).parent.parent.parent / "data" / "tcpython" / "raw" / "oxide_gibbs_energies.csv"
+from gibbs_store import LONG_FILE, WIDE_FILE, append_records, write_wide
 
 # Temperature range (must match main extraction: 500-2000K, step 50)
 T_START = 500
@@ -63,7 +60,10 @@ FALLBACK_OXIDES = {
 
 
 def extract_with_ssub3(session, oxide_name, config, temps):
-    """Try to extract Gibbs energy from SSUB3 for a pure oxide."""
+    """Try to extract Gibbs energy from SSUB3 for a pure oxide.
+
+    Returns (database, values); database is None if nothing worked.
+    """
     elements = config["elements"]
     X_O = config["X_O"]
     atoms = config["atoms_per_formula"]
@@ -112,7 +112,7 @@ def extract_with_ssub3(session, oxide_name, config, temps):
 
         success = sum(1 for r in results if r is not None)
         print(f"\n  Completed: {success}/{len(temps)} temperatures")
-        return results
+        return "SSUB3", results
 
     except Exception as e:
         print(f"  SSUB3 FAILED for {oxide_name}: {e}")
@@ -142,12 +142,12 @@ def extract_with_ssub3(session, oxide_name, config, temps):
                 success = sum(1 for r in alt_results if r is not None)
                 if success > 0:
                     print(f"  {alt_db}: got {success}/{len(temps)} temperatures")
-                    return alt_results
+                    return alt_db, alt_results
             except Exception as e2:
                 print(f"  {alt_db}: {e2}")
                 continue
 
-        return [None] * len(temps)
+        return None, [None] * len(temps)
 
 
 def main():
@@ -156,69 +156,37 @@ def main():
     print("PbO, B2O3, CeO2 — not available in TCOX14")
     print("=" * 60)
 
-    if not CSV_PATH.exists():
-        print(f"ERROR: Main CSV not found at {CSV_PATH}")
-        print("Run extract_oxide_gibbs.py first!")
+    if not LONG_FILE.exists():
+        print(f"ERROR: Gibbs store not found at {LONG_FILE}")
+        print("Run extract_oxide_gibbs.py (or gibbs_store.py migrate) first!")
         return
 
-    # Read existing CSV
-    with open(CSV_PATH) as f:
-        reader = csv.DictReader(f)
-        existing_rows = list(reader)
-        fieldnames = reader.fieldnames
-
-    print(f"\nExisting CSV: {len(existing_rows)} rows, {len(fieldnames)} columns")
-    print(f"Temperature range: {existing_rows[0]['T_K']} - {existing_rows[-1]['T_K']} K")
+    print(f"\nStore: {LONG_FILE}")
+    print(f"Temperature range: {TEMPS[0]} - {TEMPS[-1]} K")
 
     # Extract from SSUB3
     with TCPython() as session:
         all_results = {}
         for oxide_name, config in FALLBACK_OXIDES.items():
-            col_name = f"dG_{oxide_name}_per_O2"
-            phase_col = f"oxide_phase_{oxide_name}"
-
-            results = extract_with_ssub3(session, oxide_name, config, TEMPS)
+            db, results = extract_with_ssub3(session, oxide_name, config, TEMPS)
             all_results[oxide_name] = {
-                "col": col_name,
-                "phase_col": phase_col,
+                "db": db,
                 "values": results,
             }
 
-    # Update CSV
+    # Append to the store (an oxide is new rows, never new columns)
     print(f"\n{'='*60}")
-    print("Updating CSV...")
+    print("Updating store...")
 
     for oxide_name, data in all_results.items():
-        col = data["col"]
-        phase_col = data["phase_col"]
-        values = data["values"]
-
-        # Add columns if not present
-        if col not in fieldnames:
-            fieldnames.append(col)
-        if phase_col not in fieldnames:
-            fieldnames.append(phase_col)
-
-        success_count = 0
-        for i, row in enumerate(existing_rows):
-            if i < len(values) and values[i] is not None:
-                row[col] = f"{values[i]:.4f}"
-                row[phase_col] = "SSUB3"
-                success_count += 1
-            else:
-                row[col] = ""
-                row[phase_col] = ""
-
-        print(f"  {oxide_name}: wrote {success_count}/{len(existing_rows)} values to {col}")
-
-    # Write updated CSV
-    with open(CSV_PATH, 'w', newline='') as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(existing_rows)
-
-    print(f"\nCSV updated: {CSV_PATH}")
-    print(f"Total columns: {len(fieldnames)}")
+        records = [(T, oxide_name, "dG_per_O2", v, data["db"])
+                   for T, v in zip(TEMPS, data["values"]) if v is not None]
+        n = append_records(records, LONG_FILE)
+        print(f"  {oxide_name}: wrote {n}/{len(TEMPS)} values ({data['db'] or 'no database'})")
+
+    n_rows, n_cols = write_wide(LONG_FILE, WIDE_FILE)
+    print(f"\nStore updated: {LONG_FILE}")
+    print(f"Wide view regenerated: {WIDE_FILE} ({n_cols} columns)")
 
     # Summary
     print(f"\n{'='*60}")
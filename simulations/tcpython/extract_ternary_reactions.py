@@ -39,6 +39,9 @@ from datetime import datetime
 
 from tc_python import *
 
+from sweep_telemetry import SweepTelemetry
+from ternary_systems import TERNARY_SYSTEMS, OXIDE_X_O, OXIDE_ATOMS
+
 # =============================================================================
 # Configuration
 # =============================================================================
@@ -52,301 +55,6 @@ SCRIPT_DIR = Path(__file__).parent
 OUTPUT_DIR = SCRIPT_DIR.parent.parent / "data" / "tcpython" / "raw"
 OUTPUT_FILE = OUTPUT_DIR / "ternary_reaction_energies.csv"
 
-# =============================================================================
-# Ternary compound definitions
-#
-# For each oxide, we define:
-#   - elements: [METAL, "O"] for the binary oxide (Cu is always added)
-#   - ternary_formulas: list of known Cu-M-O compounds to check
-#   - For each ternary formula:
-#       - name: human-readable name
-#       - composition: {element: mole_fraction} for the ternary stoichiometry
-#       - atoms_per_formula: total atoms in one formula unit
-#       - reaction: string description of the balanced reaction
-#       - phase_hints: TC phase names to look for (SPINEL, etc.)
-#       - reactant_oxide_atoms: atoms per formula in the reactant oxide
-#       - cu_atoms: Cu atoms consumed per formula unit of product
-#
-# Stoichiometric compositions for ternary compounds:
-#   CuAl2O4: Cu=1, Al=2, O=4 → total 7 atoms → X_Cu=1/7, X_Al=2/7, X_O=4/7
-#   CuFe2O4: Cu=1, Fe=2, O=4 → total 7 atoms → same fractions
-#   CuCr2O4: Cu=1, Cr=2, O=4 → total 7 atoms → same fractions
-#   CuMn2O4: Cu=1, Mn=2, O=4 → total 7 atoms → same fractions
-#   CuV2O6:  Cu=1, V=2, O=6  → total 9 atoms → X_Cu=1/9, X_V=2/9, X_O=6/9
-#   CuTiO3:  Cu=1, Ti=1, O=3 → total 5 atoms → X_Cu=1/5, X_Ti=1/5, X_O=3/5
-#   CuSiO3:  Cu=1, Si=1, O=3 → total 5 atoms → same as CuTiO3
-#   CuAlO2:  Cu=1, Al=1, O=2 → total 4 atoms → X_Cu=1/4, X_Al=1/4, X_O=2/4
-# =============================================================================
-
-TERNARY_SYSTEMS = [
-    # --- SPINEL-FORMING OXIDES ---
-    # Spinel: CuM2O4 = Cu + M2O3 + 0.5 O2
-    #   Reactant stoich per formula: 1 Cu + 1 M2O3 (5 atoms) + 0.5 O2 (1 O atom)
-    #   So: n_Cu=1, n_oxide=1, n_O2=0.5, oxide_atoms=5
-    {
-        "oxide": "Al2O3",
-        "metal": "AL",
-        "ternaries": [
-            {
-                "product": "CuAl2O4",
-                "name": "copper aluminate spinel",
-                "reaction": "Cu + Al2O3 + 0.5 O2 -> CuAl2O4",
-                "X_Cu": 1/7, "X_M": 2/7, "X_O": 4/7,
-                "atoms_per_formula": 7,
-                "phase_hints": ["SPINEL"],
-                # Reactant-side stoichiometry for dG_rxn
-                "n_Cu": 1,          # moles Cu metal consumed
-                "n_oxide_fu": 1,    # moles of oxide formula units consumed
-                "oxide_atoms": 5,   # atoms per oxide formula unit (Al2O3)
-                "n_O2": 0.5,        # moles O2 consumed (can be 0 if no extra O)
-            },
-            {
-                "product": "CuAlO2",
-                "name": "delafossite",
-                "reaction": "Cu + 0.5 Al2O3 + 0.25 O2 -> CuAlO2",
-                "X_Cu": 1/4, "X_M": 1/4, "X_O": 2/4,
-                "atoms_per_formula": 4,
-                "phase_hints": ["DELAFOSSITE", "CUALUMINATE", "CUALOXID"],
-                "n_Cu": 1, "n_oxide_fu": 0.5, "oxide_atoms": 5, "n_O2": 0.25,
-            },
-        ],
-    },
-    {
-        "oxide": "Cr2O3",
-        "metal": "CR",
-        "ternaries": [
-            {
-                "product": "CuCr2O4",
-                "name": "copper chromite spinel",
-                "reaction": "Cu + Cr2O3 + 0.5 O2 -> CuCr2O4",
-                "X_Cu": 1/7, "X_M": 2/7, "X_O": 4/7,
-                "atoms_per_formula": 7,
-                "phase_hints": ["SPINEL"],
-                "n_Cu": 1, "n_oxide_fu": 1, "oxide_atoms": 5, "n_O2": 0.5,
-            },
-        ],
-    },
-    {
-        "oxide": "MnO",
-        "metal": "MN",
-        "ternaries": [
-            {
-                "product": "CuMn2O4",
-                "name": "copper manganite spinel",
-                "reaction": "Cu + 2MnO + O2 -> CuMn2O4",
-                "X_Cu": 1/7, "X_M": 2/7, "X_O": 4/7,
-                "atoms_per_formula": 7,
-                "phase_hints": ["SPINEL"],
-                "n_Cu": 1, "n_oxide_fu": 2, "oxide_atoms": 2, "n_O2": 1.0,
-            },
-        ],
-    },
-    {
-        "oxide": "FeO",
-        "metal": "FE",
-        "ternaries": [
-            {
-                "product": "CuFe2O4",
-                "name": "copper ferrite spinel",
-                "reaction": "Cu + 2FeO + O2 -> CuFe2O4",
-                "X_Cu": 1/7, "X_M": 2/7, "X_O": 4/7,
-                "atoms_per_formula": 7,
-                "phase_hints": ["SPINEL"],
-                "n_Cu": 1, "n_oxide_fu": 2, "oxide_atoms": 2, "n_O2": 1.0,
-            },
-        ],
-    },
-    # --- VANADATE/COMPLEX OXIDE ---
-    {
-        "oxide": "V2O5",
-        "metal": "V",
-        "ternaries": [
-            {
-                "product": "CuV2O6",
-                "name": "copper vanadate",
-                "reaction": "Cu + V2O5 + 0.5 O2 -> CuV2O6",
-                "X_Cu": 1/9, "X_M": 2/9, "X_O": 6/9,
-                "atoms_per_formula": 9,
-                "phase_hints": ["VANADATE", "CUV2O6"],
-                "n_Cu": 1, "n_oxide_fu": 1, "oxide_atoms": 7, "n_O2": 0.5,
-            },
-            {
-                "product": "Cu3V2O8",
-                "name": "copper orthovanadate",
-                "reaction": "3Cu + V2O5 + 1.5 O2 -> Cu3V2O8",
-                "X_Cu": 3/13, "X_M": 2/13, "X_O": 8/13,
-                "atoms_per_formula": 13,
-                "phase_hints": ["ORTHOVANADATE", "CU3V2O8"],
-                "n_Cu": 3, "n_oxide_fu": 1, "oxide_atoms": 7, "n_O2": 1.5,
-            },
-        ],
-    },
-    # --- TITANATE ---
-    {
-        "oxide": "TiO2",
-        "metal": "TI",
-        "ternaries": [
-            {
-                "product": "CuTiO3",
-                "name": "copper titanate",
-                "reaction": "Cu + TiO2 + 0.5 O2 -> CuTiO3",
-                "X_Cu": 1/5, "X_M": 1/5, "X_O": 3/5,
-                "atoms_per_formula": 5,
-                "phase_hints": ["ILMENITE", "CUTIO3", "PEROVSKITE"],
-                "n_Cu": 1, "n_oxide_fu": 1, "oxide_atoms": 3, "n_O2": 0.5,
-            },
-        ],
-    },
-    # --- SILICATE ---
-    {
-        "oxide": "SiO2",
-        "metal": "SI",
-        "ternaries": [
-            {
-                "product": "CuSiO3",
-                "name": "copper metasilicate",
-                "reaction": "Cu + SiO2 + 0.5 O2 -> CuSiO3",
-                "X_Cu": 1/5, "X_M": 1/5, "X_O": 3/5,
-                "atoms_per_formula": 5,
-                "phase_hints": ["PYROXENE", "CUSIO3", "WOLLASTONITE"],
-                "n_Cu": 1, "n_oxide_fu": 1, "oxide_atoms": 3, "n_O2": 0.5,
-            },
-            {
-                "product": "Cu2SiO4",
-                "name": "copper orthosilicate",
-                "reaction": "2Cu + SiO2 + O2 -> Cu2SiO4",
-                "X_Cu": 2/7, "X_M": 1/7, "X_O": 4/7,
-                "atoms_per_formula": 7,
-                "phase_hints": ["OLIVINE", "CU2SIO4"],
-                "n_Cu": 2, "n_oxide_fu": 1, "oxide_atoms": 3, "n_O2": 1.0,
-            },
-        ],
-    },
-    # --- SIMPLE OXIDES (less likely to form ternaries, but check) ---
-    {
-        "oxide": "MgO",
-        "metal": "MG",
-        "ternaries": [
-            {
-                "product": "CuMgO2",
-                "name": "copper magnesioxide (hypothetical)",
-                "reaction": "Cu + MgO + 0.5 O2 -> CuMgO2",
-                "X_Cu": 1/4, "X_M": 1/4, "X_O": 2/4,
-                "atoms_per_formula": 4,
-                "phase_hints": ["DELAFOSSITE", "CUMGO2"],
-                "n_Cu": 1, "n_oxide_fu": 1, "oxide_atoms": 2, "n_O2": 0.5,
-            },
-        ],
-    },
-    {
-        "oxide": "CaO",
-        "metal": "CA",
-        "ternaries": [
-            {
-                "product": "CuCaO2",
-                "name": "copper calcioxide (hypothetical)",
-                "reaction": "Cu + CaO + 0.5 O2 -> CuCaO2",
-                "X_Cu": 1/4, "X_M": 1/4, "X_O": 2/4,
-                "atoms_per_formula": 4,
-                "phase_hints": ["DELAFOSSITE", "CUCAO2"],
-                "n_Cu": 1, "n_oxide_fu": 1, "oxide_atoms": 2, "n_O2": 0.5,
-            },
-        ],
-    },
-    {
-        "oxide": "ZrO2",
-        "metal": "ZR",
-        "ternaries": [
-            {
-                "product": "CuZrO3",
-                "name": "copper zirconate (hypothetical)",
-                "reaction": "Cu + ZrO2 + 0.5 O2 -> CuZrO3",
-                "X_Cu": 1/5, "X_M": 1/5, "X_O": 3/5,
-                "atoms_per_formula": 5,
-                "phase_hints": ["PEROVSKITE", "CUZRO3"],
-                "n_Cu": 1, "n_oxide_fu": 1, "oxide_atoms": 3, "n_O2": 0.5,
-            },
-        ],
-    },
-    # --- MOONSHOT OXIDES ---
-    {
-        "oxide": "NiO",
-        "metal": "NI",
-        "ternaries": [
-            {
-                "product": "CuNiO2",
-                "name": "copper nickelate",
-                "reaction": "Cu + NiO + 0.5 O2 -> CuNiO2",
-                "X_Cu": 1/4, "X_M": 1/4, "X_O": 2/4,
-                "atoms_per_formula": 4,
-                "phase_hints": ["DELAFOSSITE", "CUNIO2"],
-                "n_Cu": 1, "n_oxide_fu": 1, "oxide_atoms": 2, "n_O2": 0.5,
-            },
-        ],
-    },
-    {
-        "oxide": "CoO",
-        "metal": "CO",
-        "ternaries": [
-            {
-                "product": "CuCo2O4",
-                "name": "copper cobaltite spinel",
-                "reaction": "Cu + 2CoO + O2 -> CuCo2O4",
-                "X_Cu": 1/7, "X_M": 2/7, "X_O": 4/7,
-                "atoms_per_formula": 7,
-                "phase_hints": ["SPINEL"],
-                "n_Cu": 1, "n_oxide_fu": 2, "oxide_atoms": 2, "n_O2": 1.0,
-            },
-        ],
-    },
-    {
-        "oxide": "La2O3",
-        "metal": "LA",
-        "ternaries": [
-            {
-                "product": "CuLaO2",
-                "name": "copper lanthanum oxide",
-                "reaction": "Cu + 0.5 La2O3 + 0.25 O2 -> CuLaO2",
-                "X_Cu": 1/4, "X_M": 1/4, "X_O": 2/4,
-                "atoms_per_formula": 4,
-                "phase_hints": ["DELAFOSSITE", "CULAO2"],
-                "n_Cu": 1, "n_oxide_fu": 0.5, "oxide_atoms": 5, "n_O2": 0.25,
-            },
-        ],
-    },
-    {
-        "oxide": "CeO2",
-        "metal": "CE",
-        "ternaries": [
-            {
-                "product": "CuCeO3",
-                "name": "copper cerate (hypothetical)",
-                "reaction": "Cu + CeO2 + 0.5 O2 -> CuCeO3",
-                "X_Cu": 1/5, "X_M": 1/5, "X_O": 3/5,
-                "atoms_per_formula": 5,
-                "phase_hints": ["PEROVSKITE", "CUCEO3"],
-                "n_Cu": 1, "n_oxide_fu": 1, "oxide_atoms": 3, "n_O2": 0.5,
-            },
-        ],
-    },
-    # B2O3 requires special handling (B may not coexist with Cu in TCOX14)
-    {
-        "oxide": "B2O3",
-        "metal": "B",
-        "ternaries": [
-            {
-                "product": "CuB2O4",
-                "name": "copper borate",
-                "reaction": "Cu + B2O3 + 0.5 O2 -> CuB2O4",
-                "X_Cu": 1/7, "X_M": 2/7, "X_O": 4/7,
-                "atoms_per_formula": 7,
-                "phase_hints": ["BORATE", "CUBO", "CUB2O4"],
-                "n_Cu": 1, "n_oxide_fu": 1, "oxide_atoms": 5, "n_O2": 0.5,
-            },
-        ],
-    },
-]
-
 # PbO note: PB is not in TCOX14 (would need SSUB3 fallback).
 # We skip PbO ternaries since Pb is toxic and not in TCOX14.
 
@@ -373,6 +81,8 @@ def main():
     print(f"Temperature range: {T_MIN}-{T_MAX} K")
     print(f"Output: {OUTPUT_FILE}")
     print(f"Started: {datetime.now().isoformat()}")
+    tel = SweepTelemetry("extract_ternary_reactions", DATABASE)
+    print(f"Telemetry: {tel.path}")
     print()
 
     OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
@@ -475,22 +185,8 @@ def main():
             # Calculate at the binary oxide stoichiometry (no Cu)
             print(f"  Getting {oxide_name} reference in ternary system...")
             G_binary_oxide = {}
-            oxide_X_O_map = {
-                "Al2O3": 3/5, "Cr2O3": 3/5, "La2O3": 3/5,
-                "MnO": 1/2, "FeO": 1/2, "MgO": 1/2, "CaO": 1/2,
-                "NiO": 1/2, "CoO": 1/2,
-                "V2O5": 5/7, "TiO2": 2/3, "SiO2": 2/3, "ZrO2": 2/3,
-                "CeO2": 2/3, "B2O3": 3/5,
-            }
-            oxide_atoms_map = {
-                "Al2O3": 5, "Cr2O3": 5, "La2O3": 5,
-                "MnO": 2, "FeO": 2, "MgO": 2, "CaO": 2,
-                "NiO": 2, "CoO": 2,
-                "V2O5": 7, "TiO2": 3, "SiO2": 3, "ZrO2": 3,
-                "CeO2": 3, "B2O3": 5,
-            }
-            X_O_oxide = oxide_X_O_map.get(oxide_name, 0.5)
-            atoms_oxide = oxide_atoms_map.get(oxide_name, 2)
+            X_O_oxide = OXIDE_X_O.get(oxide_name, 0.5)
+            atoms_oxide = OXIDE_ATOMS.get(oxide_name, 2)
 
             for T in temperatures:
                 try:
@@ -538,6 +234,8 @@ def main():
                         "reaction": tern["reaction"],
                     }
 
+                    ev = tel.start(f"Cu-{metal_el}-O", T_K=T, product=product,
+                                   X_Cu=round(X_Cu, 6), X_O=round(X_O, 6))
                     try:
                         calc = ternary_system.with_single_equilibrium_calculation()
                         calc.set_condition(ThermodynamicQuantity.temperature(), T)
@@ -613,8 +311,10 @@ def main():
                             row["notes"] = "No binary oxide reference"
 
                         success += 1
+                        tel.ok(ev, phases=stable)
 
                     except Exception as e:
+                        tel.fail(ev, e)
                         row["GM_system_product"] = ""
                         row["stable_phases"] = f"ERROR: {e}"
                         row["ternary_phase_found"] = ""
@@ -646,6 +346,8 @@ def main():
                     if tern_found:
                         print(f"  Ternary phase: {tern_found}")
 
+    tel.close()
+
     # =========================================================================
     # Write CSV
     # =========================================================================
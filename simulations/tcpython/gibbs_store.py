@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+"""
+Long-format store for the oxide Gibbs energy data.
+
+oxide_gibbs_energies.csv is wide: six columns per oxide (GM_X, GM_system_X,
+G_metal_X, dG_X_per_O2, phases_X, oxide_phase_X), so every new oxide widens
+the file and extract_ssub3_fallback.py had to rewrite it in place. The
+canonical store is instead one row per value:
+
+  oxide_gibbs_long.csv     T_K, oxide, quantity, value, source_db
+  oxide_gibbs_phases.csv   phase_id, phases
+
+  T_K        float   temperature (K)
+  oxide      str     "Al2O3", ...
+  quantity   str     GM, GM_system, G_metal, dG_per_O2  (value in J)
+                     phases, oxide_phase                (value = phase_id)
+  value      float   J, or the integer phase_id for the phase quantities
+  source_db  str     database the value came from (TCOX14, SSUB3)
+
+Phase strings ("CORUNDUM#1;FCC_A1#1", error messages, ...) repeat across
+hundreds of rows, so they are stored once in the phases dictionary and
+referenced by id. Missing values are simply absent rows. Adding an oxide or
+a fallback database is an append; if the same (T_K, oxide, quantity) is
+written twice, the later row wins.
+
+The wide CSV is kept as a generated view for older readers
+(python3 gibbs_store.py wide).
+
+Usage:
+  python3 gibbs_store.py migrate          (existing CSV + backups -> long)
+  python3 gibbs_store.py migrate FILE...  (specific wide CSVs)
+  python3 gibbs_store.py wide             (regenerate oxide_gibbs_energies.csv)
+  python3 gibbs_store.py summary
+
+Plain Python, no TC-Python needed (the extract scripts import it on the VM).
+"""
+
+import argparse
+import csv
+import sys
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).parent
+RAW_DIR = SCRIPT_DIR.parent.parent / "data" / "tcpython" / "raw"
+WIDE_FILE = RAW_DIR / "oxide_gibbs_energies.csv"
+LONG_FILE = RAW_DIR / "oxide_gibbs_long.csv"
+
+LONG_FIELDS = ["T_K", "oxide", "quantity", "value", "source_db"]
+PHASE_FIELDS = ["phase_id", "phases"]
+
+# quantity -> wide column template (in the wide file's column order)
+WIDE_COLUMNS = {
+    "GM": "GM_{}",
+    "GM_system": "GM_system_{}",
+    "G_metal": "G_metal_{}",
+    "dG_per_O2": "dG_{}_per_O2",
+    "phases": "phases_{}",
+    "oxide_phase": "oxide_phase_{}",
+}
+PHASE_QUANTITIES = ("phases", "oxide_phase")
+DEFAULT_DB = "TCOX14"
+# Databases extract_ssub3_fallback.py can fall back to; the wide file marks
+# those oxides with oxide_phase = <database>
+FALLBACK_DBS = ("SSUB3", "SLAG4", "TCFE14", "TCSLD5", "TCSLD4")
+
+
+def phases_path(long_path):
+    """oxide_gibbs_long.csv -> oxide_gibbs_phases.csv (same folder)."""
+    long_path = Path(long_path)
+    stem = long_path.stem
+    stem = stem[:-len("_long")] if stem.endswith("_long") else stem
+    return long_path.with_name(stem + "_phases.csv")
+
+
+def load_phase_dict(long_path=LONG_FILE):
+    """Phase strings indexed by phase_id ([] if no dictionary yet)."""
+    path = phases_path(long_path)
+    if not path.exists():
+        return []
+    with open(path, newline="") as f:
+        rows = sorted(csv.DictReader(f), key=lambda r: int(r["phase_id"]))
+    return [r["phases"] for r in rows]
+
+
+def _fmt(x):
+    x = float(x)
+    return str(int(x)) if x.is_integer() and abs(x) < 1e15 else repr(x)
+
+
+def append_records(records, long_path=LONG_FILE):
+    """Append (T_K, oxide, quantity, value, source_db) records to the store.
+
+    value is a number, or the phase string for the phase quantities (encoded
+    through the phase dictionary). None / "" values are skipped.
+    Returns the number of rows written.
+    """
+    long_path = Path(long_path)
+    phases = load_phase_dict(long_path)
+    ids = {p: i for i, p in enumerate(phases)}
+    n_known = len(phases)
+
+    rows = []
+    for T, oxide, quantity, value, source_db in records:
+        if quantity not in WIDE_COLUMNS:
+            raise ValueError("unknown quantity %r" % quantity)
+        if value is None or value == "":
+            continue
+        if quantity in PHASE_QUANTITIES:
+            if value not in ids:
+                ids[value] = len(phases)
+                phases.append(value)
+            value = ids[value]
+        rows.append({"T_K": _fmt(T), "oxide": oxide, "quantity": quantity,
+                     "value": _fmt(value), "source_db": source_db})
+
+    long_path.parent.mkdir(parents=True, exist_ok=True)
+    if len(phases) > n_known:
+        ppath = phases_path(long_path)
+        new_file = not ppath.exists()
+        with open(ppath, "a", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=PHASE_FIELDS)
+            if new_file:
+                writer.writeheader()
+            for i in range(n_known, len(phases)):
+                writer.writerow({"phase_id": i, "phases": phases[i]})
+
+    new_file = not long_path.exists()
+    with open(long_path, "a", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=LONG_FIELDS)
+        if new_file:
+            writer.writeheader()
+        writer.writerows(rows)
+    return len(rows)
+
+
+def read_records(long_path=LONG_FILE):
+    """All rows as dicts with typed values and decoded phase strings."""
+    phases = load_phase_dict(long_path)
+    out = []
+    with open(long_path, newline="") as f:
+        for r in csv.DictReader(f):
+            value = float(r["value"])
+            if r["quantity"] in PHASE_QUANTITIES:
+                value = phases[int(value)]
+            out.append({"T_K": float(r["T_K"]), "oxide": r["oxide"],
+                        "quantity": r["quantity"], "value": value,
+                        "source_db": r["source_db"]})
+    return out
+
+
+# ===========================================================================
+# WIDE <-> LONG
+# ===========================================================================
+
+def wide_to_records(rows):
+    """Records for every non-empty cell of a wide oxide_gibbs_energies table.
+
+    extract_ssub3_fallback.py marked its oxides with oxide_phase = "SSUB3"
+    (or another FALLBACK_DBS name); those become that source_db and get no
+    oxide_phase row.
+    """
+    oxides = [c[len("dG_"):-len("_per_O2")] for c in rows[0]
+              if c.startswith("dG_") and c.endswith("_per_O2")]
+    records = []
+    for r in rows:
+        T = float(r["T_K"])
+        for oxide in oxides:
+            source_db = DEFAULT_DB
+            if r.get("oxide_phase_" + oxide) in FALLBACK_DBS:
+                source_db = r["oxide_phase_" + oxide]
+            for quantity, col in WIDE_COLUMNS.items():
+                value = r.get(col.format(oxide), "")
+                if value == "" or (quantity == "oxide_phase" and source_db != DEFAULT_DB):
+                    continue
+                if quantity not in PHASE_QUANTITIES:
+                    value = float(value)
+                records.append((T, oxide, quantity, value, source_db))
+    return records
+
+
+def long_path_for(wide_path):
+    """oxide_gibbs_energies.csv -> oxide_gibbs_long.csv; backups get _long."""
+    wide_path = Path(wide_path)
+    if wide_path.name == WIDE_FILE.name:
+        return wide_path.with_name(LONG_FILE.name)
+    return wide_path.with_name(wide_path.stem + "_long.csv")
+
+
+def migrate(wide_path, long_path=None):
+    """Convert one wide CSV into a fresh long store. Returns (path, n_rows)."""
+    long_path = Path(long_path or long_path_for(wide_path))
+    with open(wide_path, newline="") as f:
+        rows = list(csv.DictReader(f))
+    for path in (long_path, phases_path(long_path)):
+        if path.exists():
+            path.unlink()
+    n = append_records(wide_to_records(rows), long_path) if rows else 0
+    return long_path, n
+
+
+def to_wide(records):
+    """Pivot long records to the legacy wide layout. Returns (fieldnames, rows)."""
+    oxides = []
+    table = {}
+    for rec in records:
+        if rec["oxide"] not in oxides:
+            oxides.append(rec["oxide"])
+        col = WIDE_COLUMNS[rec["quantity"]].format(rec["oxide"])
+        table.setdefault(rec["T_K"], {})[col] = rec["value"]
+        if rec["source_db"] != DEFAULT_DB:
+            table[rec["T_K"]]["oxide_phase_" + rec["oxide"]] = rec["source_db"]
+
+    fieldnames = ["T_K", "T_C"]
+    for oxide in oxides:
+        fieldnames.extend(col.format(oxide) for col in WIDE_COLUMNS.values())
+    rows = []
+    for T in sorted(table):
+        row = {"T_K": _fmt(T), "T_C": T - 273.15}
+        row.update(table[T])
+        rows.append(row)
+    return fieldnames, rows
+
+
+def write_wide(long_path=LONG_FILE, wide_path=WIDE_FILE):
+    fieldnames, rows = to_wide(read_records(long_path))
+    with open(wide_path, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames)
+        writer.writeheader()
+        writer.writerows(rows)
+    return len(rows), len(fieldnames)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Long-format oxide Gibbs energy store.")
+    sub = parser.add_subparsers(dest="command", required=True)
+    mp = sub.add_parser("migrate", help="convert wide CSVs to the long format")
+    mp.add_argument("files", nargs="*",
+                    help="wide CSVs (default: every oxide_gibbs_energies*.csv under raw/)")
+    sub.add_parser("wide", help="regenerate %s from the store" % WIDE_FILE.name)
+    sub.add_parser("summary", help="oxides, quantities and sources in the store")
+    args = parser.parse_args()
+
+    if args.command == "migrate":
+        files = [Path(p) for p in args.files] or sorted(
+            p for p in RAW_DIR.rglob("oxide_gibbs_energies*.csv"))
+        for path in files:
+            long_path, n = migrate(path)
+            print("%-60s -> %s (%d rows)" % (path.relative_to(RAW_DIR) if
+                                             path.is_relative_to(RAW_DIR) else path,
+                                             long_path.name, n))
+        return 0
+
+    if args.command == "wide":
+        n_rows, n_cols = write_wide()
+        print("Written: %s (%d rows, %d columns)" % (WIDE_FILE, n_rows, n_cols))
+        return 0
+
+    records = read_records()
+    print("=" * 60)
+    print("Oxide Gibbs store: %s" % LONG_FILE.name)
+    print("=" * 60)
+    print("Rows: %d   Phase strings: %d" % (len(records), len(load_phase_dict())))
+    counts = {}
+    for rec in records:
+        key = (rec["oxide"], rec["source_db"])
+        counts.setdefault(key, set()).add(rec["T_K"])
+    for (oxide, db), temps in sorted(counts.items()):
+        print("  %-6s %-7s %3d temperatures  %g-%g K" % (oxide, db, len(temps),
+                                                         min(temps), max(temps)))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,466 @@
+#!/usr/bin/env python3
+"""
+Convert the saved VM console captures (data/tcpython/logs/*.rtf) into the
+structured telemetry format written by sweep_telemetry.py.
+
+The .rtf files are TextEdit captures of the Windows console. Two kinds of
+lines carry timing information:
+  - "Started: 2026-03-14T21:20:22.85" / "Finished: ..." printed by our scripts
+  - "21:20:47,700 [pool-5-thread-1] INFO ..." printed by the Thermo-Calc engine
+
+Progress lines printed by the scripts mark where each calculation (or block
+of calculations) ends. Every progress line is placed on the timeline by
+spreading it evenly between the nearest timestamped lines before and after
+it; its duration is the time since the previous progress/section line.
+Records whose interval contains no timestamped line are flagged
+"estimated": true.
+
+Recognized progress formats:
+  cu_removal_rate.py (current)  "[12/220] R=100 um, t=30 min: ... OK" / "FAILED: ..."
+  cu_removal_rate.py (1800 K)   "[1/20] R=25 um, t=1 min (60 s)" + result lines
+  ternary_phase_map_1800K.py    "Cu-Al-O: 50/369 (50 OK)"         (blocks of 50)
+  extract_ternary_reactions.py,
+  dG_vs_T_top6.py, cu_activity_vs_oxide.py, slag_composition_effects.py,
+  extract_oxide_gibbs.py, cufe2o4_alternative_reaction.py
+                                "Completed: 23/23 temperatures"   (one block)
+  test_dictra_diffusion.py      "[+] TCFE13 + MOBFE8 (Cu-Fe)  ..."  (one test)
+
+Block records carry "n_points" and "n_ok"; wall_s is for the whole block.
+A "Completed:" line after per-point records (cu_removal_rate.py) only
+closes the run; it is not counted again as a block.
+
+Output before the first python.exe command line (a capture started in the
+middle of a run) is an implicit run whose script is inferred from its
+progress lines. Runs without a "Started:" line take their date from the
+log name (YYYY-MM-DD_...) and are placed by the Thermo-Calc timestamps.
+Only runs with no timestamped lines at all (the check_databases.py /
+mobility-probe captures) cannot be placed on a timeline and are skipped.
+
+The same run saved twice is imported once: a log whose bytes match an
+earlier one is skipped, and so is a run (script, run_id) that an earlier
+log already produced.
+
+Usage:
+  python3 import_rtf_logs.py                      (all logs -> telemetry/rtf_*.jsonl)
+  python3 import_rtf_logs.py some_log.rtf --stdout
+  python3 sweep_telemetry.py analyze              (includes the imported runs)
+
+Honda CALPHAD Project - MSE 4381 Capstone
+"""
+
+from datetime import datetime, timedelta
+import argparse
+import glob
+import hashlib
+import json
+import ntpath
+import os
+import re
+import sys
+
+from sweep_telemetry import TELEMETRY_DIR
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+LOG_DIR = os.path.join(SCRIPT_DIR, "..", "..", "data", "tcpython", "logs")
+
+
+# ===========================================================================
+# RTF -> plain text
+# ===========================================================================
+
+def strip_rtf(text):
+    """Return the plain text of a (simple, TextEdit-generated) RTF document."""
+    text = re.sub(r"\\'([0-9a-fA-F]{2})",
+                  lambda m: bytes([int(m.group(1), 16)]).decode("cp1252"), text)
+    text = text.replace("\\\n", "\n")
+    text = text.replace("\\\\", "\x00").replace("\\{", "\x01").replace("\\}", "\x02")
+    text = re.sub(r"\{\\\*?[^{}]*\}", "", text)     # font/colour tables
+    text = re.sub(r"\\[a-zA-Z]+-?\d* ?", "", text)  # control words
+    text = text.replace("{", "").replace("}", "")
+    return text.replace("\x00", "\\").replace("\x01", "{").replace("\x02", "}")
+
+
+# ===========================================================================
+# LINE PATTERNS
+# ===========================================================================
+
+RE_COMMAND = re.compile(r'python\.exe"\s+(\S+\.py)')
+RE_LOG_DATE = re.compile(r"^(\d{4}-\d\d-\d\d)_")
+RE_STARTED = re.compile(r"^Started:\s+(\d{4}-\d\d-\d\dT[\d:.]+)")
+RE_FINISHED = re.compile(r"^Finished:\s+(\d{4}-\d\d-\d\dT[\d:.]+)")
+RE_JAVA_TS = re.compile(r"^(\d\d):(\d\d):(\d\d),(\d{3}) \[")
+RE_DATABASE = re.compile(r"^\s*Databases?:\s+(.+?)\s*$")
+
+RE_SYSTEM = re.compile(r"^System:\s+(\S+)")
+RE_PRODUCT = re.compile(r"^Product:\s+(\S+)")
+RE_PROCESSING = re.compile(r"^--- Processing (\S+) ---")
+RE_TERN_HEADER = re.compile(r"^\s*--- (\S+) \((.+)\) ---\s*$")
+RE_SECTION_DASH = re.compile(r"^--- .* ---\s*$")
+RE_TEMPERATURE = re.compile(r"^TEMPERATURE:\s+(\d+) K .*phase:\s+(\S+)")
+RE_PARAM_TEMP = re.compile(r"^\s+Temperature:\s+(\d+) K")
+RE_RADIUS = re.compile(r"^\s*Particle radius:\s+(\d+) um")
+RE_DICTRA_PHASE = re.compile(r"^PHASE (\d+):")
+
+RE_REMOVAL_NEW = re.compile(
+    r"^\s*\[(\d+)/(\d+)\] R=\s*(\d+) um, t=\s*([^:]+?):\s*(.*)$")
+RE_REMOVAL_OLD = re.compile(
+    r"^\s*\[(\d+)/(\d+)\] R=\s*(\d+) um, t=.+\((\d+) s\)\s*$")
+RE_PHASE_MAP = re.compile(r"^\s*(Cu-\w+-O): (\d+)/(\d+) \((\d+) OK\)")
+RE_COMPLETED = re.compile(r"^\s*Completed: (\d+)/(\d+) (\w+)")
+RE_DICTRA_TEST = re.compile(r"^  \[([+X*!i\-?])\] (.{40}) ?(.*)$")
+RE_ERROR_LINE = re.compile(r"FAILED|ERROR|Error:|Traceback")
+
+TIME_LABELS_S = {"1 min": 60, "5 min": 300, "10 min": 600, "30 min": 1800}
+
+
+# ===========================================================================
+# PARSER
+# ===========================================================================
+
+class _Run:
+    """State for one script invocation inside a console capture."""
+
+    def __init__(self, script, source, day=None):
+        self.script = script     # "" until inferred (implicit run)
+        self.source = source
+        self.run_id = ""
+        self.backend = ""
+        self.day = day           # date of the run: "Started:", else the log name
+        self.n_point_records = 0
+        self.last_clock = None   # last absolute timestamp (for day rollover)
+        self.ticks = []          # [line_no, kind, record-or-None]
+        self.anchors = []        # [(line_no, datetime)]
+        self.ctx = {}
+        self.open_record = None  # pre-announced point waiting for its result
+
+    # -- timeline -----------------------------------------------------------
+
+    def anchor(self, line_no, when):
+        self.anchors.append((line_no, when))
+        self.last_clock = when
+
+    def java_time(self, m):
+        if self.day is None:
+            return None
+        t = datetime(self.day.year, self.day.month, self.day.day,
+                     int(m.group(1)), int(m.group(2)), int(m.group(3)),
+                     int(m.group(4)) * 1000)
+        # Console runs can cross midnight
+        while self.last_clock is not None and t < self.last_clock - timedelta(hours=12):
+            t += timedelta(days=1)
+        return t
+
+    def tick(self, line_no, kind, record=None):
+        if kind != "begin":
+            self.open_record = None
+        self.ticks.append([line_no, kind, record])
+
+    # -- records --------------------------------------------------------------
+
+    def record(self, system, conditions, ok=True, error="", n_points=1,
+               n_ok=None):
+        return {
+            "script": self.script.replace(".py", "") or "unknown",
+            "run_id": self.run_id,
+            "backend": self.backend,
+            "system": system,
+            "conditions": conditions,
+            "ok": ok,
+            "error": error,
+            "phases": [],
+            "shard": None,
+            "n_points": n_points,
+            "n_ok": (1 if ok else 0) if n_ok is None else n_ok,
+            "source": "rtf:" + self.source,
+        }
+
+    def finish(self):
+        """Place ticks on the timeline and return the finished records."""
+        if not self.ticks or not self.anchors:
+            return []
+        if not self.run_id:
+            self.run_id = self.anchors[0][1].strftime("%Y%m%d-%H%M%S")
+        times = _interpolate([t[0] for t in self.ticks], self.anchors)
+        anchor_lines = [a[0] for a in self.anchors]
+        out = []
+        for k, (line_no, kind, rec) in enumerate(self.ticks):
+            if rec is None:
+                continue
+            rec["run_id"] = self.run_id
+            if kind == "end":
+                start_line = self.ticks[k - 1][0] if k else anchor_lines[0]
+                start_t = times[k - 1] if k else self.anchors[0][1]
+                end_line, end_t = line_no, times[k]
+            else:  # "begin": runs until the next tick (or the last anchor)
+                start_line, start_t = line_no, times[k]
+                if k + 1 < len(self.ticks):
+                    end_line, end_t = self.ticks[k + 1][0], times[k + 1]
+                else:
+                    end_line, end_t = self.anchors[-1]
+            if start_t is None or end_t is None:
+                continue
+            rec["ts"] = end_t.isoformat(timespec="seconds")
+            rec["wall_s"] = round(max((end_t - start_t).total_seconds(), 0.0), 3)
+            rec["estimated"] = not any(start_line < a <= end_line
+                                       for a in anchor_lines)
+            out.append(rec)
+        return out
+
+
+def _interpolate(tick_lines, anchors):
+    """Spread ticks evenly between the timestamped lines around them."""
+    times = [None] * len(tick_lines)
+    a = 0
+    k = 0
+    while k < len(tick_lines):
+        # Anchors at or before this tick
+        while a < len(anchors) and anchors[a][0] <= tick_lines[k]:
+            a += 1
+        prev = anchors[a - 1] if a else None
+        nxt = anchors[a] if a < len(anchors) else None
+        # All ticks sharing the same (prev, next) anchor pair
+        group = [k]
+        while (k + len(group) < len(tick_lines)
+               and (nxt is None or tick_lines[k + len(group)] < nxt[0])):
+            group.append(k + len(group))
+        for pos, idx in enumerate(group):
+            if prev and nxt:
+                frac = (pos + 1) / (len(group) + 1)
+                times[idx] = prev[1] + (nxt[1] - prev[1]) * frac
+            elif prev:
+                times[idx] = prev[1]
+            elif nxt:
+                times[idx] = nxt[1]
+        k += len(group)
+    return times
+
+
+def parse_log(text, source):
+    """Parse one console capture. Returns a list of telemetry records."""
+    m = RE_LOG_DATE.match(source)
+    log_day = datetime.strptime(m.group(1), "%Y-%m-%d").date() if m else None
+    runs = []
+    # Output before the first command line belongs to a run whose start
+    # was not captured
+    run = _Run("", source, log_day)
+    for line_no, line in enumerate(text.splitlines()):
+        m = RE_COMMAND.search(line)
+        if m:
+            runs.append(run)
+            # Windows paths (simulations\tcpython\x.py) on any OS
+            run = _Run(ntpath.basename(m.group(1)), source, log_day)
+            continue
+
+        m = RE_STARTED.match(line) or RE_FINISHED.match(line)
+        if m:
+            when = datetime.fromisoformat(m.group(1))
+            if RE_STARTED.match(line) and not run.run_id:
+                run.day = when.date()
+                run.run_id = when.strftime("%Y%m%d-%H%M%S")
+            elif run.day is None:
+                run.day = when.date()
+            run.anchor(line_no, when)
+            if RE_FINISHED.match(line):
+                run.tick(line_no, "section")
+            continue
+
+        m = RE_JAVA_TS.match(line)
+        if m:
+            when = run.java_time(m)
+            if when is not None:
+                run.anchor(line_no, when)
+            continue
+
+        m = RE_DATABASE.match(line)
+        if m and not run.backend:
+            run.backend = re.sub(r"\s*\+\s*", "+", m.group(1))
+            continue
+
+        _parse_progress(run, line_no, line)
+
+    runs.append(run)
+
+    records = []
+    for r in runs:
+        records.extend(r.finish())
+    return records
+
+
+def _parse_progress(run, line_no, line):
+    ctx = run.ctx
+
+    # --- context headers (start a new timing segment) -----------------------
+    for regex, key in ((RE_SYSTEM, "system"), (RE_PRODUCT, "product"),
+                       (RE_PROCESSING, "oxide")):
+        m = regex.match(line)
+        if m:
+            ctx[key] = m.group(1)
+            run.tick(line_no, "section")
+            return
+    m = RE_TEMPERATURE.match(line)
+    if m:
+        ctx["temp_K"] = int(m.group(1))
+        ctx["phase"] = m.group(2)
+        run.tick(line_no, "section")
+        return
+    m = RE_PARAM_TEMP.match(line)
+    if m:
+        ctx["temp_K"] = int(m.group(1))
+        return
+    m = RE_DICTRA_PHASE.match(line)
+    if m:
+        ctx["test_phase"] = "P" + m.group(1)
+        run.tick(line_no, "section")
+        return
+
+    # --- cu_removal_rate.py, post-reported points ---------------------------
+    m = RE_REMOVAL_OLD.match(line)
+    if m:
+        run.script = run.script or "cu_removal_rate.py"
+        run.n_point_records += 1
+        conditions = {"temp_K": ctx.get("temp_K"), "radius_um": int(m.group(3)),
+                      "time_s": int(m.group(4))}
+        run.open_record = run.record("Fe-Cu", conditions)
+        run.tick(line_no, "begin", run.open_record)
+        return
+    m = RE_REMOVAL_NEW.match(line)
+    if m:
+        run.script = run.script or "cu_removal_rate.py"
+        run.n_point_records += 1
+        status = m.group(5)
+        failed = "FAILED" in status
+        conditions = {"temp_K": ctx.get("temp_K"), "phase": ctx.get("phase"),
+                      "radius_um": int(m.group(3)),
+                      "time_s": TIME_LABELS_S.get(m.group(4).strip(),
+                                                  m.group(4).strip())}
+        error = status.split("FAILED:", 1)[1].strip() if failed else ""
+        run.tick(line_no, "end", run.record("Fe-Cu", conditions, ok=not failed,
+                                            error=error))
+        return
+    if run.open_record is not None and RE_ERROR_LINE.search(line):
+        run.open_record["ok"] = False
+        run.open_record["n_ok"] = 0
+        run.open_record["error"] = run.open_record["error"] or line.strip()
+        return
+
+    # --- ternary_phase_map_1800K.py, progress every 50 points ---------------
+    m = RE_PHASE_MAP.match(line)
+    if m:
+        run.script = run.script or "ternary_phase_map_1800K.py"
+        system = m.group(1)
+        done, ok_total = int(m.group(2)), int(m.group(4))
+        prev_done, prev_ok = ctx.get(("map", system), (0, 0))
+        ctx[("map", system)] = (done, ok_total)
+        n = done - prev_done
+        n_ok = ok_total - prev_ok
+        rec = run.record(system, {"T_K": 1800, "points": "%d-%d" % (
+            prev_done + 1, done)}, ok=n_ok == n, n_points=n, n_ok=n_ok)
+        if n_ok < n:
+            rec["error"] = "%d of %d points failed" % (n - n_ok, n)
+        run.tick(line_no, "end", rec)
+        return
+
+    # --- "Completed: n/N <unit>" blocks -------------------------------------
+    m = RE_COMPLETED.match(line)
+    if m and run.n_point_records:
+        # Summary of points already recorded one by one
+        run.tick(line_no, "section")
+        return
+    if m:
+        n_ok, n = int(m.group(1)), int(m.group(2))
+        system = ctx.get("system") or ctx.get("oxide") or "?"
+        conditions = {"unit": m.group(3)}
+        for key in ("product", "oxide"):
+            if ctx.get(key):
+                conditions[key] = ctx[key]
+        rec = run.record(system, conditions, ok=n_ok == n, n_points=n,
+                         n_ok=n_ok)
+        if n_ok < n:
+            rec["error"] = "%d of %d %s failed" % (n - n_ok, n, m.group(3))
+        run.tick(line_no, "end", rec)
+        return
+    m = RE_TERN_HEADER.match(line)
+    if m:
+        ctx["product"] = m.group(1)
+        run.tick(line_no, "section")
+        return
+
+    # --- test_dictra_diffusion.py log() lines -------------------------------
+    m = RE_DICTRA_TEST.match(line)
+    if m and not run.script:
+        run.script = "test_dictra_diffusion.py"
+    if m and run.script.startswith("test_dictra"):
+        run.n_point_records += 1
+        marker, test, detail = m.group(1), m.group(2).strip(), m.group(3).strip()
+        failed = marker == "X"
+        system = ctx.get("test_phase", "?")
+        run.tick(line_no, "end", run.record(
+            system, {"test": test}, ok=not failed,
+            error=detail if failed else ""))
+        return
+
+    if RE_SECTION_DASH.match(line) or RE_RADIUS.match(line):
+        run.tick(line_no, "section")
+
+
+def import_log(path):
+    with open(path, encoding="cp1252", errors="replace") as f:
+        text = strip_rtf(f.read())
+    return parse_log(text, os.path.basename(path))
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Import .rtf console logs as structured telemetry.")
+    parser.add_argument("paths", nargs="*",
+                        help="RTF logs (default: data/tcpython/logs/*.rtf)")
+    parser.add_argument("--out-dir", default=TELEMETRY_DIR,
+                        help="where to write rtf_<log>.jsonl files")
+    parser.add_argument("--stdout", action="store_true",
+                        help="print records instead of writing files")
+    args = parser.parse_args()
+
+    paths = args.paths or sorted(glob.glob(os.path.join(LOG_DIR, "*.rtf")))
+    if not args.stdout:
+        os.makedirs(args.out_dir, exist_ok=True)
+
+    print("%-55s  %6s  %5s  %9s" % ("Log", "Recs", "Fail", "Wall (s)"),
+          file=sys.stderr)
+    seen_logs = {}      # content hash -> first log name
+    seen_runs = set()   # (script, run_id) already imported
+    for path in paths:
+        name = os.path.basename(path)
+        stem = os.path.splitext(name)[0]
+        out = os.path.join(args.out_dir, "rtf_%s.jsonl" % stem)
+        with open(path, "rb") as f:
+            digest = hashlib.sha256(f.read()).hexdigest()
+        if digest in seen_logs:
+            print("%-55s  duplicate of %s, skipped" % (name[:55], seen_logs[digest]),
+                  file=sys.stderr)
+            if not args.stdout and os.path.exists(out):
+                os.remove(out)
+            continue
+        seen_logs[digest] = name
+
+        records = [r for r in import_log(path)
+                   if (r["script"], r["run_id"]) not in seen_runs]
+        seen_runs.update((r["script"], r["run_id"]) for r in records)
+        n_fail = sum(1 for r in records if not r["ok"])
+        wall = sum(r["wall_s"] for r in records)
+        print("%-55s  %6d  %5d  %9.1f" % (
+            name[:55], len(records), n_fail, wall),
+            file=sys.stderr)
+        if args.stdout:
+            for r in records:
+                print(json.dumps(r))
+            continue
+        if not records:
+            continue
+        with open(out, "w") as f:
+            for r in records:
+                f.write(json.dumps(r) + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,327 @@
+#!/usr/bin/env python3
+"""
+Element-matrix reaction balancer and the shared stoichiometry table.
+
+Every Cu capture reaction has the form
+
+    n_Cu Cu + n_oxide_fu MaOb + n_O2 O2 -> Cu_c M_m O_o
+
+Instead of typing n_Cu / n_oxide_fu / n_O2 by hand, the coefficients are the
+nullspace of the element matrix A (rows = elements, columns = species):
+A v = 0. For these reactions the nullspace is one-dimensional; the vector is
+scaled so the product coefficient is +1. Signs follow the usual convention:
+products positive, reactants negative, so a positive O2 entry means the
+reaction releases O2. Arithmetic is exact (fractions), and this part is plain
+Python so the VM scripts can use it with the Thermo-Calc interpreter.
+
+The stoichiometry table (data/tcpython/processed/reaction_stoichiometry.npz)
+collects every capture reaction the project screens:
+
+  species      (S,)    species names, "Cu" and "O2" first
+  elements     (E,)    element symbols
+  composition  (S, E)  atoms of each element per formula unit
+  product      (N,)    product of each reaction
+  oxide        (N,)    reactant oxide of each reaction
+  nu           (N, S)  signed stoichiometric coefficients
+
+With G an (S, n_T) array of Gibbs energies per formula unit,
+dG_rxn for all reactions and temperatures is one matrix product, nu @ G.
+Activity corrections work the same way: RT * (nu @ ln a).
+
+Usage:
+  python3 reaction_balancer.py                 (build the table)
+  python3 reaction_balancer.py show            (print the table)
+  python3 reaction_balancer.py balance CuFe2O4 Fe2O3
+"""
+
+import argparse
+import os
+import re
+import sys
+from fractions import Fraction
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+TABLE_FILE = os.path.join(SCRIPT_DIR, "..", "..", "data", "tcpython",
+                          "processed", "reaction_stoichiometry.npz")
+
+FORMULA_RE = re.compile(r"([A-Z][a-z]?)(\d*)")
+
+# Other oxides of a metal that are also used as reactants
+# (mass_balance_calculator.py doses Fe2O3, the screen uses FeO)
+ALTERNATE_OXIDES = {
+    "Fe": ["Fe2O3", "Fe3O4"],
+    "Mn": ["Mn2O3", "MnO2"],
+    "Co": ["Co3O4"],
+    "V":  ["V2O3"],
+    "Ti": ["Ti2O3"],
+    "Ce": ["Ce2O3"],
+}
+
+
+# ===========================================================================
+# BALANCING (plain Python)
+# ===========================================================================
+
+def parse_formula(formula):
+    """"Cu3V2O8" -> {"Cu": 3, "V": 2, "O": 8}."""
+    comp = {}
+    pos = 0
+    for m in FORMULA_RE.finditer(formula):
+        if m.start() != pos:
+            break
+        comp[m.group(1)] = comp.get(m.group(1), 0) + int(m.group(2) or 1)
+        pos = m.end()
+    if pos != len(formula) or not comp:
+        raise ValueError("cannot parse formula %r" % formula)
+    return comp
+
+
+def element_matrix(species):
+    """Element matrix A (list of rows) and the element order."""
+    comps = [parse_formula(s) for s in species]
+    elements = sorted({el for c in comps for el in c})
+    return [[c.get(el, 0) for c in comps] for el in elements], elements
+
+
+def nullspace(A):
+    """Exact rational nullspace basis of integer matrix A (list of rows)."""
+    rows = [[Fraction(x) for x in row] for row in A]
+    n = len(rows[0]) if rows else 0
+    pivots = []
+    r = 0
+    for c in range(n):
+        p = next((i for i in range(r, len(rows)) if rows[i][c] != 0), None)
+        if p is None:
+            continue
+        rows[r], rows[p] = rows[p], rows[r]
+        piv = rows[r][c]
+        rows[r] = [x / piv for x in rows[r]]
+        for i in range(len(rows)):
+            if i != r and rows[i][c] != 0:
+                f = rows[i][c]
+                rows[i] = [a - f * b for a, b in zip(rows[i], rows[r])]
+        pivots.append(c)
+        r += 1
+        if r == len(rows):
+            break
+
+    basis = []
+    for free in (c for c in range(n) if c not in pivots):
+        v = [Fraction(0)] * n
+        v[free] = Fraction(1)
+        for i, c in enumerate(pivots):
+            v[c] = -rows[i][free]
+        basis.append(v)
+    return basis
+
+
+def balance(reactants, products):
+    """Balance reactants -> products. Returns {species: signed coefficient}.
+
+    Coefficients are Fractions, negative for consumed species, scaled so the
+    first product has coefficient +1. A species listed as a reactant may come
+    out positive (it is produced instead, e.g. O2 released).
+    Raises ValueError if the reaction has no unique balance.
+    """
+    species = list(reactants) + list(products)
+    A, _ = element_matrix(species)
+    basis = nullspace(A)
+    if len(basis) != 1:
+        raise ValueError("%s -> %s: %d independent balances (need exactly 1)"
+                         % (" + ".join(reactants), " + ".join(products), len(basis)))
+    v = basis[0]
+    scale = v[len(reactants)]
+    if scale == 0:
+        raise ValueError("%s does not take part in the balanced reaction" % products[0])
+    return {s: x / scale for s, x in zip(species, v)}
+
+
+def fmt_coef(x, species, space=False):
+    """Reaction-string coefficient in the TERNARY_SYSTEMS style."""
+    x = Fraction(x).limit_denominator(12)
+    if x == 1:
+        return species
+    if x.denominator == 1 and not space:
+        return "%d%s" % (x.numerator, species)
+    return "%g %s" % (float(x), species)
+
+
+def reaction_string(product, oxide, n_Cu, n_ox, n_O2):
+    """"Cu + 2MnO + O2 -> CuMn2O4" from Fraction coefficients."""
+    lhs = [fmt_coef(n_Cu, "Cu"), fmt_coef(n_ox, oxide, space=n_ox.denominator != 1)]
+    rhs = [product]
+    if n_O2 > 0:
+        lhs.append(fmt_coef(n_O2, "O2", space=True))
+    elif n_O2 < 0:
+        rhs.append(fmt_coef(-n_O2, "O2", space=True))
+    return " + ".join(lhs) + " -> " + " + ".join(rhs)
+
+
+def capture_stoichiometry(product, oxide):
+    """Coefficients of Cu + oxide + O2 -> product, in TERNARY_SYSTEMS form.
+
+    Returns a dict with the reaction string, n_Cu, n_oxide_fu, n_O2
+    (consumed amounts; n_O2 < 0 when O2 is released), oxide_atoms,
+    atoms_per_formula and the product mole fractions X_Cu, X_M, X_O.
+    """
+    nu = balance(["Cu", oxide, "O2"], [product])
+    n_Cu, n_ox, n_O2 = -nu["Cu"], -nu[oxide], -nu["O2"]
+    comp = parse_formula(product)
+    atoms = sum(comp.values())
+    x_cu = Fraction(comp.get("Cu", 0), atoms)
+    x_o = Fraction(comp.get("O", 0), atoms)
+    return {
+        "reaction": reaction_string(product, oxide, n_Cu, n_ox, n_O2),
+        "n_Cu": float(n_Cu),
+        "n_oxide_fu": float(n_ox),
+        "n_O2": float(n_O2),
+        "oxide_atoms": sum(parse_formula(oxide).values()),
+        "atoms_per_formula": atoms,
+        "X_Cu": float(x_cu),
+        "X_M": float(1 - x_cu - x_o),
+        "X_O": float(x_o),
+    }
+
+
+def oxide_X_O(oxide):
+    """Mole fraction of O in a binary oxide ("Al2O3" -> 0.6)."""
+    comp = parse_formula(oxide)
+    return comp["O"] / sum(comp.values())
+
+
+# ===========================================================================
+# STOICHIOMETRY TABLE (NumPy)
+# ===========================================================================
+
+def build_table(pairs):
+    """Build the stoichiometry table for (product, oxide) pairs.
+
+    Pairs that cannot be balanced are skipped and reported.
+    Returns (table dict of NumPy arrays, list of skipped (pair, reason)).
+    """
+    import numpy as np
+
+    reactions = []
+    skipped = []
+    for product, oxide in pairs:
+        try:
+            reactions.append((product, oxide, balance(["Cu", oxide, "O2"], [product])))
+        except ValueError as e:
+            skipped.append(((product, oxide), str(e)))
+
+    species = ["Cu", "O2"]
+    for _, oxide, _ in reactions:
+        if oxide not in species:
+            species.append(oxide)
+    for product, _, _ in reactions:
+        if product not in species:
+            species.append(product)
+
+    A, elements = element_matrix(species)
+    nu = np.zeros((len(reactions), len(species)))
+    index = {s: i for i, s in enumerate(species)}
+    for r, (_, _, coeffs) in enumerate(reactions):
+        for s, x in coeffs.items():
+            nu[r, index[s]] = float(x)
+
+    table = {
+        "species": np.array(species),
+        "elements": np.array(elements),
+        "composition": np.array(A, dtype=float).T,
+        "product": np.array([p for p, _, _ in reactions]),
+        "oxide": np.array([o for _, o, _ in reactions]),
+        "nu": nu,
+    }
+    return table, skipped
+
+
+def save_table(table, path=TABLE_FILE):
+    import numpy as np
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    np.savez_compressed(path, **table)
+    return path
+
+
+def load_table(path=TABLE_FILE):
+    import numpy as np
+    with np.load(path, allow_pickle=False) as f:
+        return {k: f[k] for k in f.files}
+
+
+def reaction_index(table, product, oxide):
+    """Row of (product, oxide) in the table; KeyError if absent."""
+    hits = ((table["product"] == product) & (table["oxide"] == oxide)).nonzero()[0]
+    if not len(hits):
+        raise KeyError("%s from %s not in stoichiometry table" % (product, oxide))
+    return int(hits[0])
+
+
+def dG_rxn(table, G):
+    """dG_rxn for every reaction: nu (N, S) @ G (S, ...) -> (N, ...)."""
+    return table["nu"] @ G
+
+
+def capture_pairs():
+    """All (product, oxide) pairs screened anywhere in the project."""
+    from ternary_systems import TERNARY_SYSTEMS
+    from candidate_generator import generate_candidates
+
+    pairs = []
+    for sys_def in TERNARY_SYSTEMS:
+        for tern in sys_def["ternaries"]:
+            pairs.append((tern["product"], sys_def["oxide"]))
+    for cand in generate_candidates():
+        pairs.append((cand["product"], cand["oxide"]))
+
+    # Same products from the other oxides of each metal
+    for product, _ in list(pairs):
+        for el in parse_formula(product):
+            for alt in ALTERNATE_OXIDES.get(el, []):
+                pairs.append((product, alt))
+
+    seen = set()
+    return [p for p in pairs if not (p in seen or seen.add(p))]
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Balance Cu capture reactions and build the stoichiometry table.")
+    sub = parser.add_subparsers(dest="command")
+    sub.add_parser("build", help="write %s (default)" % os.path.basename(TABLE_FILE))
+    sub.add_parser("show", help="print the saved table")
+    bp = sub.add_parser("balance", help="balance Cu + OXIDE + O2 -> PRODUCT")
+    bp.add_argument("product")
+    bp.add_argument("oxide")
+    args = parser.parse_args()
+
+    if args.command == "balance":
+        print(capture_stoichiometry(args.product, args.oxide)["reaction"])
+        return 0
+
+    if args.command == "show":
+        table = load_table()
+        print("%-12s %-8s  %s" % ("Product", "Oxide", "Reaction"))
+        print("-" * 70)
+        col = {str(sp): i for i, sp in enumerate(table["species"])}
+        for r, (product, oxide) in enumerate(zip(table["product"], table["oxide"])):
+            n_Cu, n_ox, n_O2 = (Fraction(-table["nu"][r, col[sp]]).limit_denominator(12)
+                                for sp in ("Cu", str(oxide), "O2"))
+            print("%-12s %-8s  %s" % (product, oxide,
+                                      reaction_string(product, oxide, n_Cu, n_ox, n_O2)))
+        return 0
+
+    table, skipped = build_table(capture_pairs())
+    path = save_table(table)
+    print("=" * 70)
+    print("Reaction stoichiometry table")
+    print("=" * 70)
+    print("Reactions: %d   Species: %d   Elements: %d" % (
+        len(table["product"]), len(table["species"]), len(table["elements"])))
+    for (product, oxide), reason in skipped:
+        print("  skipped %s from %s: %s" % (product, oxide, reason))
+    print("Written: %s" % os.path.normpath(path))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
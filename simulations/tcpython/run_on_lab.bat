@@ -23,9 +23,9 @@ if "%1"=="" (
     exit /b 0
 )
 
-echo Running: %1
+echo Running: %*
 echo.
-%TC_PYTHON% %1
+%TC_PYTHON% %*
 
 echo.
 echo ============================================================
@@ -0,0 +1,310 @@
+#!/usr/bin/env python3
+"""
+Batched, unattended dG_rxn screen of the generated Cu-M-O candidate library.
+
+candidate_generator.py enumerates balanced products for the spinel,
+delafossite, vanadate, silicate and borate families. This script probes
+which Cu-M-O systems the database can set up, then evaluates every
+(candidate, T) point with the same method as extract_ternary_reactions.py:
+
+  dG_rxn = GM_system * atoms_per_formula
+           - (n_Cu * G(Cu) + n_oxide_fu * oxide_atoms * G(oxide) + n_O2 * G(O2))
+
+Results are streamed to disk in batches (one flushed CSV write per batch),
+so a crash or a lost VM session keeps everything finished so far. Re-running
+the same command resumes: points that already have a successful row are
+skipped.
+
+Output: ../../data/tcpython/raw/generated_candidates_dG.csv
+  Same columns as ternary_reaction_energies.csv plus family and metal, so
+  screening/tiered_screening.py can use it as tier-1 cache.
+
+Run on OSU lab machine:
+  "C:\\Program Files\\Thermo-Calc\\2025b\\python\\python.exe" screen_candidates_batch.py
+  ... screen_candidates_batch.py --families spinel delafossite --t-step 100
+  ... screen_candidates_batch.py --shard 2/4        (see sweep_shards.py)
+"""
+
+import argparse
+import csv
+from pathlib import Path
+from datetime import datetime
+
+from tc_python import *
+
+from candidate_generator import FAMILY_NAMES, generate_candidates
+from extract_ternary_reactions import find_phase_gm
+from reaction_balancer import oxide_X_O
+from sweep_shards import (POINT_INDEX, in_shard, parse_shard, shard_label,
+                          shard_output_path, write_shard_csv)
+from sweep_telemetry import SweepTelemetry
+
+# =============================================================================
+# Configuration
+# =============================================================================
+T_MIN = 800
+T_MAX = 1900
+T_STEP = 100
+
+DATABASE = "TCOX14"
+BATCH_SIZE = 25  # points per flushed CSV write
+
+SCRIPT_DIR = Path(__file__).parent
+OUTPUT_DIR = SCRIPT_DIR.parent.parent / "data" / "tcpython" / "raw"
+OUTPUT_FILE = OUTPUT_DIR / "generated_candidates_dG.csv"
+
+FIELDNAMES = [
+    "T_K", "T_C", "oxide", "product", "product_name", "reaction",
+    "family", "metal",
+    "GM_system_product", "stable_phases", "ternary_phase_found",
+    "GM_ternary_phase", "G_Cu_metal", "G_O2",
+    "dG_rxn_system_J", "dG_rxn_system_kJ", "notes",
+]
+
+
+def equilibrium(system, T, X_Cu, X_O=None):
+    calc = system.with_single_equilibrium_calculation()
+    calc.set_condition(ThermodynamicQuantity.temperature(), T)
+    calc.set_condition(ThermodynamicQuantity.pressure(), 101325)
+    if X_Cu is not None:
+        calc.set_condition(
+            ThermodynamicQuantity.mole_fraction_of_a_component("CU"), X_Cu)
+    if X_O is not None:
+        calc.set_condition(
+            ThermodynamicQuantity.mole_fraction_of_a_component("O"), X_O)
+    return calc.calculate()
+
+
+def load_done(path):
+    """(product, T_K) pairs that already have a dG value in `path`."""
+    done = set()
+    if not path.exists():
+        return done, []
+    with open(path, newline="") as f:
+        rows = list(csv.DictReader(f))
+    for r in rows:
+        if r.get("dG_rxn_system_kJ", "") != "":
+            done.add((r["product"], float(r["T_K"])))
+    return done, rows
+
+
+class BatchWriter:
+    """Append rows to the output CSV, flushing every `batch_size` rows."""
+
+    def __init__(self, path, fieldnames, batch_size):
+        new_file = not path.exists() or path.stat().st_size == 0
+        self._f = open(path, "a", newline="")
+        self._writer = csv.DictWriter(self._f, fieldnames=fieldnames,
+                                      extrasaction="ignore")
+        if new_file:
+            self._writer.writeheader()
+        self.batch_size = batch_size
+        self._pending = []
+        self.n_written = 0
+
+    def add(self, row):
+        self._pending.append(row)
+        if len(self._pending) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        if self._pending:
+            self._writer.writerows(self._pending)
+            self._f.flush()
+            self.n_written += len(self._pending)
+            self._pending = []
+
+    def close(self):
+        self.flush()
+        self._f.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Batched dG_rxn screen of generated Cu-M-O candidates.")
+    parser.add_argument("--families", nargs="+", choices=FAMILY_NAMES, default=None)
+    parser.add_argument("--metals", nargs="+", default=None,
+                        help="TC element names, e.g. FE MN V")
+    parser.add_argument("--t-min", type=int, default=T_MIN)
+    parser.add_argument("--t-max", type=int, default=T_MAX)
+    parser.add_argument("--t-step", type=int, default=T_STEP)
+    parser.add_argument("--batch-size", type=int, default=BATCH_SIZE)
+    parser.add_argument("--shard", default=None, help="run only shard i/K")
+    args = parser.parse_args()
+
+    shard = parse_shard(args.shard) if args.shard else None
+    started = datetime.now().isoformat()
+    metals = [m.upper() for m in args.metals] if args.metals else None
+    candidates = generate_candidates(args.families, metals)
+    temperatures = list(range(args.t_min, args.t_max + 1, args.t_step))
+
+    # Canonical point order: candidate-major, then temperature
+    points = [(ci, T) for ci in range(len(candidates)) for T in temperatures]
+    n_total = len(points)
+    out_path = Path(shard_output_path(OUTPUT_FILE, shard))
+    done, previous_rows = load_done(out_path)
+    todo = [(j, ci, T) for j, (ci, T) in enumerate(points)
+            if in_shard(j, shard) and (candidates[ci]["product"], T) not in done]
+
+    tel = SweepTelemetry("screen_candidates_batch", DATABASE, shard=shard)
+
+    print("=" * 70)
+    print("TC-Python: Batched screen of generated Cu-M-O candidates")
+    print("=" * 70)
+    print(f"Database: {DATABASE}")
+    print(f"Candidates: {len(candidates)}  "
+          f"({', '.join(args.families or FAMILY_NAMES)})")
+    print(f"Temperatures: {args.t_min}-{args.t_max} K, step {args.t_step} K "
+          f"({len(temperatures)} points)")
+    print(f"Sweep: {shard_label(shard)} ({n_total} points in full sweep)")
+    print(f"Already done: {len(done)}   To run: {len(todo)}")
+    print(f"Output: {out_path}")
+    print(f"Telemetry: {tel.path}")
+    print(f"Started: {started}")
+    print()
+
+    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+    fieldnames = ([POINT_INDEX] if shard else []) + FIELDNAMES
+    writer = BatchWriter(out_path, fieldnames, args.batch_size)
+    new_rows = []
+
+    # Group remaining points by metal so each Cu-M-O system is set up once
+    by_metal = {}
+    for j, ci, T in todo:
+        by_metal.setdefault(candidates[ci]["metal"], []).append((j, ci, T))
+
+    with TCPython() as session:
+        print("Connected to Thermo-Calc\n")
+
+        print("--- Getting Cu metal and O2 gas references ---")
+        need_T = sorted({T for _, _, T in todo})
+        try:
+            cu_system = (session
+                         .select_database_and_elements(DATABASE, ["CU", "O"])
+                         .get_system())
+            o2_system = (session
+                         .select_database_and_elements(DATABASE, ["O"])
+                         .get_system())
+            G_Cu_metal = {}
+            G_O2 = {}
+            for T in need_T:
+                G_Cu_metal[T] = equilibrium(cu_system, T, None, 0.0001).get_value_of("GM")
+                G_O2[T] = 2 * equilibrium(o2_system, T, None).get_value_of("GM")
+        except Exception as e:
+            print(f"  ERROR getting references: {e}\n")
+            writer.close()
+            return
+
+        skipped_metals = []
+        for metal_el in sorted(by_metal):
+            mpoints = by_metal[metal_el]
+            print(f"\n--- Cu-{metal_el}-O ({len(mpoints)} points) ---")
+
+            def base_row(ci, T, j):
+                cand = candidates[ci]
+                return {
+                    POINT_INDEX: j,
+                    "T_K": T, "T_C": T - 273.15,
+                    "oxide": cand["oxide"], "product": cand["product"],
+                    "product_name": cand["name"], "reaction": cand["reaction"],
+                    "family": cand["family"], "metal": metal_el,
+                    "G_Cu_metal": G_Cu_metal[T], "G_O2": G_O2[T],
+                }
+
+            # Probe: is this element in the database?
+            ev = tel.start(f"Cu-{metal_el}-O", stage="system_setup")
+            try:
+                ternary_system = (session
+                                  .select_database_and_elements(
+                                      DATABASE, ["CU", metal_el, "O"])
+                                  .get_system())
+                tel.ok(ev)
+            except Exception as e:
+                tel.fail(ev, e)
+                print(f"  SYSTEM SETUP ERROR: {e}")
+                print(f"  (Element {metal_el} may not be in {DATABASE})")
+                skipped_metals.append(metal_el)
+                for j, ci, T in mpoints:
+                    row = base_row(ci, T, j)
+                    row.update({"stable_phases": f"ERROR: {e}",
+                                "notes": f"Element {metal_el} not in {DATABASE}"})
+                    writer.add(row)
+                    new_rows.append(row)
+                continue
+
+            # Binary oxide reference (X_Cu ~ 0) at the screening oxide composition
+            X_O_oxide = oxide_X_O(candidates[mpoints[0][1]]["oxide"])
+            G_binary_oxide = {}
+            for T in sorted({T for _, _, T in mpoints}):
+                try:
+                    G_binary_oxide[T] = equilibrium(
+                        ternary_system, T, 0.0001, X_O_oxide).get_value_of("GM")
+                except Exception:
+                    G_binary_oxide[T] = None
+
+            success = 0
+            for j, ci, T in mpoints:
+                cand = candidates[ci]
+                row = base_row(ci, T, j)
+                ev = tel.start(f"Cu-{metal_el}-O", T_K=T, product=cand["product"],
+                               family=cand["family"],
+                               X_Cu=round(cand["X_Cu"], 6), X_O=round(cand["X_O"], 6))
+                try:
+                    result = equilibrium(ternary_system, T, cand["X_Cu"], cand["X_O"])
+                    stable = result.get_stable_phases()
+                    GM_system = result.get_value_of("GM")
+                    gm_ternary, ternary_phase = find_phase_gm(result, cand["phase_hints"])
+
+                    row["GM_system_product"] = GM_system
+                    row["stable_phases"] = "; ".join(stable)
+                    row["ternary_phase_found"] = ternary_phase if ternary_phase else ""
+                    row["GM_ternary_phase"] = gm_ternary if gm_ternary else ""
+
+                    G_oxide_ref = G_binary_oxide.get(T)
+                    if G_oxide_ref is not None:
+                        G_products = GM_system * cand["atoms_per_formula"]
+                        G_reactants = (cand["n_Cu"] * G_Cu_metal[T]
+                                       + cand["n_oxide_fu"] * cand["oxide_atoms"] * G_oxide_ref
+                                       + cand["n_O2"] * G_O2[T])
+                        dG_rxn_J = G_products - G_reactants
+                        row["dG_rxn_system_J"] = dG_rxn_J
+                        row["dG_rxn_system_kJ"] = dG_rxn_J / 1000
+                        row["notes"] = ""
+                    else:
+                        row["notes"] = "No binary oxide reference"
+
+                    success += 1
+                    tel.ok(ev, phases=stable)
+                except Exception as e:
+                    tel.fail(ev, e)
+                    row["stable_phases"] = f"ERROR: {e}"
+                    row["notes"] = str(e)
+
+                writer.add(row)
+                new_rows.append(row)
+
+            writer.flush()
+            print(f"  Completed: {success}/{len(mpoints)} points "
+                  f"({writer.n_written} rows written so far)")
+
+    tel.close()
+    writer.close()
+
+    if shard is not None:
+        # Rewrite the shard file with its manifest so sweep_shards.py can merge it
+        # (earlier failed rows for re-run points are dropped)
+        rows = [r for r in previous_rows
+                if (r["product"], float(r["T_K"])) in done] + new_rows
+        write_shard_csv(OUTPUT_FILE, FIELDNAMES, rows, shard, n_total, started,
+                        fail_column="stable_phases", fail_prefix="ERROR")
+
+    print(f"\n{'='*70}")
+    print(f"CSV: {out_path} ({writer.n_written} new rows)")
+    if skipped_metals:
+        print(f"Elements not available in {DATABASE}: {', '.join(skipped_metals)}")
+    print(f"Finished: {datetime.now().isoformat()}")
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    main()
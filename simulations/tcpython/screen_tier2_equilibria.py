@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+Tier-2 equilibria for the tiered screen (screening/tiered_screening.py).
+
+The local screen decides most (product, T) points from linearized Ellingham
+bounds or cached TC data and writes the rest to screening/tier2_queue.csv.
+This script runs the same product-side equilibrium as
+extract_ternary_reactions.py, but only for the queued points. Products are
+looked up in TERNARY_SYSTEMS first, then in the candidate_generator.py
+library. Reference calculations (Cu metal, O2 gas, binary oxide) are only
+done at the queued temperatures.
+
+Output: ../../data/tcpython/raw/tier2_equilibria.csv
+  Same columns as ternary_reaction_energies.csv. Rows are appended to an
+  existing file, so repeated screens build up the cache that tier 1 reads.
+
+Run on OSU lab machine:
+  "C:\\Program Files\\Thermo-Calc\\2025b\\python\\python.exe" screen_tier2_equilibria.py
+  "C:\\Program Files\\Thermo-Calc\\2025b\\python\\python.exe" screen_tier2_equilibria.py --queue my_queue.csv
+"""
+
+import argparse
+import csv
+from pathlib import Path
+from datetime import datetime
+
+from tc_python import *
+
+from extract_ternary_reactions import DATABASE, find_phase_gm
+from candidate_generator import generate_candidates
+from reaction_balancer import oxide_X_O
+from ternary_systems import TERNARY_SYSTEMS
+from sweep_telemetry import SweepTelemetry
+
+SCRIPT_DIR = Path(__file__).parent
+QUEUE_FILE = SCRIPT_DIR.parent.parent / "screening" / "tier2_queue.csv"
+OUTPUT_DIR = SCRIPT_DIR.parent.parent / "data" / "tcpython" / "raw"
+OUTPUT_FILE = OUTPUT_DIR / "tier2_equilibria.csv"
+
+FIELDNAMES = [
+    "T_K", "T_C", "oxide", "product", "product_name", "reaction",
+    "GM_system_product", "stable_phases", "ternary_phase_found",
+    "GM_ternary_phase", "G_Cu_metal", "G_O2",
+    "dG_rxn_system_J", "dG_rxn_system_kJ", "notes",
+]
+
+
+def equilibrium(system, T, X_Cu, X_O=None):
+    calc = system.with_single_equilibrium_calculation()
+    calc.set_condition(ThermodynamicQuantity.temperature(), T)
+    calc.set_condition(ThermodynamicQuantity.pressure(), 101325)
+    if X_Cu is not None:
+        calc.set_condition(
+            ThermodynamicQuantity.mole_fraction_of_a_component("CU"), X_Cu)
+    if X_O is not None:
+        calc.set_condition(
+            ThermodynamicQuantity.mole_fraction_of_a_component("O"), X_O)
+    return calc.calculate()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run queued tier-2 equilibria.")
+    parser.add_argument("--queue", default=str(QUEUE_FILE),
+                        help="tier2_queue.csv written by tiered_screening.py")
+    args = parser.parse_args()
+
+    with open(args.queue) as f:
+        queue = [(r["product"], float(r["T_K"])) for r in csv.DictReader(f)]
+
+    # product -> (metal, reactant oxide, ternary definition); the hand-written
+    # TERNARY_SYSTEMS take precedence over the generated library
+    products = {}
+    for sys_def in TERNARY_SYSTEMS:
+        for tern in sys_def["ternaries"]:
+            products[tern["product"]] = (sys_def["metal"], sys_def["oxide"], tern)
+    for cand in generate_candidates():
+        products.setdefault(cand["product"], (cand["metal"], cand["oxide"], cand))
+
+    unknown = sorted({p for p, _ in queue if p not in products})
+    queue = [(p, T) for p, T in queue if p in products]
+    temperatures = sorted({T for _, T in queue})
+
+    print("=" * 70)
+    print("TC-Python: Tier-2 equilibria for the tiered screen")
+    print("=" * 70)
+    print(f"Database: {DATABASE}")
+    print(f"Queue: {args.queue} ({len(queue)} points, {len(temperatures)} temperatures)")
+    if unknown:
+        print(f"Skipping unknown products: {', '.join(unknown)}")
+    print(f"Output: {OUTPUT_FILE}")
+    print(f"Started: {datetime.now().isoformat()}")
+    tel = SweepTelemetry("screen_tier2_equilibria", DATABASE)
+    print(f"Telemetry: {tel.path}")
+    print()
+
+    if not queue:
+        print("Nothing to do.")
+        return
+
+    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+    all_rows = []
+
+    with TCPython() as session:
+        print("Connected to Thermo-Calc\n")
+
+        print("--- Getting Cu metal and O2 gas references ---")
+        try:
+            cu_system = (session
+                         .select_database_and_elements(DATABASE, ["CU", "O"])
+                         .get_system())
+            o2_system = (session
+                         .select_database_and_elements(DATABASE, ["O"])
+                         .get_system())
+            G_Cu_metal = {}
+            G_O2 = {}
+            for T in temperatures:
+                G_Cu_metal[T] = equilibrium(cu_system, T, None, 0.0001).get_value_of("GM")
+                G_O2[T] = 2 * equilibrium(o2_system, T, None).get_value_of("GM")
+        except Exception as e:
+            print(f"  ERROR getting references: {e}\n")
+            return
+
+        # Group the queue by ternary system so each system is set up once
+        by_metal = {}
+        for product, T in queue:
+            by_metal.setdefault(products[product][0], []).append((product, T))
+
+        for metal_el, points in by_metal.items():
+            oxide_name = products[points[0][0]][1]
+            X_O_oxide = oxide_X_O(oxide_name)
+            print(f"\n--- Cu-{metal_el}-O ({len(points)} points) ---")
+
+            try:
+                ternary_system = (session
+                                  .select_database_and_elements(
+                                      DATABASE, ["CU", metal_el, "O"])
+                                  .get_system())
+            except Exception as e:
+                print(f"  SYSTEM SETUP ERROR: {e}")
+                continue
+
+            G_binary_oxide = {}
+            for T in sorted({T for _, T in points}):
+                try:
+                    G_binary_oxide[T] = equilibrium(
+                        ternary_system, T, 0.0001,
+                        X_O_oxide).get_value_of("GM")
+                except Exception:
+                    G_binary_oxide[T] = None
+
+            success = 0
+            for product, T in points:
+                tern = products[product][2]
+                row = {
+                    "T_K": T,
+                    "T_C": T - 273.15,
+                    "oxide": oxide_name,
+                    "product": product,
+                    "product_name": tern["name"],
+                    "reaction": tern["reaction"],
+                    "G_Cu_metal": G_Cu_metal[T],
+                    "G_O2": G_O2[T],
+                }
+                ev = tel.start(f"Cu-{metal_el}-O", T_K=T, product=product,
+                               X_Cu=round(tern["X_Cu"], 6), X_O=round(tern["X_O"], 6))
+                try:
+                    result = equilibrium(ternary_system, T, tern["X_Cu"], tern["X_O"])
+                    stable = result.get_stable_phases()
+                    GM_system = result.get_value_of("GM")
+                    gm_ternary, ternary_phase = find_phase_gm(result, tern["phase_hints"])
+
+                    row["GM_system_product"] = GM_system
+                    row["stable_phases"] = "; ".join(stable)
+                    row["ternary_phase_found"] = ternary_phase if ternary_phase else ""
+                    row["GM_ternary_phase"] = gm_ternary if gm_ternary else ""
+
+                    # Same dG_rxn as extract_ternary_reactions.py
+                    G_oxide_ref = G_binary_oxide.get(T)
+                    if G_oxide_ref is not None:
+                        G_products = GM_system * tern["atoms_per_formula"]
+                        G_reactants = (tern["n_Cu"] * G_Cu_metal[T]
+                                       + tern["n_oxide_fu"] * tern["oxide_atoms"] * G_oxide_ref
+                                       + tern["n_O2"] * G_O2[T])
+                        dG_rxn_J = G_products - G_reactants
+                        row["dG_rxn_system_J"] = dG_rxn_J
+                        row["dG_rxn_system_kJ"] = dG_rxn_J / 1000
+                        row["notes"] = "tier 2"
+                    else:
+                        row["dG_rxn_system_J"] = ""
+                        row["dG_rxn_system_kJ"] = ""
+                        row["notes"] = "No binary oxide reference"
+
+                    success += 1
+                    tel.ok(ev, phases=stable)
+                except Exception as e:
+                    tel.fail(ev, e)
+                    row["GM_system_product"] = ""
+                    row["stable_phases"] = f"ERROR: {e}"
+                    row["ternary_phase_found"] = ""
+                    row["GM_ternary_phase"] = ""
+                    row["dG_rxn_system_J"] = ""
+                    row["dG_rxn_system_kJ"] = ""
+                    row["notes"] = str(e)
+
+                all_rows.append(row)
+
+            print(f"  Completed: {success}/{len(points)} points")
+
+    tel.close()
+
+    new_file = not OUTPUT_FILE.exists()
+    with open(OUTPUT_FILE, 'a', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=FIELDNAMES)
+        if new_file:
+            writer.writeheader()
+        writer.writerows(all_rows)
+
+    print(f"\n{'='*70}")
+    print(f"CSV appended: {OUTPUT_FILE} ({len(all_rows)} rows)")
+    print(f"Finished: {datetime.now().isoformat()}")
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    main()
@@ -31,6 +31,8 @@ from datetime import datetime
 
 from tc_python import *
 
+from sweep_telemetry import SweepTelemetry
+
 # =============================================================================
 # Configuration
 # =============================================================================
@@ -109,6 +111,8 @@ def main():
     print("Systems: {}".format(", ".join(s["name"] for s in SYSTEMS)))
     print("Output: {}".format(OUTPUT_FILE))
     print("Started: {}".format(datetime.now().isoformat()))
+    tel = SweepTelemetry("slag_composition_effects", DATABASE)
+    print("Telemetry: {}".format(tel.path))
     print()
 
     OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
@@ -177,6 +181,8 @@ def main():
                     "X_O": round(X_O, 6),
                 }
 
+                ev = tel.start(sys_name, T_K=T_FIXED, ratio_value=round(R, 4),
+                               X_Cu=X_CU_FIXED, X_O=row["X_O"])
                 try:
                     calc = system.with_single_equilibrium_calculation()
                     calc.set_condition(ThermodynamicQuantity.temperature(), T_FIXED)
@@ -200,8 +206,10 @@ def main():
                     row["stable_phases"] = "; ".join(stable)
                     row["notes"] = ""
                     success += 1
+                    tel.ok(ev, phases=stable)
 
                 except Exception as e:
+                    tel.fail(ev, e)
                     row["a_Cu"] = ""
                     row["stable_phases"] = "ERROR: {}".format(e)
                     row["notes"] = str(e)
@@ -232,6 +240,8 @@ def main():
                     print("  Trend: non-monotonic")
             print()
 
+    tel.close()
+
     # =========================================================================
     # Write CSV
     # =========================================================================
@@ -0,0 +1,290 @@
+"""
+Surface boundary-condition table for the DICTRA particle model.
+
+cu_removal_rate.py holds the steel at the particle surface at a fixed
+CU_SURFACE_WT = 0.01 wt% for every oxide and temperature, because the
+activity BC lets DICTRA pick the Cu-rich root of the Fe-Cu miscibility gap.
+This script does the root selection itself, once per (oxide, T), so the
+sweep can keep a fixed-composition BC that is oxide-specific:
+
+  1. Surface Cu activity from the capture reaction
+       n_Cu Cu + MOx + n_O2 O2 -> CuMOy
+     at equilibrium, with pure product and parent oxide:
+       a_Cu = exp(dG_pure / (n_Cu R T)) * pO2^(-n_O2 / n_Cu)
+     (pure liquid Cu reference; the AC(CU) values in cu_activity_vs_oxide.csv
+     are relative to SER, ~6e-4 for pure liquid Cu at 1800 K, so they are
+     not used here). dG_pure per product comes from
+     data/tcpython/processed/activity_corrected_dG.csv, and every parent
+     oxide takes the product that gives the lowest a_Cu. pO2 is 1 atm, the
+     condition the screening verdicts use, and air.
+  2. Fe-rich root in TCFE13: the steel phase of cu_removal_rate.py at this T
+     (LIQUID above LIQUIDUS_K, FCC_A1 below), alone and homogeneous (no
+     global minimization, so the metastable branch inside the gap is
+     evaluated), activity of Cu relative to pure liquid Cu. X_Cu is scanned
+     upward from the dilute end; the first crossing of the target is
+     bisected. If a_Cu(X) turns over (spinodal) before reaching the target,
+     there is no Fe-rich root and the entry is flagged.
+
+status per entry:
+  ok                surface Cu below the bulk 0.30 wt%: the oxide removes Cu
+  no_driving_force  the Fe-rich root is at or above the bulk composition
+  above_spinodal    the target activity is above the Fe-rich branch maximum
+  failed            the equilibrium calculations failed
+
+Temperatures are those of cu_removal_rate.py; the dG data stop at 1900 K and
+are extrapolated linearly above (dG_extrapolated = 1).
+
+Run on OSU VM:
+  "C:\\Program Files\\Thermo-Calc\\2025b\\python\\python.exe" surface_bc_table.py
+
+Expected runtime: ~2-4 minutes (about 1,000 single-phase equilibria).
+
+Output: data/tcpython/raw/surface_bc_table.csv
+Then:   cu_removal_rate.py --oxide FeO   (or MnO; --po2 air)
+
+Honda CALPHAD Project - MSE 4381 Capstone
+"""
+
+from datetime import datetime
+import csv
+import math
+import os
+import sys
+import traceback
+
+from sweep_telemetry import SweepTelemetry
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+DATA_DIR = os.path.join(SCRIPT_DIR, "..", "..", "data", "tcpython")
+DG_CSV = os.path.join(DATA_DIR, "processed", "activity_corrected_dG.csv")
+OUTPUT_CSV = os.path.join(DATA_DIR, "raw", "surface_bc_table.csv")
+
+# ===========================================================================
+# PARAMETERS
+# ===========================================================================
+
+# Same sweep and steel as cu_removal_rate.py
+TEMPS_K = list(range(1673, 1924, 25))
+LIQUIDUS_K = 1800
+CU_INIT_WT = 0.30
+THERMO_DB = "TCFE13"
+ELEMENTS = ["FE", "CU"]
+
+PO2_ATM = {"1atm": 1.0, "air": 0.21}
+
+R_GAS = 8.314
+M_CU, M_FE = 63.546, 55.845
+
+# Fe-rich branch scan: log-spaced X_Cu, then bisection in ln X
+X_SCAN_MIN = 1e-8
+X_SCAN_MAX = 0.5
+N_SCAN = 80
+N_BISECT = 40
+LN_A_TOL = 1e-6
+
+FIELDS = ["oxide", "product", "po2", "pO2_atm", "temp_K", "phase",
+          "dG_pure_kJ", "dG_extrapolated", "a_cu_eq", "a_cu_bulk",
+          "x_cu_surface", "cu_surface_wt_pct", "status"]
+
+
+def x_to_wt(x):
+    return 100 * x * M_CU / (x * M_CU + (1 - x) * M_FE)
+
+
+def wt_to_x(w):
+    return (w / M_CU) / (w / M_CU + (100 - w) / M_FE)
+
+
+def load_dg(path=DG_CSV):
+    """{(parent_oxide, product): (n_Cu, n_O2, [(T, dG_pure_kJ)] sorted)}"""
+    table = {}
+    with open(path) as f:
+        for row in csv.DictReader(f):
+            key = (row["parent_oxide"], row["product"])
+            entry = table.setdefault(key, (float(row["n_Cu"]), float(row["n_O2"]), []))
+            entry[2].append((float(row["T_K"]), float(row["dG_pure_kJ"])))
+    for _, _, pts in table.values():
+        pts.sort()
+    return table
+
+
+def dg_at(points, temp_K):
+    """Linear interpolation in T; linear extrapolation past either end."""
+    if len(points) == 1:
+        return points[0][1], temp_K != points[0][0]
+    for (t1, g1), (t2, g2) in zip(points, points[1:]):
+        if temp_K <= t2:
+            break
+    extrapolated = temp_K < points[0][0] or temp_K > points[-1][0]
+    return g1 + (g2 - g1) * (temp_K - t1) / (t2 - t1), extrapolated
+
+
+def surface_activity(dg_table, temp_K, p_o2):
+    """{parent_oxide: (product, dG_pure_kJ, extrapolated, a_Cu)}, lowest a_Cu."""
+    best = {}
+    for (oxide, product), (n_cu, n_o2, pts) in dg_table.items():
+        dg, extrap = dg_at(pts, temp_K)
+        a = math.exp(dg * 1e3 / (n_cu * R_GAS * temp_K)) * p_o2 ** (-n_o2 / n_cu)
+        if oxide not in best or a < best[oxide][3]:
+            best[oxide] = (product, dg, extrap, a)
+    return best
+
+
+# ===========================================================================
+
+STARTED = datetime.now().isoformat()
+TELEMETRY = SweepTelemetry("surface_bc_table", THERMO_DB)
+
+print("=" * 75)
+print("SURFACE BC TABLE - Fe-rich root of the oxide/steel equilibrium")
+print("Honda CALPHAD - Cu Removal from Recycled Steel")
+print("Started: %s" % STARTED)
+print("=" * 75)
+print()
+
+DG_TABLE = load_dg()
+OXIDES = sorted({oxide for oxide, _ in DG_TABLE})
+print("  Oxides:         %s" % ", ".join(OXIDES))
+print("  Temperatures:   %d-%d K (%d)" % (TEMPS_K[0], TEMPS_K[-1], len(TEMPS_K)))
+print("  pO2:            %s" % ", ".join("%s (%g atm)" % kv for kv in PO2_ATM.items()))
+print("  Bulk Cu:        %.2f wt%%" % CU_INIT_WT)
+print("  Telemetry:      %s" % TELEMETRY.path)
+print()
+
+try:
+    from tc_python import *
+    print("tc_python imported successfully.")
+except ImportError:
+    print("ERROR: tc_python not available. Run on OSU VM.")
+    sys.exit(1)
+
+_tcp_ctx = TCPython()
+session = _tcp_ctx.__enter__()
+
+try:
+    system = (session
+              .select_database_and_elements(THERMO_DB, ELEMENTS)
+              .without_default_phases()
+              .select_phase("LIQUID")
+              .select_phase("FCC_A1")
+              .get_system())
+except Exception as e:
+    print("FATAL: Could not load system: %s" % e)
+    traceback.print_exc()
+    sys.exit(1)
+
+
+def activity(temp_K, phase, x_cu):
+    """a_Cu (pure liquid Cu reference) in homogeneous `phase` at x_cu."""
+    other = "FCC_A1" if phase == "LIQUID" else "LIQUID"
+    calc = (system.with_single_equilibrium_calculation()
+            .with_reference_state("CU", "LIQUID")
+            .disable_global_minimization())
+    calc.set_phase_to_suspended(other)
+    calc.set_condition(ThermodynamicQuantity.temperature(), temp_K)
+    calc.set_condition(ThermodynamicQuantity.pressure(), 101325)
+    calc.set_condition(
+        ThermodynamicQuantity.mole_fraction_of_a_component("CU"), x_cu)
+    return calc.calculate().get_value_of("ACR(CU)")
+
+
+def fe_rich_root(temp_K, phase, scan, target):
+    """
+    X_Cu on the Fe-rich branch with a_Cu = target, or (None, status).
+    scan is [(x, a)] ascending in x from the dilute end.
+    """
+    if target <= scan[0][1]:
+        return scan[0][0] * target / scan[0][1], "ok"     # Henry's law
+    for (x1, a1), (x2, a2) in zip(scan, scan[1:]):
+        if a2 < a1:
+            return None, "above_spinodal"
+        if a2 >= target:
+            break
+    else:
+        return None, "above_spinodal"
+    lo, hi = math.log(x1), math.log(x2)
+    for _ in range(N_BISECT):
+        mid = 0.5 * (lo + hi)
+        ln_a = math.log(activity(temp_K, phase, math.exp(mid)))
+        if abs(ln_a - math.log(target)) < LN_A_TOL:
+            break
+        if ln_a < math.log(target):
+            lo = mid
+        else:
+            hi = mid
+    return math.exp(0.5 * (lo + hi)), "ok"
+
+
+# ===========================================================================
+# TABLE
+# ===========================================================================
+
+rows = []
+x_bulk = wt_to_x(CU_INIT_WT)
+
+for temp_K in TEMPS_K:
+    phase = "LIQUID" if temp_K >= LIQUIDUS_K else "FCC_A1"
+    ev = TELEMETRY.start("-".join(ELEMENTS), temp_K=temp_K, phase=phase)
+    try:
+        step = (math.log(X_SCAN_MAX) - math.log(X_SCAN_MIN)) / (N_SCAN - 1)
+        scan = [(x, activity(temp_K, phase, x)) for x in
+                (X_SCAN_MIN * math.exp(k * step) for k in range(N_SCAN))]
+        a_bulk = activity(temp_K, phase, x_bulk)
+        TELEMETRY.ok(ev, phases=[phase])
+    except Exception as e:
+        TELEMETRY.fail(ev, e, phases=[phase])
+        print("%d K %s: activity scan FAILED: %s" % (temp_K, phase, str(e)[:100]))
+        scan, a_bulk = None, float("nan")
+
+    print("%d K (%s): a_Cu(bulk %.2f wt%%) = %.4g" % (
+        temp_K, phase, CU_INIT_WT, a_bulk))
+    for po2, p_o2 in PO2_ATM.items():
+        for oxide, (product, dg, extrap, a_eq) in sorted(
+                surface_activity(DG_TABLE, temp_K, p_o2).items()):
+            row = {"oxide": oxide, "product": product, "po2": po2,
+                   "pO2_atm": p_o2, "temp_K": temp_K, "phase": phase,
+                   "dG_pure_kJ": round(dg, 3), "dG_extrapolated": int(extrap),
+                   "a_cu_eq": a_eq, "a_cu_bulk": a_bulk,
+                   "x_cu_surface": "", "cu_surface_wt_pct": ""}
+            if scan is None:
+                row["status"] = "failed"
+            else:
+                try:
+                    x, status = fe_rich_root(temp_K, phase, scan, a_eq)
+                except Exception as e:
+                    x, status = None, "failed"
+                    print("    %s: root FAILED: %s" % (oxide, str(e)[:100]))
+                if x is not None:
+                    row["x_cu_surface"] = x
+                    row["cu_surface_wt_pct"] = x_to_wt(x)
+                    if x >= x_bulk:
+                        status = "no_driving_force"
+                row["status"] = status
+            rows.append(row)
+            print("    %-6s %-5s %-8s a_eq = %.3e  surface = %-10s %s" % (
+                oxide, po2, product, a_eq,
+                "%.4g wt%%" % row["cu_surface_wt_pct"]
+                if row["cu_surface_wt_pct"] != "" else "-", row["status"]))
+
+TELEMETRY.close()
+
+# ===========================================================================
+# WRITE CSV
+# ===========================================================================
+
+try:
+    os.makedirs(os.path.dirname(OUTPUT_CSV), exist_ok=True)
+except Exception:
+    pass
+
+with open(OUTPUT_CSV, "w", newline="") as f:
+    writer = csv.DictWriter(f, fieldnames=FIELDS)
+    writer.writeheader()
+    writer.writerows(rows)
+
+print()
+print("=" * 75)
+print("Entries: %d (%d ok)" % (len(rows), sum(r["status"] == "ok" for r in rows)))
+print("Output: %s" % OUTPUT_CSV)
+print("Finished: %s" % datetime.now().isoformat())
+print("=" * 75)
@@ -0,0 +1,296 @@
+#!/usr/bin/env python3
+"""
+Split long TC-Python sweeps across several lab machines and merge the results.
+
+Every sweep script builds an ordered list of points (temperature x radius x
+time, composition grid points, ...). With `--shard i/K` a script only runs
+the points whose canonical index j satisfies j % K == i - 1. Round-robin
+assignment spreads slow regions of the sweep (e.g. the liquid-steel
+temperatures) evenly over all K machines.
+
+Sharded runs write tagged outputs next to the canonical CSV:
+  ternary_phase_map_1800K.shard2of4.csv        (rows + point_index column)
+  ternary_phase_map_1800K.shard2of4.csv.json   (manifest)
+
+The manifest records which shard ran, the total number of sweep points and
+whether the run reached the end, so the merge step can prove that every
+point was covered before writing the canonical CSV.
+
+Usage on each lab machine:
+  python.exe ternary_phase_map_1800K.py --shard 1/4
+  python.exe ternary_phase_map_1800K.py --shard 2/4
+  ...
+
+Merge (locally or on the VM, plain Python, no TC-Python needed):
+  python3 sweep_shards.py merge ../../data/tcpython/raw/ternary_phase_map_1800K.csv
+  python3 sweep_shards.py merge <canonical.csv> --from "March 12 7 pm" --from "March 12 745PM"
+
+Overlapping points (a shard re-run, or shards from two different K splits)
+are deduplicated: successful rows win over failed rows, and among equals the
+most recently finished run wins.
+
+Honda CALPHAD Project - MSE 4381 Capstone
+"""
+
+from datetime import datetime
+import argparse
+import csv
+import glob
+import json
+import os
+import re
+import sys
+
+SHARD_RE = re.compile(r"^\s*(\d+)\s*/\s*(\d+)\s*$")
+SHARD_TAG_RE = re.compile(r"\.shard(\d+)of(\d+)\.csv$")
+
+POINT_INDEX = "point_index"
+
+
+# ===========================================================================
+# SHARD SELECTION (used by the sweep scripts)
+# ===========================================================================
+
+def parse_shard(spec):
+    """Parse an "i/K" string into a (i, K) tuple with 1 <= i <= K."""
+    m = SHARD_RE.match(spec or "")
+    if not m:
+        raise ValueError("shard must look like i/K (e.g. 2/4), got %r" % spec)
+    i, k = int(m.group(1)), int(m.group(2))
+    if k < 1 or not 1 <= i <= k:
+        raise ValueError("shard index must satisfy 1 <= i <= K, got %s" % spec)
+    return i, k
+
+
+def shard_from_argv(argv=None):
+    """Read an optional --shard i/K from the command line.
+
+    Returns None when the script should run the full sweep. Unknown
+    arguments are ignored so scripts can keep their own options.
+    """
+    parser = argparse.ArgumentParser(add_help=False)
+    parser.add_argument("--shard", default=None)
+    args, _ = parser.parse_known_args(sys.argv[1:] if argv is None else argv)
+    if args.shard is None:
+        return None
+    return parse_shard(args.shard)
+
+
+def in_shard(point_index, shard):
+    """True if canonical point `point_index` belongs to `shard` (or no shard)."""
+    if shard is None:
+        return True
+    i, k = shard
+    return point_index % k == i - 1
+
+
+def shard_points(points, shard):
+    """Return [(point_index, point), ...] for the points assigned to `shard`."""
+    return [(j, p) for j, p in enumerate(points) if in_shard(j, shard)]
+
+
+def shard_label(shard):
+    return "full sweep" if shard is None else "shard %d/%d" % shard
+
+
+def shard_output_path(path, shard):
+    """Tag a canonical output path with the shard, e.g. x.csv -> x.shard2of4.csv."""
+    if shard is None:
+        return str(path)
+    root, ext = os.path.splitext(str(path))
+    return "%s.shard%dof%d%s" % (root, shard[0], shard[1], ext or ".csv")
+
+
+def write_shard_csv(path, fieldnames, rows, shard, n_total, started,
+                    fail_column=None, fail_prefix=None, fail_value=None):
+    """Write a shard-tagged CSV plus its JSON manifest.
+
+    `rows` must carry a "point_index" key (canonical index in the full
+    sweep). `fail_column` plus `fail_prefix` (text such as "ERROR") or
+    `fail_value` (an exact numeric sentinel such as -1) tell the merge step
+    how to spot a failed point so that a successful re-run can replace it.
+    """
+    out_path = shard_output_path(path, shard)
+    with open(out_path, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=[POINT_INDEX] + list(fieldnames))
+        writer.writeheader()
+        writer.writerows(rows)
+
+    manifest = {
+        "canonical": os.path.basename(str(path)),
+        "shard": "%d/%d" % shard,
+        "n_total": n_total,
+        "n_assigned": len([j for j in range(n_total) if in_shard(j, shard)]),
+        "n_rows": len(rows),
+        "fail_column": fail_column,
+        "fail_prefix": fail_prefix,
+        "fail_value": fail_value,
+        "host": os.environ.get("COMPUTERNAME") or os.environ.get("HOSTNAME", ""),
+        "started": started,
+        "finished": datetime.now().isoformat(),
+        "complete": True,
+    }
+    with open(out_path + ".json", "w") as f:
+        json.dump(manifest, f, indent=2)
+    return out_path
+
+
+# ===========================================================================
+# MERGE
+# ===========================================================================
+
+def find_shard_files(canonical, extra_dirs=()):
+    """Find all shard CSVs for `canonical` in its folder and `extra_dirs`."""
+    root, _ = os.path.splitext(os.path.basename(str(canonical)))
+    dirs = [os.path.dirname(os.path.abspath(str(canonical)))] + list(extra_dirs)
+    found = []
+    for d in dirs:
+        pattern = os.path.join(glob.escape(d), root + ".shard*of*.csv")
+        found.extend(sorted(glob.glob(pattern)))
+    return found
+
+
+def load_shard(path):
+    """Read one shard CSV and its manifest. Returns (manifest, fieldnames, rows)."""
+    m = SHARD_TAG_RE.search(path)
+    if not m:
+        raise ValueError("not a shard file: %s" % path)
+    manifest_path = path + ".json"
+    if os.path.exists(manifest_path):
+        with open(manifest_path) as f:
+            manifest = json.load(f)
+    else:
+        # Shard copied without its manifest: the run cannot be proven complete
+        manifest = {"shard": "%s/%s" % m.groups(), "complete": False}
+    with open(path, newline="") as f:
+        reader = csv.DictReader(f)
+        fieldnames = [c for c in reader.fieldnames if c != POINT_INDEX]
+        rows = list(reader)
+    return manifest, fieldnames, rows
+
+
+def _is_failed(rows, manifest):
+    col = manifest.get("fail_column")
+    prefix = manifest.get("fail_prefix")
+    value = manifest.get("fail_value")
+    if value is None and prefix == "-1":
+        value = -1          # manifests written before fail_value existed
+    if not col:
+        return False
+    if value is not None:
+        return any(_as_float(r.get(col)) == value for r in rows)
+    if prefix is None:
+        return False
+    return any(str(r.get(col, "")).startswith(prefix) for r in rows)
+
+
+def _as_float(cell):
+    try:
+        return float(cell)
+    except (TypeError, ValueError):
+        return None
+
+
+def merge_shards(canonical, extra_dirs=(), allow_incomplete=False):
+    """Merge shard CSVs into the canonical CSV.
+
+    Returns (n_points, problems). Raises RuntimeError if coverage is
+    incomplete and `allow_incomplete` is False.
+    """
+    paths = find_shard_files(canonical, extra_dirs)
+    if not paths:
+        raise RuntimeError("no shard files found for %s" % canonical)
+
+    problems = []
+    fieldnames = None
+    n_total = None
+    covered = set()
+    # point_index -> (rank, rows); rank = (succeeded, finished timestamp)
+    best = {}
+
+    for path in paths:
+        manifest, fields, rows = load_shard(path)
+        i, k = parse_shard(manifest["shard"])
+        name = os.path.relpath(path)
+
+        if fieldnames is None:
+            fieldnames = fields
+        elif fields != fieldnames:
+            raise RuntimeError("column mismatch in %s" % name)
+
+        if not manifest.get("complete"):
+            problems.append("%s: run did not finish (no complete manifest)" % name)
+            continue
+
+        if n_total is None:
+            n_total = manifest["n_total"]
+        elif manifest["n_total"] != n_total:
+            raise RuntimeError("%s: sweep has %d points, other shards %d "
+                               "(different sweep configuration?)"
+                               % (name, manifest["n_total"], n_total))
+
+        covered.update(j for j in range(n_total) if j % k == i - 1)
+
+        groups = {}
+        for r in rows:
+            groups.setdefault(int(r[POINT_INDEX]), []).append(r)
+        for j, group in groups.items():
+            rank = (not _is_failed(group, manifest), manifest.get("finished", ""))
+            if j not in best or rank > best[j][0]:
+                best[j] = (rank, group)
+
+    if n_total is None:
+        raise RuntimeError("no complete shard runs for %s" % canonical)
+
+    missing = sorted(set(range(n_total)) - covered)
+    if missing:
+        problems.append("%d of %d sweep points not covered by any finished "
+                        "shard (first: %s)" % (len(missing), n_total, missing[:10]))
+    n_failed = sum(1 for (ok, _), _ in best.values() if not ok)
+    if n_failed:
+        problems.append("%d points failed in every shard that ran them" % n_failed)
+
+    if missing and not allow_incomplete:
+        raise RuntimeError("; ".join(problems))
+
+    with open(str(canonical), "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction="ignore")
+        writer.writeheader()
+        for j in sorted(best):
+            writer.writerows(best[j][1])
+
+    return len(best), problems
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Merge shard-tagged sweep outputs into the canonical CSV.")
+    sub = parser.add_subparsers(dest="command", required=True)
+    mp = sub.add_parser("merge", help="merge shards into the canonical CSV")
+    mp.add_argument("canonical", nargs="+",
+                    help="canonical CSV path(s), e.g. ../../data/tcpython/raw/"
+                         "cu_removal_rate_summary.csv")
+    mp.add_argument("--from", dest="extra_dirs", action="append", default=[],
+                    help="extra folder holding copied shard files (repeatable)")
+    mp.add_argument("--allow-incomplete", action="store_true",
+                    help="write the CSV even if some points are not covered")
+    args = parser.parse_args()
+
+    status = 0
+    for canonical in args.canonical:
+        print("Merging: %s" % canonical)
+        try:
+            n, problems = merge_shards(canonical, args.extra_dirs,
+                                       args.allow_incomplete)
+        except RuntimeError as e:
+            print("  FAILED: %s" % e)
+            status = 1
+            continue
+        for p in problems:
+            print("  WARNING: %s" % p)
+        print("  Wrote %d points" % n)
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+"""
+Per-calculation timing and failure telemetry for TC-Python sweeps.
+
+Each sweep script appends one JSON line per equilibrium / DICTRA
+calculation to data/tcpython/logs/telemetry/<script>_<timestamp>.jsonl:
+
+  {"ts": "2026-03-14T21:21:04", "script": "cu_removal_rate",
+   "run_id": "20260314-212104", "backend": "TCFE13+MOBFE8",
+   "system": "Fe-Cu", "conditions": {"temp_K": 1823, "radius_um": 50, ...},
+   "wall_s": 1.84, "ok": true, "error": "", "phases": ["LIQUID"],
+   "shard": "2/4"}
+
+Lines are flushed as they are written, so a run that crashes or is killed
+on the VM still leaves a usable record of every finished point.
+
+Usage inside a sweep script:
+
+  tel = SweepTelemetry("ternary_phase_map_1800K", backend="TCOX14")
+  ev = tel.start("Cu-Al-O", T_K=1800, X_Cu=0.01, X_O=0.2)
+  try:
+      result = calc.calculate()
+      tel.ok(ev, phases=result.get_stable_phases())
+  except Exception as e:
+      tel.fail(ev, e)
+
+Analyzer (plain Python, runs locally):
+  python3 sweep_telemetry.py analyze                      (all runs)
+  python3 sweep_telemetry.py analyze run1.jsonl --top 20 --by T_K
+
+Honda CALPHAD Project - MSE 4381 Capstone
+"""
+
+from datetime import datetime
+import argparse
+import glob
+import json
+import math
+import os
+import sys
+import time
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+TELEMETRY_DIR = os.path.join(SCRIPT_DIR, "..", "..", "data", "tcpython",
+                             "logs", "telemetry")
+
+
+# ===========================================================================
+# RECORDING
+# ===========================================================================
+
+class SweepTelemetry:
+    """Append-only JSONL event stream for one sweep run."""
+
+    def __init__(self, script, backend, shard=None, path=None):
+        self.script = script
+        self.backend = backend
+        self.shard = None if shard is None else "%d/%d" % tuple(shard)
+        self.run_id = datetime.now().strftime("%Y%m%d-%H%M%S")
+        if path is None:
+            tag = "" if shard is None else "_shard%dof%d" % tuple(shard)
+            path = os.path.join(TELEMETRY_DIR, "%s_%s%s.jsonl" % (
+                script, self.run_id, tag))
+        self.path = path
+        self._fh = None
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+            self._fh = open(path, "a")
+        except OSError as e:
+            # Telemetry must never stop a VM run
+            print("WARNING: telemetry disabled (%s)" % e)
+
+    def start(self, system, **conditions):
+        """Begin timing one calculation. Returns an event dict."""
+        return {"system": system, "conditions": conditions,
+                "_t0": time.perf_counter()}
+
+    def ok(self, event, phases=None):
+        self._emit(event, True, "", phases)
+
+    def fail(self, event, exc, phases=None):
+        self._emit(event, False, str(exc), phases)
+
+    def _emit(self, event, ok, error, phases):
+        wall_s = time.perf_counter() - event["_t0"]
+        if self._fh is None:
+            return
+        record = {
+            "ts": datetime.now().isoformat(timespec="seconds"),
+            "script": self.script,
+            "run_id": self.run_id,
+            "backend": self.backend,
+            "system": event["system"],
+            "conditions": event["conditions"],
+            "wall_s": round(wall_s, 4),
+            "ok": ok,
+            "error": error[:500],
+            "phases": list(phases) if phases else [],
+            "shard": self.shard,
+        }
+        self._fh.write(json.dumps(record) + "\n")
+        self._fh.flush()
+
+    def close(self):
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
+
+
+# ===========================================================================
+# ANALYSIS
+# ===========================================================================
+
+def load_events(paths):
+    """Read events from JSONL files; malformed lines are skipped."""
+    events = []
+    for path in paths:
+        with open(path) as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    events.append(json.loads(line))
+                except ValueError:
+                    pass
+    return events
+
+
+def percentile(values, q):
+    """Linear-interpolated percentile of a non-empty list (q in 0-100)."""
+    v = sorted(values)
+    pos = (len(v) - 1) * q / 100.0
+    lo = int(math.floor(pos))
+    hi = min(lo + 1, len(v) - 1)
+    return v[lo] + (v[hi] - v[lo]) * (pos - lo)
+
+
+def latency_histogram(walls, bins_per_decade=2):
+    """Log-spaced histogram of wall times. Returns [(lo_s, hi_s, count), ...]."""
+    walls = [w for w in walls if w > 0]
+    if not walls:
+        return []
+    lo_exp = math.floor(math.log10(min(walls)) * bins_per_decade)
+    hi_exp = math.floor(math.log10(max(walls)) * bins_per_decade)
+    counts = {}
+    for w in walls:
+        e = math.floor(math.log10(w) * bins_per_decade)
+        counts[e] = counts.get(e, 0) + 1
+    return [(10 ** (e / bins_per_decade), 10 ** ((e + 1) / bins_per_decade),
+             counts.get(e, 0)) for e in range(lo_exp, hi_exp + 1)]
+
+
+def format_conditions(cond):
+    return ", ".join("%s=%s" % (k, v) for k, v in cond.items())
+
+
+def summarize(events, top=10, by=None):
+    """Print per-system latency stats, histogram, slowest points and failures."""
+    if not events:
+        print("No telemetry events found.")
+        return
+
+    systems = {}
+    for ev in events:
+        key = "%s | %s" % (ev.get("script", "?"), ev.get("system", "?"))
+        systems.setdefault(key, []).append(ev)
+
+    print("=" * 90)
+    print("PER-SYSTEM LATENCY (%d calculations, %d runs)" % (
+        len(events), len(set(e.get("run_id") for e in events))))
+    print("=" * 90)
+    print("%-40s  %6s  %5s  %8s  %8s  %8s  %9s" % (
+        "Script | system", "N", "Fail", "p50 (s)", "p90 (s)", "max (s)",
+        "total (s)"))
+    print("-" * 90)
+    for key in sorted(systems, key=lambda k: -sum(e["wall_s"] for e in systems[k])):
+        evs = systems[key]
+        walls = [e["wall_s"] for e in evs]
+        n_fail = sum(1 for e in evs if not e.get("ok"))
+        print("%-40s  %6d  %5d  %8.3f  %8.3f  %8.3f  %9.1f" % (
+            key[:40], len(evs), n_fail, percentile(walls, 50),
+            percentile(walls, 90), max(walls), sum(walls)))
+
+    print()
+    print("LATENCY HISTOGRAM (all calculations)")
+    print("-" * 90)
+    hist = latency_histogram([e["wall_s"] for e in events])
+    peak = max(c for _, _, c in hist) if hist else 1
+    for lo, hi, count in hist:
+        bar = "#" * int(round(50.0 * count / peak))
+        print("  %9.3g - %-9.3g s  %6d  %s" % (lo, hi, count, bar))
+
+    print()
+    print("SLOWEST %d POINTS" % top)
+    print("-" * 90)
+    for ev in sorted(events, key=lambda e: -e["wall_s"])[:top]:
+        print("  %8.2f s  %-4s  %-12s  %s" % (
+            ev["wall_s"], "OK" if ev.get("ok") else "FAIL",
+            ev.get("system", "?"), format_conditions(ev.get("conditions", {}))))
+
+    failures = [e for e in events if not e.get("ok")]
+    print()
+    print("FAILURE MAP (%d failures)" % len(failures))
+    print("-" * 90)
+    if not failures:
+        print("  No failures recorded.")
+        return
+    for key in sorted(systems):
+        evs = systems[key]
+        failed = [e for e in evs if not e.get("ok")]
+        if not failed:
+            continue
+        axis = by or _default_axis(evs)
+        print("  %s  (%d/%d failed, by %s)" % (key, len(failed), len(evs), axis))
+        totals, fails = {}, {}
+        for e in evs:
+            v = e.get("conditions", {}).get(axis, "?")
+            totals[v] = totals.get(v, 0) + 1
+            if not e.get("ok"):
+                fails[v] = fails.get(v, 0) + 1
+        for v in sorted(fails, key=lambda x: (str(type(x)), x)):
+            print("    %s=%-12s %4d/%-4d failed" % (axis, v, fails[v], totals[v]))
+        errors = {}
+        for e in failed:
+            msg = (e.get("error") or "").splitlines()[0][:80] if e.get("error") else ""
+            errors[msg] = errors.get(msg, 0) + 1
+        for msg, count in sorted(errors.items(), key=lambda x: -x[1])[:3]:
+            print("    %4dx %s" % (count, msg or "(no message)"))
+
+
+def _default_axis(events):
+    """Pick the condition that varies most as the failure-map axis."""
+    keys = {}
+    for e in events:
+        for k, v in e.get("conditions", {}).items():
+            keys.setdefault(k, set()).add(v)
+    if not keys:
+        return "?"
+    for preferred in ("T_K", "temp_K"):
+        if preferred in keys and len(keys[preferred]) > 1:
+            return preferred
+    return max(keys, key=lambda k: len(keys[k]))
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Summarize sweep telemetry (JSONL event streams).")
+    sub = parser.add_subparsers(dest="command", required=True)
+    ap = sub.add_parser("analyze", help="latency and failure report")
+    ap.add_argument("paths", nargs="*",
+                    help="JSONL files or folders (default: all telemetry)")
+    ap.add_argument("--top", type=int, default=10,
+                    help="number of slowest points to list")
+    ap.add_argument("--by", default=None,
+                    help="condition to group failures by (default: T_K/temp_K)")
+    args = parser.parse_args()
+
+    paths = []
+    for p in args.paths or [TELEMETRY_DIR]:
+        if os.path.isdir(p):
+            paths.extend(sorted(glob.glob(os.path.join(p, "*.jsonl"))))
+        else:
+            paths.append(p)
+    summarize(load_events(paths), top=args.top, by=args.by)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
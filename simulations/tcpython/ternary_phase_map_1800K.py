@@ -19,6 +19,11 @@ Output: ../../data/tcpython/raw/ternary_phase_map_1800K.csv
 
 Run on OSU lab machine:
   "C:\\Program Files\\Thermo-Calc\\2025b\\python\\python.exe" ternary_phase_map_1800K.py
+
+Split across K lab machines (see sweep_shards.py):
+  ... ternary_phase_map_1800K.py --shard 1/3     (machine 1)
+  ... ternary_phase_map_1800K.py --shard 2/3     (machine 2), etc.
+  python3 sweep_shards.py merge ../../data/tcpython/raw/ternary_phase_map_1800K.csv
 """
 
 import csv
@@ -27,6 +32,9 @@ from datetime import datetime
 
 from tc_python import *
 
+from sweep_shards import shard_from_argv, in_shard, shard_label, write_shard_csv
+from sweep_telemetry import SweepTelemetry
+
 # =============================================================================
 # Configuration
 # =============================================================================
@@ -53,6 +61,10 @@ SYSTEMS = [
 
 
 def main():
+    shard = shard_from_argv()
+    started = datetime.now().isoformat()
+    tel = SweepTelemetry("ternary_phase_map_1800K", DATABASE, shard=shard)
+
     print("=" * 70)
     print("TC-Python: Ternary Phase Map at {}K".format(T_FIXED))
     print("=" * 70)
@@ -61,7 +73,9 @@ def main():
         N_GRID, N_GRID, X_CU_MIN, X_CU_MAX, X_O_MIN, X_O_MAX))
     print("Systems: {}".format(", ".join(s["name"] for s in SYSTEMS)))
     print("Output: {}".format(OUTPUT_FILE))
-    print("Started: {}".format(datetime.now().isoformat()))
+    print("Sweep: {}".format(shard_label(shard)))
+    print("Telemetry: {}".format(tel.path))
+    print("Started: {}".format(started))
     print()
 
     OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
@@ -81,7 +95,11 @@ def main():
                 valid_points.append((X_Cu, X_O, X_M))
 
     print("Valid grid points per system: {}".format(len(valid_points)))
-    print("Total calculations: ~{}".format(len(valid_points) * len(SYSTEMS)))
+    n_total = len(valid_points) * len(SYSTEMS)
+    n_mine = sum(1 for j in range(n_total) if in_shard(j, shard))
+    print("Total calculations: ~{}".format(n_total))
+    if shard is not None:
+        print("This shard: {} points".format(n_mine))
     print()
 
     all_rows = []
@@ -89,22 +107,33 @@ def main():
     with TCPython() as session:
         print("Connected to Thermo-Calc\n")
 
-        for sys_def in SYSTEMS:
+        for sys_idx, sys_def in enumerate(SYSTEMS):
             sys_name = sys_def["name"]
             metal = sys_def["metal"]
+            # Canonical sweep index of this system's first grid point
+            base_index = sys_idx * len(valid_points)
+            my_idx = [idx for idx in range(len(valid_points))
+                      if in_shard(base_index + idx, shard)]
+            if not my_idx:
+                continue
 
             print("=" * 60)
             print("System: {}".format(sys_name))
             print("=" * 60)
 
+            ev = tel.start(sys_name, stage="system_setup")
             try:
                 system = (session
                           .select_database_and_elements(DATABASE, sys_def["elements"])
                           .get_system())
+                tel.ok(ev)
             except Exception as e:
+                tel.fail(ev, e)
                 print("  SYSTEM SETUP ERROR: {}".format(e))
-                for X_Cu, X_O, X_M in valid_points:
+                for idx in my_idx:
+                    X_Cu, X_O, X_M = valid_points[idx]
                     all_rows.append({
+                        "point_index": base_index + idx,
                         "system": sys_name,
                         "T_K": T_FIXED,
                         "X_Cu": round(X_Cu, 6),
@@ -119,9 +148,11 @@ def main():
                 continue
 
             success = 0
-            total = len(valid_points)
-            for idx, (X_Cu, X_O, X_M) in enumerate(valid_points):
+            total = len(my_idx)
+            for n_idx, idx in enumerate(my_idx):
+                X_Cu, X_O, X_M = valid_points[idx]
                 row = {
+                    "point_index": base_index + idx,
                     "system": sys_name,
                     "T_K": T_FIXED,
                     "X_Cu": round(X_Cu, 6),
@@ -129,6 +160,8 @@ def main():
                     "X_O": round(X_O, 6),
                 }
 
+                ev = tel.start(sys_name, T_K=T_FIXED, X_Cu=row["X_Cu"],
+                               X_O=row["X_O"])
                 try:
                     calc = system.with_single_equilibrium_calculation()
                     calc.set_condition(ThermodynamicQuantity.temperature(), T_FIXED)
@@ -155,8 +188,10 @@ def main():
                     row["GM_system"] = GM_system
                     row["notes"] = ""
                     success += 1
+                    tel.ok(ev, phases=stable)
 
                 except Exception as e:
+                    tel.fail(ev, e)
                     row["stable_phases"] = "ERROR: {}".format(e)
                     row["num_phases"] = ""
                     row["dominant_phase"] = ""
@@ -166,9 +201,9 @@ def main():
                 all_rows.append(row)
 
                 # Progress every 50 points
-                if (idx + 1) % 50 == 0 or idx == total - 1:
+                if (n_idx + 1) % 50 == 0 or n_idx == total - 1:
                     print("  {}: {}/{} ({} OK)".format(
-                        sys_name, idx + 1, total, success))
+                        sys_name, n_idx + 1, total, success))
 
             print("  Completed: {}/{} compositions\n".format(success, total))
 
@@ -187,6 +222,8 @@ def main():
                     pct = 100.0 * count / len(sys_rows)
                     print("    {:<20} {:>4} ({:.0f}%)".format(phase, count, pct))
 
+    tel.close()
+
     # =========================================================================
     # Write CSV
     # =========================================================================
@@ -196,13 +233,21 @@ def main():
         "GM_system", "notes",
     ]
 
-    with open(OUTPUT_FILE, 'w', newline='') as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(all_rows)
+    if shard is None:
+        out_path = OUTPUT_FILE
+        with open(OUTPUT_FILE, 'w', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=fieldnames,
+                                    extrasaction='ignore')
+            writer.writeheader()
+            writer.writerows(all_rows)
+    else:
+        out_path = write_shard_csv(OUTPUT_FILE, fieldnames, all_rows, shard,
+                                   n_total, started,
+                                   fail_column="stable_phases",
+                                   fail_prefix="ERROR")
 
     print("\n" + "=" * 70)
-    print("CSV written to: {}".format(OUTPUT_FILE))
+    print("CSV written to: {}".format(out_path))
     print("{} rows ({} systems)".format(len(all_rows), len(SYSTEMS)))
     print("Finished: {}".format(datetime.now().isoformat()))
     print("=" * 70)
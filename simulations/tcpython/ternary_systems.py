@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""
+Cu-M-O ternary product definitions shared by the TC-Python scripts.
+
+Each screening oxide lists the known (or hypothetical) Cu-M-O compounds to
+check: product formula, name and the TC phase names to look for. Everything
+numeric is derived from the formulas by reaction_balancer.py, so nothing has
+to be kept in sync by hand:
+
+  - reaction string and reactant stoichiometry (n_Cu, n_oxide_fu, n_O2)
+    for  n_Cu Cu + n_oxide_fu MOx + n_O2 O2 -> product
+  - product mole fractions X_Cu, X_M, X_O and atoms_per_formula
+  - oxide_atoms, plus OXIDE_X_O / OXIDE_ATOMS for the binary oxide references
+
+Plain Python, no TC-Python needed (extract_ternary_reactions.py,
+screen_tier2_equilibria.py and reaction_balancer.py import it).
+"""
+
+from reaction_balancer import capture_stoichiometry, oxide_X_O, parse_formula
+
+TERNARY_SYSTEMS = [
+    # --- SPINEL-FORMING OXIDES ---
+    # Spinel: CuM2O4 = Cu + M2O3 + 0.5 O2
+    {
+        "oxide": "Al2O3",
+        "metal": "AL",
+        "ternaries": [
+            {
+                "product": "CuAl2O4",
+                "name": "copper aluminate spinel",
+                "phase_hints": ["SPINEL"],
+            },
+            {
+                "product": "CuAlO2",
+                "name": "delafossite",
+                "phase_hints": ["DELAFOSSITE", "CUALUMINATE", "CUALOXID"],
+            },
+        ],
+    },
+    {
+        "oxide": "Cr2O3",
+        "metal": "CR",
+        "ternaries": [
+            {
+                "product": "CuCr2O4",
+                "name": "copper chromite spinel",
+                "phase_hints": ["SPINEL"],
+            },
+        ],
+    },
+    {
+        "oxide": "MnO",
+        "metal": "MN",
+        "ternaries": [
+            {
+                "product": "CuMn2O4",
+                "name": "copper manganite spinel",
+                "phase_hints": ["SPINEL"],
+            },
+        ],
+    },
+    {
+        "oxide": "FeO",
+        "metal": "FE",
+        "ternaries": [
+            {
+                "product": "CuFe2O4",
+                "name": "copper ferrite spinel",
+                "phase_hints": ["SPINEL"],
+            },
+        ],
+    },
+    # --- VANADATE/COMPLEX OXIDE ---
+    {
+        "oxide": "V2O5",
+        "metal": "V",
+        "ternaries": [
+            {
+                "product": "CuV2O6",
+                "name": "copper vanadate",
+                "phase_hints": ["VANADATE", "CUV2O6"],
+            },
+            {
+                "product": "Cu3V2O8",
+                "name": "copper orthovanadate",
+                "phase_hints": ["ORTHOVANADATE", "CU3V2O8"],
+            },
+        ],
+    },
+    # --- TITANATE ---
+    {
+        "oxide": "TiO2",
+        "metal": "TI",
+        "ternaries": [
+            {
+                "product": "CuTiO3",
+                "name": "copper titanate",
+                "phase_hints": ["ILMENITE", "CUTIO3", "PEROVSKITE"],
+            },
+        ],
+    },
+    # --- SILICATE ---
+    {
+        "oxide": "SiO2",
+        "metal": "SI",
+        "ternaries": [
+            {
+                "product": "CuSiO3",
+                "name": "copper metasilicate",
+                "phase_hints": ["PYROXENE", "CUSIO3", "WOLLASTONITE"],
+            },
+            {
+                "product": "Cu2SiO4",
+                "name": "copper orthosilicate",
+                "phase_hints": ["OLIVINE", "CU2SIO4"],
+            },
+        ],
+    },
+    # --- SIMPLE OXIDES (less likely to form ternaries, but check) ---
+    {
+        "oxide": "MgO",
+        "metal": "MG",
+        "ternaries": [
+            {
+                "product": "CuMgO2",
+                "name": "copper magnesioxide (hypothetical)",
+                "phase_hints": ["DELAFOSSITE", "CUMGO2"],
+            },
+        ],
+    },
+    {
+        "oxide": "CaO",
+        "metal": "CA",
+        "ternaries": [
+            {
+                "product": "CuCaO2",
+                "name": "copper calcioxide (hypothetical)",
+                "phase_hints": ["DELAFOSSITE", "CUCAO2"],
+            },
+        ],
+    },
+    {
+        "oxide": "ZrO2",
+        "metal": "ZR",
+        "ternaries": [
+            {
+                "product": "CuZrO3",
+                "name": "copper zirconate (hypothetical)",
+                "phase_hints": ["PEROVSKITE", "CUZRO3"],
+            },
+        ],
+    },
+    # --- MOONSHOT OXIDES ---
+    {
+        "oxide": "NiO",
+        "metal": "NI",
+        "ternaries": [
+            {
+                "product": "CuNiO2",
+                "name": "copper nickelate",
+                "phase_hints": ["DELAFOSSITE", "CUNIO2"],
+            },
+        ],
+    },
+    {
+        "oxide": "CoO",
+        "metal": "CO",
+        "ternaries": [
+            {
+                "product": "CuCo2O4",
+                "name": "copper cobaltite spinel",
+                "phase_hints": ["SPINEL"],
+            },
+        ],
+    },
+    {
+        "oxide": "La2O3",
+        "metal": "LA",
+        "ternaries": [
+            {
+                "product": "CuLaO2",
+                "name": "copper lanthanum oxide",
+                "phase_hints": ["DELAFOSSITE", "CULAO2"],
+            },
+        ],
+    },
+    {
+        "oxide": "CeO2",
+        "metal": "CE",
+        "ternaries": [
+            {
+                "product": "CuCeO3",
+                "name": "copper cerate (hypothetical)",
+                "phase_hints": ["PEROVSKITE", "CUCEO3"],
+            },
+        ],
+    },
+    # B2O3 requires special handling (B may not coexist with Cu in TCOX14)
+    {
+        "oxide": "B2O3",
+        "metal": "B",
+        "ternaries": [
+            {
+                "product": "CuB2O4",
+                "name": "copper borate",
+                "phase_hints": ["BORATE", "CUBO", "CUB2O4"],
+            },
+        ],
+    },
+]
+
+# Balanced stoichiometry and compositions for every product
+for _sys_def in TERNARY_SYSTEMS:
+    for _tern in _sys_def["ternaries"]:
+        _tern.update(capture_stoichiometry(_tern["product"], _sys_def["oxide"]))
+
+# Binary oxide reference compositions (mole fraction O, atoms per formula)
+OXIDE_X_O = {s["oxide"]: oxide_X_O(s["oxide"]) for s in TERNARY_SYSTEMS}
+OXIDE_ATOMS = {s["oxide"]: sum(parse_formula(s["oxide"]).values())
+               for s in TERNARY_SYSTEMS}